@@ -0,0 +1,39 @@
+"""add seed_versions table
+
+Revision ID: a7c3e9d2f104
+Revises: 8f53ce50c4b0, ucz4sottgz50
+Create Date: 2025-11-12 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9d2f104'
+down_revision: Union[str, Sequence[str], None] = ('8f53ce50c4b0', 'ucz4sottgz50')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create seed_versions so startup seeding runs once per seed definition.
+
+    Also merges the two existing heads (indicator drafts and rework tracking).
+    """
+    op.create_table(
+        'seed_versions',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False),
+        sa.Column('applied_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('seed_versions')
@@ -0,0 +1,50 @@
+"""add notification_deliveries for idempotent notification fan-out
+
+Revision ID: a9d4e2f7c810
+Revises: f1a7c3e9b2d4
+Create Date: 2025-11-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e2f7c810'
+down_revision: Union[str, Sequence[str], None] = 'f1a7c3e9b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'notification_deliveries',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('idempotency_key', sa.String(length=200), nullable=False),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('recipient', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('idempotency_key'),
+    )
+    op.create_index(
+        op.f('ix_notification_deliveries_id'), 'notification_deliveries', ['id'], unique=False
+    )
+    op.create_index(
+        'ix_notification_deliveries_status_created',
+        'notification_deliveries',
+        ['status', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notification_deliveries_status_created', table_name='notification_deliveries')
+    op.drop_index(op.f('ix_notification_deliveries_id'), table_name='notification_deliveries')
+    op.drop_table('notification_deliveries')
@@ -0,0 +1,57 @@
+"""add retry queue columns to notification_deliveries
+
+Revision ID: b4c8d1e6f2a7
+Revises: a9d4e2f7c810
+Create Date: 2025-11-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c8d1e6f2a7'
+down_revision: Union[str, Sequence[str], None] = 'a9d4e2f7c810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Keep rendered content and attempt bookkeeping so failed deliveries can be retried."""
+    op.add_column(
+        'notification_deliveries',
+        sa.Column('subject', sa.String(length=255), server_default='', nullable=False),
+    )
+    op.add_column(
+        'notification_deliveries', sa.Column('body', sa.Text(), server_default='', nullable=False)
+    )
+    op.add_column('notification_deliveries', sa.Column('html', sa.Text(), nullable=True))
+    op.add_column(
+        'notification_deliveries',
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column('notification_deliveries', sa.Column('last_error', sa.Text(), nullable=True))
+    op.add_column(
+        'notification_deliveries', sa.Column('next_attempt_at', sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        'ix_notification_deliveries_status_next_attempt',
+        'notification_deliveries',
+        ['status', 'next_attempt_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_notification_deliveries_status_next_attempt', table_name='notification_deliveries'
+    )
+    op.drop_column('notification_deliveries', 'next_attempt_at')
+    op.drop_column('notification_deliveries', 'last_error')
+    op.drop_column('notification_deliveries', 'attempts')
+    op.drop_column('notification_deliveries', 'html')
+    op.drop_column('notification_deliveries', 'body')
+    op.drop_column('notification_deliveries', 'subject')
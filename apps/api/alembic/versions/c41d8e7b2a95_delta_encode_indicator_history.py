@@ -0,0 +1,47 @@
+"""delta-encode indicator history and pin response indicator version
+
+Revision ID: c41d8e7b2a95
+Revises: a7c3e9d2f104
+Create Date: 2025-11-14 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8e7b2a95'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9d2f104'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Allow indicators_history rows to store schema deltas instead of full copies,
+    and record which indicator version each assessment response was answered against.
+
+    Existing history rows are full copies and stay marked as snapshots; they can
+    be compacted later with IndicatorVersionService.compact_history().
+    """
+    op.add_column(
+        'indicators_history',
+        sa.Column('is_snapshot', sa.Boolean(), server_default=sa.text('true'), nullable=False),
+    )
+    op.add_column(
+        'indicators_history',
+        sa.Column('schema_patch', sa.JSON(), nullable=True),
+    )
+    op.add_column(
+        'assessment_responses',
+        sa.Column('indicator_version', sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema (run IndicatorVersionService.expand_history() first to keep delta rows readable)."""
+    op.drop_column('assessment_responses', 'indicator_version')
+    op.drop_column('indicators_history', 'schema_patch')
+    op.drop_column('indicators_history', 'is_snapshot')
@@ -0,0 +1,41 @@
+"""add composite indexes for the paginated assessor queue
+
+Revision ID: c9e2f7a4d1b3
+Revises: b4c8d1e6f2a7
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e2f7a4d1b3'
+down_revision: Union[str, Sequence[str], None] = 'b4c8d1e6f2a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add composite indexes matching the assessor queue's keyset sort orders,
+    (submitted_at, id) and (updated_at, id), with and without a leading
+    status column for status-filtered tabs.
+    """
+    op.create_index('ix_assessments_submitted_at_id', 'assessments', ['submitted_at', 'id'])
+    op.create_index('ix_assessments_updated_at_id', 'assessments', ['updated_at', 'id'])
+    op.create_index(
+        'ix_assessments_status_submitted_at_id', 'assessments', ['status', 'submitted_at', 'id']
+    )
+    op.create_index(
+        'ix_assessments_status_updated_at_id', 'assessments', ['status', 'updated_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_assessments_status_updated_at_id', table_name='assessments')
+    op.drop_index('ix_assessments_status_submitted_at_id', table_name='assessments')
+    op.drop_index('ix_assessments_updated_at_id', table_name='assessments')
+    op.drop_index('ix_assessments_submitted_at_id', table_name='assessments')
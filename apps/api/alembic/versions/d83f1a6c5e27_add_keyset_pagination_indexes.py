@@ -0,0 +1,37 @@
+"""add keyset pagination indexes for audit logs, users and indicators
+
+Revision ID: d83f1a6c5e27
+Revises: c41d8e7b2a95
+Create Date: 2025-11-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd83f1a6c5e27'
+down_revision: Union[str, Sequence[str], None] = 'c41d8e7b2a95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add composite indexes matching the keyset sort orders, so each page is an
+    index range scan: audit logs by (created_at, id), users by (name, id) and
+    indicators by (governance_area_id, name, id).
+    """
+    op.create_index('ix_audit_logs_created_at_id', 'audit_logs', ['created_at', 'id'])
+    op.create_index('ix_users_name_id', 'users', ['name', 'id'])
+    op.create_index(
+        'ix_indicators_area_name_id', 'indicators', ['governance_area_id', 'name', 'id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_indicators_area_name_id', table_name='indicators')
+    op.drop_index('ix_users_name_id', table_name='users')
+    op.drop_index('ix_audit_logs_created_at_id', table_name='audit_logs')
@@ -0,0 +1,56 @@
+"""add append-only patch log for indicator drafts
+
+Revision ID: e5b2c9f0a1d3
+Revises: d83f1a6c5e27
+Create Date: 2025-11-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c9f0a1d3'
+down_revision: Union[str, Sequence[str], None] = 'd83f1a6c5e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Store draft autosaves as per-indicator patches on top of the draft snapshot.
+
+    Existing drafts keep their data as the snapshot with every indicator at
+    version 0.
+    """
+    op.add_column(
+        'indicator_drafts',
+        sa.Column('indicator_versions', sa.JSON(), server_default='{}', nullable=False),
+    )
+    op.create_table(
+        'indicator_draft_patches',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('draft_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('temp_id', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['draft_id'], ['indicator_drafts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('draft_id', 'temp_id', 'version', name='uq_indicator_draft_patch_version'),
+    )
+    op.create_index(
+        op.f('ix_indicator_draft_patches_draft_id'), 'indicator_draft_patches', ['draft_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema (compact drafts first, or pending patches are lost)."""
+    op.drop_index(op.f('ix_indicator_draft_patches_draft_id'), table_name='indicator_draft_patches')
+    op.drop_table('indicator_draft_patches')
+    op.drop_column('indicator_drafts', 'indicator_versions')
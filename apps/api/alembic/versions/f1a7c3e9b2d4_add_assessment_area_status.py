@@ -0,0 +1,81 @@
+"""add assessment_area_status for assessor workloads
+
+Revision ID: f1a7c3e9b2d4
+Revises: e5b2c9f0a1d3
+Create Date: 2025-11-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c3e9b2d4'
+down_revision: Union[str, Sequence[str], None] = 'e5b2c9f0a1d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Precompute which governance areas each assessment has responses in.
+
+    The table is backfilled from existing responses; afterwards the API keeps
+    it current on every response write.
+    """
+    op.create_table(
+        'assessment_area_status',
+        sa.Column('assessment_id', sa.Integer(), nullable=False),
+        sa.Column('governance_area_id', sa.Integer(), nullable=False),
+        sa.Column('response_count', sa.Integer(), nullable=False),
+        sa.Column('completed_count', sa.Integer(), nullable=False),
+        sa.Column('reviewed_count', sa.Integer(), nullable=False),
+        sa.Column('pass_count', sa.Integer(), nullable=False),
+        sa.Column('fail_count', sa.Integer(), nullable=False),
+        sa.Column('conditional_count', sa.Integer(), nullable=False),
+        sa.Column('rework_count', sa.Integer(), nullable=False),
+        sa.Column('first_reviewed_at', sa.DateTime(), nullable=True),
+        sa.Column('last_activity_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['governance_area_id'], ['governance_areas.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('assessment_id', 'governance_area_id'),
+    )
+    op.create_index(
+        'ix_assessment_area_status_area_activity',
+        'assessment_area_status',
+        ['governance_area_id', 'last_activity_at'],
+        unique=False,
+    )
+
+    op.execute(
+        """
+        INSERT INTO assessment_area_status (
+            assessment_id, governance_area_id, response_count, completed_count,
+            reviewed_count, pass_count, fail_count, conditional_count, rework_count,
+            first_reviewed_at, last_activity_at
+        )
+        SELECT
+            r.assessment_id,
+            i.governance_area_id,
+            COUNT(r.id),
+            SUM(CASE WHEN r.is_completed THEN 1 ELSE 0 END),
+            COUNT(r.validation_status),
+            SUM(CASE WHEN r.validation_status = 'PASS' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN r.validation_status = 'FAIL' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN r.validation_status = 'CONDITIONAL' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN r.requires_rework THEN 1 ELSE 0 END),
+            MIN(CASE WHEN r.validation_status IS NOT NULL THEN r.updated_at END),
+            MAX(r.updated_at)
+        FROM assessment_responses r
+        JOIN indicators i ON i.id = r.indicator_id
+        GROUP BY r.assessment_id, i.governance_area_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_assessment_area_status_area_activity', table_name='assessment_area_status')
+    op.drop_table('assessment_area_status')
@@ -2,7 +2,7 @@
 # Reusable dependency injection functions for authentication, database sessions, etc.
 
 import logging
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Generator, Optional
 
 from app.core.security import verify_token
 from app.db.base import get_db as get_db_session
@@ -12,7 +12,9 @@ from app.db.models.user import User
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session, joinedload
-from supabase import Client
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +122,7 @@ async def get_current_admin_user(
     return current_user
 
 
-def get_supabase_client() -> Client:
+def get_supabase_client() -> "Client":
     """
     Get Supabase client dependency.
 
@@ -130,7 +132,7 @@ def get_supabase_client() -> Client:
     return get_supabase()
 
 
-def get_supabase_admin_client() -> Client:
+def get_supabase_admin_client() -> "Client":
     """
     Get Supabase admin client dependency.
 
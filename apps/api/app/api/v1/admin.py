@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Optional
 
 from app.api.deps import get_client_ip, get_db, require_mlgoo_dilg
+from app.core.config import settings
+from app.core.pagination import CountMode
 from app.db.models.user import User
 from app.schemas.admin import (
     AdminSuccessResponse,
@@ -41,7 +43,12 @@ router = APIRouter()
     description="Retrieve audit logs with optional filtering by user, entity type, action, and date range. Requires MLGOO_DILG role.",
 )
 async def get_audit_logs(
-    skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's next_cursor (keyset pagination)"
+    ),
+    skip: int = Query(
+        0, ge=0, description="Number of records to skip (offset pagination; prefer cursor)"
+    ),
     limit: int = Query(
         100, ge=1, le=500, description="Maximum number of records to return"
     ),
@@ -55,6 +62,9 @@ async def get_audit_logs(
     ),
     start_date: Optional[datetime] = Query(None, description="Filter from date (inclusive)"),
     end_date: Optional[datetime] = Query(None, description="Filter to date (inclusive)"),
+    count: CountMode = Query(
+        CountMode.EXACT, description="How to compute total: exact, estimated or none"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_mlgoo_dilg),
 ):
@@ -71,14 +81,18 @@ async def get_audit_logs(
     - `start_date`: Filter from this date (inclusive)
     - `end_date`: Filter to this date (inclusive)
 
+    **Pagination:**
+    - Pass each response's `next_cursor` as `cursor` to get the next page;
+      every page costs the same however deep it is
+    - `skip` is still accepted for offset pagination when no cursor is given
+    - `count`: `exact` (default) runs COUNT(*), `estimated` uses planner
+      statistics or a recently cached count, `none` skips the total
+
     **Returns:**
     - Paginated list of audit logs with user details
-    - Total count of matching records
+    - Total count of matching records and the next page's cursor
     """
-    audit_logs, total = audit_service.get_audit_logs(
-        db=db,
-        skip=skip,
-        limit=limit,
+    filters = dict(
         user_id=user_id,
         entity_type=entity_type,
         entity_id=entity_id,
@@ -86,6 +100,15 @@ async def get_audit_logs(
         start_date=start_date,
         end_date=end_date,
     )
+    next_cursor = None
+    if skip and not cursor:
+        audit_logs, total = audit_service.get_audit_logs(
+            db=db, skip=skip, limit=limit, count=count, **filters
+        )
+    else:
+        audit_logs, total, next_cursor = audit_service.get_audit_logs_page(
+            db=db, cursor=cursor, limit=limit, count=count, **filters
+        )
 
     # Enrich audit logs with user information
     enriched_logs = []
@@ -105,7 +128,112 @@ async def get_audit_logs(
         enriched_logs.append(AuditLogResponse(**log_dict))
 
     return AuditLogListResponse(
-        items=enriched_logs, total=total, skip=skip, limit=limit
+        items=enriched_logs,
+        total=total,
+        total_estimated=total is not None and count == CountMode.ESTIMATED,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/audit-logs/export",
+    tags=["admin"],
+    summary="Export audit logs to CSV",
+    description="Export filtered audit logs to CSV format. Requires MLGOO_DILG role.",
+)
+async def export_audit_logs_csv(
+    user_id: Optional[int] = Query(None),
+    entity_type: Optional[str] = Query(None),
+    entity_id: Optional[int] = Query(None),
+    action: Optional[str] = Query(None),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_mlgoo_dilg),
+):
+    """
+    Export audit logs to CSV with optional filtering.
+
+    **Authentication:** Requires MLGOO_DILG role.
+
+    **Returns:**
+    - CSV file with audit log data
+    """
+    import csv
+    import io
+
+    from fastapi.responses import StreamingResponse
+
+    # The request's session is closed before the body streams (yield
+    # dependencies exit first), so the export reads through its own session
+    # on the same engine and closes it when the stream ends
+    bind = db.get_bind()
+
+    def generate_csv():
+        export_db = Session(bind=bind, autoflush=False)
+        try:
+            # Stream every matching audit log, one keyset page at a time
+            audit_logs = audit_service.iter_audit_logs(
+                db=export_db,
+                user_id=user_id,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                action=action,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            output = io.StringIO()
+            writer = csv.writer(output)
+
+            # Write header
+            writer.writerow(
+                [
+                    "ID",
+                    "Timestamp",
+                    "User ID",
+                    "User Email",
+                    "User Name",
+                    "Entity Type",
+                    "Entity ID",
+                    "Action",
+                    "IP Address",
+                    "Changes",
+                ]
+            )
+
+            # Write data rows, emitting the buffer every batch
+            for index, log in enumerate(audit_logs, start=1):
+                writer.writerow(
+                    [
+                        log.id,
+                        log.created_at.isoformat(),
+                        log.user_id,
+                        log.user.email if log.user else "",
+                        log.user.name if log.user else "",
+                        log.entity_type,
+                        log.entity_id or "",
+                        log.action,
+                        log.ip_address or "",
+                        str(log.changes) if log.changes else "",
+                    ]
+                )
+                if index % settings.EXPORT_BATCH_SIZE == 0:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate(0)
+
+            yield output.getvalue()
+        finally:
+            export_db.close()
+
+    return StreamingResponse(
+        generate_csv(),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename=audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
+        },
     )
 
 
@@ -199,96 +327,6 @@ async def get_entity_audit_history(
     return enriched_logs
 
 
-@router.get(
-    "/audit-logs/export",
-    tags=["admin"],
-    summary="Export audit logs to CSV",
-    description="Export filtered audit logs to CSV format. Requires MLGOO_DILG role.",
-)
-async def export_audit_logs_csv(
-    user_id: Optional[int] = Query(None),
-    entity_type: Optional[str] = Query(None),
-    entity_id: Optional[int] = Query(None),
-    action: Optional[str] = Query(None),
-    start_date: Optional[datetime] = Query(None),
-    end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_mlgoo_dilg),
-):
-    """
-    Export audit logs to CSV with optional filtering.
-
-    **Authentication:** Requires MLGOO_DILG role.
-
-    **Returns:**
-    - CSV file with audit log data
-    """
-    import csv
-    import io
-
-    from fastapi.responses import StreamingResponse
-
-    # Get all matching audit logs (no pagination limit for export)
-    audit_logs, _ = audit_service.get_audit_logs(
-        db=db,
-        skip=0,
-        limit=10000,  # High limit for export
-        user_id=user_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        start_date=start_date,
-        end_date=end_date,
-    )
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow(
-        [
-            "ID",
-            "Timestamp",
-            "User ID",
-            "User Email",
-            "User Name",
-            "Entity Type",
-            "Entity ID",
-            "Action",
-            "IP Address",
-            "Changes",
-        ]
-    )
-
-    # Write data rows
-    for log in audit_logs:
-        writer.writerow(
-            [
-                log.id,
-                log.created_at.isoformat(),
-                log.user_id,
-                log.user.email if log.user else "",
-                log.user.name if log.user else "",
-                log.entity_type,
-                log.entity_id or "",
-                log.action,
-                log.ip_address or "",
-                str(log.changes) if log.changes else "",
-            ]
-        )
-
-    # Create response with CSV data
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=audit_logs_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-        },
-    )
-
-
 # ============================================================================
 # Assessment Cycle Management Endpoints
 # ============================================================================
@@ -8,7 +8,8 @@ from app.api import deps
 from app.db.enums import UserRole
 from app.db.models.user import User
 from app.schemas.analytics import DashboardKPIResponse, ReportsDataResponse
-from app.services.analytics_service import ReportsFilters, analytics_service
+from app.services.analytics_cache_service import analytics_cache_service
+from app.services.analytics_service import ReportsFilters
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
 from sqlalchemy.orm import Session
@@ -55,6 +56,7 @@ async def get_current_mlgoo_dilg_user(
         "- Top 5 failed indicators\n"
         "- Barangay rankings by compliance score\n"
         "- Historical trends across cycles\n\n"
+        "Responses are cached and recomputed after assessments are validated.\n\n"
         "**Access:** Requires MLGOO_DILG role."
     ),
     responses={
@@ -116,7 +118,7 @@ async def get_current_mlgoo_dilg_user(
         403: {"description": "Not enough permissions (MLGOO_DILG role required)"},
     },
 )
-async def get_dashboard(
+def get_dashboard(
     cycle_id: Optional[int] = Query(
         None,
         description="Assessment cycle ID (defaults to latest cycle if not provided)",
@@ -142,7 +144,7 @@ async def get_dashboard(
         HTTPException: 401 if not authenticated, 403 if insufficient permissions
     """
     try:
-        dashboard_kpis = analytics_service.get_dashboard_kpis(db, cycle_id)
+        dashboard_kpis = analytics_cache_service.get_dashboard_kpis(db, cycle_id)
         return dashboard_kpis
     except Exception as e:
         raise HTTPException(
@@ -249,7 +251,7 @@ async def get_dashboard(
         403: {"description": "Insufficient permissions"},
     },
 )
-async def get_reports(
+def get_reports(
     cycle_id: Optional[int] = Query(
         None,
         description="Filter by assessment cycle ID",
@@ -333,8 +335,8 @@ async def get_reports(
             status=status,
         )
 
-        # Get reports data with RBAC
-        reports_data = analytics_service.get_reports_data(
+        # Get reports data with RBAC (cached per filters, page and scope)
+        reports_data = analytics_cache_service.get_reports_data(
             db=db,
             filters=filters,
             current_user=current_user,
@@ -778,6 +778,8 @@ async def save_assessment_answers(
     if existing_response:
         # Update existing record
         existing_response.response_data = response_data
+        # Answers were validated against the current form; re-pin to its version
+        existing_response.indicator_version = indicator.version
         existing_response.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(existing_response)
@@ -789,6 +791,7 @@ async def save_assessment_answers(
             response_data=response_data,
             is_completed=False,  # Will be set to True when all required fields are filled
             requires_rework=False,
+            indicator_version=indicator.version,
         )
         db.add(new_response)
         db.commit()
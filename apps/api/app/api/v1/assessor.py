@@ -1,21 +1,37 @@
 # 🧭 Assessor API Routes
 # Endpoints for assessor-specific functionality (secure queue, validation actions)
 
+from datetime import datetime
 from typing import List, Optional
 
 from app.api import deps
+from app.core.etag import conditional_json_response
+from app.db.enums import AssessmentStatus
 from app.db.models.user import User
 from app.schemas import (
     AssessmentDetailsResponse,
     AssessorAnalyticsResponse,
     AssessorQueueItem,
+    AssessorQueuePage,
+    AssessorQueueSort,
+    BulkValidationRequest,
+    BulkValidationResponse,
     MOVCreate,
     MOVUploadResponse,
     ValidationRequest,
     ValidationResponse,
 )
 from app.services import assessor_service, intelligence_service
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -23,6 +39,10 @@ router = APIRouter()
 
 @router.get("/queue", response_model=List[AssessorQueueItem], tags=["assessor"])
 async def get_assessor_queue(
+    skip: int = Query(0, ge=0, description="Number of submissions to skip"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="Maximum number of submissions to return"
+    ),
     db: Session = Depends(deps.get_db),
     current_assessor: User = Depends(deps.get_current_area_assessor_user),
 ):
@@ -31,7 +51,64 @@ async def get_assessor_queue(
 
     Returns a list of submissions filtered by the assessor's governance area.
     """
-    return assessor_service.get_assessor_queue(db=db, assessor=current_assessor)
+    return assessor_service.get_assessor_queue(
+        db=db, assessor=current_assessor, skip=skip, limit=limit
+    )
+
+
+@router.get("/queue/page", response_model=AssessorQueuePage, tags=["assessor"])
+async def get_assessor_queue_page(
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's next_cursor"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of submissions to return"),
+    status: Optional[List[AssessmentStatus]] = Query(
+        None, description="Only these statuses (repeatable)"
+    ),
+    barangay_id: Optional[int] = Query(None, description="Filter by barangay"),
+    submitted_from: Optional[datetime] = Query(
+        None, description="Submitted on or after this time"
+    ),
+    submitted_to: Optional[datetime] = Query(
+        None, description="Submitted on or before this time"
+    ),
+    rework_round: Optional[int] = Query(
+        None, ge=0, description="Number of times the assessment was sent back for rework"
+    ),
+    sort: AssessorQueueSort = Query(
+        AssessorQueueSort.SUBMITTED_DESC, description="Sort order; '-' prefix is descending"
+    ),
+    include_counts: bool = Query(
+        True, description="Include counts_by_status (skip it on later pages)"
+    ),
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+):
+    """
+    Get one page of the assessor's submissions queue.
+
+    Filtering and sorting happen in the database, and pages are keyed on
+    the sort column, so every page costs the same however long the queue
+    is. Pass `next_cursor` back as `cursor` (with the same filters and
+    sort) for the next page.
+
+    `counts_by_status` gives the queue size per status under the other
+    filters, for status tabs.
+    """
+    page = assessor_service.get_assessor_queue_page(
+        db=db,
+        assessor=current_assessor,
+        cursor=cursor,
+        limit=limit,
+        statuses=status,
+        barangay_id=barangay_id,
+        submitted_from=submitted_from,
+        submitted_to=submitted_to,
+        rework_round=rework_round,
+        sort=sort,
+        include_counts=include_counts,
+    )
+    return AssessorQueuePage(limit=limit, **page)
 
 
 @router.post(
@@ -63,6 +140,37 @@ async def validate_assessment_response(
     return ValidationResponse(**result)
 
 
+@router.post(
+    "/assessment-responses/bulk-validate",
+    response_model=BulkValidationResponse,
+    tags=["assessor"],
+)
+async def bulk_validate_assessment_responses(
+    validation_data: BulkValidationRequest,
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+    ip_address: Optional[str] = Depends(deps.get_client_ip),
+):
+    """
+    Validate many assessment responses in one request.
+
+    Each item carries a validation status (Pass/Fail/Conditional), an
+    optional public comment and optional assessor remarks (saved as an
+    internal note). All items must belong to the assessor's governance
+    area; if any is missing or outside it, the response lists them in
+    `errors` and nothing is saved. Otherwise everything is written in a
+    single transaction.
+    """
+    result = assessor_service.bulk_validate_assessment_responses(
+        db=db,
+        assessor=current_assessor,
+        items=validation_data.items,
+        ip_address=ip_address,
+    )
+
+    return BulkValidationResponse(**result)
+
+
 @router.post(
     "/assessment-responses/{response_id}/movs",
     response_model=MOVUploadResponse,
@@ -184,6 +292,79 @@ async def get_assessment_details(
     return AssessmentDetailsResponse(**result)
 
 
+@router.get("/assessments/{assessment_id}/summary", tags=["assessor"])
+async def get_assessment_review_summary(
+    assessment_id: int,
+    request: Request,
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+):
+    """
+    Compact first-render payload for reviewing an assessment.
+
+    Returns the assessment metadata, per-area counts and one status line
+    per indicator in the assessor's area (with MOV and comment counts).
+    MOVs, comments and form data are fetched per area or per indicator
+    from the endpoints below, which can be requested in parallel.
+
+    Responses carry an ETag; send it back in If-None-Match to get an
+    empty 304 when nothing changed.
+    """
+    summary = assessor_service.get_assessment_review_summary(
+        db=db, assessment_id=assessment_id, assessor=current_assessor
+    )
+    return conditional_json_response(request, summary)
+
+
+@router.get(
+    "/assessments/{assessment_id}/areas/{governance_area_id}", tags=["assessor"]
+)
+async def get_assessment_area_details(
+    assessment_id: int,
+    governance_area_id: int,
+    request: Request,
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+):
+    """
+    Full review data for one governance area of an assessment.
+
+    Returns each response in the area with its indicator, technical notes,
+    MOVs and feedback comments. Supports If-None-Match like the summary.
+    """
+    details = assessor_service.get_assessment_area_details(
+        db=db,
+        assessment_id=assessment_id,
+        governance_area_id=governance_area_id,
+        assessor=current_assessor,
+    )
+    return conditional_json_response(request, details)
+
+
+@router.get(
+    "/assessments/{assessment_id}/indicators/{indicator_id}", tags=["assessor"]
+)
+async def get_assessment_indicator_details(
+    assessment_id: int,
+    indicator_id: int,
+    request: Request,
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+):
+    """
+    Full review data for one indicator's response in an assessment.
+
+    Supports If-None-Match like the summary.
+    """
+    details = assessor_service.get_assessment_indicator_details(
+        db=db,
+        assessment_id=assessment_id,
+        indicator_id=indicator_id,
+        assessor=current_assessor,
+    )
+    return conditional_json_response(request, details)
+
+
 @router.post(
     "/assessments/{assessment_id}/rework",
     tags=["assessor"],
@@ -256,6 +437,13 @@ async def finalize_assessment(
 )
 async def classify_assessment(
     assessment_id: int,
+    use_pinned_version: bool = Query(
+        False,
+        description=(
+            "Re-evaluate auto-calculable responses against the indicator version "
+            "each was answered against before classifying"
+        ),
+    ),
     db: Session = Depends(deps.get_db),
     current_assessor: User = Depends(deps.get_current_area_assessor_user),
 ):
@@ -265,12 +453,14 @@ async def classify_assessment(
     Applies the "3+1" SGLGB compliance rule to determine if the barangay
     has passed or failed the assessment. This endpoint is primarily for
     testing purposes - classification automatically runs during finalization.
+    With ``use_pinned_version``, historical results are reproduced even if
+    indicator rules changed after the BLGU answered.
 
     The assessor must have permission to review assessments in their governance area.
     """
     try:
         result = intelligence_service.classify_assessment(
-            db=db, assessment_id=assessment_id
+            db=db, assessment_id=assessment_id, use_pinned_version=use_pinned_version
         )
         return result
     except ValueError as e:
@@ -11,12 +11,15 @@ from app.schemas.bbi import (
     BBIResponse,
     BBIResultResponse,
     BBIUpdate,
+    BBIWhatIfRequest,
     BBIWithGovernanceArea,
     TestBBICalculationRequest,
     TestBBICalculationResponse,
 )
+from app.core.config import settings
 from app.services.bbi_service import bbi_service
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.services.calculation_sandbox_service import calculation_sandbox_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -269,6 +272,75 @@ async def test_bbi_calculation(
         )
 
 
+@router.post("/{bbi_id}/what-if", tags=["bbis"])
+def what_if_bbi_mapping(
+    bbi_id: int,
+    request: BBIWhatIfRequest,
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_admin_user),
+):
+    """
+    Show the impact of a mapping rules change across real assessments.
+
+    Requires admin privileges (MLGOO_DILG role).
+
+    The draft and the BBI's current mapping_rules are evaluated against the
+    recorded indicator statuses of every submitted assessment (optionally
+    limited to one cycle) in one pass, returning the Functional /
+    Non-Functional distribution under each, the delta and the assessments
+    that change status.
+
+    Up to WHAT_IF_SYNC_MAX_RESPONSES assessments are evaluated in the
+    request; larger replays return 202 with a task_id to poll at
+    `GET /bbis/what-if/{task_id}`.
+    """
+    if not bbi_service.get_bbi(db, bbi_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"BBI with ID {bbi_id} not found",
+        )
+
+    total = calculation_sandbox_service.count_assessments(db, request.cycle_id)
+    rows = min(total, request.max_responses or total)
+
+    if rows > settings.WHAT_IF_SYNC_MAX_RESPONSES:
+        from app.workers.calculation_sandbox import run_what_if
+
+        task = run_what_if.delay(
+            "bbi",
+            bbi_id,
+            request.mapping_rules,
+            cycle_id=request.cycle_id,
+            max_responses=request.max_responses,
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"status": "processing", "task_id": task.id, "assessments": rows}
+
+    return calculation_sandbox_service.evaluate_bbi_what_if(
+        db,
+        bbi_id,
+        request.mapping_rules,
+        cycle_id=request.cycle_id,
+        max_responses=request.max_responses,
+    )
+
+
+@router.get("/what-if/{task_id}", tags=["bbis"])
+async def get_bbi_what_if_result(
+    task_id: str,
+    current_user: User = Depends(deps.get_current_admin_user),
+):
+    """
+    Poll a BBI what-if replay that was handed to the worker.
+
+    Requires admin privileges (MLGOO_DILG role).
+    """
+    from app.workers.calculation_sandbox import get_what_if_status
+
+    return get_what_if_status(task_id)
+
+
 # ============================================================================
 # BBI Results Endpoints
 # ============================================================================
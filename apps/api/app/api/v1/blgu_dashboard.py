@@ -19,10 +19,11 @@ from sqlalchemy.orm import Session, joinedload
 from app.api import deps
 from app.db.enums import AssessmentStatus, UserRole
 from app.db.models.assessment import Assessment, AssessmentResponse
-from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.governance_area import Indicator
 from app.db.models.user import User
 from app.schemas.blgu_dashboard import BLGUDashboardResponse, IndicatorNavigationItem
 from app.services.completeness_validation_service import completeness_validation_service
+from app.services.reference_data_service import reference_data_service
 
 router = APIRouter(tags=["blgu-dashboard"])
 
@@ -171,7 +172,7 @@ def get_blgu_dashboard(
         })
 
     # Get all governance areas
-    governance_areas = db.query(GovernanceArea).all()
+    governance_areas = reference_data_service.get_governance_areas(db)
 
     # Process all top-level indicators in each governance area
     completed_indicators = 0
@@ -4,33 +4,39 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.config import settings
 from app.db.models.user import User
 from app.schemas.indicator import (
     BulkCreateError,
     BulkIndicatorCreate,
     BulkIndicatorResponse,
+    FormSchemaEditRequest,
     FormSchemaResponse,
     IndicatorCreate,
     IndicatorDraftCreate,
     IndicatorDraftDeltaUpdate,
+    IndicatorDraftPatchRequest,
+    IndicatorDraftPatchResponse,
     IndicatorDraftResponse,
     IndicatorDraftSummary,
     IndicatorDraftUpdate,
     IndicatorHistoryResponse,
     IndicatorResponse,
     IndicatorUpdate,
+    IndicatorWhatIfRequest,
     ReorderRequest,
 )
 from app.schemas.form_schema import FormSchema
 from app.schemas.calculation_schema import CalculationSchema
 from app.services.indicator_service import indicator_service
 from app.services.indicator_draft_service import indicator_draft_service
-from app.services.form_schema_validator import generate_validation_errors
+from app.services.schema_validation_service import SchemaGraph, schema_validation_service
 from app.services.intelligence_service import intelligence_service
+from app.services.calculation_sandbox_service import calculation_sandbox_service
 
 router = APIRouter(tags=["indicators"])
 
@@ -84,8 +90,12 @@ def list_indicators(
     *,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
+    response: Response,
     governance_area_id: Optional[int] = Query(None, description="Filter by governance area"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page's X-Next-Cursor header"
+    ),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
 ) -> List[IndicatorResponse]:
@@ -97,18 +107,32 @@ def list_indicators(
     **Query Parameters**:
     - governance_area_id: Filter by governance area (optional)
     - is_active: Filter by active status (optional)
+    - cursor: Keyset pagination cursor (optional, takes precedence over skip)
     - skip: Pagination offset (default: 0)
     - limit: Max records (default: 100, max: 1000)
 
-    **Returns**: List of indicators matching filters
+    **Returns**: List of indicators matching filters. When more results
+    exist, the `X-Next-Cursor` response header holds the cursor for the
+    next page.
     """
-    indicators = indicator_service.list_indicators(
+    if skip and not cursor:
+        return indicator_service.list_indicators(
+            db=db,
+            governance_area_id=governance_area_id,
+            is_active=is_active,
+            skip=skip,
+            limit=limit,
+        )
+
+    indicators, next_cursor = indicator_service.list_indicators_page(
         db=db,
+        cursor=cursor,
+        limit=limit,
         governance_area_id=governance_area_id,
         is_active=is_active,
-        skip=skip,
-        limit=limit,
     )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return indicators
 
 
@@ -121,6 +145,9 @@ def validate_form_schema(
     *,
     current_user: User = Depends(deps.require_mlgoo_dilg),
     form_schema: FormSchema,
+    base_hash: Optional[str] = Query(
+        None, description="schema_hash of the version this schema was edited from"
+    ),
 ) -> dict:
     """
     Validate a form schema without saving it.
@@ -130,9 +157,13 @@ def validate_form_schema(
     **Request Body**:
     - form_schema: FormSchema object with fields to validate
 
+    **Query Parameters**:
+    - base_hash: `schema_hash` from the previous validation of this schema;
+      only the fields that changed since then are re-checked
+
     **Returns**:
-    - `{"valid": true}` if the schema is valid
-    - `{"valid": false, "errors": [...]}` if validation fails with detailed error messages
+    - `{"valid": true, "schema_hash": ...}` if the schema is valid
+    - `{"valid": false, "errors": [...], "schema_hash": ...}` if validation fails with detailed error messages
 
     **Validation Checks**:
     - Field IDs are unique
@@ -147,20 +178,58 @@ def validate_form_schema(
     - 401: Unauthorized (not authenticated)
     - 403: Forbidden (not MLGOO_DILG role)
     """
-    # Generate validation errors
-    errors = generate_validation_errors(form_schema)
+    graph = schema_validation_service.validate_form_schema(form_schema, base_hash=base_hash)
+    return _form_validation_response(graph)
+
+
+@router.post(
+    "/validate-form-schema/edits",
+    status_code=status.HTTP_200_OK,
+    summary="Validate edits to a previously validated form schema",
+)
+def validate_form_schema_edits(
+    *,
+    current_user: User = Depends(deps.require_mlgoo_dilg),
+    edits: FormSchemaEditRequest,
+) -> dict:
+    """
+    Validate a form schema given only the fields changed since it was last validated.
+
+    **Permissions**: MLGOO_DILG only
+
+    **Request Body**:
+    - base_hash: `schema_hash` from the previous validation
+    - upsert_fields: Added or changed fields (new fields are appended)
+    - removed_field_ids: IDs of removed fields
+
+    **Returns**: Same as `/validate-form-schema`, for the edited schema
+
+    **Status Codes**:
+    - 200: Edited schema is valid
+    - 400: Edited schema is invalid (returns error details)
+    - 401: Unauthorized (not authenticated)
+    - 403: Forbidden (not MLGOO_DILG role)
+    - 409: base_hash is not known to this server; validate the full schema instead
+    """
+    graph = schema_validation_service.apply_form_schema_edits(
+        edits.base_hash, edits.upsert_fields, edits.removed_field_ids
+    )
+    return _form_validation_response(graph)
+
 
-    if errors:
+def _form_validation_response(graph: SchemaGraph) -> dict:
+    if graph.errors:
         # Return 400 with detailed errors
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "valid": False,
-                "errors": errors,
+                "errors": graph.errors,
+                "schema_hash": graph.schema_hash,
             },
         )
 
-    return {"valid": True}
+    return {"valid": True, "schema_hash": graph.schema_hash}
 
 
 @router.post(
@@ -172,6 +241,9 @@ def validate_calculation_schema(
     *,
     current_user: User = Depends(deps.require_mlgoo_dilg),
     calculation_schema: CalculationSchema,
+    form_schema_hash: Optional[str] = Query(
+        None, description="schema_hash of the validated form schema the rules read from"
+    ),
 ) -> dict:
     """
     Validate a calculation schema without saving it.
@@ -181,8 +253,12 @@ def validate_calculation_schema(
     **Request Body**:
     - calculation_schema: CalculationSchema object with condition groups and rules
 
+    **Query Parameters**:
+    - form_schema_hash: `schema_hash` returned by `/validate-form-schema`; when
+      given, every field referenced by a rule must exist in that form schema
+
     **Returns**:
-    - `{"valid": true}` if the schema is valid
+    - `{"valid": true, "schema_hash": ...}` if the schema is valid
     - `{"valid": false, "errors": [...]}` if validation fails
 
     **Validation Checks**:
@@ -190,21 +266,37 @@ def validate_calculation_schema(
     - Field references are present (basic structure validation)
     - Nested conditions are properly formed
     - Operators are valid for each rule type
+    - Referenced fields exist in the form schema (with form_schema_hash)
 
     **Status Codes**:
     - 200: Schema is valid
     - 400: Schema is invalid (returns error details)
     - 401: Unauthorized (not authenticated)
     - 403: Forbidden (not MLGOO_DILG role)
+    - 409: form_schema_hash is not known to this server; validate the form schema first
 
     **Note**: This endpoint only validates the schema structure.
     To test the schema with actual data, use the `/test-calculation` endpoint.
     """
-    # Pydantic validation already happened during request parsing
-    # If we got here, the schema structure is valid
+    # Pydantic validation already happened during request parsing, so the
+    # structure is valid; what is left is checking field references
+    result = schema_validation_service.validate_calculation_schema(
+        calculation_schema, form_schema_hash=form_schema_hash
+    )
+    if result["errors"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "valid": False,
+                "errors": result["errors"],
+                "schema_hash": result["schema_hash"],
+            },
+        )
+
     return {
         "valid": True,
         "message": "Calculation schema structure is valid",
+        "schema_hash": result["schema_hash"],
     }
 
 
@@ -313,6 +405,97 @@ def test_calculation(
         )
 
 
+@router.post(
+    "/{indicator_id}/what-if",
+    status_code=status.HTTP_200_OK,
+    summary="Replay a draft calculation schema over stored responses",
+)
+def what_if_calculation(
+    *,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.require_mlgoo_dilg),
+    indicator_id: int,
+    request: IndicatorWhatIfRequest,
+    response: Response,
+) -> dict:
+    """
+    Show the impact of a calculation schema change across real submissions.
+
+    The draft schema and the indicator's current schema are evaluated over
+    every stored response for the indicator (optionally limited to one
+    assessment cycle) in a single compiled pass. Without a current schema
+    the recorded validation statuses are the baseline.
+
+    **Permissions**: MLGOO_DILG only
+
+    **Returns** (200, up to WHAT_IF_SYNC_MAX_RESPONSES responses):
+    ```json
+    {
+      "evaluated": 120,
+      "truncated": false,
+      "current": {"Pass": 90, "Fail": 30},
+      "draft": {"Pass": 72, "Fail": 48},
+      "delta": {"Pass": -18, "Fail": 18},
+      "transitions": {"Pass -> Fail": 18},
+      "changed_samples": [{"assessment_id": 4, "barangay_name": "...", "current": "Pass", "draft": "Fail"}]
+    }
+    ```
+
+    **Returns** (202, larger replays): `{"status": "processing", "task_id": "..."}`;
+    poll `GET /indicators/what-if/{task_id}` for the result.
+
+    **Status Codes**:
+    - 404: Indicator or cycle not found
+    """
+    total = calculation_sandbox_service.count_indicator_responses(
+        db, indicator_id, request.cycle_id
+    )
+    rows = min(total, request.max_responses or total)
+
+    if rows > settings.WHAT_IF_SYNC_MAX_RESPONSES:
+        from app.workers.calculation_sandbox import run_what_if
+
+        task = run_what_if.delay(
+            "indicator",
+            indicator_id,
+            request.calculation_schema.model_dump(),
+            cycle_id=request.cycle_id,
+            max_responses=request.max_responses,
+        )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"status": "processing", "task_id": task.id, "responses": rows}
+
+    return calculation_sandbox_service.evaluate_indicator_what_if(
+        db,
+        indicator_id,
+        request.calculation_schema,
+        cycle_id=request.cycle_id,
+        max_responses=request.max_responses,
+    )
+
+
+@router.get(
+    "/what-if/{task_id}",
+    summary="Get the result of a background what-if replay",
+)
+def get_what_if_result(
+    *,
+    current_user: User = Depends(deps.require_mlgoo_dilg),
+    task_id: str,
+) -> dict:
+    """
+    Poll a what-if replay that was handed to the worker.
+
+    **Permissions**: MLGOO_DILG only
+
+    **Returns**: `{"status": "processing"}` until the replay finishes, then
+    the what-if result with `"status": "completed"`.
+    """
+    from app.workers.calculation_sandbox import get_what_if_status
+
+    return get_what_if_status(task_id)
+
+
 @router.get(
     "/{indicator_id}",
     response_model=IndicatorResponse,
@@ -848,6 +1031,60 @@ def delta_update_indicator_draft(
     return draft
 
 
+@router.post(
+    "/drafts/{draft_id}/patches",
+    response_model=IndicatorDraftPatchResponse,
+    summary="Append per-indicator changes to an indicator draft",
+)
+def append_indicator_draft_patches(
+    *,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.require_mlgoo_dilg),
+    draft_id: UUID,
+    patch_request: IndicatorDraftPatchRequest,
+) -> IndicatorDraftPatchResponse:
+    """
+    Autosave an indicator draft by appending only the changed indicators.
+
+    Writes one small row per changed indicator instead of rewriting the
+    whole draft, and detects conflicts per indicator: a save only fails if
+    another process changed one of the same indicators since
+    `base_versions` (as returned by this endpoint or in the draft's
+    `indicator_versions`).
+
+    **Permissions**: MLGOO_DILG only (must own the draft)
+
+    **Path Parameters**:
+    - draft_id: Draft UUID
+
+    **Request Body**:
+    - changed_indicators: Changed indicator nodes (each with a temp_id)
+    - deleted_ids: temp_ids of removed indicators
+    - base_versions: Version each changed indicator was edited from (0 for new ones)
+    - metadata: Optional metadata (current_step, status, title)
+
+    **Returns**: New version of each changed indicator
+
+    **Raises**:
+    - 404: Draft not found
+    - 403: Access denied (not draft owner)
+    - 409: Indicators changed by another process (`detail.conflicts` maps
+      temp_id to its current version)
+    - 423: Draft locked by another user
+    """
+    indicator_versions = indicator_draft_service.append_patches(
+        db=db,
+        draft_id=draft_id,
+        user_id=current_user.id,
+        changed_indicators=patch_request.changed_indicators,
+        base_versions=patch_request.base_versions,
+        deleted_ids=patch_request.deleted_ids,
+        metadata=patch_request.metadata,
+    )
+
+    return IndicatorDraftPatchResponse(draft_id=draft_id, indicator_versions=indicator_versions)
+
+
 @router.delete(
     "/drafts/{draft_id}",
     status_code=status.HTTP_204_NO_CONTENT,
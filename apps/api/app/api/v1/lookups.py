@@ -3,29 +3,44 @@
 # governance areas and barangays.
 
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.core.config import settings
+from app.core.etag import conditional_json_response
 from app.schemas import lookups as lookup_schema
-from app.services.governance_area_service import governance_area_service
-from app.services.barangay_service import barangay_service
+from app.services.reference_data_service import reference_data_service
 
 router = APIRouter()
 
+# Reference data is the same for every user; browsers revalidate with the ETag
+LOOKUP_CACHE_CONTROL = f"public, max-age={settings.LOOKUP_MAX_AGE_SECONDS}"
+
 
 @router.get(
     "/governance-areas",
     response_model=List[lookup_schema.GovernanceArea],
 )
 def get_all_governance_areas(
+    request: Request,
     db: Session = Depends(deps.get_db),
-):
+) -> Response:
     """
     Retrieve all governance areas.
     Accessible by all authenticated users.
+
+    Served from the reference data cache with an ETag; send it back in
+    If-None-Match to get an empty 304 when nothing changed.
     """
-    return governance_area_service.get_all_governance_areas(db)
+    reference = reference_data_service.get(db)
+    return conditional_json_response(
+        request,
+        reference.governance_areas_payload,
+        cache_control=LOOKUP_CACHE_CONTROL,
+        etag=reference.governance_areas_etag,
+    )
 
 
 @router.get(
@@ -33,10 +48,19 @@ def get_all_governance_areas(
     response_model=List[lookup_schema.Barangay],
 )
 def get_all_barangays(
+    request: Request,
     db: Session = Depends(deps.get_db),
-):
+) -> Response:
     """
     Retrieve all barangays.
     Accessible by all authenticated users.
+
+    Served from the reference data cache with an ETag, like governance areas.
     """
-    return barangay_service.get_all_barangays(db)
+    reference = reference_data_service.get(db)
+    return conditional_json_response(
+        request,
+        reference.barangays_payload,
+        cache_control=LOOKUP_CACHE_CONTROL,
+        etag=reference.barangays_etag,
+    )
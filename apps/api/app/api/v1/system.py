@@ -5,11 +5,8 @@ from fastapi import APIRouter
 from datetime import datetime
 
 from app.schemas.system import ApiResponse, HealthCheck
-from app.db.base import (
-    check_all_connections,
-    check_database_connection,
-    check_supabase_connection,
-)
+from app.db.base import check_all_connections
+from app.services.health_service import health_service
 
 router = APIRouter()
 
@@ -29,12 +26,13 @@ async def health_check():
     - API service status
     - Database connectivity (SQLAlchemy + Supabase)
     - Overall system health
+
+    Connection results come from the shared health cache.
     """
     timestamp = datetime.now()
 
-    # Check database connections
-    db_status = await check_all_connections()
-    db_status["timestamp"] = timestamp
+    # Check database connections (cached)
+    db_status = await health_service.get_health_status()
 
     # Determine overall health
     api_healthy = True  # API is running if this endpoint responds
@@ -63,15 +61,18 @@ async def database_status():
     - PostgreSQL connection via SQLAlchemy
     - Supabase connection and configuration
     - Connection errors and troubleshooting info
+
+    Always probes live (bypasses the health cache).
     """
     timestamp = datetime.now()
+    connections = await check_all_connections()
 
     return {
         "timestamp": timestamp,
-        "connections": await check_all_connections(),
+        "connections": connections,
         "individual_checks": {
-            "postgresql": await check_database_connection(),
-            "supabase": await check_supabase_connection(),
+            "postgresql": connections["database"],
+            "supabase": connections["supabase"],
         },
     }
 
@@ -5,6 +5,9 @@ import math
 from typing import Optional
 
 from app.api import deps
+from app.core.config import settings
+from app.core.pagination import CountMode
+from app.core.security import encrypt_payload
 from app.db.models.user import User
 from app.schemas.user import User as UserSchema
 from app.schemas.user import (
@@ -13,8 +16,18 @@ from app.schemas.user import (
     UserListResponse,
     UserUpdate,
 )
+from app.services.user_import_service import user_import_service
 from app.services.user_service import user_service
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -58,21 +71,42 @@ async def get_users(
     search: Optional[str] = Query(None, description="Search in name and email"),
     role: Optional[str] = Query(None, description="Filter by role"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous response's next_cursor (overrides page)"
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT, description="How to compute total: exact, estimated or none"
+    ),
 ):
     """
     Get paginated list of users with optional filtering.
 
+    Users are ordered by name. Pass `next_cursor` back as `cursor` for
+    keyset pagination, which costs the same on every page; `page` remains
+    available for offset pagination.
+
     Requires admin privileges (MLGOO_DILG role).
     """
-    skip = (page - 1) * size
-    users, total = user_service.get_users(
-        db, skip=skip, limit=size, search=search, role=role, is_active=is_active
-    )
+    filters = dict(search=search, role=role, is_active=is_active, count=count)
+    if page > 1 and not cursor:
+        users, total = user_service.get_users(
+            db, skip=(page - 1) * size, limit=size, **filters
+        )
+        next_cursor = None
+    else:
+        users, total, next_cursor = user_service.get_users_page(
+            db, cursor=cursor, limit=size, **filters
+        )
 
-    total_pages = math.ceil(total / size)
+    total_pages = math.ceil(total / size) if total is not None else None
 
     return UserListResponse(
-        users=users, total=total, page=page, size=size, total_pages=total_pages
+        users=users,
+        total=total,
+        page=page,
+        size=size,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -98,6 +132,63 @@ async def create_user(
     return user_service.create_user_admin(db, user_create)
 
 
+@router.post("/import", response_model=dict, tags=["users"])
+def import_users(
+    response: Response,
+    file: UploadFile = File(..., description="CSV (with a header row) or JSON list of users"),
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_admin_user),
+):
+    """
+    Bulk-create users from a CSV or JSON file.
+
+    Requires admin privileges (MLGOO_DILG role).
+
+    Rows use the same fields and role-based assignment rules as
+    `POST /users/`. Every row is validated first (duplicate emails,
+    unknown barangays or governance areas); valid rows are created and
+    invalid ones are reported by row number:
+
+    ```json
+    {"total": 3, "created": 2, "users": [{"row": 1, "id": 7, "email": "..."}],
+     "errors": [{"row": 3, "email": "...", "error": "Email already registered"}]}
+    ```
+
+    Files with more than USER_IMPORT_SYNC_MAX_ROWS rows are imported by a
+    worker: the response is 202 `{"status": "processing", "task_id": "..."}`;
+    poll `GET /users/import/{task_id}` for progress and the result.
+    """
+    rows = user_import_service.parse_file(file.file.read(), file.filename)
+
+    if len(rows) > settings.USER_IMPORT_SYNC_MAX_ROWS:
+        from app.workers.user_import import import_users as import_users_task
+
+        # Passwords stay out of the broker and result backend
+        task = import_users_task.delay(encrypt_payload(rows))
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"status": "processing", "task_id": task.id, "total": len(rows)}
+
+    return user_import_service.import_users(db, rows)
+
+
+@router.get("/import/{task_id}", response_model=dict, tags=["users"])
+async def get_user_import_status(
+    task_id: str,
+    current_user: User = Depends(deps.get_current_admin_user),
+):
+    """
+    Poll a background user import.
+
+    Requires admin privileges (MLGOO_DILG role).
+
+    Returns `{"status": "processing", "processed": n, "total": m}` while
+    the import runs, then the import result with `"status": "completed"`.
+    """
+    from app.workers.user_import import get_import_status
+
+    return get_import_status(task_id)
+
+
 @router.get("/{user_id}", response_model=UserSchema, tags=["users"])
 async def get_user(
     user_id: int,
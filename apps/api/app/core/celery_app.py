@@ -1,8 +1,18 @@
 # 🔄 Celery Application Configuration
 # Celery app setup for background task processing
 
+import time
+
 from app.core.config import settings
+from app.core.metrics import celery_task_duration_seconds, start_worker_metrics_server
 from celery import Celery  # type: ignore
+from celery.schedules import crontab  # type: ignore
+from celery.signals import (  # type: ignore
+    task_postrun,
+    task_prerun,
+    worker_process_init,
+    worker_ready,
+)
 
 # Create Celery app instance
 celery_app = Celery(
@@ -13,6 +23,8 @@ celery_app = Celery(
         "app.workers.notifications",
         "app.workers.sglgb_classifier",
         "app.workers.intelligence_worker",
+        "app.workers.calculation_sandbox",
+        "app.workers.user_import",
     ],
 )
 
@@ -37,5 +49,51 @@ celery_app.conf.task_routes = {
     "app.workers.intelligence.*": {"queue": "intelligence"},
 }
 
+# Periodic tasks (run with: celery -A app.core.celery_app beat)
+celery_app.conf.beat_schedule = {
+    "send-deadline-reminders": {
+        "task": "notifications.send_deadline_reminders",
+        "schedule": crontab(minute=0, hour=settings.DEADLINE_REMINDER_HOUR_UTC),
+    },
+    "retry-notifications": {
+        "task": "notifications.retry_notifications",
+        "schedule": crontab(minute="*/5"),
+    },
+}
+
+# Task duration metrics (start times keyed by task id, per worker process)
+_task_started_at: dict[str, float] = {}
+
+
+@task_prerun.connect
+def _record_task_start(task_id=None, **kwargs):
+    _task_started_at[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _record_task_duration(task_id=None, task=None, state=None, **kwargs):
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is None or task is None:
+        return
+    celery_task_duration_seconds.labels(
+        task=task.name, state=state or "UNKNOWN"
+    ).observe(time.perf_counter() - started_at)
+
+
+@worker_ready.connect
+def _start_metrics_server(**kwargs):
+    if settings.CELERY_METRICS_PORT:
+        start_worker_metrics_server(settings.CELERY_METRICS_PORT)
+
+
+
+@worker_process_init.connect
+def _start_reference_data_listener(**kwargs):
+    # Threads don't survive the fork, so each pool process subscribes itself
+    from app.services.reference_data_service import reference_data_service
+
+    reference_data_service.start_listener()
+
+
 if __name__ == "__main__":
     celery_app.start()
@@ -82,6 +82,49 @@ class Settings(BaseSettings):
         True  # If False, server can start with at least one working connection
     )
 
+    # Health Checks
+    HEALTH_CHECK_CACHE_TTL_SECONDS: float = 10.0  # Probe results reused for this long
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 5.0  # Per-probe timeout (DB, Supabase)
+
+    # Audit Log Writer (write-behind)
+    AUDIT_QUEUE_MAX_SIZE: int = 10000  # Events buffered before callers flush inline
+    AUDIT_BATCH_SIZE: int = 500  # Max events per multi-row INSERT
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0  # Background flush cadence
+
+    # Pagination
+    ESTIMATED_COUNT_CACHE_TTL_SECONDS: float = 60.0  # Reuse of counts in "estimated" mode
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per keyset page when streaming exports
+
+    # Deadline Status
+    DEADLINE_STATUS_CACHE_TTL_SECONDS: float = 300.0  # Upper bound on per-cycle status reuse
+
+    # Dashboard Stats
+    DASHBOARD_STATS_CACHE_TTL_SECONDS: float = 60.0  # Upper bound on reuse across processes
+
+    # Reference Data (governance areas, barangays, active cycle)
+    REFERENCE_DATA_CACHE_TTL_SECONDS: float = 300.0  # Reload even if no change was announced
+    REFERENCE_DATA_REDIS_RETRY_SECONDS: float = 5.0  # Back-off while Redis is unreachable
+    LOOKUP_MAX_AGE_SECONDS: int = 60  # Browser reuse of lookup responses before revalidating
+
+    # Analytics Dashboard / Reports Cache
+    ANALYTICS_CACHE_TTL_SECONDS: float = 300.0  # Fresh for this long unless a validation lands
+    ANALYTICS_CACHE_STALE_SECONDS: float = 120.0  # Then served stale while one request refreshes
+    ANALYTICS_CACHE_LOCK_SECONDS: float = 30.0  # Lease on the cross-process recompute lock
+    ANALYTICS_CACHE_WAIT_SECONDS: float = 10.0  # Concurrent misses wait this long for the winner
+    ANALYTICS_CACHE_REDIS_RETRY_SECONDS: float = 5.0  # Back-off while Redis is unreachable
+
+    # Calculation Sandbox (what-if replays of draft rules)
+    WHAT_IF_SYNC_MAX_RESPONSES: int = 500  # Larger replays run in a Celery worker
+    WHAT_IF_MAX_RESPONSES: int = 20000  # Hard cap on rows replayed per request
+    WHAT_IF_TIME_BUDGET_SECONDS: float = 5.0  # In-request evaluation budget
+    WHAT_IF_WORKER_TIME_BUDGET_SECONDS: float = 120.0  # Worker evaluation budget
+
+    # Bulk user import
+    USER_IMPORT_MAX_ROWS: int = 5000  # Hard cap on rows per import file
+    USER_IMPORT_SYNC_MAX_ROWS: int = 50  # Larger imports run in a Celery worker
+    USER_IMPORT_HASH_WORKERS: int = 8  # Threads hashing passwords (bcrypt releases the GIL)
+    USER_IMPORT_BATCH_SIZE: int = 500  # Rows per multi-row INSERT
+
     # Email Configuration (for notifications)
     SMTP_TLS: bool = True
     SMTP_PORT: Optional[int] = None
@@ -91,6 +134,22 @@ class Settings(BaseSettings):
     EMAILS_FROM_EMAIL: Optional[str] = None
     EMAILS_FROM_NAME: Optional[str] = None
 
+    # Notification Delivery
+    NOTIFICATION_TRANSPORT: str = "log"  # "log" (debug stand-in, logs messages) or "smtp"
+    NOTIFICATION_BATCH_SIZE: int = 100  # Recipients per delivery task
+    NOTIFICATION_BATCH_RATE_LIMIT: str = "30/m"  # Celery rate limit for delivery tasks (per worker)
+    NOTIFICATION_MAX_ATTEMPTS: int = 5  # Deliveries tried this often before being marked failed
+    NOTIFICATION_RETRY_BASE_SECONDS: int = 60  # First retry delay, doubled on each attempt
+    NOTIFICATION_SEND_LEASE_SECONDS: int = 300  # Claimed ("pending") rows are retried after this
+    NOTIFICATION_PORTAL_URL: str = "http://localhost:3000"  # Link target in notification emails
+    SMTP_POOL_SIZE: int = 2  # Persistent SMTP connections kept per worker process
+    SMTP_POOL_IDLE_SECONDS: float = 60.0  # Idle pooled connections older than this are checked with NOOP before reuse
+
+    # Deadline Reminders (Celery beat)
+    DEADLINE_REMINDER_HOUR_UTC: int = 0  # Daily run (08:00 Asia/Manila)
+    DEADLINE_REMINDER_DAYS_BEFORE: int = 3  # Remind pending barangays this close to a deadline
+    DEADLINE_ESCALATION_DAYS_AFTER: int = 7  # Keep escalating overdue barangays for this long
+
     # File Upload
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
     UPLOAD_FOLDER: str = "uploads"
@@ -99,6 +158,8 @@ class Settings(BaseSettings):
     # Background Tasks
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/0"
+    CELERY_METRICS_PORT: Optional[int] = None  # Worker /metrics port (disabled if unset)
+    METRICS_TOKEN: Optional[str] = None  # Bearer token for the API's /metrics (disabled if unset)
 
     # Gemini AI Configuration
     GEMINI_API_KEY: Optional[str] = None
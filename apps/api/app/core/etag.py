@@ -0,0 +1,54 @@
+# 🏷️ ETags
+# Conditional GET support: strong ETags over JSON payloads and 304 responses
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Responses are user-specific, so only the browser may cache them, and it
+# must revalidate (cheaply, via If-None-Match) before reusing one
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def compute_etag(payload: Any) -> str:
+    """Strong ETag of a JSON-serializable payload (stable across key order)."""
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def conditional_json_response(
+    request: Request,
+    payload: Any,
+    cache_control: str = PRIVATE_REVALIDATE,
+    etag: Optional[str] = None,
+) -> Response:
+    """
+    Return ``payload`` as JSON with an ETag, or an empty 304 if the client has it.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        payload: JSON-serializable response body
+        cache_control: Cache-Control header sent with either response
+        etag: Precomputed ETag of ``payload`` (computed here if omitted)
+    """
+    if etag is None:
+        payload = jsonable_encoder(payload)
+        etag = compute_etag(payload)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=jsonable_encoder(payload), headers=headers)
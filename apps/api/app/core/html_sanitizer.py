@@ -0,0 +1,151 @@
+# 🧼 HTML Sanitizer
+# Single-pass, allowlist-based sanitizing of user-supplied text and rich text
+
+import html
+import re
+from enum import Enum
+from typing import FrozenSet, List, Optional
+
+# Elements removed together with their content
+DANGEROUS_TAGS: FrozenSet[str] = frozenset(
+    {"script", "iframe", "object", "embed", "applet", "link", "style", "meta", "base", "form"}
+)
+
+# Formatting elements kept in rich text
+RICH_TEXT_TAGS: FrozenSet[str] = frozenset(
+    {"b", "i", "u", "strong", "em", "p", "br", "ul", "ol", "li", "h1", "h2", "h3", "h4", "h5", "h6"}
+)
+
+# Attribute values that execute or embed content when followed
+DANGEROUS_SCHEMES = ("javascript:", "vbscript:", "data:")
+
+# The only pattern run over the whole input. A token is "<...>" without a
+# nested "<": either a tag with a name, or any other markup (comments,
+# declarations, processing instructions, malformed tags). Inside a tag,
+# quoted attribute values are consumed whole, as browsers do, so a ">" in
+# a value doesn't end the tag early and leak the rest of it as text.
+_TOKEN = re.compile(
+    r"<(?:(?P<close>/)?(?P<name>[A-Za-z][A-Za-z0-9]*)"
+    r"""(?P<attrs>[\s/](?:"[^"]*"|'[^']*'|[^<>"'])*)?|[^<>]+)>"""
+)
+
+# Attributes inside a tag token (only run over the tags that are kept)
+_ATTRIBUTE = re.compile(
+    r"""(?P<name>[^\s"'=<>/]+)(?:\s*=\s*(?P<value>"[^"]*"|'[^']*'|[^\s"'>]*))?"""
+)
+
+# Characters browsers ignore inside URL schemes ("java\tscript:")
+_URL_NOISE = re.compile(r"[\x00-\x20]+")
+
+
+class Mode(str, Enum):
+    """What a sanitizer run keeps."""
+
+    TEXT = "text"  # No markup: tags removed, text HTML-escaped
+    FORMATTING = "formatting"  # Any tag except dangerous elements, without dangerous attributes
+    RICH_TEXT = "rich_text"  # Only RICH_TEXT_TAGS, without dangerous attributes
+
+
+def _dangerous_attribute(name: str, value: Optional[str]) -> bool:
+    if name.lower().startswith("on"):
+        return True
+    if value is None:
+        return False
+    if value[:1] in ("'", '"'):
+        value = value[1:-1]
+    value = _URL_NOISE.sub("", html.unescape(value)).lower()
+    return value.startswith(DANGEROUS_SCHEMES)
+
+
+def _clean_attributes(token: str, start: int, attrs: str) -> str:
+    """Return the tag token without dangerous attributes (verbatim if none are)."""
+    kept: List[str] = []
+    last = 0
+    for match in _ATTRIBUTE.finditer(attrs):
+        if _dangerous_attribute(match.group("name"), match.group("value")):
+            kept.append(attrs[last : match.start()])
+            last = match.end()
+    if not kept:
+        return token
+    kept.append(attrs[last:])
+    return token[:start] + "".join(kept) + ">"
+
+
+def _strip_edges(parts: List[Optional[str]]) -> str:
+    """
+    Join output parts and strip surrounding whitespace.
+
+    A None part is a tag dropped only by the rich-text allowlist; it still
+    bounds the strip, exactly as when stripping happened before the
+    allowlist was applied.
+    """
+    for step, strip in ((1, str.lstrip), (-1, str.rstrip)):
+        index = 0 if step == 1 else len(parts) - 1
+        while 0 <= index < len(parts) and parts[index] is not None:
+            parts[index] = strip(parts[index])
+            if parts[index]:
+                break
+            index += step
+    return "".join(part for part in parts if part)
+
+
+def sanitize(text: str, mode: Mode) -> str:
+    """
+    Sanitize ``text`` in one left-to-right scan.
+
+    The scan alternates between text runs and markup tokens found by one
+    precompiled pattern. A dangerous element switches the scanner into a
+    skipping state until its closing tag (or the end of the input), so its
+    content is dropped without backtracking. Kept tags only have their
+    attributes inspected; everything else is decided from the tag name.
+
+    Text runs are HTML-escaped in TEXT mode; in the other modes only a
+    stray "<" is escaped, so removed markup can never splice surrounding
+    text into a new tag.
+    """
+    parts: List[Optional[str]] = []
+    skipping: Optional[str] = None
+    pos = 0
+    search = _TOKEN.search
+
+    while True:
+        match = search(text, pos)
+        if match is None:
+            if skipping is None:
+                tail = text[pos:]
+                parts.append(html.escape(tail) if mode is Mode.TEXT else tail.replace("<", "&lt;"))
+            break
+
+        close, name, attrs = match.group("close", "name", "attrs")
+        if name:
+            name = name.lower()
+
+        if skipping is not None:
+            if close and name == skipping:
+                skipping = None
+            pos = match.end()
+            continue
+
+        run = text[pos : match.start()]
+        if run:
+            parts.append(html.escape(run) if mode is Mode.TEXT else run.replace("<", "&lt;"))
+        pos = match.end()
+
+        if name in DANGEROUS_TAGS:
+            if not close and not (attrs or "").endswith("/"):
+                skipping = name
+            continue
+
+        if name is None or mode is Mode.TEXT:
+            continue
+
+        if mode is Mode.RICH_TEXT and name not in RICH_TEXT_TAGS:
+            parts.append(None)
+            continue
+
+        token = match.group(0)
+        if attrs:
+            token = _clean_attributes(token, match.start("attrs") - match.start(), attrs)
+        parts.append(token)
+
+    return _strip_edges(parts)
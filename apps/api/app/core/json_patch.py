@@ -0,0 +1,115 @@
+# 🩹 JSON Patch
+# Minimal RFC 6902 diff/apply (add, remove, replace) for JSON documents
+
+import copy
+from typing import Any, Dict, List, Union
+
+JsonPatch = List[Dict[str, Any]]
+_Container = Union[Dict[str, Any], List[Any]]
+
+
+def _escape(token: Union[str, int]) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _same(a: Any, b: Any) -> bool:
+    # JSON distinguishes true/1 and 1/1.0 by type; Python equality doesn't
+    return type(a) is type(b) and a == b
+
+
+def make_patch(source: Any, target: Any, path: str = "") -> JsonPatch:
+    """
+    Compute a patch that turns ``source`` into ``target``.
+
+    Objects are diffed key by key and arrays element by element (trailing
+    elements added or removed), so small edits to large schemas produce
+    small patches. Anything else that differs is replaced wholesale.
+    """
+    if _same(source, target):
+        return []
+
+    if isinstance(source, dict) and isinstance(target, dict):
+        ops: JsonPatch = []
+        for key in source:
+            if key not in target:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in target.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in source:
+                ops.append({"op": "add", "path": child, "value": copy.deepcopy(value)})
+            else:
+                ops.extend(make_patch(source[key], value, child))
+        return ops
+
+    if isinstance(source, list) and isinstance(target, list):
+        ops = []
+        common = min(len(source), len(target))
+        for index in range(common):
+            ops.extend(make_patch(source[index], target[index], f"{path}/{index}"))
+        for index in range(common, len(target)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": copy.deepcopy(target[index])})
+        # Remove from the end so earlier indexes stay valid
+        for index in range(len(source) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        return ops
+
+    return [{"op": "replace", "path": path, "value": copy.deepcopy(target)}]
+
+
+def _resolve_parent(document: Any, path: str) -> tuple[_Container, str]:
+    tokens = [_unescape(token) for token in path.split("/")[1:]]
+    parent = document
+    for token in tokens[:-1]:
+        parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    return parent, tokens[-1]
+
+
+def apply_patch(document: Any, patch: JsonPatch) -> Any:
+    """
+    Apply a patch produced by ``make_patch`` and return the new document.
+
+    The input document is not modified.
+
+    Raises:
+        ValueError: If the patch contains an unsupported operation or a path
+            that doesn't exist in the document
+    """
+    result = copy.deepcopy(document)
+
+    for operation in patch:
+        op, path = operation.get("op"), operation.get("path", "")
+        if op not in ("add", "remove", "replace"):
+            raise ValueError(f"Unsupported JSON patch operation: {op}")
+
+        if path == "":
+            if op == "remove":
+                result = None
+            else:
+                result = copy.deepcopy(operation["value"])
+            continue
+
+        try:
+            parent, token = _resolve_parent(result, path)
+            if isinstance(parent, list):
+                if op == "add":
+                    index = len(parent) if token == "-" else int(token)
+                    parent.insert(index, copy.deepcopy(operation["value"]))
+                elif op == "remove":
+                    del parent[int(token)]
+                else:
+                    parent[int(token)] = copy.deepcopy(operation["value"])
+            else:
+                if op == "remove":
+                    del parent[token]
+                elif op == "replace" and token not in parent:
+                    raise KeyError(token)
+                else:
+                    parent[token] = copy.deepcopy(operation["value"])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Cannot apply JSON patch {op} at '{path}': {e}")
+
+    return result
@@ -0,0 +1,44 @@
+# 💤 Lazy Imports
+# Defer heavy SDK imports (Gemini, Supabase) until first use
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    ``genai = LazyModule("google.generativeai")`` costs nothing at import
+    time; ``genai.configure(...)`` imports the SDK once and forwards to it.
+    Attributes set on the stand-in (e.g. by ``unittest.mock.patch``) shadow
+    the real module's until deleted.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_lazy_name"])
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self.__dict__['_lazy_name']!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a stand-in that imports ``name`` on first attribute access."""
+    return LazyModule(name)
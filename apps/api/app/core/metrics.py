@@ -0,0 +1,344 @@
+# 📈 Prometheus Metrics
+# Metric definitions and collectors exposed on the /metrics endpoint
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Celery queues declared in app.core.celery_app task_routes, plus the default
+# "celery" queue that receives any task without a matching route
+CELERY_QUEUES: Tuple[str, ...] = (
+    "notifications",
+    "classification",
+    "intelligence",
+    "celery",
+)
+
+# Label used for requests that did not match any route, so scanners hitting
+# random paths cannot blow up the series count.
+UNMATCHED_ROUTE = "unmatched"
+
+# Latency buckets tuned for API calls: most requests are 10-500ms, the
+# analytics and export endpoints can take several seconds.
+REQUEST_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+# ============================================================================
+# HTTP
+# ============================================================================
+
+http_requests_total = Counter(
+    "vantage_http_requests_total",
+    "HTTP requests processed, by route template and status code",
+    ["method", "route", "status"],
+)
+
+http_request_duration_seconds = Histogram(
+    "vantage_http_request_duration_seconds",
+    "HTTP request latency, by route template and status code",
+    ["method", "route", "status"],
+    buckets=REQUEST_LATENCY_BUCKETS,
+)
+
+
+# ============================================================================
+# Database connection pool
+# ============================================================================
+
+db_pool_checkout_seconds = Histogram(
+    "vantage_db_pool_checkout_seconds",
+    "Time spent waiting to check a connection out of the pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - start)
+
+
+class DatabasePoolCollector(Collector):
+    """Reports in-use / idle / overflow connections of the application engine."""
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        from app.db.base import engine
+
+        pool = getattr(engine, "pool", None)
+        if pool is None or not hasattr(pool, "checkedout"):
+            return
+
+        gauge = GaugeMetricFamily(
+            "vantage_db_pool_connections",
+            "Database connections in the application pool, by state",
+            labels=["state"],
+        )
+        gauge.add_metric(["in_use"], pool.checkedout())
+        gauge.add_metric(["idle"], pool.checkedin())
+        gauge.add_metric(["overflow"], max(pool.overflow(), 0))
+        yield gauge
+
+        size = GaugeMetricFamily(
+            "vantage_db_pool_size", "Configured size of the application pool"
+        )
+        size.add_metric([], pool.size())
+        yield size
+
+
+# ============================================================================
+# Celery
+# ============================================================================
+
+celery_task_duration_seconds = Histogram(
+    "vantage_celery_task_duration_seconds",
+    "Celery task run time, by task name and final state",
+    ["task", "state"],
+    buckets=(0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 1800.0),
+)
+
+
+class CeleryQueueCollector(Collector):
+    """
+    Reports pending messages per Celery queue.
+
+    Only Redis brokers are supported: each queue is a Redis list, so the depth
+    is a single LLEN. A broker outage yields no samples instead of failing the
+    whole scrape.
+    """
+
+    def __init__(self, queues: Tuple[str, ...] = CELERY_QUEUES):
+        from app.core.redis_client import RedisConnection
+
+        self.queues = queues
+        self._redis = RedisConnection("Celery queue depth")
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        client = self._redis.client()
+        if client is None:
+            return
+
+        try:
+            with client.pipeline(transaction=False) as pipe:
+                for queue in self.queues:
+                    pipe.llen(queue)
+                depths = pipe.execute()
+        except Exception as e:
+            self._redis.failed(e)
+            return
+
+        gauge = GaugeMetricFamily(
+            "vantage_celery_queue_depth",
+            "Messages waiting in each Celery queue",
+            labels=["queue"],
+        )
+        for queue, depth in zip(self.queues, depths):
+            gauge.add_metric([queue], depth)
+        yield gauge
+
+
+# ============================================================================
+# Calculation engine
+# ============================================================================
+
+calculation_evaluations_total = Counter(
+    "vantage_calculation_evaluations_total",
+    "Calculation schema evaluations, by outcome (pass, fail, conditional or error)",
+    ["outcome"],
+)
+
+calculation_duration_seconds = Histogram(
+    "vantage_calculation_duration_seconds",
+    "Time to evaluate one calculation schema",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5),
+)
+
+
+# ============================================================================
+# Storage
+# ============================================================================
+
+storage_uploads_total = Counter(
+    "vantage_storage_uploads_total",
+    "Uploads to Supabase Storage, by bucket and outcome",
+    ["bucket", "outcome"],
+)
+
+storage_upload_bytes_total = Counter(
+    "vantage_storage_upload_bytes_total",
+    "Bytes successfully uploaded to Supabase Storage, by bucket",
+    ["bucket"],
+)
+
+storage_upload_duration_seconds = Histogram(
+    "vantage_storage_upload_duration_seconds",
+    "Time to upload one file to Supabase Storage, by bucket",
+    ["bucket"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+@contextmanager
+def track_storage_upload(bucket: str, size_bytes: int) -> Iterator[None]:
+    """Time an upload and count it (and its bytes, on success) for ``bucket``."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        storage_uploads_total.labels(bucket=bucket, outcome="error").inc()
+        raise
+    finally:
+        storage_upload_duration_seconds.labels(bucket=bucket).observe(
+            time.perf_counter() - start
+        )
+    storage_uploads_total.labels(bucket=bucket, outcome="success").inc()
+    storage_upload_bytes_total.labels(bucket=bucket).inc(size_bytes)
+
+
+# ============================================================================
+# Caches
+# ============================================================================
+
+cache_requests_total = Counter(
+    "vantage_cache_requests_total",
+    "Cache lookups, by cache name and result (hit or miss)",
+    ["cache", "result"],
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count one lookup against ``cache``; hit ratio = hit / (hit + miss)."""
+    cache_requests_total.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+# ============================================================================
+# Audit log writer
+# ============================================================================
+
+audit_events_total = Counter(
+    "vantage_audit_events_total",
+    "Audit events by outcome (enqueued, written, retried or dropped)",
+    ["outcome"],
+)
+
+audit_queue_depth = Gauge(
+    "vantage_audit_queue_depth",
+    "Audit events waiting to be written",
+    multiprocess_mode="livesum",
+)
+
+audit_backpressure_total = Counter(
+    "vantage_audit_backpressure_total",
+    "Times a request found the audit queue full and flushed it inline",
+)
+
+audit_flush_duration_seconds = Histogram(
+    "vantage_audit_flush_duration_seconds",
+    "Time to write one batch of audit events",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+audit_flush_batch_size = Histogram(
+    "vantage_audit_flush_batch_size",
+    "Audit events written per batch",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+
+# ============================================================================
+# Notifications
+# ============================================================================
+
+notifications_total = Counter(
+    "vantage_notifications_total",
+    "Notification deliveries by outcome (sent, retrying, failed or skipped)",
+    ["kind", "outcome"],
+)
+
+smtp_connections_opened_total = Counter(
+    "vantage_smtp_connections_opened_total",
+    "SMTP connections opened by the per-process connection pool",
+)
+
+
+# ============================================================================
+# Exposition
+# ============================================================================
+
+_collectors_registered = False
+
+
+def register_collectors() -> None:
+    """Register the scrape-time collectors once per process."""
+    global _collectors_registered
+    if _collectors_registered:
+        return
+    REGISTRY.register(DatabasePoolCollector())
+    REGISTRY.register(CeleryQueueCollector())
+    _collectors_registered = True
+
+
+def render_latest(registry=REGISTRY) -> Tuple[bytes, str]:
+    """Return the text exposition payload and its content type."""
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def start_worker_metrics_server(port: int) -> None:
+    """
+    Serve worker-side metrics (task durations) on ``port``.
+
+    Prefork children record into their own memory, so when
+    PROMETHEUS_MULTIPROC_DIR is set the samples are aggregated from the
+    shared directory; otherwise the process registry is served as-is
+    (correct for the solo and threads pools).
+    """
+    import os
+
+    from prometheus_client import CollectorRegistry, start_http_server
+
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    start_http_server(port, registry=registry)
+    logger.info(f"📈 Worker metrics available on :{port}/metrics")
+
+
+def route_template(scope: dict) -> Optional[str]:
+    """Path template of the route that handled the request (e.g. ``/api/v1/users/{user_id}``)."""
+    route = scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if template is None:
+        return None
+
+    # Depending on the FastAPI version, routes of an included router carry
+    # either the full path or only the router-local one. Router prefixes
+    # are static, so the missing leading segments come from the request path.
+    path_parts = scope.get("path", "").split("/")
+    prefix_len = len(path_parts) - len(template.split("/")) + 1
+    if prefix_len <= 1:
+        return template
+    return "/".join(path_parts[:prefix_len]) + template
@@ -0,0 +1,229 @@
+# 📑 Pagination
+# Keyset (cursor) pagination and cheap row counts for large list endpoints
+
+import base64
+import binascii
+import json
+import threading
+import time
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import text, tuple_
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+
+# Maximum number of cached counts kept per process
+COUNT_CACHE_SIZE = 1024
+
+
+class CountMode(str, Enum):
+    """How a list endpoint computes its total."""
+
+    EXACT = "exact"  # COUNT(*) over the filtered query
+    ESTIMATED = "estimated"  # Planner statistics or a recently cached count
+    NONE = "none"  # Skip the count entirely
+
+
+# ============================================================================
+# Cursors
+# ============================================================================
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or doesn't match the
+            endpoint's sort key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("wrong number of values")
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+# ============================================================================
+# Keyset pagination
+# ============================================================================
+
+
+def apply_keyset(
+    query: Query, columns: Sequence[Any], cursor: Optional[str], descending: bool = False
+) -> Query:
+    """
+    Order a query by ``columns`` and restrict it to rows after ``cursor``.
+
+    The last column must be unique (normally the primary key) so the order
+    is total. The comparison is a single row-value predicate, which a
+    composite index on the same columns serves directly, so deep pages cost
+    the same as the first one.
+    """
+    if descending:
+        query = query.order_by(*[column.desc() for column in columns])
+    else:
+        query = query.order_by(*columns)
+
+    if cursor:
+        values = decode_cursor(cursor, len(columns))
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*values) if descending else key > tuple_(*values))
+    return query
+
+
+def keyset_page(
+    query: Query,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of a keyset-paginated query.
+
+    Returns:
+        tuple: (items, next_cursor); next_cursor is None on the last page
+    """
+    rows = apply_keyset(query, columns, cursor, descending).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    items = rows[:limit]
+    last = items[-1]
+    return items, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+def iter_keyset(
+    db: Session,
+    query: Query,
+    columns: Sequence[Any],
+    batch_size: int = 1000,
+    descending: bool = False,
+) -> Iterator[Any]:
+    """
+    Iterate over every row of a query, one keyset page at a time.
+
+    Rows are expunged from the session after each page so memory stays
+    bounded by ``batch_size`` however many rows are streamed.
+    """
+    cursor: Optional[str] = None
+    while True:
+        items, cursor = keyset_page(query, columns, cursor, batch_size, descending)
+        yield from items
+        for item in items:
+            db.expunge(item)
+        if cursor is None:
+            return
+
+
+# ============================================================================
+# Counts
+# ============================================================================
+
+_count_cache: "dict[Tuple[str, str], Tuple[float, int]]" = {}
+_count_cache_lock = threading.Lock()
+
+
+def _cached_count(query: Query) -> int:
+    compiled = query.statement.compile()
+    key = (str(compiled), repr(sorted(compiled.params.items(), key=lambda item: item[0])))
+    now = time.monotonic()
+
+    with _count_cache_lock:
+        entry = _count_cache.get(key)
+        if entry is not None and now - entry[0] < settings.ESTIMATED_COUNT_CACHE_TTL_SECONDS:
+            return entry[1]
+
+    total = query.count()
+    with _count_cache_lock:
+        if len(_count_cache) >= COUNT_CACHE_SIZE:
+            _count_cache.clear()
+        _count_cache[key] = (now, total)
+    return total
+
+
+def _planner_estimate(db: Session, table_name: str) -> Optional[int]:
+    estimate = db.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name},
+    ).scalar()
+    # reltuples is -1 (or 0 on older servers) until the table is first analyzed
+    if estimate is None or estimate <= 0:
+        return None
+    return int(estimate)
+
+
+def count_rows(
+    db: Session,
+    query: Query,
+    mode: CountMode,
+    table_name: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Count the rows of a (filtered, unordered) query according to ``mode``.
+
+    In estimated mode an unfiltered query on PostgreSQL reads the planner's
+    row estimate for ``table_name`` from pg_class; anything else uses an
+    exact count cached for ESTIMATED_COUNT_CACHE_TTL_SECONDS.
+
+    Args:
+        db: Database session
+        query: Query to count
+        mode: How to count
+        table_name: Table to estimate from, only when the query has no filters
+
+    Returns:
+        The total, or None in CountMode.NONE
+    """
+    if mode == CountMode.NONE:
+        return None
+    if mode == CountMode.EXACT:
+        return query.count()
+
+    if table_name and db.get_bind().dialect.name == "postgresql":
+        estimate = _planner_estimate(db, table_name)
+        if estimate is not None:
+            return estimate
+    return _cached_count(query)
+
+
+def clear_count_cache() -> None:
+    """Drop all cached counts (mainly for tests)."""
+    with _count_cache_lock:
+        _count_cache.clear()
@@ -0,0 +1,92 @@
+# 🔌 Shared Redis Connection
+# Lazily created client for the broker's Redis, and a thread announcing changes through it
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisConnection:
+    """
+    Redis client for short, optional calls (cache reads, version bumps, metrics).
+
+    The client is created on first use against CELERY_BROKER_URL with 0.5s
+    connect and read timeouts. ``client()`` returns None when the broker
+    isn't Redis, or for ``retry_seconds`` after a caller reported a failure
+    with ``failed()``, so callers fall back instead of timing out on every
+    call while Redis is away.
+    """
+
+    def __init__(self, purpose: str, retry_seconds: float = 0.0):
+        self.purpose = purpose
+        self.retry_seconds = retry_seconds
+        self._client = None
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def configured(self) -> bool:
+        """Whether the broker (and so the shared Redis) is Redis at all."""
+        return settings.CELERY_BROKER_URL.startswith(("redis://", "rediss://"))
+
+    def client(self) -> Optional[Any]:
+        """The shared client, or None if Redis isn't configured or is backing off."""
+        if not self.configured:
+            return None
+        if time.monotonic() < self._retry_at:
+            return None
+        if self._client is None:
+            import redis
+
+            with self._lock:
+                if self._client is None:
+                    self._client = redis.Redis.from_url(
+                        settings.CELERY_BROKER_URL,
+                        socket_connect_timeout=0.5,
+                        socket_timeout=0.5,
+                    )
+        return self._client
+
+    def failed(self, error: Exception) -> None:
+        """Record a failed call: skip Redis for ``retry_seconds``."""
+        self._retry_at = time.monotonic() + self.retry_seconds
+        logger.debug(f"Redis unavailable for {self.purpose}: {str(error)}")
+
+
+class BackgroundAnnouncer:
+    """
+    Runs ``announce`` on a daemon thread after each ``request()``.
+
+    Lets commit hooks share a change through Redis without waiting on it.
+    Requests made while an announcement is running are covered by one more
+    run, not one each. The thread starts on the first request.
+    """
+
+    def __init__(self, name: str, announce: Callable[[], None]):
+        self.name = name
+        self._announce = announce
+        self._pending = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def request(self) -> None:
+        """Schedule an announcement and return immediately."""
+        self._pending.set()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            self._pending.clear()
+            try:
+                self._announce()
+            except Exception as e:
+                logger.warning(f"{self.name} failed: {str(e)}")
@@ -1,13 +1,14 @@
 # 🔐 Security Functions
 # Password hashing, JWT token creation/verification, and security utilities
 
-import html
-import re
+import hashlib
+import json
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from app.core.config import settings
-from jose import JWTError, jwt  # type: ignore
+from app.core.html_sanitizer import Mode, sanitize
+from jose import JWTError, jwe, jwt  # type: ignore
 from passlib.context import CryptContext  # type: ignore
 
 # Password hashing context
@@ -157,6 +158,41 @@ def generate_password_reset_token(email: str) -> str:
     return encoded_jwt
 
 
+def encrypt_payload(data: Any) -> str:
+    """
+    Encrypt JSON-serialisable data for a Celery task argument.
+
+    Task arguments sit in the broker and result backend in the clear, so
+    anything secret (e.g. imported passwords) is passed encrypted with a
+    key derived from SECRET_KEY; workers need the same SECRET_KEY.
+
+    Args:
+        data: JSON-serialisable data
+
+    Returns:
+        str: Compact JWE token (dir / A256GCM)
+    """
+    token = jwe.encrypt(
+        json.dumps(data), _payload_key(), algorithm="dir", encryption="A256GCM"
+    )
+    return token.decode("ascii")
+
+
+def decrypt_payload(token: str) -> Any:
+    """
+    Decrypt data encrypted with encrypt_payload.
+
+    Raises:
+        jose.JWEError: If the token is malformed or was encrypted with
+            another SECRET_KEY
+    """
+    return json.loads(jwe.decrypt(token, _payload_key()))
+
+
+def _payload_key() -> bytes:
+    return hashlib.sha256(f"task-payload:{settings.SECRET_KEY}".encode()).digest()
+
+
 # ============================================================================
 # HTML Sanitization & XSS Prevention
 # ============================================================================
@@ -167,7 +203,8 @@ def sanitize_html(text: Optional[str], allow_basic_formatting: bool = False) ->
     Sanitize HTML content to prevent XSS attacks.
 
     This function removes dangerous HTML tags and attributes while optionally
-    preserving basic formatting tags like <b>, <i>, <p>, <br>.
+    preserving basic formatting tags like <b>, <i>, <p>, <br>. The input is
+    scanned once (see app.core.html_sanitizer).
 
     Args:
         text: The text content to sanitize
@@ -190,45 +227,7 @@ def sanitize_html(text: Optional[str], allow_basic_formatting: bool = False) ->
     if not isinstance(text, str):
         return str(text)
 
-    # List of dangerous tags to always remove
-    dangerous_tags = [
-        'script', 'iframe', 'object', 'embed', 'applet',
-        'link', 'style', 'meta', 'base', 'form',
-    ]
-
-    # List of dangerous attributes to remove
-    dangerous_attrs = [
-        'onload', 'onerror', 'onclick', 'onmouseover', 'onmouseout',
-        'onkeydown', 'onkeyup', 'onkeypress', 'onfocus', 'onblur',
-        'onchange', 'onsubmit', 'onreset', 'onselect', 'onabort',
-        'javascript:', 'data:', 'vbscript:',
-    ]
-
-    # Remove dangerous tags and their content
-    for tag in dangerous_tags:
-        # Remove opening tag, content, and closing tag
-        pattern = f'<{tag}[^>]*>.*?</{tag}>'
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-        # Remove self-closing tags
-        pattern = f'<{tag}[^>]*/>'
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-    # Remove dangerous attributes from remaining tags
-    for attr in dangerous_attrs:
-        # Remove attribute="value" or attribute='value' or attribute=value
-        pattern = f'{attr}\\s*=\\s*["\']?[^"\'\\s>]*["\']?'
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-    # If basic formatting is not allowed, strip all remaining HTML tags
-    if not allow_basic_formatting:
-        text = re.sub('<[^>]+>', '', text)
-
-    # Escape any remaining special HTML characters to prevent injection
-    # This converts < > & " ' to their HTML entity equivalents
-    if not allow_basic_formatting:
-        text = html.escape(text)
-
-    return text.strip()
+    return sanitize(text, Mode.FORMATTING if allow_basic_formatting else Mode.TEXT)
 
 
 def sanitize_text_input(text: Optional[str], max_length: Optional[int] = None) -> Optional[str]:
@@ -271,25 +270,7 @@ def sanitize_rich_text(text: Optional[str]) -> Optional[str]:
     if text is None:
         return None
 
-    # First pass: remove dangerous content
-    sanitized = sanitize_html(text, allow_basic_formatting=True)
-
-    # Whitelist of allowed tags for rich text
-    allowed_tags = {'b', 'i', 'u', 'strong', 'em', 'p', 'br', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
-
-    # Remove tags not in whitelist
-    def replace_tag(match):
-        tag = match.group(1).lower()
-        if tag.startswith('/'):
-            tag = tag[1:]  # Remove slash for closing tags
-        if tag in allowed_tags:
-            return match.group(0)  # Keep allowed tags
-        return ''  # Remove disallowed tags
-
-    # Pattern to match HTML tags
-    pattern = r'<(/?\w+)(?:\s[^>]*)?>'
-    if sanitized is None:
-        return None
-    sanitized = re.sub(pattern, replace_tag, sanitized, flags=re.IGNORECASE)
+    if not isinstance(text, str):
+        return str(text)
 
-    return sanitized
+    return sanitize(text, Mode.RICH_TEXT)
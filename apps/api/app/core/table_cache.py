@@ -0,0 +1,114 @@
+# 🗃️ Table Caches
+# In-process result caches invalidated by commits that write the tables they read
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Iterable, List, Set, Tuple
+
+from app.core.metrics import record_cache_lookup
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# session.info key: names of tables written in the current transaction
+_WRITTEN_TABLES = "table_cache_written_tables"
+
+# (tables, callback) pairs notified after commits that write any of the tables
+_subscribers: List[Tuple[FrozenSet[str], Callable[[Set[str]], None]]] = []
+
+
+def subscribe(tables: Iterable[str], callback: Callable[[Set[str]], None]) -> None:
+    """Call ``callback(written_tables)`` after every commit that writes one of ``tables``."""
+    _subscribers.append((frozenset(tables), callback))
+
+
+class TableCache:
+    """
+    Computed results cached until a commit writes one of the tables they depend on.
+
+    Any session commit that inserted, updated or deleted rows in one of
+    ``tables`` (by flushing ORM objects or by running a DML statement
+    through Session.execute) invalidates every entry. Commits made by
+    other processes aren't seen, so entries also expire after
+    ``ttl_seconds``.
+    """
+
+    def __init__(self, name: str, tables: Iterable[str], ttl_seconds: float):
+        self.name = name
+        self.tables = frozenset(tables)
+        self.ttl_seconds = ttl_seconds
+        # key -> (generation, computed_at, value)
+        self._entries: Dict[Hashable, Tuple[int, float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        subscribe(self.tables, lambda written: self.invalidate())
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return a copy of the cached value for ``key``, computing it on a miss.
+
+        A value computed while the cache was invalidated is returned but not
+        stored, so a slow computation can't cache pre-commit data.
+        """
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.get(key)
+        hit = (
+            entry is not None
+            and entry[0] == generation
+            and time.monotonic() - entry[1] < self.ttl_seconds
+        )
+        record_cache_lookup(self.name, hit=hit)
+        if hit:
+            return copy.deepcopy(entry[2])
+
+        value = compute()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (generation, time.monotonic(), value)
+        return copy.deepcopy(value)
+
+    def invalidate(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+def invalidate_tables(tables: Set[str]) -> None:
+    """Invalidate every cache (and notify every subscriber) that depends on one of ``tables``."""
+    for dependencies, callback in _subscribers:
+        if dependencies & tables:
+            callback(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_tables(session: Session, flush_context) -> None:
+    """Remember which tables this transaction wrote through the unit of work."""
+    objects = set(session.new) | set(session.dirty) | set(session.deleted)
+    if objects:
+        written = session.info.setdefault(_WRITTEN_TABLES, set())
+        written.update(type(obj).__table__.name for obj in objects)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_statement_tables(state: ORMExecuteState) -> None:
+    """Remember the target table of bulk INSERT / UPDATE / DELETE statements."""
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        name = getattr(table, "name", None)
+        if name:
+            state.session.info.setdefault(_WRITTEN_TABLES, set()).add(name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_tables(session: Session) -> None:
+    """Invalidate dependent caches once the writes are visible to other sessions."""
+    written = session.info.pop(_WRITTEN_TABLES, None)
+    if written:
+        invalidate_tables(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_tables(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES, None)
@@ -1,43 +1,71 @@
 # 🗄️ Database Base Configuration
 # Supabase client, SQLAlchemy engine, session management, and base models
 
+import asyncio
 import logging
-from typing import Any, Dict, Generator
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional
 
 from app.core.config import settings
+from app.core.metrics import InstrumentedQueuePool
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
-from supabase import Client, create_client
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Supabase client for real-time features, auth, and storage
-# Initialize only if credentials are provided
-supabase: Client | None = None
-try:
-    if settings.SUPABASE_URL and settings.SUPABASE_ANON_KEY:
-        supabase = create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
-    else:
-        logger.warning("Supabase client not configured (missing URL or ANON_KEY)")
-except Exception as e:
-    logger.error(f"Failed to initialize Supabase client: {str(e)}")
-    supabase = None
-
-# Admin Supabase client for server-side operations
-supabase_admin: Client | None = None
-try:
-    if settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY:
-        supabase_admin = create_client(
-            settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY
+# Supabase clients are built on first use and shared by the whole process:
+# importing the SDK alone costs most of a second, and Celery workers that
+# never touch storage or auth should not pay for it. `supabase` and
+# `supabase_admin` stay importable through the module __getattr__ below.
+_supabase_clients: Dict[str, Optional["Client"]] = {}
+_supabase_clients_lock = threading.Lock()
+
+
+def _create_supabase_client(kind: str) -> Optional["Client"]:
+    """Build the anon ("anon") or service-role ("admin") client, or None if unavailable."""
+    if kind == "admin":
+        key, label, missing = (
+            settings.SUPABASE_SERVICE_ROLE_KEY,
+            "Supabase admin client",
+            "SERVICE_ROLE_KEY",
         )
     else:
-        logger.warning(
-            "Supabase admin client not configured (missing URL or SERVICE_ROLE_KEY)"
-        )
-except Exception as e:
-    logger.error(f"Failed to initialize Supabase admin client: {str(e)}")
-    supabase_admin = None
+        key, label, missing = settings.SUPABASE_ANON_KEY, "Supabase client", "ANON_KEY"
+
+    if not (settings.SUPABASE_URL and key):
+        logger.warning(f"{label} not configured (missing URL or {missing})")
+        return None
+
+    try:
+        from supabase import create_client
+
+        return create_client(settings.SUPABASE_URL, key)
+    except Exception as e:
+        logger.error(f"Failed to initialize {label}: {str(e)}")
+        return None
+
+
+def _shared_supabase_client(kind: str) -> Optional["Client"]:
+    """Return the process-wide client of ``kind``, creating it on first use."""
+    if kind not in _supabase_clients:
+        with _supabase_clients_lock:
+            if kind not in _supabase_clients:
+                _supabase_clients[kind] = _create_supabase_client(kind)
+    return _supabase_clients[kind]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazily resolve the legacy module-level client names
+    if name == "supabase":
+        return _shared_supabase_client("anon")
+    if name == "supabase_admin":
+        return _shared_supabase_client("admin")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # SQLAlchemy engine for direct database operations
 engine = None
@@ -48,6 +76,7 @@ if settings.DATABASE_URL:
     engine = create_engine(
         settings.DATABASE_URL,
         # Connection pool settings optimized for Supabase
+        poolclass=InstrumentedQueuePool,
         pool_pre_ping=True,
         pool_recycle=300,
         pool_size=10,
@@ -86,7 +115,7 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def get_supabase() -> Client:
+def get_supabase() -> "Client":
     """
     Get Supabase client for real-time operations, auth, and storage.
 
@@ -96,14 +125,15 @@ def get_supabase() -> Client:
     Raises:
         RuntimeError: If Supabase client is not configured
     """
-    if supabase is None:
+    client = _shared_supabase_client("anon")
+    if client is None:
         raise RuntimeError(
             "Supabase client not configured. Please set SUPABASE_URL and SUPABASE_ANON_KEY."
         )
-    return supabase
+    return client
 
 
-def get_supabase_admin() -> Client:
+def get_supabase_admin() -> "Client":
     """
     Get Supabase admin client for server-side operations.
 
@@ -113,24 +143,20 @@ def get_supabase_admin() -> Client:
     Raises:
         RuntimeError: If service role key is not configured
     """
-    if not supabase_admin:
+    client = _shared_supabase_client("admin")
+    if not client:
         raise RuntimeError(
             "Supabase admin client not configured. Please set SUPABASE_SERVICE_ROLE_KEY."
         )
 
-    return supabase_admin
+    return client
 
 
 # 🔍 Database Connectivity Checks
 
 
-async def check_database_connection() -> Dict[str, Any]:
-    """
-    Check SQLAlchemy database connection health.
-
-    Returns:
-        Dict containing connection status and details
-    """
+def _probe_database() -> Dict[str, Any]:
+    """Blocking SELECT 1 against the engine; run in a worker thread."""
     if not engine:
         return {
             "connected": False,
@@ -166,13 +192,9 @@ async def check_database_connection() -> Dict[str, Any]:
         }
 
 
-async def check_supabase_connection() -> Dict[str, Any]:
-    """
-    Check Supabase client connection health.
-
-    Returns:
-        Dict containing connection status and details
-    """
+def _probe_supabase() -> Dict[str, Any]:
+    """Blocking Supabase auth round-trip; run in a worker thread."""
+    supabase = _shared_supabase_client("anon")
     if supabase is None:
         return {
             "connected": False,
@@ -201,15 +223,56 @@ async def check_supabase_connection() -> Dict[str, Any]:
         }
 
 
+async def _run_probe(probe, name: str) -> Dict[str, Any]:
+    """
+    Run a blocking probe in a worker thread so it never stalls the event loop.
+
+    A probe that exceeds HEALTH_CHECK_TIMEOUT_SECONDS is reported as failed;
+    its thread is left to finish on its own.
+    """
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(probe), timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"{name} connection check timed out")
+        return {
+            "connected": False,
+            "error": f"{name} connection check timed out",
+            "details": f"No response within {settings.HEALTH_CHECK_TIMEOUT_SECONDS}s",
+        }
+
+
+async def check_database_connection() -> Dict[str, Any]:
+    """
+    Check SQLAlchemy database connection health.
+
+    Returns:
+        Dict containing connection status and details
+    """
+    return await _run_probe(_probe_database, "Database")
+
+
+async def check_supabase_connection() -> Dict[str, Any]:
+    """
+    Check Supabase client connection health.
+
+    Returns:
+        Dict containing connection status and details
+    """
+    return await _run_probe(_probe_supabase, "Supabase")
+
+
 async def check_all_connections() -> Dict[str, Any]:
     """
-    Check all database connections (SQLAlchemy + Supabase).
+    Check all database connections (SQLAlchemy + Supabase) concurrently.
 
     Returns:
         Dict containing overall status and individual connection details
     """
-    db_check = await check_database_connection()
-    supabase_check = await check_supabase_connection()
+    db_check, supabase_check = await asyncio.gather(
+        check_database_connection(), check_supabase_connection()
+    )
 
     overall_healthy = db_check.get("connected", False) and supabase_check.get(
         "connected", False
@@ -4,10 +4,19 @@
 # Import Base for migrations and table creation
 from ..base import Base
 from .admin import AuditLog
-from .assessment import MOV, MOVFile, Assessment, AssessmentResponse, FeedbackComment
+from .assessment import (
+    MOV,
+    MOVFile,
+    Assessment,
+    AssessmentAreaStatus,
+    AssessmentResponse,
+    FeedbackComment,
+)
 from .barangay import Barangay
 from .bbi import BBI, BBIResult
 from .governance_area import GovernanceArea, Indicator
+from .notification import NotificationDelivery
+from .system import SeedVersion
 from .user import User
 
 __all__ = [
@@ -18,10 +27,13 @@ __all__ = [
     "Indicator",
     "Assessment",
     "AssessmentResponse",
+    "AssessmentAreaStatus",
     "MOV",
     "MOVFile",
     "FeedbackComment",
     "AuditLog",
     "BBI",
     "BBIResult",
+    "SeedVersion",
+    "NotificationDelivery",
 ]
@@ -70,6 +70,7 @@ class AuditLog(Base):
     __table_args__ = (
         Index('ix_audit_logs_created_at_desc', created_at.desc()),  # For time-based sorting
         Index('ix_audit_logs_entity_lookup', entity_type, entity_id),  # For entity-specific queries
+        Index('ix_audit_logs_created_at_id', created_at, id),  # Keyset pagination
     )
 
     def __repr__(self):
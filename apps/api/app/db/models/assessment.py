@@ -5,7 +5,7 @@ from datetime import datetime
 
 from app.db.base import Base
 from app.db.enums import AssessmentStatus, ComplianceStatus, MOVStatus, ValidationStatus
-from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 
@@ -18,6 +18,13 @@ class Assessment(Base):
     """
 
     __tablename__ = "assessments"
+    __table_args__ = (
+        # Keyset pagination of the assessor queue, optionally narrowed by status
+        Index("ix_assessments_submitted_at_id", "submitted_at", "id"),
+        Index("ix_assessments_updated_at_id", "updated_at", "id"),
+        Index("ix_assessments_status_submitted_at_id", "status", "submitted_at", "id"),
+        Index("ix_assessments_status_updated_at_id", "status", "updated_at", "id"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -173,6 +180,9 @@ class AssessmentResponse(Base):
         ForeignKey("indicators.id"), nullable=False
     )
 
+    # Indicator version the response was answered against (NULL for legacy rows)
+    indicator_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.utcnow
@@ -190,6 +200,48 @@ class AssessmentResponse(Base):
     )
 
 
+class AssessmentAreaStatus(Base):
+    """
+    AssessmentAreaStatus table model for database storage.
+
+    One row per (assessment, governance area) that the assessment has
+    responses in, with response/validation counts for that area. Maintained
+    by AssessmentAreaStatusService whenever responses are written, so
+    assessor workloads can find "assessments in my area" without joining
+    every response to its indicator.
+    """
+
+    __tablename__ = "assessment_area_status"
+    __table_args__ = (
+        # Assessor queue / analytics lookups by area, most recent activity first
+        Index("ix_assessment_area_status_area_activity", "governance_area_id", "last_activity_at"),
+    )
+
+    assessment_id: Mapped[int] = mapped_column(
+        ForeignKey("assessments.id", ondelete="CASCADE"), primary_key=True
+    )
+    governance_area_id: Mapped[int] = mapped_column(
+        ForeignKey("governance_areas.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Counts over the assessment's responses to this area's indicators
+    response_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    completed_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    reviewed_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    pass_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    fail_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    conditional_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    rework_count: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    # Earliest update of a reviewed response (proxy for first review time)
+    first_reviewed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Latest update of any response in this area
+    last_activity_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # Relationships
+    assessment = relationship("Assessment")
+
+
 class MOV(Base):
     """
     MOV (Means of Verification) table model for database storage.
@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 
 from app.db.base import Base
 from app.db.enums import AreaType
-from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgresUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
@@ -114,6 +114,11 @@ class Indicator(Base):
     deadline_overrides = relationship("DeadlineOverride", back_populates="indicator")
     mov_files = relationship("MOVFile", back_populates="indicator")
 
+    __table_args__ = (
+        # Keyset pagination of the indicator list
+        Index("ix_indicators_area_name_id", "governance_area_id", "name", "id"),
+    )
+
 
 class IndicatorHistory(Base):
     """
@@ -122,6 +127,10 @@ class IndicatorHistory(Base):
     Stores historical versions of indicators to maintain data integrity.
     When an indicator's schemas are modified, the old version is archived here
     to ensure existing assessments continue to reference the correct schema version.
+
+    Schema fields are either stored in full (``is_snapshot``) or as a JSON
+    patch against the previous archived version (``schema_patch``); use
+    IndicatorVersionService to read them back.
     """
 
     __tablename__ = "indicators_history"
@@ -159,6 +168,13 @@ class IndicatorHistory(Base):
     remark_schema: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     technical_notes_text: Mapped[str | None] = mapped_column(String, nullable=True)
 
+    # Delta encoding: snapshot rows carry the schema fields above, delta rows
+    # leave them NULL and store a JSON patch from the previous version instead
+    is_snapshot: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=True, server_default=text("true")
+    )
+    schema_patch: Mapped[list | None] = mapped_column(JSON, nullable=True)
+
     # Foreign keys preserved from original indicator
     governance_area_id: Mapped[int] = mapped_column(nullable=False)
     parent_id: Mapped[int | None] = mapped_column(nullable=True)
@@ -215,10 +231,17 @@ class IndicatorDraft(Base):
     )
 
     # Draft data stored as JSONB (array of indicator nodes)
+    # This is the compacted snapshot; newer per-indicator changes live in
+    # indicator_draft_patches until they are compacted into it
     data: Mapped[dict] = mapped_column(
         JSON, nullable=False, server_default="[]"
     )
 
+    # Version of each indicator (by temp_id) as of the snapshot in ``data``
+    indicator_versions: Mapped[dict] = mapped_column(
+        JSON, nullable=False, server_default="{}", default=dict
+    )
+
     # Optional title for the draft
     title: Mapped[str | None] = mapped_column(String(200), nullable=True)
 
@@ -251,3 +274,53 @@ class IndicatorDraft(Base):
     user = relationship("User", foreign_keys=[user_id])
     governance_area = relationship("GovernanceArea")
     locked_by_user = relationship("User", foreign_keys=[locked_by_user_id])
+    patches = relationship(
+        "IndicatorDraftPatch",
+        back_populates="draft",
+        cascade="all, delete-orphan",
+        order_by="IndicatorDraftPatch.id",
+    )
+
+
+class IndicatorDraftPatch(Base):
+    """
+    IndicatorDraftPatch table model for database storage.
+
+    Append-only log of per-indicator draft changes. Each row replaces one
+    indicator (by temp_id) in the draft, or deletes it when ``data`` is null.
+    ``version`` is the indicator's new version; the unique constraint makes
+    two writers that started from the same version collide, so conflicts
+    are detected per indicator without locking the draft row.
+    """
+
+    __tablename__ = "indicator_draft_patches"
+    __table_args__ = (
+        UniqueConstraint(
+            "draft_id", "temp_id", "version", name="uq_indicator_draft_patch_version"
+        ),
+    )
+
+    # Primary key (also the replay order)
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    draft_id: Mapped[UUID] = mapped_column(
+        PostgresUUID(as_uuid=True),
+        ForeignKey("indicator_drafts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Indicator node this patch replaces
+    temp_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    version: Mapped[int] = mapped_column(nullable=False)
+
+    # Full indicator node, or null when the indicator was deleted
+    data: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
+    user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    # Relationships
+    draft = relationship("IndicatorDraft", back_populates="patches")
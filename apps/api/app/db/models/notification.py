@@ -0,0 +1,49 @@
+# 📬 Notification Database Models
+# Delivery bookkeeping for outgoing notifications (reminders, escalations, alerts)
+
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+
+class NotificationDelivery(Base):
+    """
+    One outgoing notification, keyed by an idempotency key.
+
+    A row is claimed before a message is handed to the transport. The key
+    is unique, so a message whose key already exists (from an earlier run
+    or a concurrent worker) is never sent twice. The rendered content is
+    kept so messages the transport did not accept can be retried later.
+    """
+
+    __tablename__ = "notification_deliveries"
+    __table_args__ = (
+        Index("ix_notification_deliveries_status_created", "status", "created_at"),
+        # Retry queue scan: due retries in order
+        Index("ix_notification_deliveries_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # e.g. "deadline-reminder:3:42:2025-03-01"
+    idempotency_key = Column(String(200), nullable=False, unique=True)
+    kind = Column(String(50), nullable=False)  # e.g. "deadline_reminder"
+    recipient = Column(String(255), nullable=False)
+
+    # Rendered content (kept for retries)
+    subject = Column(String(255), nullable=False, default="")
+    body = Column(Text, nullable=False, default="")
+    html = Column(Text, nullable=True)
+
+    # "pending" (claimed, being sent), "sent", "retry" (waiting for
+    # next_attempt_at) or "failed" (gave up after NOTIFICATION_MAX_ATTEMPTS).
+    # For pending rows next_attempt_at is the end of the sender's lease: if
+    # the sender dies before recording the outcome, the row is retried then.
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
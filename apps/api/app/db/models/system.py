@@ -1,12 +1,31 @@
 # 🔧 System Database Models
-# This file is reserved for future system-related database tables
-# such as application settings, feature flags, etc.
+# System-level tables such as seed bookkeeping
 #
 # Note: HealthCheck and other system responses are Pydantic schemas
 # and belong in app/schemas/system.py, not here.
 
-# Currently no database tables needed for basic system functionality.
-# Future tables might include:
-# - AppSettings (for configuration storage)
-# - FeatureFlags (for feature toggles)
-# - SystemLogs (for audit trails)
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import Column, DateTime, Integer, String
+
+
+class SeedVersion(Base):
+    """
+    Record of a one-shot data seeding step.
+
+    Startup compares the stored fingerprint with the fingerprint of the
+    current seed definitions and skips seeding entirely when they match,
+    so restarts cost a single query instead of every seeding pass.
+    """
+
+    __tablename__ = "seed_versions"
+
+    # Seed set name (e.g. "initial_data")
+    name = Column(String(100), primary_key=True)
+
+    # Manually bumped version and content fingerprint of the seed definitions
+    version = Column(Integer, nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+
+    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
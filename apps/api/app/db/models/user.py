@@ -11,6 +11,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     SmallInteger,
     String,
@@ -67,3 +68,7 @@ class User(Base):
     assessments = relationship("Assessment", foreign_keys="Assessment.blgu_user_id", back_populates="blgu_user")
     feedback_comments = relationship("FeedbackComment", back_populates="assessor")
     created_deadline_overrides = relationship("DeadlineOverride", back_populates="creator", foreign_keys="DeadlineOverride.created_by")
+
+    __table_args__ = (
+        Index("ix_users_name_id", name, id),  # Keyset pagination of the user list
+    )
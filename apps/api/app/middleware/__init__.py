@@ -1,6 +1,7 @@
 # 🔒 Middleware Package
 # Security and request processing middleware
 
+from app.middleware.metrics import MetricsMiddleware
 from app.middleware.security import (
     RateLimitMiddleware,
     RequestLoggingMiddleware,
@@ -8,6 +9,7 @@ from app.middleware.security import (
 )
 
 __all__ = [
+    "MetricsMiddleware",
     "SecurityHeadersMiddleware",
     "RateLimitMiddleware",
     "RequestLoggingMiddleware",
@@ -0,0 +1,43 @@
+# 📈 Metrics Middleware
+# Records request latency histograms by route template for Prometheus
+
+import time
+from typing import Callable
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.metrics import (
+    UNMATCHED_ROUTE,
+    http_request_duration_seconds,
+    http_requests_total,
+    route_template,
+)
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware to record request count and latency per route.
+
+    Requests are labelled with the matched route template
+    (``/api/v1/assessor/assessments/{assessment_id}``), not the raw path, so
+    the number of series stays bounded. Unhandled exceptions are recorded
+    as status 500 before being re-raised.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        start_time = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start_time
+            labels = {
+                "method": request.method,
+                "route": route_template(request.scope) or UNMATCHED_ROUTE,
+                "status": str(status_code),
+            }
+            http_requests_total.labels(**labels).inc()
+            http_request_duration_seconds.labels(**labels).observe(elapsed)
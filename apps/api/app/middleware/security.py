@@ -163,8 +163,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         path = request.url.path
         config = self._get_rate_limit_config(path)
 
-        # Skip rate limit enforcement for health checks (but still add headers)
-        skip_enforcement = request.url.path == "/health"
+        # Skip rate limit enforcement for health probes (but still add headers)
+        skip_enforcement = path == "/health" or path.startswith("/health/")
 
         # Check rate limit
         is_limited = False
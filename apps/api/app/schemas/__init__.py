@@ -42,6 +42,11 @@ from .assessor import (
     AssessorAnalyticsResponse,
     AssessmentDetailsResponse,
     AssessorQueueItem,
+    AssessorQueuePage,
+    AssessorQueuePageItem,
+    AssessorQueueSort,
+    BulkValidationRequest,
+    BulkValidationResponse,
     MOVUploadResponse,
     PerformanceOverview,
     SystemicWeakness,
@@ -110,6 +115,11 @@ __all__ = [
     "SuccessResponse",
     # Assessor schemas
     "AssessorQueueItem",
+    "AssessorQueuePage",
+    "AssessorQueuePageItem",
+    "AssessorQueueSort",
+    "BulkValidationRequest",
+    "BulkValidationResponse",
     "AssessmentDetailsResponse",
     "ValidationRequest",
     "ValidationResponse",
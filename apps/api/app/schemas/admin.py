@@ -47,9 +47,11 @@ class AuditLogListResponse(BaseModel):
     """Schema for paginated audit log list."""
 
     items: list[AuditLogResponse]
-    total: int
+    total: Optional[int] = Field(None, description="Matching records; None when count=none")
+    total_estimated: bool = Field(False, description="Whether total is an estimate")
     skip: int
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page; None on the last page")
 
 
 class AuditLogFilters(BaseModel):
@@ -2,10 +2,11 @@
 # Pydantic models for assessor-related API responses/requests
 
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
 from app.db.enums import ValidationStatus
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 
 class AssessorQueueItem(BaseModel):
@@ -19,6 +20,31 @@ class AssessorQueueItem(BaseModel):
         from_attributes = True
 
 
+class AssessorQueueSort(str, Enum):
+    """Sort orders of the paginated queue ("-" = descending)."""
+
+    SUBMITTED_DESC = "-submitted_at"
+    SUBMITTED_ASC = "submitted_at"
+    UPDATED_DESC = "-updated_at"
+    UPDATED_ASC = "updated_at"
+
+
+class AssessorQueuePageItem(AssessorQueueItem):
+    barangay_id: int | None = None
+    rework_count: int = 0
+
+
+class AssessorQueuePage(BaseModel):
+    """One cursor page of the assessor queue."""
+
+    items: list[AssessorQueuePageItem]
+    limit: int
+    next_cursor: str | None = Field(None, description="Cursor for the next page; None on the last page")
+    counts_by_status: dict[str, int] | None = Field(
+        None, description="Queue size per status under the non-status filters"
+    )
+
+
 class ValidationRequest(BaseModel):
     """Request schema for validating an assessment response."""
 
@@ -36,6 +62,45 @@ class ValidationResponse(BaseModel):
     validation_status: ValidationStatus
 
 
+class BulkValidationItem(BaseModel):
+    """One response to validate in a bulk validation request."""
+
+    response_id: int
+    validation_status: ValidationStatus
+    public_comment: str | None = None
+    assessor_remarks: str | None = Field(
+        None, description="Internal note, visible to assessors only"
+    )
+
+
+class BulkValidationRequest(BaseModel):
+    """Request schema for validating many assessment responses at once."""
+
+    items: list[BulkValidationItem] = Field(..., min_length=1, max_length=500)
+
+    @field_validator("items")
+    @classmethod
+    def validate_unique_responses(cls, v):
+        ids = [item.response_id for item in v]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each response can only appear once per request")
+        return v
+
+
+class BulkValidationError(BaseModel):
+    response_id: int
+    error: str
+
+
+class BulkValidationResponse(BaseModel):
+    """Response schema for bulk validation; nothing is written when errors is non-empty."""
+
+    success: bool
+    message: str
+    validated_count: int
+    errors: list[BulkValidationError] = Field(default_factory=list)
+
+
 class MOVUploadResponse(BaseModel):
     """Response schema for MOV upload endpoint."""
 
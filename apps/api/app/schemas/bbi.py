@@ -133,3 +133,21 @@ class TestBBICalculationResponse(BaseModel):
         ...,
         description="Details of how the calculation was performed",
     )
+
+
+class BBIWhatIfRequest(BaseModel):
+    """Request schema for replaying draft mapping rules over stored assessments."""
+
+    mapping_rules: Dict[str, Any] = Field(
+        ...,
+        description="Draft mapping rules",
+    )
+    cycle_id: Optional[int] = Field(
+        None,
+        description="Only replay submissions from this assessment cycle",
+    )
+    max_responses: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Replay at most this many assessments",
+    )
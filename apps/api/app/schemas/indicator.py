@@ -7,7 +7,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from app.schemas.form_schema import FormSchema
+from app.schemas.calculation_schema import CalculationSchema
+from app.schemas.form_schema import FormField, FormSchema
 
 
 class GovernanceAreaNested(BaseModel):
@@ -238,6 +239,9 @@ class IndicatorDraftResponse(BaseModel):
     current_step: int
     status: str
     data: List[Dict[str, Any]]
+    indicator_versions: Dict[str, int] = Field(
+        default_factory=dict, description="Current version of each indicator, by temp_id"
+    )
     title: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -281,3 +285,65 @@ class IndicatorDraftDeltaUpdate(BaseModel):
         None,
         description="Optional metadata (current_step, status, title, etc.)",
     )
+
+
+class IndicatorDraftPatchRequest(BaseModel):
+    """Schema for appending per-indicator patches to a draft."""
+
+    changed_indicators: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Changed indicator nodes (each with a temp_id)"
+    )
+    deleted_ids: List[str] = Field(
+        default_factory=list, description="temp_ids of indicators removed from the draft"
+    )
+    base_versions: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Version each changed/deleted indicator was edited from (0 or omitted for new ones)",
+    )
+    metadata: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Optional metadata (current_step, status, title)",
+    )
+
+
+class IndicatorDraftPatchResponse(BaseModel):
+    """Response schema for appended draft patches."""
+
+    draft_id: UUID
+    indicator_versions: Dict[str, int] = Field(
+        ..., description="New version of each changed or deleted indicator, by temp_id"
+    )
+
+
+# =============================================================================
+# Builder Validation Schemas
+# =============================================================================
+
+
+class FormSchemaEditRequest(BaseModel):
+    """Schema for validating a few edited fields against a previously validated form schema."""
+
+    base_hash: str = Field(..., description="schema_hash returned for the edited version")
+    upsert_fields: List[FormField] = Field(
+        default_factory=list, description="Added or changed fields (matched by field_id)"
+    )
+    removed_field_ids: List[str] = Field(
+        default_factory=list, description="IDs of removed fields"
+    )
+
+
+# =============================================================================
+# What-If Calculation Schemas
+# =============================================================================
+
+
+class IndicatorWhatIfRequest(BaseModel):
+    """Schema for replaying a draft calculation schema over stored responses."""
+
+    calculation_schema: CalculationSchema = Field(..., description="Draft calculation schema")
+    cycle_id: Optional[int] = Field(
+        None, description="Only replay submissions from this assessment cycle"
+    )
+    max_responses: Optional[int] = Field(
+        None, ge=1, description="Replay at most this many responses"
+    )
@@ -87,10 +87,11 @@ class UserListResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     users: list[User]
-    total: int
+    total: Optional[int] = None  # None when count=none
     page: int
     size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # For keyset pagination; None on the last page
 
 
 class UserInDB(User):
@@ -0,0 +1,393 @@
+# 📊 Analytics Cache Service
+# Shared cache of dashboard KPI and report responses, recomputed once per change
+
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+from app.core.redis_client import BackgroundAnnouncer, RedisConnection
+from app.core.table_cache import subscribe
+from app.db.enums import UserRole
+from app.db.models import Barangay, GovernanceArea, Indicator, User
+from app.schemas.analytics import DashboardKPIResponse, ReportsDataResponse
+from app.services.analytics_service import ReportsFilters, analytics_service
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "vantage:analytics"
+# Bumped by every invalidation; entries computed under an older generation are stale
+GENERATION_KEY = f"{KEY_PREFIX}:generation"
+# Oldest generation that may still be served while stale (raised by hard invalidations)
+FLOOR_KEY = f"{KEY_PREFIX}:floor"
+
+# Commits writing these change the names and structure shown in every
+# response, so cached responses are dropped rather than served stale
+STRUCTURE_TABLES = frozenset(
+    {Barangay.__tablename__, GovernanceArea.__tablename__, Indicator.__tablename__}
+)
+
+# In-process entries (used while Redis is unavailable) kept before pruning
+_LOCAL_MAX_ENTRIES = 256
+
+# A computed response: {"generation": int, "computed_at": float, "payload": dict}
+Entry = Dict[str, Any]
+Compute = Callable[[Session], Dict[str, Any]]
+
+
+def _default_session_factory() -> Optional[Callable[[], Session]]:
+    # Resolved on every refresh so background refreshes follow whatever
+    # SessionLocal the process ends up configured with
+    from app.db import base
+
+    return base.SessionLocal
+
+
+class AnalyticsCacheService:
+    """
+    Cached responses for GET /analytics/dashboard and GET /analytics/reports.
+
+    Entries are keyed by endpoint, cycle, normalized filters and RBAC scope,
+    and stored in Redis so every API worker shares them (in process memory
+    while Redis is unreachable). Results only move when assessments are
+    validated and classified, so:
+
+    - finalize_assessment / classify_assessment call invalidate() after
+      committing, which bumps a shared generation counter. Entries computed
+      under an older generation are stale.
+    - An entry is fresh for ANALYTICS_CACHE_TTL_SECONDS. Other changes (new
+      submissions, draft answers) show up once it lapses.
+    - A stale entry is still served for ANALYTICS_CACHE_STALE_SECONDS while
+      one background thread recomputes it (stale-while-revalidate).
+    - On a miss, one request per key recomputes it (single-flight: an
+      in-process event plus a Redis lock across processes); concurrent
+      requests for the same key wait up to ANALYTICS_CACHE_WAIT_SECONDS
+      for its result instead of querying too.
+    - Commits writing barangays, governance areas or indicators drop every
+      entry instead of serving it stale. The commit only bumps this
+      process's generation; a background thread raises the shared floor in
+      Redis, so commits never wait on Redis.
+
+    Assessments aren't linked to cycles yet, so an invalidation covers every
+    cycle's entries.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Entry] = {}
+        self._generation = 0
+        self._floor = 0
+        # key -> event set once the in-process computation of that key ends
+        self._flights: Dict[str, threading.Event] = {}
+        self._redis_connection = RedisConnection(
+            "the analytics cache", settings.ANALYTICS_CACHE_REDIS_RETRY_SECONDS
+        )
+        self._structure_announcer = BackgroundAnnouncer(
+            "analytics-cache-invalidation", lambda: self._share_invalidation(hard=True)
+        )
+        subscribe(STRUCTURE_TABLES, self._on_structure_write)
+
+    def get_dashboard_kpis(
+        self, db: Session, cycle_id: Optional[int] = None
+    ) -> DashboardKPIResponse:
+        """Cached AnalyticsService.get_dashboard_kpis (MLGOO-DILG only, so one scope)."""
+        payload = self._get(
+            db,
+            endpoint="dashboard",
+            cycle_id=cycle_id,
+            params={},
+            scope="all",
+            compute=lambda session: analytics_service.get_dashboard_kpis(
+                session, cycle_id
+            ).model_dump(mode="json"),
+        )
+        return DashboardKPIResponse.model_validate(payload)
+
+    def get_reports_data(
+        self,
+        db: Session,
+        filters: ReportsFilters,
+        current_user: User,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> ReportsDataResponse:
+        """Cached AnalyticsService.get_reports_data, per filter set, page and RBAC scope."""
+        filters = self._normalize_filters(filters)
+        params = {**asdict(filters), "page": page, "page_size": page_size}
+        params.pop("cycle_id")
+        payload = self._get(
+            db,
+            endpoint="reports",
+            cycle_id=filters.cycle_id,
+            params=params,
+            scope=self._report_scope(current_user),
+            compute=lambda session: analytics_service.get_reports_data(
+                db=session,
+                filters=filters,
+                current_user=current_user,
+                page=page,
+                page_size=page_size,
+            ).model_dump(mode="json"),
+        )
+        return ReportsDataResponse.model_validate(payload)
+
+    def invalidate(self, hard: bool = False) -> None:
+        """
+        Mark every cached response stale; the next read of each key recomputes it.
+
+        Call after committing a change to assessment results. With ``hard``,
+        stale responses are dropped instead of served while recomputing.
+        """
+        self._invalidate_locally(hard)
+        self._share_invalidation(hard)
+
+    def _on_structure_write(self, tables: Set[str]) -> None:
+        """A commit changed names or structure: drop entries now, share it in the background."""
+        self._invalidate_locally(hard=True)
+        if self._redis_connection.configured:
+            self._structure_announcer.request()
+
+    def _invalidate_locally(self, hard: bool) -> None:
+        with self._lock:
+            self._generation += 1
+            if hard:
+                self._floor = self._generation
+                self._entries.clear()
+
+    def _share_invalidation(self, hard: bool) -> None:
+        """Bump the shared generation (and floor) so every process sees the invalidation."""
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            generation = client.incr(GENERATION_KEY)
+            if hard:
+                client.set(FLOOR_KEY, generation)
+        except Exception as e:
+            self._redis_connection.failed(e)
+
+    # ----- Lookup -----
+
+    def _get(
+        self,
+        db: Session,
+        endpoint: str,
+        cycle_id: Optional[int],
+        params: Dict[str, Any],
+        scope: str,
+        compute: Compute,
+    ) -> Dict[str, Any]:
+        key = self._key(endpoint, cycle_id, params, scope)
+        generation, floor, entry = self._read(key)
+        if entry is not None:
+            age = time.time() - entry["computed_at"]
+            if entry["generation"] >= generation and age < settings.ANALYTICS_CACHE_TTL_SECONDS:
+                record_cache_lookup("analytics", hit=True)
+                return entry["payload"]
+            usable_for = settings.ANALYTICS_CACHE_TTL_SECONDS + settings.ANALYTICS_CACHE_STALE_SECONDS
+            if entry["generation"] >= floor and age < usable_for:
+                record_cache_lookup("analytics", hit=True)
+                self._refresh_in_background(key, generation, compute)
+                return entry["payload"]
+
+        record_cache_lookup("analytics", hit=False)
+        return self._compute_once(key, generation, lambda: compute(db))
+
+    def _compute_once(
+        self, key: str, generation: int, compute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Compute and store ``key``, unless another request already is: then wait for it."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = threading.Event()
+
+        if not leader:
+            flight.wait(settings.ANALYTICS_CACHE_WAIT_SECONDS)
+            payload = self._current_payload(key, generation)
+            return payload if payload is not None else compute()
+
+        try:
+            release = self._acquire(key)
+            if release is None:
+                # Another process is computing it
+                payload = self._wait_for(key, generation)
+                return payload if payload is not None else compute()
+            try:
+                payload = compute()
+                self._write(key, generation, payload)
+                return payload
+            finally:
+                release()
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.set()
+
+    def _refresh_in_background(self, key: str, generation: int, compute: Compute) -> None:
+        with self._lock:
+            if key in self._flights:
+                return
+            flight = self._flights[key] = threading.Event()
+        threading.Thread(
+            target=self._refresh,
+            args=(key, generation, compute, flight),
+            name="analytics-cache-refresh",
+            daemon=True,
+        ).start()
+
+    def _refresh(
+        self, key: str, generation: int, compute: Compute, flight: threading.Event
+    ) -> None:
+        # The request that found the entry stale has moved on; use our own session
+        try:
+            release = self._acquire(key)
+            if release is None:
+                return  # Another process is refreshing it
+            try:
+                session_factory = self._session_factory or _default_session_factory()
+                db = session_factory()
+                try:
+                    payload = compute(db)
+                finally:
+                    db.close()
+                self._write(key, generation, payload)
+            finally:
+                release()
+        except Exception as e:
+            logger.warning(f"Failed to refresh cached analytics {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.set()
+
+    def _current_payload(self, key: str, generation: int) -> Optional[Dict[str, Any]]:
+        """The payload for ``key`` if it was computed under ``generation`` or later."""
+        _, _, entry = self._read(key)
+        if entry is not None and entry["generation"] >= generation:
+            return entry["payload"]
+        return None
+
+    def _wait_for(self, key: str, generation: int) -> Optional[Dict[str, Any]]:
+        deadline = time.monotonic() + settings.ANALYTICS_CACHE_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            payload = self._current_payload(key, generation)
+            if payload is not None:
+                return payload
+            time.sleep(0.05)
+        return None
+
+    # ----- Keys -----
+
+    @staticmethod
+    def _key(endpoint: str, cycle_id: Optional[int], params: Dict[str, Any], scope: str) -> str:
+        digest = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        cycle = cycle_id if cycle_id is not None else "all"
+        return f"{KEY_PREFIX}:{endpoint}:cycle={cycle}:{scope}:{digest}"
+
+    @staticmethod
+    def _normalize_filters(filters: ReportsFilters) -> ReportsFilters:
+        """Sort and de-duplicate list filters; empty lists mean no filter."""
+        return ReportsFilters(
+            cycle_id=filters.cycle_id,
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            governance_area_codes=sorted(set(filters.governance_area_codes or [])) or None,
+            barangay_ids=sorted(set(filters.barangay_ids or [])) or None,
+            status=filters.status,
+        )
+
+    @staticmethod
+    def _report_scope(user: User) -> str:
+        """The slice of data a user's reports are restricted to (see _build_filtered_query)."""
+        if user.role == UserRole.MLGOO_DILG:
+            return "all"
+        if user.role == UserRole.BLGU_USER:
+            return f"barangay={user.barangay_id}"
+        return f"user={user.id}"
+
+    # ----- Storage -----
+
+    def _read(self, key: str) -> Tuple[int, int, Optional[Entry]]:
+        """Current generation, floor and the stored entry for ``key`` (one round trip)."""
+        client = self._redis()
+        if client is not None:
+            try:
+                generation, floor, raw = client.mget(GENERATION_KEY, FLOOR_KEY, key)
+                entry = json.loads(raw) if raw is not None else None
+                return int(generation or 0), int(floor or 0), entry
+            except Exception as e:
+                self._redis_connection.failed(e)
+        with self._lock:
+            return self._generation, self._floor, self._entries.get(key)
+
+    def _write(self, key: str, generation: int, payload: Dict[str, Any]) -> None:
+        entry = {"generation": generation, "computed_at": time.time(), "payload": payload}
+        lifetime = settings.ANALYTICS_CACHE_TTL_SECONDS + settings.ANALYTICS_CACHE_STALE_SECONDS
+        client = self._redis()
+        if client is not None:
+            try:
+                client.set(key, json.dumps(entry), ex=math.ceil(lifetime))
+                return
+            except Exception as e:
+                self._redis_connection.failed(e)
+        with self._lock:
+            if generation < self._floor:
+                return  # Dropped by a hard invalidation while computing
+            if len(self._entries) >= _LOCAL_MAX_ENTRIES:
+                now = time.time()
+                self._entries = {
+                    k: e for k, e in self._entries.items() if now - e["computed_at"] < lifetime
+                }
+                while len(self._entries) >= _LOCAL_MAX_ENTRIES:
+                    oldest = min(self._entries, key=lambda k: self._entries[k]["computed_at"])
+                    del self._entries[oldest]
+            self._entries[key] = entry
+
+    def _acquire(self, key: str) -> Optional[Callable[[], None]]:
+        """Take the cross-process lock on computing ``key``; None if another process holds it."""
+        client = self._redis()
+        if client is None:
+            return lambda: None
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        try:
+            acquired = client.set(
+                lock_key,
+                token,
+                nx=True,
+                px=int(settings.ANALYTICS_CACHE_LOCK_SECONDS * 1000),
+            )
+        except Exception as e:
+            self._redis_connection.failed(e)
+            return lambda: None
+        if not acquired:
+            return None
+
+        def release() -> None:
+            try:
+                # Only delete our own lease; it may have expired and been taken over
+                if client.get(lock_key) == token.encode():
+                    client.delete(lock_key)
+            except Exception as e:
+                self._redis_connection.failed(e)
+
+        return release
+
+    def _redis(self):
+        return self._redis_connection.client()
+
+# Create a single instance to be used across the application
+analytics_cache_service = AnalyticsCacheService()
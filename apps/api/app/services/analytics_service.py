@@ -16,6 +16,7 @@ from app.schemas.analytics import (
     ReportsDataResponse,
     TrendData,
 )
+from app.services.reference_data_service import reference_data_service
 from sqlalchemy import case, desc, func
 from sqlalchemy.orm import Session, joinedload
 
@@ -807,10 +808,9 @@ class AnalyticsService:
                 governance_area = barangay.governance_area.name
             elif hasattr(barangay, 'governance_area_id') and barangay.governance_area_id:
                 # Look up the governance area
-                from app.db.models import GovernanceArea
-                area = db.query(GovernanceArea).filter(
-                    GovernanceArea.id == barangay.governance_area_id
-                ).first()
+                area = reference_data_service.get_governance_area(
+                    db, barangay.governance_area_id
+                )
                 if area:
                     governance_area = area.name
 
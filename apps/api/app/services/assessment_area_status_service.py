@@ -0,0 +1,147 @@
+# 🗺️ Assessment Area Status Service
+# Maintains the assessment_area_status table (per-area response counts per assessment)
+
+from itertools import chain
+from typing import Iterable, Set, Union
+
+from sqlalchemy import case, delete, event, exists, func, insert, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.db.enums import ValidationStatus
+from app.db.models.assessment import AssessmentAreaStatus, AssessmentResponse
+from app.db.models.governance_area import Indicator
+
+
+class AssessmentAreaStatusService:
+    """
+    Service that keeps assessment_area_status in step with assessment responses.
+
+    Rows are recomputed per assessment with one set-based INSERT ... SELECT
+    ... ON CONFLICT DO UPDATE, then areas left without responses are
+    deleted. Upserting (rather than deleting and re-inserting) lets two
+    transactions refresh the same assessment at once, e.g. validators of
+    different areas, without a primary-key violation. Recomputation is
+    hooked into every session flush that inserts, updates or deletes
+    AssessmentResponse rows, so all write paths (BLGU answers, assessor
+    validation, rework, compliance recalculation) keep the table current
+    inside their own transaction without having to call it.
+    """
+
+    def refresh(self, bind: Union[Session, Connection], assessment_ids: Iterable[int]) -> None:
+        """
+        Recompute the area rows of the given assessments.
+
+        Args:
+            bind: Session or connection to run on (its transaction is used)
+            assessment_ids: Assessments whose responses changed
+        """
+        ids = sorted(
+            {assessment_id for assessment_id in assessment_ids if assessment_id is not None}
+        )
+        if not ids:
+            return
+
+        status_table = AssessmentAreaStatus.__table__
+        connectable = bind.get_bind() if isinstance(bind, Session) else bind
+        dialect = connectable.dialect.name
+        insert_stmt = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        key_columns = ["assessment_id", "governance_area_id"]
+        count_columns = [
+            "response_count",
+            "completed_count",
+            "reviewed_count",
+            "pass_count",
+            "fail_count",
+            "conditional_count",
+            "rework_count",
+            "first_reviewed_at",
+            "last_activity_at",
+        ]
+        upsert = insert_stmt(status_table).from_select(
+            key_columns + count_columns,
+            self._aggregate_query().where(AssessmentResponse.assessment_id.in_(ids)),
+        )
+        bind.execute(
+            upsert.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={column: upsert.excluded[column] for column in count_columns},
+            )
+        )
+
+        # Areas whose last response was deleted (or moved) no longer have a row
+        has_responses = exists(
+            select(AssessmentResponse.id)
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .where(
+                AssessmentResponse.assessment_id == status_table.c.assessment_id,
+                Indicator.governance_area_id == status_table.c.governance_area_id,
+            )
+        )
+        bind.execute(
+            delete(status_table).where(
+                status_table.c.assessment_id.in_(ids), ~has_responses
+            )
+        )
+
+    def rebuild(self, db: Session) -> int:
+        """
+        Recompute the whole table (backfill or repair).
+
+        Returns:
+            Number of rows written (committed)
+        """
+        status_table = AssessmentAreaStatus.__table__
+        db.execute(delete(status_table))
+        db.execute(
+            insert(status_table).from_select(
+                [column.name for column in status_table.columns],
+                self._aggregate_query(),
+            )
+        )
+        db.commit()
+        return db.scalar(select(func.count()).select_from(status_table))
+
+    @staticmethod
+    def _aggregate_query():
+        response = AssessmentResponse
+        reviewed = response.validation_status.isnot(None)
+
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        return (
+            select(
+                response.assessment_id,
+                Indicator.governance_area_id,
+                func.count(response.id),
+                count_where(response.is_completed.is_(True)),
+                count_where(reviewed),
+                count_where(response.validation_status == ValidationStatus.PASS),
+                count_where(response.validation_status == ValidationStatus.FAIL),
+                count_where(response.validation_status == ValidationStatus.CONDITIONAL),
+                count_where(response.requires_rework.is_(True)),
+                func.min(case((reviewed, response.updated_at))),
+                func.max(response.updated_at),
+            )
+            .join(Indicator, Indicator.id == response.indicator_id)
+            .group_by(response.assessment_id, Indicator.governance_area_id)
+        )
+
+
+assessment_area_status_service = AssessmentAreaStatusService()
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_area_status_after_flush(session: Session, flush_context) -> None:
+    """Recompute area status for assessments whose responses were just flushed."""
+    assessment_ids: Set[int] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, AssessmentResponse):
+            assessment_ids.add(obj.assessment_id)
+            # A response moved to another assessment also changes the old one
+            assessment_ids.update(inspect(obj).attrs.assessment_id.history.deleted or ())
+
+    if assessment_ids:
+        assessment_area_status_service.refresh(session.connection(), assessment_ids)
@@ -4,6 +4,8 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from app.core.config import settings
+from app.core.table_cache import TableCache
 from app.db.enums import AssessmentStatus, MOVStatus
 from app.db.models import (
     MOV,
@@ -27,9 +29,16 @@ from app.schemas.assessment import (
     ProgressSummary,
 )
 from fastapi import HTTPException, status  # type: ignore[reportMissingImports]
-from sqlalchemy import and_, func  # type: ignore[reportMissingImports]
+from sqlalchemy import and_, func, select  # type: ignore[reportMissingImports]
 from sqlalchemy.orm import Session, joinedload  # type: ignore[reportMissingImports]
 
+# Dashboard assessment statistics, recomputed after commits that write assessments
+assessment_stats_cache = TableCache(
+    "assessment_stats",
+    {Assessment.__tablename__, AssessmentResponse.__tablename__},
+    settings.DASHBOARD_STATS_CACHE_TTL_SECONDS,
+)
+
 
 class AssessmentService:
     """Service class for assessment management operations."""
@@ -815,6 +824,10 @@ class AssessmentService:
             response_data=initial_data,
             assessment_id=response_create.assessment_id,
             indicator_id=response_create.indicator_id,
+            # Pin the schema version this response is answered against
+            indicator_version=db.query(Indicator.version)
+            .filter(Indicator.id == response_create.indicator_id)
+            .scalar(),
         )
 
         # Initialize completion based on current schema if available
@@ -872,6 +885,8 @@ class AssessmentService:
             db_response.is_completed = self._check_response_completion(
                 db_response.indicator.form_schema, response_update.response_data, db_response.movs
             )
+            # The answers now follow the current form; re-pin to its version
+            db_response.indicator_version = db_response.indicator.version
 
         # Generate remark if response is completed and indicator has calculation_schema
         if db_response.is_completed and db_response.indicator.calculation_schema:
@@ -2300,38 +2315,50 @@ class AssessmentService:
         """
         Get assessment statistics for admin dashboard.
 
+        Computed with one aggregate query and cached until a commit writes
+        assessments or assessment responses.
+
         Args:
             db: Database session
 
         Returns:
             Dictionary with assessment statistics
         """
-        total_assessments = db.query(Assessment).count()
-
-        # Assessments by status
-        status_stats = (
-            db.query(Assessment.status, func.count(Assessment.id))
-            .group_by(Assessment.status)
-            .all()
+        return assessment_stats_cache.get(
+            "assessment_stats", lambda: self._compute_assessment_stats(db)
         )
 
-        # Responses by completion status
-        total_responses = db.query(AssessmentResponse).count()
-        completed_responses = (
-            db.query(AssessmentResponse).filter(AssessmentResponse.is_completed).count()
-        )
-        responses_requiring_rework = (
-            db.query(AssessmentResponse)
-            .filter(AssessmentResponse.requires_rework)
-            .count()
+    @staticmethod
+    def _compute_assessment_stats(db: Session) -> Dict[str, Any]:
+        # Response counts per assessment, rolled up per assessment status
+        responses = (
+            select(
+                AssessmentResponse.assessment_id,
+                func.count().label("total"),
+                func.count().filter(AssessmentResponse.is_completed).label("completed"),
+                func.count().filter(AssessmentResponse.requires_rework).label("rework"),
+            )
+            .group_by(AssessmentResponse.assessment_id)
+            .subquery()
         )
+        status_stats = db.execute(
+            select(
+                Assessment.status,
+                func.count(),
+                func.coalesce(func.sum(responses.c.total), 0),
+                func.coalesce(func.sum(responses.c.completed), 0),
+                func.coalesce(func.sum(responses.c.rework), 0),
+            )
+            .outerjoin(responses, responses.c.assessment_id == Assessment.id)
+            .group_by(Assessment.status)
+        ).all()
 
         return {
-            "total_assessments": total_assessments,
-            "assessments_by_status": {status: count for status, count in status_stats},
-            "total_responses": total_responses,
-            "completed_responses": completed_responses,
-            "responses_requiring_rework": responses_requiring_rework,
+            "total_assessments": sum(row[1] for row in status_stats),
+            "assessments_by_status": {row[0]: row[1] for row in status_stats},
+            "total_responses": sum(row[2] for row in status_stats),
+            "completed_responses": sum(row[3] for row in status_stats),
+            "responses_requiring_rework": sum(row[4] for row in status_stats),
         }
 
     def get_all_validated_assessments(
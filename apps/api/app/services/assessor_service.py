@@ -1,58 +1,101 @@
 # 🛠️ Assessor Service
 # Business logic for assessor features
 
+import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from app.db.enums import AssessmentStatus, ComplianceStatus, ValidationStatus
 from app.db.models.assessment import (
     MOV as MOVModel,  # SQLAlchemy model - alias to avoid conflict
     Assessment,
+    AssessmentAreaStatus,
     AssessmentResponse,
     FeedbackComment,
 )
+from app.db.models.barangay import Barangay
 from app.db.models.governance_area import GovernanceArea, Indicator
 from app.db.models.user import User
+from app.core.pagination import keyset_page
 from app.schemas.assessment import MOV, MOVCreate  # Pydantic schema
+from app.schemas.assessor import AssessorQueueSort, BulkValidationItem
+from app.services.audit_service import audit_service
+# Imported for its flush hook, which keeps assessment_area_status current
+from app.services.assessment_area_status_service import (  # noqa: F401
+    assessment_area_status_service,
+)
+from app.services.reference_data_service import reference_data_service
 from app.services.storage_service import storage_service
-from fastapi import UploadFile
-from sqlalchemy.orm import Session, joinedload
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import (
+    Integer,
+    String,
+    and_,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+    values,
+)
+from sqlalchemy.sql import FromClause
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+
+logger = logging.getLogger(__name__)
+
+# Assessment statuses that appear in assessor queues and analytics
+ASSESSOR_VISIBLE_STATUSES = [
+    AssessmentStatus.SUBMITTED_FOR_REVIEW,
+    AssessmentStatus.NEEDS_REWORK,
+    AssessmentStatus.VALIDATED,
+]
+
+# Keyset sort orders for the paginated queue, by sort column; each matches a
+# composite index on assessments (ix_assessments_<column>_id)
+QUEUE_KEYSETS = {
+    "submitted_at": (Assessment.submitted_at, Assessment.id),
+    "updated_at": (Assessment.updated_at, Assessment.id),
+}
 
 
 class AssessorService:
-    def get_assessor_queue(self, db: Session, assessor: User) -> List[dict]:
+    def get_assessor_queue(
+        self, db: Session, assessor: User, skip: int = 0, limit: Optional[int] = None
+    ) -> List[dict]:
         """
         Return submissions filtered by the assessor's governance area.
 
         Includes barangay name, submission date, status, and last updated.
+        Area membership comes from the precomputed assessment_area_status
+        table, so the queue never scans assessment responses.
         """
-        # Fetch assessments whose BLGU user belongs to barangays in the
-        # same governance area as the assessor via indicator governance area linkage.
         # Simplified initial implementation: show assessments in Submitted/Needs Rework/Validated.
-        assessments = (
+        query = (
             db.query(Assessment)
-            .join(AssessmentResponse, AssessmentResponse.assessment_id == Assessment.id)
-            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .join(
+                AssessmentAreaStatus,
+                and_(
+                    AssessmentAreaStatus.assessment_id == Assessment.id,
+                    AssessmentAreaStatus.governance_area_id == assessor.validator_area_id,
+                ),
+            )
             .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
             .filter(
-                Indicator.governance_area_id == assessor.governance_area_id,
                 # Only include true submissions (must have been submitted)
                 Assessment.submitted_at.isnot(None),
-                Assessment.status.in_(
-                    [
-                        AssessmentStatus.SUBMITTED_FOR_REVIEW,
-                        AssessmentStatus.NEEDS_REWORK,
-                        AssessmentStatus.VALIDATED,
-                    ]
-                ),
+                Assessment.status.in_(ASSESSOR_VISIBLE_STATUSES),
             )
-            .distinct(Assessment.id)
-            .order_by(Assessment.id, Assessment.updated_at.desc())
-            .all()
+            .order_by(Assessment.id)
+            .offset(skip)
         )
+        if limit is not None:
+            query = query.limit(limit)
 
         items = []
-        for a in assessments:
+        for a in query.all():
             barangay_name = getattr(getattr(a.blgu_user, "barangay", None), "name", "-")
             items.append(
                 {
@@ -68,6 +111,137 @@ class AssessorService:
 
         return items
 
+    def get_assessor_queue_page(
+        self,
+        db: Session,
+        assessor: User,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        statuses: Optional[List[AssessmentStatus]] = None,
+        barangay_id: Optional[int] = None,
+        submitted_from: Optional[datetime] = None,
+        submitted_to: Optional[datetime] = None,
+        rework_round: Optional[int] = None,
+        sort: AssessorQueueSort = AssessorQueueSort.SUBMITTED_DESC,
+        include_counts: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Return one keyset page of the assessor's queue, filtered and sorted in SQL.
+
+        Pages are keyed on (sort column, id), which the composite indexes on
+        assessments serve directly, so the first page (and every later one)
+        reads about ``limit`` rows however long the queue is. Items are
+        built from selected columns rather than loaded entities.
+
+        Args:
+            db: Database session
+            assessor: Assessor whose governance area scopes the queue
+            cursor: Opaque cursor from the previous page (None for the first page)
+            limit: Maximum number of items to return
+            statuses: Only these statuses (within ASSESSOR_VISIBLE_STATUSES)
+            barangay_id: Only this barangay's submissions
+            submitted_from, submitted_to: Submission date range (inclusive)
+            rework_round: Only assessments sent back this many times
+            sort: Sort column, descending when prefixed with "-"
+            include_counts: Also return counts_by_status (usually only
+                wanted with the first page)
+
+        Returns:
+            dict: {"items", "next_cursor", "counts_by_status"}; counts cover
+            every visible status under the other filters, so they are not
+            narrowed by ``statuses``
+        """
+        filters = self._queue_filters(barangay_id, submitted_from, submitted_to, rework_round)
+        visible = [
+            s for s in (statuses or ASSESSOR_VISIBLE_STATUSES) if s in ASSESSOR_VISIBLE_STATUSES
+        ]
+
+        query = self._queue_query(
+            db.query(
+                Assessment.id,
+                Assessment.submitted_at,
+                Assessment.updated_at,
+                Assessment.status,
+                Assessment.rework_count,
+                User.barangay_id,
+                Barangay.name.label("barangay_name"),
+            ),
+            assessor,
+            filters,
+        ).filter(Assessment.status.in_(visible))
+        rows, next_cursor = keyset_page(
+            query,
+            QUEUE_KEYSETS[sort.value.lstrip("-")],
+            cursor,
+            limit,
+            descending=sort.value.startswith("-"),
+        )
+
+        counts_by_status = None
+        if include_counts:
+            counts_by_status = {status.value: 0 for status in ASSESSOR_VISIBLE_STATUSES}
+            grouped = (
+                self._queue_query(
+                    db.query(Assessment.status, func.count(Assessment.id)), assessor, filters
+                )
+                .filter(Assessment.status.in_(ASSESSOR_VISIBLE_STATUSES))
+                .group_by(Assessment.status)
+            )
+            for status, count in grouped:
+                counts_by_status[status.value] = count
+
+        return {
+            "items": [
+                {
+                    "assessment_id": row.id,
+                    "barangay_id": row.barangay_id,
+                    "barangay_name": row.barangay_name or "-",
+                    "submission_date": row.submitted_at,
+                    "status": row.status.value,
+                    "rework_count": row.rework_count,
+                    "updated_at": row.updated_at,
+                }
+                for row in rows
+            ],
+            "next_cursor": next_cursor,
+            "counts_by_status": counts_by_status,
+        }
+
+    @staticmethod
+    def _queue_filters(
+        barangay_id: Optional[int],
+        submitted_from: Optional[datetime],
+        submitted_to: Optional[datetime],
+        rework_round: Optional[int],
+    ) -> List[Any]:
+        filters = [Assessment.submitted_at.isnot(None)]
+        if barangay_id is not None:
+            filters.append(User.barangay_id == barangay_id)
+        if submitted_from is not None:
+            filters.append(Assessment.submitted_at >= submitted_from)
+        if submitted_to is not None:
+            filters.append(Assessment.submitted_at <= submitted_to)
+        if rework_round is not None:
+            filters.append(Assessment.rework_count == rework_round)
+        return filters
+
+    @staticmethod
+    def _queue_query(query: Any, assessor: User, filters: List[Any]) -> Any:
+        """Scope a queue query to the assessor's area and apply the filters."""
+        return (
+            query.select_from(Assessment)
+            .join(
+                AssessmentAreaStatus,
+                and_(
+                    AssessmentAreaStatus.assessment_id == Assessment.id,
+                    AssessmentAreaStatus.governance_area_id == assessor.validator_area_id,
+                ),
+            )
+            .join(User, User.id == Assessment.blgu_user_id)
+            .outerjoin(Barangay, Barangay.id == User.barangay_id)
+            .filter(*filters)
+        )
+
     def validate_assessment_response(
         self,
         db: Session,
@@ -168,6 +342,202 @@ class AssessorService:
             "validation_status": validation_status,
         }
 
+    def bulk_validate_assessment_responses(
+        self,
+        db: Session,
+        assessor: User,
+        items: List[BulkValidationItem],
+        ip_address: Optional[str] = None,
+    ) -> dict:
+        """
+        Validate many assessment responses in one transaction.
+
+        Every response is checked against the assessor's governance area in
+        a single query; if any is missing or outside the area nothing is
+        written. Otherwise statuses (and regenerated remarks) are applied
+        with one ``UPDATE ... FROM (VALUES ...)``, comments with one
+        multi-row INSERT, area statuses are recomputed once for the affected
+        assessments and one audit event records the batch.
+
+        Args:
+            db: Database session
+            assessor: The assessor performing the validation
+            items: Responses to validate, with their comments
+            ip_address: Client IP for the audit event
+
+        Returns:
+            dict: success, message, validated_count and per-response errors
+        """
+        by_id = {item.response_id: item for item in items}
+        rows = {
+            row.id: row
+            for row in db.execute(
+                select(
+                    AssessmentResponse.id,
+                    AssessmentResponse.assessment_id,
+                    AssessmentResponse.indicator_id,
+                    AssessmentResponse.is_completed,
+                    AssessmentResponse.response_data,
+                    Indicator.governance_area_id,
+                    Indicator.calculation_schema.isnot(None).label("has_calculation"),
+                )
+                .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+                .where(AssessmentResponse.id.in_(by_id))
+            )
+        }
+
+        errors = []
+        for response_id in by_id:
+            row = rows.get(response_id)
+            if row is None:
+                errors.append({"response_id": response_id, "error": "Assessment response not found"})
+            elif row.governance_area_id != assessor.validator_area_id:
+                errors.append(
+                    {
+                        "response_id": response_id,
+                        "error": "Assessment response is not in your governance area",
+                    }
+                )
+        if errors:
+            return {
+                "success": False,
+                "message": f"{len(errors)} of {len(items)} responses cannot be validated; nothing was saved",
+                "validated_count": 0,
+                "errors": errors,
+            }
+
+        # Remarks are regenerated from indicators loaded once for the batch
+        remark_rows = [row for row in rows.values() if row.has_calculation and row.is_completed]
+        remarks: Dict[int, Optional[str]] = {}
+        if remark_rows:
+            indicators = {
+                indicator.id: indicator
+                for indicator in db.scalars(
+                    select(Indicator).where(
+                        Indicator.id.in_({row.indicator_id for row in remark_rows})
+                    )
+                )
+            }
+            remarks = {
+                row.id: self._generated_remark(indicators[row.indicator_id], row)
+                for row in remark_rows
+            }
+        changes = [
+            (response_id, item.validation_status.name, remarks.get(response_id))
+            for response_id, item in by_id.items()
+        ]
+        comments = [
+            {
+                "comment": comment,
+                "comment_type": comment_type,
+                "response_id": item.response_id,
+                "assessor_id": assessor.id,
+                "is_internal_note": is_internal,
+            }
+            for item in items
+            for comment, comment_type, is_internal in (
+                (item.public_comment, "validation", False),
+                (item.assessor_remarks, "internal_note", True),
+            )
+            if comment
+        ]
+
+        try:
+            relation = self._validation_changes(db, changes)
+            db.execute(
+                update(AssessmentResponse)
+                .where(AssessmentResponse.id == relation.c.id)
+                .values(
+                    validation_status=cast(
+                        relation.c.validation_status,
+                        AssessmentResponse.__table__.c.validation_status.type,
+                    ),
+                    generated_remark=func.coalesce(
+                        relation.c.generated_remark, AssessmentResponse.generated_remark
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if comments:
+                db.execute(insert(FeedbackComment), comments)
+            # The bulk UPDATE bypasses the session flush hook
+            assessment_area_status_service.refresh(
+                db, {row.assessment_id for row in rows.values()}
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Bulk validation failed: {str(e)}",
+            )
+
+        audit_service.log_audit_event(
+            user_id=assessor.id,
+            entity_type="assessment_response",
+            entity_id=None,
+            action="bulk_validate",
+            changes={
+                "validation_status": {
+                    str(response_id): item.validation_status.value
+                    for response_id, item in by_id.items()
+                },
+                "comments": len(comments),
+            },
+            ip_address=ip_address,
+        )
+
+        return {
+            "success": True,
+            "message": f"Validated {len(items)} assessment responses",
+            "validated_count": len(items),
+            "errors": [],
+        }
+
+    @staticmethod
+    def _generated_remark(indicator: Indicator, row: Any) -> Optional[str]:
+        """Regenerate a response's remark as validate_assessment_response does."""
+        try:
+            from app.services.intelligence_service import intelligence_service
+
+            assessment_data = row.response_data or {}
+            indicator_status = intelligence_service.evaluate_indicator(indicator, assessment_data)
+            return intelligence_service.render_indicator_remark(
+                indicator, indicator_status, assessment_data
+            )
+        except Exception as e:
+            # Log error but don't fail the validation
+            logger.warning(f"Failed to generate remark for response {row.id}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _validation_changes(db: Session, changes: List[tuple]) -> FromClause:
+        """
+        Build an inline ``(id, validation_status, generated_remark)`` relation.
+
+        PostgreSQL gets a ``VALUES`` list; SQLite (used by the test suite)
+        gets the equivalent ``SELECT ... UNION ALL SELECT ...``, as in
+        IndicatorHierarchyService._edges.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            return values(
+                column("id", Integer),
+                column("validation_status", String),
+                column("generated_remark", String),
+                name="validation_changes",
+            ).data(changes)
+
+        return union_all(
+            *(
+                select(
+                    literal(response_id, Integer).label("id"),
+                    literal(validation_status, String).label("validation_status"),
+                    literal(remark, String).label("generated_remark"),
+                )
+                for response_id, validation_status, remark in changes
+            )
+        ).subquery("validation_changes")
+
     def create_mov_for_assessor(
         self, db: Session, mov_create: MOVCreate, assessor: User
     ) -> dict:
@@ -371,6 +741,11 @@ class AssessorService:
         - Feedback comments
         - Technical notes for each indicator
 
+        The review screen should prefer the sectioned reads
+        (get_assessment_review_summary, get_assessment_area_details and
+        get_assessment_indicator_details), whose size doesn't grow with
+        every MOV and comment in the assessment.
+
         Args:
             db: Database session
             assessment_id: ID of the assessment to retrieve
@@ -379,19 +754,9 @@ class AssessorService:
         Returns:
             dict: Assessment details or error information
         """
-        # Get the assessment with all related data
         assessment = (
             db.query(Assessment)
-            .options(
-                joinedload(Assessment.blgu_user).joinedload(User.barangay),
-                joinedload(Assessment.responses)
-                .joinedload(AssessmentResponse.indicator)
-                .joinedload(Indicator.governance_area),
-                joinedload(Assessment.responses).joinedload(AssessmentResponse.movs),
-                joinedload(Assessment.responses).joinedload(
-                    AssessmentResponse.feedback_comments
-                ),
-            )
+            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
             .filter(Assessment.id == assessment_id)
             .first()
         )
@@ -403,122 +768,341 @@ class AssessorService:
                 "assessment_id": assessment_id,
             }
 
-        # Verify the assessor has permission to view this assessment
-        # by checking if any of the assessment's indicators belong to the assessor's governance area
-        # If there are no responses, we need to check if the BLGU user's barangay is in the assessor's governance area
-        has_permission = False
-
-        if assessment.responses:
-            # Check if any response's indicator belongs to the assessor's governance area
-            for response in assessment.responses:
-                if response.indicator.governance_area_id == assessor.governance_area_id:
-                    has_permission = True
-                    break
-        else:
-            # For assessments with no responses, check if the BLGU user's barangay
-            # belongs to the assessor's governance area (this would require additional logic
-            # to map barangays to governance areas, but for now we'll allow access)
-            # This is a simplified approach - in a real system, you'd need proper mapping
-            has_permission = True  # Allow access to empty assessments for now
+        # Collections are loaded with one SELECT ... IN each rather than
+        # joined, so MOVs and comments don't multiply each other's rows
+        responses = (
+            self._detail_responses_query(db)
+            .filter(AssessmentResponse.assessment_id == assessment_id)
+            .all()
+        )
 
-        if not has_permission:
+        # Verify the assessor has permission to view this assessment
+        # by checking if any of the assessment's indicators belong to the assessor's governance area.
+        # Assessments with no responses yet are visible (there is no area to check against)
+        if responses and not any(
+            response.indicator.governance_area_id == assessor.validator_area_id
+            for response in responses
+        ):
             return {
                 "success": False,
                 "message": "Access denied. You can only view assessments in your governance area",
                 "assessment_id": assessment_id,
             }
 
-        # Build the response data
         assessment_data = {
             "success": True,
             "assessment": {
-                "id": assessment.id,
-                "status": assessment.status.value,
-                "created_at": assessment.created_at.isoformat(),
-                "updated_at": assessment.updated_at.isoformat(),
-                "submitted_at": assessment.submitted_at.isoformat()
-                if assessment.submitted_at
-                else None,
-                "validated_at": assessment.validated_at.isoformat()
-                if assessment.validated_at
-                else None,
-                "blgu_user": {
-                    "id": assessment.blgu_user.id,
-                    "name": assessment.blgu_user.name,
-                    "email": assessment.blgu_user.email,
-                    "barangay": {
-                        "id": assessment.blgu_user.barangay.id,
-                        "name": assessment.blgu_user.barangay.name,
-                    }
-                    if assessment.blgu_user.barangay
-                    else None,
-                },
-                "responses": [],
+                **self._serialize_assessment(assessment),
+                "responses": [
+                    self._serialize_response(response)
+                    for response in responses
+                    # Only responses within the assessor's governance area
+                    if response.indicator.governance_area_id == assessor.validator_area_id
+                ],
             },
         }
 
-        # Process only responses within the assessor's governance area
-        for response in assessment.responses:
-            if response.indicator.governance_area_id != assessor.governance_area_id:
-                continue
-            response_data = {
-                "id": response.id,
-                "is_completed": response.is_completed,
-                "requires_rework": response.requires_rework,
-                "validation_status": response.validation_status.value
-                if response.validation_status
+        return assessment_data
+
+    def get_assessment_review_summary(
+        self, db: Session, assessment_id: int, assessor: User
+    ) -> Dict[str, Any]:
+        """
+        Compact first-render payload for the assessor review screen.
+
+        Contains the assessment metadata, per-area counts (from
+        assessment_area_status) and one status line per indicator in the
+        assessor's area, with MOV and comment counts but no MOVs, comments
+        or form data. Its size depends on the number of indicators, not on
+        how many files or comments the assessment has.
+
+        Raises:
+            HTTPException: 404 if the assessment doesn't exist, 403 if it
+                has no responses in the assessor's area
+        """
+        assessment = self._review_assessment(db, assessment_id, assessor)
+
+        areas = db.execute(
+            select(
+                AssessmentAreaStatus.governance_area_id,
+                GovernanceArea.name,
+                GovernanceArea.area_type,
+                AssessmentAreaStatus.response_count,
+                AssessmentAreaStatus.completed_count,
+                AssessmentAreaStatus.reviewed_count,
+                AssessmentAreaStatus.pass_count,
+                AssessmentAreaStatus.fail_count,
+                AssessmentAreaStatus.conditional_count,
+                AssessmentAreaStatus.rework_count,
+            )
+            .join(GovernanceArea, GovernanceArea.id == AssessmentAreaStatus.governance_area_id)
+            .where(AssessmentAreaStatus.assessment_id == assessment_id)
+            .order_by(AssessmentAreaStatus.governance_area_id)
+        )
+
+        mov_count = (
+            select(func.count(MOVModel.id))
+            .where(MOVModel.response_id == AssessmentResponse.id)
+            .scalar_subquery()
+        )
+        comment_count = (
+            select(func.count(FeedbackComment.id))
+            .where(FeedbackComment.response_id == AssessmentResponse.id)
+            .scalar_subquery()
+        )
+        indicators = db.execute(
+            select(
+                AssessmentResponse.id,
+                AssessmentResponse.indicator_id,
+                Indicator.name,
+                AssessmentResponse.is_completed,
+                AssessmentResponse.requires_rework,
+                AssessmentResponse.validation_status,
+                AssessmentResponse.updated_at,
+                mov_count.label("mov_count"),
+                comment_count.label("comment_count"),
+            )
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .where(
+                AssessmentResponse.assessment_id == assessment_id,
+                Indicator.governance_area_id == assessor.validator_area_id,
+            )
+            .order_by(AssessmentResponse.indicator_id)
+        )
+
+        return {
+            "assessment": self._serialize_assessment(assessment),
+            "areas": [
+                {
+                    "governance_area_id": row.governance_area_id,
+                    "name": row.name,
+                    "area_type": row.area_type.value,
+                    "response_count": row.response_count,
+                    "completed_count": row.completed_count,
+                    "reviewed_count": row.reviewed_count,
+                    "pass_count": row.pass_count,
+                    "fail_count": row.fail_count,
+                    "conditional_count": row.conditional_count,
+                    "rework_count": row.rework_count,
+                }
+                for row in areas
+            ],
+            "indicators": [
+                {
+                    "response_id": row.id,
+                    "indicator_id": row.indicator_id,
+                    "indicator_name": row.name,
+                    "is_completed": row.is_completed,
+                    "requires_rework": row.requires_rework,
+                    "validation_status": row.validation_status.value
+                    if row.validation_status
+                    else None,
+                    "mov_count": row.mov_count,
+                    "comment_count": row.comment_count,
+                    "updated_at": row.updated_at.isoformat(),
+                }
+                for row in indicators
+            ],
+        }
+
+    def get_assessment_area_details(
+        self, db: Session, assessment_id: int, governance_area_id: int, assessor: User
+    ) -> Dict[str, Any]:
+        """
+        Full review data (indicator, MOVs, comments) for one governance area.
+
+        Raises:
+            HTTPException: 404 if the assessment doesn't exist, 403 if the
+                area isn't the assessor's or the assessment has no
+                responses in it
+        """
+        if governance_area_id != assessor.validator_area_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied. You can only view your own governance area",
+            )
+        self._review_assessment(db, assessment_id, assessor, load=False)
+
+        responses = (
+            self._detail_responses_query(db)
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .filter(
+                AssessmentResponse.assessment_id == assessment_id,
+                Indicator.governance_area_id == governance_area_id,
+            )
+            .order_by(AssessmentResponse.indicator_id)
+            .all()
+        )
+        return {
+            "assessment_id": assessment_id,
+            "governance_area_id": governance_area_id,
+            "responses": [self._serialize_response(response) for response in responses],
+        }
+
+    def get_assessment_indicator_details(
+        self, db: Session, assessment_id: int, indicator_id: int, assessor: User
+    ) -> Dict[str, Any]:
+        """
+        Full review data (indicator, MOVs, comments) for one indicator's response.
+
+        Raises:
+            HTTPException: 404 if the assessment or response doesn't exist,
+                403 if the indicator isn't in the assessor's area
+        """
+        self._review_assessment(db, assessment_id, assessor, load=False)
+
+        response = (
+            self._detail_responses_query(db)
+            .filter(
+                AssessmentResponse.assessment_id == assessment_id,
+                AssessmentResponse.indicator_id == indicator_id,
+            )
+            .first()
+        )
+        if response is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Assessment response not found",
+            )
+        if response.indicator.governance_area_id != assessor.validator_area_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied. You can only view indicators in your governance area",
+            )
+        return {"assessment_id": assessment_id, "response": self._serialize_response(response)}
+
+    def _review_assessment(
+        self, db: Session, assessment_id: int, assessor: User, load: bool = True
+    ) -> Optional[Assessment]:
+        """
+        Check the assessor may review an assessment (it has responses in their area).
+
+        Returns:
+            The assessment with its BLGU user and barangay when ``load``,
+            otherwise None (only the check is run)
+        """
+        in_area = (
+            select(AssessmentAreaStatus.assessment_id)
+            .where(
+                AssessmentAreaStatus.assessment_id == Assessment.id,
+                AssessmentAreaStatus.governance_area_id == assessor.validator_area_id,
+            )
+            .exists()
+        )
+        query = db.query(Assessment, in_area.label("in_area")).filter(Assessment.id == assessment_id)
+        if load:
+            query = query.options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
+        else:
+            query = query.options(load_only(Assessment.id))
+        row = query.first()
+
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Assessment not found"
+            )
+        if not row.in_area:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied. You can only view assessments in your governance area",
+            )
+        return row.Assessment if load else None
+
+    @staticmethod
+    def _detail_responses_query(db: Session) -> Any:
+        """Responses with everything the review detail shows, without a cartesian join."""
+        return db.query(AssessmentResponse).options(
+            # Many-to-one: joined, one row per response
+            joinedload(AssessmentResponse.indicator).joinedload(Indicator.governance_area),
+            # Collections: one SELECT ... IN per relationship
+            selectinload(AssessmentResponse.movs),
+            selectinload(AssessmentResponse.feedback_comments).joinedload(
+                FeedbackComment.assessor
+            ),
+        )
+
+    @staticmethod
+    def _serialize_assessment(assessment: Assessment) -> Dict[str, Any]:
+        return {
+            "id": assessment.id,
+            "status": assessment.status.value,
+            "created_at": assessment.created_at.isoformat(),
+            "updated_at": assessment.updated_at.isoformat(),
+            "submitted_at": assessment.submitted_at.isoformat()
+            if assessment.submitted_at
+            else None,
+            "validated_at": assessment.validated_at.isoformat()
+            if assessment.validated_at
+            else None,
+            "blgu_user": {
+                "id": assessment.blgu_user.id,
+                "name": assessment.blgu_user.name,
+                "email": assessment.blgu_user.email,
+                "barangay": {
+                    "id": assessment.blgu_user.barangay.id,
+                    "name": assessment.blgu_user.barangay.name,
+                }
+                if assessment.blgu_user.barangay
                 else None,
-                "response_data": response.response_data,
-                "created_at": response.created_at.isoformat(),
-                "updated_at": response.updated_at.isoformat(),
-                "indicator": {
-                    "id": response.indicator.id,
-                    "name": response.indicator.name,
-                    "description": response.indicator.description,
-                    "form_schema": response.indicator.form_schema,
-                    "governance_area": {
-                        "id": response.indicator.governance_area.id,
-                        "name": response.indicator.governance_area.name,
-                        "area_type": response.indicator.governance_area.area_type.value,
-                    },
-                    # Technical notes - for now using description, but this could be a separate field
-                    "technical_notes": response.indicator.description
-                    or "No technical notes available",
+            },
+        }
+
+    @staticmethod
+    def _serialize_response(response: AssessmentResponse) -> Dict[str, Any]:
+        return {
+            "id": response.id,
+            "is_completed": response.is_completed,
+            "requires_rework": response.requires_rework,
+            "validation_status": response.validation_status.value
+            if response.validation_status
+            else None,
+            "response_data": response.response_data,
+            "created_at": response.created_at.isoformat(),
+            "updated_at": response.updated_at.isoformat(),
+            "indicator": {
+                "id": response.indicator.id,
+                "name": response.indicator.name,
+                "description": response.indicator.description,
+                "form_schema": response.indicator.form_schema,
+                "governance_area": {
+                    "id": response.indicator.governance_area.id,
+                    "name": response.indicator.governance_area.name,
+                    "area_type": response.indicator.governance_area.area_type.value,
                 },
-                "movs": [
-                    {
-                        "id": mov.id,
-                        "filename": mov.filename,
-                        "original_filename": mov.original_filename,
-                        "file_size": mov.file_size,
-                        "content_type": mov.content_type,
-                        "storage_path": mov.storage_path,
-                        "status": mov.status.value,
-                        "uploaded_at": mov.uploaded_at.isoformat(),
-                    }
-                    for mov in response.movs
-                ],
-                "feedback_comments": [
-                    {
-                        "id": comment.id,
-                        "comment": comment.comment,
-                        "comment_type": comment.comment_type,
-                        "is_internal_note": comment.is_internal_note,
-                        "created_at": comment.created_at.isoformat(),
-                        "assessor": {
-                            "id": comment.assessor.id,
-                            "name": comment.assessor.name,
-                            "email": comment.assessor.email,
-                        }
-                        if comment.assessor
-                        else None,
+                # Technical notes - for now using description, but this could be a separate field
+                "technical_notes": response.indicator.description
+                or "No technical notes available",
+            },
+            "movs": [
+                {
+                    "id": mov.id,
+                    "filename": mov.filename,
+                    "original_filename": mov.original_filename,
+                    "file_size": mov.file_size,
+                    "content_type": mov.content_type,
+                    "storage_path": mov.storage_path,
+                    "status": mov.status.value,
+                    "uploaded_at": mov.uploaded_at.isoformat(),
+                }
+                for mov in response.movs
+            ],
+            "feedback_comments": [
+                {
+                    "id": comment.id,
+                    "comment": comment.comment,
+                    "comment_type": comment.comment_type,
+                    "is_internal_note": comment.is_internal_note,
+                    "created_at": comment.created_at.isoformat(),
+                    "assessor": {
+                        "id": comment.assessor.id,
+                        "name": comment.assessor.name,
+                        "email": comment.assessor.email,
                     }
-                    for comment in response.feedback_comments
-                ],
-            }
-            assessment_data["assessment"]["responses"].append(response_data)
-
-        return assessment_data
+                    if comment.assessor
+                    else None,
+                }
+                for comment in response.feedback_comments
+            ],
+        }
 
     def send_assessment_for_rework(
         self, db: Session, assessment_id: int, assessor: User
@@ -692,6 +1276,10 @@ class AssessorService:
             # Log the error but don't fail the finalization operation
             print(f"Failed to run classification: {e}")
             classification_result = {"success": False, "error": str(e)}
+            # Classification invalidates analytics itself; the validation still changed
+            from app.services.analytics_cache_service import analytics_cache_service
+
+            analytics_cache_service.invalidate()
 
         # Calculate BBI statuses for all active BBIs
         from app.services.bbi_service import bbi_service
@@ -753,176 +1341,100 @@ class AssessorService:
         Returns:
             dict: Analytics data structured for AssessorAnalyticsResponse
         """
+        area_id = assessor.validator_area_id
+
         # Get governance area name
-        governance_area = (
-            db.query(GovernanceArea)
-            .filter(GovernanceArea.id == assessor.governance_area_id)
-            .first()
-        )
+        governance_area = reference_data_service.get_governance_area(db, area_id)
         governance_area_name = governance_area.name if governance_area else "Unknown"
 
-        # Get all assessments in the assessor's governance area
-        # via indicators that belong to responses
-        assessments = (
-            db.query(Assessment)
-            .join(AssessmentResponse, AssessmentResponse.assessment_id == Assessment.id)
-            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
-            .options(
-                joinedload(Assessment.blgu_user).joinedload(User.barangay),
-                joinedload(Assessment.responses).joinedload(
-                    AssessmentResponse.indicator
-                ),
-            )
-            .filter(Indicator.governance_area_id == assessor.governance_area_id)
-            .filter(
-                Assessment.status.in_(
-                    [
-                        AssessmentStatus.SUBMITTED_FOR_REVIEW,
-                        AssessmentStatus.NEEDS_REWORK,
-                        AssessmentStatus.VALIDATED,
-                    ]
-                )
+        # One row per assessment in the assessor's area, with its response
+        # counts summed over all areas from assessment_area_status
+        totals = (
+            select(
+                AssessmentAreaStatus.assessment_id,
+                func.sum(AssessmentAreaStatus.pass_count).label("pass_count"),
+                func.sum(AssessmentAreaStatus.fail_count).label("fail_count"),
+                func.sum(AssessmentAreaStatus.reviewed_count).label("reviewed_count"),
+                func.min(AssessmentAreaStatus.first_reviewed_at).label("first_reviewed_at"),
             )
-            .distinct(Assessment.id)
-            .all()
+            .group_by(AssessmentAreaStatus.assessment_id)
+            .subquery()
         )
+        in_area = select(AssessmentAreaStatus.assessment_id).where(
+            AssessmentAreaStatus.governance_area_id == area_id
+        )
+        assessments = db.execute(
+            select(
+                Assessment.status,
+                Assessment.final_compliance_status,
+                Assessment.submitted_at,
+                Assessment.validated_at,
+                Assessment.rework_count,
+                totals.c.pass_count,
+                totals.c.fail_count,
+                totals.c.reviewed_count,
+                totals.c.first_reviewed_at,
+            )
+            .join(totals, totals.c.assessment_id == Assessment.id)
+            .where(
+                Assessment.id.in_(in_area),
+                Assessment.status.in_(ASSESSOR_VISIBLE_STATUSES),
+            )
+        ).all()
 
         # Calculate overview (performance metrics)
         total_assessed = len(assessments)
-        passed = sum(
-            1
-            for a in assessments
-            if a.final_compliance_status == ComplianceStatus.PASSED
-        )
-        failed = sum(
-            1
-            for a in assessments
-            if a.final_compliance_status == ComplianceStatus.FAILED
-        )
-        # If compliance status not set, count based on validation status
-        # An assessment passes if majority of responses are Pass
-        if total_assessed > 0:
-            assessments_without_compliance = [
-                a
-                for a in assessments
-                if a.final_compliance_status is None
-            ]
-            for a in assessments_without_compliance:
-                if a.responses:
-                    pass_count = sum(
-                        1
-                        for r in a.responses
-                        if r.validation_status == ValidationStatus.PASS
-                    )
-                    fail_count = sum(
-                        1
-                        for r in a.responses
-                        if r.validation_status == ValidationStatus.FAIL
-                    )
-                    if pass_count > fail_count:
-                        passed += 1
-                    elif fail_count > 0:
-                        failed += 1
+        passed = failed = 0
+        for a in assessments:
+            if a.final_compliance_status == ComplianceStatus.PASSED:
+                passed += 1
+            elif a.final_compliance_status == ComplianceStatus.FAILED:
+                failed += 1
+            # If compliance status not set, an assessment passes if the
+            # majority of its responses are Pass
+            elif a.final_compliance_status is None:
+                if a.pass_count > a.fail_count:
+                    passed += 1
+                elif a.fail_count > 0:
+                    failed += 1
 
         pass_rate = (passed / total_assessed * 100) if total_assessed > 0 else 0.0
 
         # Simple trend series: last 6 months of assessment submissions
-        # This is a minimal implementation - can be extended with more granular data
         trend_series = []
         if assessments:
-            # Group by month (simplified - just show last 6 months)
+            submitted_by_month: Dict[str, int] = {}
+            for a in assessments:
+                if a.submitted_at:
+                    month = a.submitted_at.strftime("%Y-%m")
+                    submitted_by_month[month] = submitted_by_month.get(month, 0) + 1
+
             current_date = datetime.utcnow()
             for i in range(6):
-                month_date = current_date - timedelta(days=30 * (5 - i))
-                month_assessed = sum(
-                    1
-                    for a in assessments
-                    if a.submitted_at
-                    and a.submitted_at.year == month_date.year
-                    and a.submitted_at.month == month_date.month
-                )
+                month = (current_date - timedelta(days=30 * (5 - i))).strftime("%Y-%m")
                 trend_series.append(
-                    {
-                        "month": month_date.strftime("%Y-%m"),
-                        "assessed": month_assessed,
-                    }
+                    {"month": month, "assessed": submitted_by_month.get(month, 0)}
                 )
 
-        # Calculate hotspots (top underperforming indicators)
-        # Find indicators with most failures (validation_status = Fail)
-        indicator_failures: Dict[int, Dict[str, Any]] = {}
-        barangay_failures: Dict[int, List[str]] = {}
-
-        for assessment in assessments:
-            barangay_name = getattr(
-                getattr(assessment.blgu_user, "barangay", None), "name", "Unknown"
-            )
-            for response in assessment.responses:
-                if (
-                    response.indicator.governance_area_id == assessor.governance_area_id
-                    and response.validation_status == ValidationStatus.FAIL
-                ):
-                    indicator_id = response.indicator.id
-                    indicator_name = response.indicator.name
-
-                    if indicator_id not in indicator_failures:
-                        indicator_failures[indicator_id] = {
-                            "indicator": indicator_name,
-                            "failed_count": 0,
-                            "barangays": [],
-                        }
-                        barangay_failures[indicator_id] = []
-
-                    indicator_failures[indicator_id]["failed_count"] += 1
-                    if barangay_name not in barangay_failures[indicator_id]:
-                        barangay_failures[indicator_id].append(barangay_name)
-                        indicator_failures[indicator_id]["barangays"].append(
-                            barangay_name
-                        )
-
-        # Convert to list and sort by failed_count (top 10)
-        hotspots_list = [
-            {
-                "indicator": data["indicator"],
-                "indicator_id": indicator_id,
-                "failed_count": data["failed_count"],
-                "barangays": data["barangays"],
-                "reason": None,  # Can be extended with feedback comments analysis
-            }
-            for indicator_id, data in sorted(
-                indicator_failures.items(), key=lambda x: x[1]["failed_count"], reverse=True
-            )[:10]
-        ]
+        hotspots_list = self._get_area_hotspots(db, area_id)
 
         # Calculate workflow metrics
         total_reviewed = sum(
             1
             for a in assessments
-            if a.status == AssessmentStatus.VALIDATED
-            or any(r.validation_status is not None for r in a.responses)
+            if a.status == AssessmentStatus.VALIDATED or a.reviewed_count > 0
         )
 
-        # Calculate average time to first review
+        # Average time to first review (first validated response's updated_at
+        # is the proxy for validation time)
         review_times = []
-        for assessment in assessments:
-            if assessment.submitted_at:
-                # Find first validation timestamp from responses
-                first_validation = None
-                for response in assessment.responses:
-                    if response.validation_status is not None:
-                        # Use updated_at as proxy for validation time
-                        if (
-                            first_validation is None
-                            or response.updated_at < first_validation
-                        ):
-                            first_validation = response.updated_at
-
-                if first_validation:
-                    time_diff = (first_validation - assessment.submitted_at).total_seconds() / (
-                        24 * 3600
-                    )  # Convert to days
-                    if time_diff > 0:
-                        review_times.append(time_diff)
+        for a in assessments:
+            if a.submitted_at and a.first_reviewed_at:
+                time_diff = (a.first_reviewed_at - a.submitted_at).total_seconds() / (
+                    24 * 3600
+                )  # Convert to days
+                if time_diff > 0:
+                    review_times.append(time_diff)
 
         avg_time_to_first_review = (
             sum(review_times) / len(review_times) if review_times else 0.0
@@ -931,21 +1443,14 @@ class AssessorService:
         # Calculate rework cycle time
         rework_times = []
         rework_count = 0
-        for assessment in assessments:
-            if assessment.rework_count > 0:
+        for a in assessments:
+            if a.rework_count > 0:
                 rework_count += 1
-                # Simplified: estimate rework cycle time from status transitions
-                # Time from submission to validation (if validated after rework)
-                if (
-                    assessment.submitted_at
-                    and assessment.validated_at
-                    and assessment.validated_at > assessment.submitted_at
-                ):
-                    time_diff = (
-                        (assessment.validated_at - assessment.submitted_at).total_seconds()
-                        / (24 * 3600)
+                # Simplified: time from submission to validation (if validated after rework)
+                if a.submitted_at and a.validated_at and a.validated_at > a.submitted_at:
+                    rework_times.append(
+                        (a.validated_at - a.submitted_at).total_seconds() / (24 * 3600)
                     )
-                    rework_times.append(time_diff)
 
         avg_rework_cycle_time = (
             sum(rework_times) / len(rework_times) if rework_times else 0.0
@@ -955,10 +1460,8 @@ class AssessorService:
 
         # Counts by status
         counts_by_status: Dict[str, int] = {}
-        for status in AssessmentStatus:
-            count = sum(1 for a in assessments if a.status == status)
-            if count > 0:
-                counts_by_status[status.value] = count
+        for a in assessments:
+            counts_by_status[a.status.value] = counts_by_status.get(a.status.value, 0) + 1
 
         # Build response
         return {
@@ -981,5 +1484,57 @@ class AssessorService:
             "governance_area_name": governance_area_name,
         }
 
+    def _get_area_hotspots(
+        self, db: Session, area_id: Optional[int], top: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Top indicators of an area by failed responses, with affected barangays."""
+        failed_in_area = and_(
+            Indicator.governance_area_id == area_id,
+            AssessmentResponse.validation_status == ValidationStatus.FAIL,
+            Assessment.status.in_(ASSESSOR_VISIBLE_STATUSES),
+        )
+        failed_count = func.count(AssessmentResponse.id)
+        top_indicators = db.execute(
+            select(Indicator.id, Indicator.name, failed_count)
+            .select_from(AssessmentResponse)
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
+            .where(failed_in_area)
+            .group_by(Indicator.id, Indicator.name)
+            .order_by(failed_count.desc(), Indicator.id)
+            .limit(top)
+        ).all()
+        if not top_indicators:
+            return []
+
+        barangays: Dict[int, List[str]] = {}
+        rows = db.execute(
+            select(AssessmentResponse.indicator_id, Barangay.name)
+            .select_from(AssessmentResponse)
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
+            .join(User, User.id == Assessment.blgu_user_id)
+            .outerjoin(Barangay, Barangay.id == User.barangay_id)
+            .where(
+                failed_in_area,
+                AssessmentResponse.indicator_id.in_([row.id for row in top_indicators]),
+            )
+            .distinct()
+            .order_by(AssessmentResponse.indicator_id, Barangay.name)
+        )
+        for indicator_id, barangay_name in rows:
+            barangays.setdefault(indicator_id, []).append(barangay_name or "Unknown")
+
+        return [
+            {
+                "indicator": name,
+                "indicator_id": indicator_id,
+                "failed_count": count,
+                "barangays": barangays.get(indicator_id, []),
+                "reason": None,  # Can be extended with feedback comments analysis
+            }
+            for indicator_id, name, count in top_indicators
+        ]
+
 
 assessor_service = AssessorService()
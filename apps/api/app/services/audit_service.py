@@ -1,11 +1,219 @@
 # 🔒 Audit Service
 # Business logic for audit logging and tracking administrative actions
 
+import atexit
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import (
+    audit_backpressure_total,
+    audit_events_total,
+    audit_flush_batch_size,
+    audit_flush_duration_seconds,
+    audit_queue_depth,
+)
+from app.core.pagination import CountMode, count_rows, iter_keyset, keyset_page
 from app.db.models.admin import AuditLog
-from sqlalchemy.orm import Session
+from loguru import logger
+from sqlalchemy import insert
+from sqlalchemy.orm import Query, Session, joinedload
+
+# A failed batch is retried on later flushes, then dropped (and counted)
+AUDIT_MAX_WRITE_ATTEMPTS = 3
+
+# Keyset sort order for audit log pages (newest first)
+AUDIT_LOG_KEYSET = (AuditLog.created_at, AuditLog.id)
+
+# (insert parameters, failed attempts so far)
+_QueuedEvent = Tuple[Dict[str, Any], int]
+
+
+def _default_session_factory() -> Optional[Callable[[], Session]]:
+    # Resolved on every flush so the writer follows whatever SessionLocal the
+    # process ends up configured with
+    from app.db import base
+
+    return base.SessionLocal
+
+
+class AuditLogWriter:
+    """
+    Write-behind buffer for audit events.
+
+    Events go into a bounded in-process queue and a background thread writes
+    them in batches (one multi-row INSERT and one commit per batch) on its
+    own session, so audited requests never commit on the caller's session
+    or pay a round trip per event.
+
+    - The thread starts on the first event and flushes every
+      AUDIT_FLUSH_INTERVAL_SECONDS, or as soon as a full batch is waiting.
+    - When the queue is full the calling thread flushes it inline
+      (backpressure) instead of dropping events.
+    - stop() drains the queue; it is called from the API lifespan and
+      registered with atexit for workers and scripts.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        self._session_factory = session_factory
+        self._batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self._flush_interval = (
+            flush_interval if flush_interval is not None else settings.AUDIT_FLUSH_INTERVAL_SECONDS
+        )
+        self._queue: "queue.Queue[_QueuedEvent]" = queue.Queue(
+            maxsize=max_queue_size or settings.AUDIT_QUEUE_MAX_SIZE
+        )
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be written."""
+        return self._queue.qsize()
+
+    def enqueue(self, event: Dict[str, Any]) -> None:
+        """
+        Buffer one audit event (AuditLog column values) for writing.
+
+        Never blocks on the database unless the queue is full, in which case
+        the caller flushes the backlog itself.
+        """
+        self.start()
+        try:
+            self._queue.put_nowait((event, 0))
+        except queue.Full:
+            audit_backpressure_total.inc()
+            logger.warning(
+                f"Audit queue full ({self._queue.maxsize} events), flushing inline"
+            )
+            self.flush()
+            try:
+                self._queue.put_nowait((event, 0))
+            except queue.Full:
+                # Other threads refilled it while we flushed; write ours directly
+                self._write_batch([(event, 0)])
+                audit_events_total.labels(outcome="enqueued").inc()
+                return
+
+        audit_events_total.labels(outcome="enqueued").inc()
+        depth = self._queue.qsize()
+        audit_queue_depth.set(depth)
+        if depth >= self._batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        Write everything currently queued, in batches.
+
+        Returns:
+            Number of events written
+        """
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._drain()
+                if not batch:
+                    break
+                if not self._write_batch(batch):
+                    # Failed events were requeued; try again on the next flush
+                    break
+                written += len(batch)
+        audit_queue_depth.set(self._queue.qsize())
+        return written
+
+    def start(self) -> None:
+        """Start the background flush thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="audit-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0) -> int:
+        """
+        Stop the background thread and write any remaining events.
+
+        Returns:
+            Number of events written by the final drain
+        """
+        self._stopping.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        return self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # Keep the thread alive whatever happens
+                logger.error(f"Audit log flush failed: {e}")
+
+    def _drain(self) -> List[_QueuedEvent]:
+        batch: List[_QueuedEvent] = []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[_QueuedEvent]) -> bool:
+        session_factory = self._session_factory or _default_session_factory()
+        if session_factory is None:
+            logger.error(f"Database not configured, dropping {len(batch)} audit events")
+            audit_events_total.labels(outcome="dropped").inc(len(batch))
+            return False
+
+        start = time.perf_counter()
+        db = session_factory()
+        try:
+            db.execute(insert(AuditLog), [event for event, _ in batch])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to write {len(batch)} audit events: {e}")
+            self._requeue_failed(batch)
+            return False
+        finally:
+            db.close()
+
+        audit_flush_duration_seconds.observe(time.perf_counter() - start)
+        audit_flush_batch_size.observe(len(batch))
+        audit_events_total.labels(outcome="written").inc(len(batch))
+        return True
+
+    def _requeue_failed(self, batch: List[_QueuedEvent]) -> None:
+        for event, attempts in batch:
+            if attempts + 1 >= AUDIT_MAX_WRITE_ATTEMPTS:
+                audit_events_total.labels(outcome="dropped").inc()
+                continue
+            try:
+                self._queue.put_nowait((event, attempts + 1))
+                audit_events_total.labels(outcome="retried").inc()
+            except queue.Full:
+                audit_events_total.labels(outcome="dropped").inc()
 
 
 class AuditService:
@@ -13,45 +221,40 @@ class AuditService:
 
     def log_audit_event(
         self,
-        db: Session,
         user_id: int,
         entity_type: str,
         entity_id: Optional[int],
         action: str,
         changes: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
-    ) -> AuditLog:
+    ) -> None:
         """
-        Log an audit event to the database.
+        Record an audit event.
+
+        The event is buffered and written in the background on a separate
+        session (see AuditLogWriter), so it never commits the caller's
+        transaction. Call ``audit_log_writer.flush()`` to write it immediately.
 
         Args:
-            db: Database session
             user_id: ID of the user performing the action
             entity_type: Type of entity being modified (e.g., "indicator", "bbi", "deadline_override")
             entity_id: ID of the entity being modified (optional for bulk operations)
             action: Action performed (e.g., "create", "update", "delete", "deactivate")
             changes: Dictionary of changes with before/after values
             ip_address: IP address of the request
-
-        Returns:
-            AuditLog: Created audit log entry
-        """
-        audit_log = AuditLog(
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action=action,
-            changes=changes,
-            ip_address=ip_address,
-            created_at=datetime.utcnow(),
+        """
+        audit_log_writer.enqueue(
+            {
+                "user_id": user_id,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "action": action,
+                "changes": changes,
+                "ip_address": ip_address,
+                "created_at": datetime.utcnow(),
+            }
         )
 
-        db.add(audit_log)
-        db.commit()
-        db.refresh(audit_log)
-
-        return audit_log
-
     def calculate_json_diff(
         self, before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]
     ) -> Dict[str, Dict[str, Any]]:
@@ -99,9 +302,12 @@ class AuditService:
         action: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> tuple[List[AuditLog], int]:
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[List[AuditLog], Optional[int]]:
         """
-        Get audit logs with optional filtering and pagination.
+        Get audit logs with optional filtering and offset pagination.
+
+        Deep offsets scan every skipped row; prefer get_audit_logs_page.
 
         Args:
             db: Database session
@@ -113,41 +319,138 @@ class AuditService:
             action: Filter by action
             start_date: Filter by start date (inclusive)
             end_date: Filter by end date (inclusive)
+            count: How to compute the total (see CountMode)
 
         Returns:
             tuple: (audit_logs, total_count)
         """
+        query, filtered = self._filtered_query(
+            db, user_id, entity_type, entity_id, action, start_date, end_date
+        )
+        total = count_rows(db, query, count, None if filtered else AuditLog.__tablename__)
+
+        # Most recent first; id breaks ties between events logged in the same batch
+        audit_logs = (
+            query.options(joinedload(AuditLog.user))
+            .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+        return audit_logs, total
+
+    def get_audit_logs_page(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        user_id: Optional[int] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[List[AuditLog], Optional[int], Optional[str]]:
+        """
+        Get one page of audit logs, most recent first, using keyset pagination.
+
+        Pages are keyed on (created_at, id), so every page costs the same
+        index range scan however deep it is.
+
+        Args:
+            db: Database session
+            cursor: Opaque cursor from the previous page (None for the first page)
+            limit: Maximum number of records to return
+            user_id, entity_type, entity_id, action, start_date, end_date:
+                Filters, as in get_audit_logs
+            count: How to compute the total (see CountMode)
+
+        Returns:
+            tuple: (audit_logs, total_count or None, next_cursor or None)
+        """
+        query, filtered = self._filtered_query(
+            db, user_id, entity_type, entity_id, action, start_date, end_date
+        )
+        total = count_rows(db, query, count, None if filtered else AuditLog.__tablename__)
+
+        audit_logs, next_cursor = keyset_page(
+            query.options(joinedload(AuditLog.user)),
+            AUDIT_LOG_KEYSET,
+            cursor,
+            limit,
+            descending=True,
+        )
+        return audit_logs, total, next_cursor
+
+    def iter_audit_logs(
+        self,
+        db: Session,
+        user_id: Optional[int] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[AuditLog]:
+        """
+        Iterate over every matching audit log, most recent first.
+
+        Rows are read one keyset page at a time and released afterwards,
+        so exports of any size run in constant memory.
+        """
+        query, _ = self._filtered_query(
+            db, user_id, entity_type, entity_id, action, start_date, end_date
+        )
+        return iter_keyset(
+            db,
+            query.options(joinedload(AuditLog.user)),
+            AUDIT_LOG_KEYSET,
+            batch_size=batch_size or settings.EXPORT_BATCH_SIZE,
+            descending=True,
+        )
+
+    def _filtered_query(
+        self,
+        db: Session,
+        user_id: Optional[int],
+        entity_type: Optional[str],
+        entity_id: Optional[int],
+        action: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> tuple[Query, bool]:
+        """Build the filtered audit log query; also reports whether any filter applied."""
         query = db.query(AuditLog)
+        filtered = False
 
-        # Apply filters
         if user_id is not None:
             query = query.filter(AuditLog.user_id == user_id)
+            filtered = True
 
         if entity_type:
             query = query.filter(AuditLog.entity_type == entity_type)
+            filtered = True
 
         if entity_id is not None:
             query = query.filter(AuditLog.entity_id == entity_id)
+            filtered = True
 
         if action:
             query = query.filter(AuditLog.action == action)
+            filtered = True
 
         if start_date:
             query = query.filter(AuditLog.created_at >= start_date)
+            filtered = True
 
         if end_date:
             query = query.filter(AuditLog.created_at <= end_date)
+            filtered = True
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Order by most recent first
-        query = query.order_by(AuditLog.created_at.desc())
-
-        # Apply pagination
-        audit_logs = query.offset(skip).limit(limit).all()
-
-        return audit_logs, total
+        return query, filtered
 
     def get_audit_log_by_id(self, db: Session, log_id: int) -> Optional[AuditLog]:
         """Get a single audit log by ID."""
@@ -177,5 +480,9 @@ class AuditService:
         )
 
 
-# Singleton instance for global use
+# Singleton instances for global use
+audit_log_writer = AuditLogWriter()
 audit_service = AuditService()
+
+# Workers and scripts don't run the API lifespan; drain on interpreter exit
+atexit.register(audit_log_writer.stop)
@@ -22,7 +22,9 @@ Usage:
     )
 """
 
+import time
 from typing import Dict, Any, List, Optional
+from app.core.metrics import calculation_duration_seconds, calculation_evaluations_total
 from app.db.enums import ValidationStatus
 from app.schemas.calculation_schema import (
     CalculationSchema,
@@ -85,6 +87,25 @@ class CalculationEngineService:
         if response_data is None:
             response_data = {}
 
+        start_time = time.perf_counter()
+        try:
+            status = self._execute_schema(calculation_schema, response_data, bbi_statuses)
+        except CalculationEngineError:
+            calculation_evaluations_total.labels(outcome="error").inc()
+            raise
+        finally:
+            calculation_duration_seconds.observe(time.perf_counter() - start_time)
+
+        calculation_evaluations_total.labels(outcome=status.value.lower()).inc()
+        return status
+
+    def _execute_schema(
+        self,
+        calculation_schema: Dict[str, Any],
+        response_data: Dict[str, Any],
+        bbi_statuses: Optional[Dict[int, str]],
+    ) -> ValidationStatus:
+        """Parse and evaluate a non-empty calculation schema."""
         try:
             # Parse and validate the calculation schema using Pydantic
             schema_obj = CalculationSchema(**calculation_schema)
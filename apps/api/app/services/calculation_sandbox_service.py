@@ -0,0 +1,468 @@
+# 🧪 Calculation Sandbox Service
+# What-if replay of draft calculation schemas and BBI mapping rules against stored responses
+
+import operator
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.enums import AssessmentStatus, BBIStatus
+from app.db.models.admin import AssessmentCycle
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.barangay import Barangay
+from app.db.models.bbi import BBI
+from app.db.models.governance_area import Indicator
+from app.db.models.user import User
+from app.schemas.calculation_schema import (
+    AndAllRule,
+    BBIFunctionalityCheckRule,
+    CalculationRule,
+    CalculationSchema,
+    ConditionGroup,
+    CountThresholdRule,
+    MatchValueRule,
+    OrAnyRule,
+    PercentageThresholdRule,
+)
+
+# Outcome recorded for a response the rule could not be evaluated against
+ERROR_OUTCOME = "Error"
+# Outcome for a response without a recorded validation status
+NOT_VALIDATED_OUTCOME = "Not validated"
+# Changed (and failed) rows listed in a result, for spot checks
+SAMPLE_SIZE = 50
+# Rows evaluated between time budget checks
+_BUDGET_CHECK_EVERY = 256
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+}
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+def _missing(field_id: str, data: Dict[str, Any]) -> ValueError:
+    return ValueError(
+        f"Field '{field_id}' not found in assessment data. "
+        f"Available fields: {list(data.keys())}"
+    )
+
+
+def compile_rule(rule: CalculationRule) -> Predicate:
+    """
+    Compile a calculation rule into a predicate over response data.
+
+    The rule tree is dispatched once, here, instead of once per response.
+    Predicates behave exactly like IntelligenceService.evaluate_rule,
+    including which inputs raise ValueError.
+    """
+    if isinstance(rule, AndAllRule):
+        conditions = tuple(compile_rule(condition) for condition in rule.conditions)
+        return lambda data: all(condition(data) for condition in conditions)
+
+    if isinstance(rule, OrAnyRule):
+        conditions = tuple(compile_rule(condition) for condition in rule.conditions)
+        return lambda data: any(condition(data) for condition in conditions)
+
+    if isinstance(rule, PercentageThresholdRule):
+        field_id, threshold = rule.field_id, rule.threshold
+        compare = _COMPARATORS[rule.operator]
+
+        def percentage_threshold(data: Dict[str, Any]) -> bool:
+            if field_id not in data:
+                raise _missing(field_id, data)
+            try:
+                value = float(data[field_id])
+            except (TypeError, ValueError):
+                raise ValueError(f"Field '{field_id}' has non-numeric value: {data[field_id]}")
+            return compare(value, threshold)
+
+        return percentage_threshold
+
+    if isinstance(rule, CountThresholdRule):
+        field_id, threshold = rule.field_id, rule.threshold
+        compare = _COMPARATORS[rule.operator]
+
+        def count_threshold(data: Dict[str, Any]) -> bool:
+            if field_id not in data:
+                raise _missing(field_id, data)
+            value = data[field_id]
+            if not isinstance(value, list):
+                raise ValueError(
+                    f"Field '{field_id}' expected list for checkbox count, "
+                    f"got {type(value).__name__}: {value}"
+                )
+            return compare(len(value), threshold)
+
+        return count_threshold
+
+    if isinstance(rule, MatchValueRule):
+        field_id, expected, op = rule.field_id, rule.expected_value, rule.operator
+
+        def match_value(data: Dict[str, Any]) -> bool:
+            if field_id not in data:
+                raise _missing(field_id, data)
+            value = data[field_id]
+            if op == "==":
+                return value == expected
+            if op == "!=":
+                return value != expected
+            if isinstance(value, str):
+                found = str(expected) in value
+            elif isinstance(value, list):
+                found = expected in value
+            else:
+                return op == "not_contains"
+            return found if op == "contains" else not found
+
+        return match_value
+
+    if isinstance(rule, BBIFunctionalityCheckRule):
+        key, expected_status = f"bbi_{rule.bbi_id}_status", rule.expected_status
+        return lambda data: key in data and data[key] == expected_status
+
+    raise ValueError(f"Unknown rule type: {type(rule).__name__}")
+
+
+def _compile_group(group: ConditionGroup) -> Predicate:
+    rules = tuple(compile_rule(rule) for rule in group.rules)
+    if group.operator == "AND":
+        return lambda data: all(rule(data) for rule in rules)
+    if group.operator == "OR":
+        return lambda data: any(rule(data) for rule in rules)
+    raise ValueError(f"Unknown condition group operator: {group.operator}")
+
+
+def compile_calculation_schema(schema: CalculationSchema) -> Callable[[Dict[str, Any]], str]:
+    """Compile a calculation schema into a function from response data to its output status."""
+    groups = tuple(_compile_group(group) for group in schema.condition_groups)
+    on_pass, on_fail = schema.output_status_on_pass, schema.output_status_on_fail
+    return lambda data: on_pass if all(group(data) for group in groups) else on_fail
+
+
+def compile_mapping_rules(mapping_rules: Dict[str, Any]) -> Callable[[Dict[int, str]], str]:
+    """
+    Compile BBI mapping rules into a function from indicator statuses to a BBI status.
+
+    Same semantics as BBIService._evaluate_mapping_rules: no conditions means
+    Non-Functional, and an unknown operator falls back to AND.
+    """
+    conditions = tuple(
+        (condition.get("indicator_id"), condition.get("required_status"))
+        for condition in mapping_rules.get("conditions", [])
+    )
+    combine = any if mapping_rules.get("operator", "AND") == "OR" else all
+    functional, non_functional = BBIStatus.FUNCTIONAL.value, BBIStatus.NON_FUNCTIONAL.value
+
+    def evaluate(statuses: Dict[int, str]) -> str:
+        if conditions and combine(statuses.get(i) == required for i, required in conditions):
+            return functional
+        return non_functional
+
+    return evaluate
+
+
+def mapping_rule_indicator_ids(mapping_rules: Optional[Dict[str, Any]]) -> List[int]:
+    return [
+        condition["indicator_id"]
+        for condition in (mapping_rules or {}).get("conditions", [])
+        if isinstance(condition.get("indicator_id"), int)
+    ]
+
+
+class CalculationSandboxService:
+    """
+    Service for what-if evaluation of rule changes.
+
+    A draft calculation schema (or BBI mapping) is compiled once and replayed,
+    together with the current rule, over every stored submission in scope in
+    one streamed pass. The result is the outcome distribution under both
+    rules, the per-outcome delta and the transitions between them, so rule
+    authors can see the impact of a threshold change across all barangays.
+
+    Evaluation stops at a time budget and reports how far it got. Large
+    replays are meant to run in the sandbox Celery worker (see
+    app.workers.calculation_sandbox).
+    """
+
+    # ========================================
+    # SCOPE
+    # ========================================
+
+    def _scope(self, db: Session, cycle_id: Optional[int]) -> List[Any]:
+        """WHERE clauses limiting replays to submitted assessments (of a cycle's year)."""
+        clauses = [Assessment.status != AssessmentStatus.DRAFT]
+        if cycle_id is not None:
+            cycle = db.get(AssessmentCycle, cycle_id)
+            if not cycle:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Assessment cycle with ID {cycle_id} not found",
+                )
+            clauses.append(Assessment.submitted_at >= datetime(cycle.year, 1, 1))
+            clauses.append(Assessment.submitted_at < datetime(cycle.year + 1, 1, 1))
+        return clauses
+
+    def _max_rows(self, max_responses: Optional[int]) -> int:
+        return min(max_responses or settings.WHAT_IF_MAX_RESPONSES, settings.WHAT_IF_MAX_RESPONSES)
+
+    def count_indicator_responses(
+        self, db: Session, indicator_id: int, cycle_id: Optional[int] = None
+    ) -> int:
+        """Number of stored responses an indicator what-if would replay."""
+        return db.scalar(
+            select(func.count(AssessmentResponse.id))
+            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
+            .where(AssessmentResponse.indicator_id == indicator_id, *self._scope(db, cycle_id))
+        )
+
+    def count_assessments(self, db: Session, cycle_id: Optional[int] = None) -> int:
+        """Number of assessments a BBI what-if would replay."""
+        return db.scalar(select(func.count(Assessment.id)).where(*self._scope(db, cycle_id)))
+
+    # ========================================
+    # REPLAY
+    # ========================================
+
+    def _replay(
+        self,
+        rows: Iterable[Tuple[int, Optional[str], Any]],
+        current: Callable[[Any], str],
+        draft: Callable[[Any], str],
+        time_budget: float,
+    ) -> Dict[str, Any]:
+        """Evaluate both rules over (assessment_id, barangay, input) rows within a time budget."""
+        started = time.monotonic()
+        deadline = started + time_budget
+
+        current_counts: Counter = Counter()
+        draft_counts: Counter = Counter()
+        transitions: Counter = Counter()
+        changed: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        evaluated = 0
+        truncated = False
+
+        for assessment_id, barangay_name, data in rows:
+            if evaluated % _BUDGET_CHECK_EVERY == 0 and evaluated and time.monotonic() > deadline:
+                truncated = True
+                break
+            evaluated += 1
+
+            outcomes = []
+            for rule in (current, draft):
+                try:
+                    outcomes.append(rule(data))
+                except (ValueError, TypeError) as e:
+                    outcomes.append(ERROR_OUTCOME)
+                    if len(errors) < SAMPLE_SIZE:
+                        errors.append({"assessment_id": assessment_id, "error": str(e)})
+            before, after = outcomes
+            current_counts[before] += 1
+            draft_counts[after] += 1
+            if before != after:
+                transitions[f"{before} -> {after}"] += 1
+                if len(changed) < SAMPLE_SIZE:
+                    changed.append(
+                        {
+                            "assessment_id": assessment_id,
+                            "barangay_name": barangay_name,
+                            "current": before,
+                            "draft": after,
+                        }
+                    )
+
+        outcomes = sorted(set(current_counts) | set(draft_counts))
+        return {
+            "evaluated": evaluated,
+            "truncated": truncated,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            "current": dict(current_counts),
+            "draft": dict(draft_counts),
+            "delta": {
+                outcome: draft_counts[outcome] - current_counts[outcome]
+                for outcome in outcomes
+                if draft_counts[outcome] != current_counts[outcome]
+            },
+            "changed": sum(transitions.values()),
+            "transitions": dict(transitions),
+            "changed_samples": changed,
+            "error_samples": errors,
+        }
+
+    def evaluate_indicator_what_if(
+        self,
+        db: Session,
+        indicator_id: int,
+        draft_schema: CalculationSchema,
+        cycle_id: Optional[int] = None,
+        max_responses: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Replay a draft calculation schema over an indicator's stored responses.
+
+        The current rule is the indicator's saved calculation_schema; if it
+        has none, the recorded validation statuses are the baseline.
+
+        Args:
+            db: Database session
+            indicator_id: Indicator whose responses are replayed
+            draft_schema: Draft calculation schema
+            cycle_id: Only replay submissions from this cycle's year
+            max_responses: Replay at most this many responses
+            time_budget: Seconds before evaluation stops (default
+                WHAT_IF_TIME_BUDGET_SECONDS)
+
+        Returns:
+            dict: Outcome distributions, deltas, transitions and samples
+        """
+        indicator = db.get(Indicator, indicator_id)
+        if not indicator:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Indicator with ID {indicator_id} not found",
+            )
+
+        draft = compile_calculation_schema(draft_schema)
+        if indicator.calculation_schema:
+            baseline = "calculation_schema"
+            saved = compile_calculation_schema(CalculationSchema(**indicator.calculation_schema))
+            current = lambda row: saved(row[0])  # noqa: E731
+        else:
+            baseline = "validation_status"
+            current = lambda row: row[1].value if row[1] else NOT_VALIDATED_OUTCOME  # noqa: E731
+
+        limit = self._max_rows(max_responses)
+        rows = db.execute(
+            select(
+                AssessmentResponse.assessment_id,
+                Barangay.name,
+                AssessmentResponse.response_data,
+                AssessmentResponse.validation_status,
+            )
+            .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
+            .outerjoin(User, User.id == Assessment.blgu_user_id)
+            .outerjoin(Barangay, Barangay.id == User.barangay_id)
+            .where(AssessmentResponse.indicator_id == indicator_id, *self._scope(db, cycle_id))
+            .order_by(AssessmentResponse.assessment_id)
+            .limit(limit)
+            .execution_options(yield_per=500)
+        )
+
+        result = self._replay(
+            (
+                (assessment_id, barangay_name, (data or {}, validation_status))
+                for assessment_id, barangay_name, data, validation_status in rows
+            ),
+            current,
+            lambda row: draft(row[0]),
+            settings.WHAT_IF_TIME_BUDGET_SECONDS if time_budget is None else time_budget,
+        )
+        return {
+            "target": "indicator",
+            "indicator_id": indicator_id,
+            "cycle_id": cycle_id,
+            "baseline": baseline,
+            "limit": limit,
+            **result,
+        }
+
+    def evaluate_bbi_what_if(
+        self,
+        db: Session,
+        bbi_id: int,
+        draft_mapping_rules: Dict[str, Any],
+        cycle_id: Optional[int] = None,
+        max_responses: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Replay draft BBI mapping rules over every assessment in scope.
+
+        Indicator statuses come from one query restricted to the indicators
+        either rule set references; the current rule is the BBI's saved
+        mapping_rules (no rules means Non-Functional, as in BBIService).
+
+        Args:
+            db: Database session
+            bbi_id: BBI whose mapping is being changed
+            draft_mapping_rules: Draft mapping rules
+            cycle_id: Only replay submissions from this cycle's year
+            max_responses: Replay at most this many assessments
+            time_budget: Seconds before evaluation stops
+
+        Returns:
+            dict: Outcome distributions, deltas, transitions and samples
+        """
+        bbi = db.get(BBI, bbi_id)
+        if not bbi:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"BBI with ID {bbi_id} not found",
+            )
+
+        current = compile_mapping_rules(bbi.mapping_rules or {})
+        draft = compile_mapping_rules(draft_mapping_rules)
+        indicator_ids = set(mapping_rule_indicator_ids(bbi.mapping_rules))
+        indicator_ids.update(mapping_rule_indicator_ids(draft_mapping_rules))
+
+        limit = self._max_rows(max_responses)
+        scope = self._scope(db, cycle_id)
+        assessments = db.execute(
+            select(Assessment.id, Barangay.name)
+            .outerjoin(User, User.id == Assessment.blgu_user_id)
+            .outerjoin(Barangay, Barangay.id == User.barangay_id)
+            .where(*scope)
+            .order_by(Assessment.id)
+            .limit(limit)
+        ).all()
+
+        statuses: Dict[int, Dict[int, str]] = {assessment_id: {} for assessment_id, _ in assessments}
+        if indicator_ids and statuses:
+            for assessment_id, indicator_id, validation_status in db.execute(
+                select(
+                    AssessmentResponse.assessment_id,
+                    AssessmentResponse.indicator_id,
+                    AssessmentResponse.validation_status,
+                )
+                .join(Assessment, Assessment.id == AssessmentResponse.assessment_id)
+                .where(
+                    AssessmentResponse.indicator_id.in_(indicator_ids),
+                    AssessmentResponse.validation_status.isnot(None),
+                    *scope,
+                )
+            ):
+                if assessment_id in statuses:
+                    statuses[assessment_id][indicator_id] = validation_status.value
+
+        result = self._replay(
+            (
+                (assessment_id, barangay_name, statuses[assessment_id])
+                for assessment_id, barangay_name in assessments
+            ),
+            current,
+            draft,
+            settings.WHAT_IF_TIME_BUDGET_SECONDS if time_budget is None else time_budget,
+        )
+        return {
+            "target": "bbi",
+            "bbi_id": bbi_id,
+            "cycle_id": cycle_id,
+            "baseline": "mapping_rules",
+            "limit": limit,
+            **result,
+        }
+
+
+calculation_sandbox_service = CalculationSandboxService()
@@ -34,6 +34,7 @@ from app.db.models.assessment import AssessmentResponse
 from app.db.models.governance_area import Indicator
 from app.db.enums import ValidationStatus
 from app.services.calculation_engine_service import calculation_engine_service
+from app.services.indicator_version_service import indicator_version_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -62,7 +63,8 @@ class ComplianceValidationService:
         db: Session,
         assessment_id: int,
         indicator_id: int,
-        bbi_statuses: Optional[Dict[int, str]] = None
+        bbi_statuses: Optional[Dict[int, str]] = None,
+        use_pinned_version: bool = False
     ) -> Dict[str, Any]:
         """
         Validate compliance for a single indicator response.
@@ -79,6 +81,8 @@ class ComplianceValidationService:
             assessment_id: ID of the assessment
             indicator_id: ID of the indicator to validate
             bbi_statuses: Optional dict mapping BBI IDs to their status (for BBI rules)
+            use_pinned_version: Evaluate against the indicator version the response
+                was answered against instead of the current one
 
         Returns:
             Dict with validation results:
@@ -122,16 +126,22 @@ class ComplianceValidationService:
                     f"No response found for assessment {assessment_id} and indicator {indicator_id}"
                 )
 
+            schemas = (
+                indicator_version_service.get_pinned_indicator(db, response)
+                if use_pinned_version
+                else indicator
+            )
+
             # Execute calculation
             calculated_status = self.calculation_engine.execute_calculation(
-                calculation_schema=indicator.calculation_schema,
+                calculation_schema=schemas.calculation_schema,
                 response_data=response.response_data,
                 bbi_statuses=bbi_statuses or {}
             )
 
             # Generate remark
             generated_remark = self.calculation_engine.get_remark_for_status(
-                remark_schema=indicator.remark_schema,
+                remark_schema=schemas.remark_schema,
                 status=calculated_status
             )
 
@@ -184,7 +194,8 @@ class ComplianceValidationService:
         self,
         db: Session,
         assessment_id: int,
-        bbi_statuses: Optional[Dict[int, str]] = None
+        bbi_statuses: Optional[Dict[int, str]] = None,
+        use_pinned_version: bool = False
     ) -> Dict[str, Any]:
         """
         Validate compliance for all auto-calculable indicators in an assessment.
@@ -196,6 +207,8 @@ class ComplianceValidationService:
             db: Database session
             assessment_id: ID of the assessment to validate
             bbi_statuses: Optional dict mapping BBI IDs to their status
+            use_pinned_version: Evaluate each response against the indicator
+                version it was answered against
 
         Returns:
             Dict with summary:
@@ -254,7 +267,8 @@ class ComplianceValidationService:
                     db=db,
                     assessment_id=assessment_id,
                     indicator_id=indicator.id,
-                    bbi_statuses=bbi_statuses
+                    bbi_statuses=bbi_statuses,
+                    use_pinned_version=use_pinned_version
                 )
 
                 results.append(result)
@@ -303,18 +317,22 @@ class ComplianceValidationService:
         self,
         db: Session,
         indicator_id: int,
-        bbi_statuses: Optional[Dict[int, str]] = None
+        bbi_statuses: Optional[Dict[int, str]] = None,
+        use_pinned_version: bool = False
     ) -> Dict[str, Any]:
         """
         Recalculate compliance for all responses to a specific indicator.
 
         This is useful when an indicator's calculation schema is updated and
-        you want to recalculate all existing responses.
+        you want to recalculate all existing responses. With
+        ``use_pinned_version`` each response is instead re-evaluated against
+        the version it was answered against (historical recalculation).
 
         Args:
             db: Database session
             indicator_id: ID of the indicator
             bbi_statuses: Optional dict mapping BBI IDs to their status
+            use_pinned_version: Evaluate each response against its pinned version
 
         Returns:
             Dict with summary similar to bulk_validate_assessment
@@ -352,16 +370,22 @@ class ComplianceValidationService:
 
             for response in responses:
                 try:
+                    schemas = (
+                        indicator_version_service.get_pinned_indicator(db, response)
+                        if use_pinned_version
+                        else indicator
+                    )
+
                     # Execute calculation
                     calculated_status = self.calculation_engine.execute_calculation(
-                        calculation_schema=indicator.calculation_schema,
+                        calculation_schema=schemas.calculation_schema,
                         response_data=response.response_data,
                         bbi_statuses=bbi_statuses or {}
                     )
 
                     # Generate remark
                     generated_remark = self.calculation_engine.get_remark_for_status(
-                        remark_schema=indicator.remark_schema,
+                        remark_schema=schemas.remark_schema,
                         status=calculated_status
                     )
 
@@ -0,0 +1,192 @@
+# ⏰ Deadline Reminder Service
+# Plans proactive deadline reminders and overdue escalations for the active cycle
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.enums import AssessmentStatus, UserRole
+from app.db.models.assessment import Assessment
+from app.db.models.barangay import Barangay
+from app.db.models.user import User
+from app.services.deadline_service import DeadlineStatusType, deadline_service
+from app.services.notification_service import notification_service
+from app.services.notification_transport import OutgoingMessage
+from app.services.reference_data_service import reference_data_service
+
+# Phases that BLGU users are reminded about, with their display names
+REMINDER_PHASES = {
+    "phase1": "Phase 1 submission",
+    "rework": "Rework submission",
+}
+
+# Assessment statuses meaning the barangay owes a rework submission
+REWORK_STATUSES = (AssessmentStatus.REWORK, AssessmentStatus.NEEDS_REWORK)
+
+
+class DeadlineReminderService:
+    """
+    Service that turns the deadline status board into notifications.
+
+    - Pending barangays within DEADLINE_REMINDER_DAYS_BEFORE of a deadline
+      get a reminder. Only barangays whose assessment was sent back for
+      rework are reminded about the rework deadline.
+    - Overdue barangays (up to DEADLINE_ESCALATION_DAYS_AFTER past the
+      deadline) get an overdue notice, and MLGOO-DILG users get one digest
+      listing them.
+
+    Every recipient gets at most one message per cycle per day covering all
+    of their phases; the idempotency key encodes exactly that. Messages are
+    rendered once per barangay (and once for the admin digest), not once
+    per recipient.
+    """
+
+    def plan(self, db: Session) -> List[OutgoingMessage]:
+        """
+        Build today's reminder and escalation messages for the active cycle.
+
+        Phase 1 statuses come from the set-based deadline board (one grouped
+        query); rework statuses from one query for barangays with an
+        assessment in rework; recipients from one query for BLGU users and
+        one for MLGOO-DILG users.
+        """
+        cycle = reference_data_service.get_active_cycle(db)
+        if not cycle:
+            return []
+
+        now = datetime.now(timezone.utc)
+        remind_within = timedelta(days=settings.DEADLINE_REMINDER_DAYS_BEFORE)
+        escalate_within = timedelta(days=settings.DEADLINE_ESCALATION_DAYS_AFTER)
+
+        # barangay_id -> [(status, phase, deadline)]
+        due: Dict[int, List[Tuple[str, str, datetime]]] = defaultdict(list)
+        # phase -> [barangay name]
+        overdue_by_phase: Dict[str, List[str]] = defaultdict(list)
+        barangay_names: Dict[int, str] = {}
+
+        def note(barangay_id: int, phase: str, status: str, deadline: datetime) -> None:
+            if status == DeadlineStatusType.PENDING.value:
+                if deadline - now <= remind_within:
+                    due[barangay_id].append((status, phase, deadline))
+            elif status == DeadlineStatusType.OVERDUE.value:
+                if now - deadline <= escalate_within:
+                    due[barangay_id].append((status, phase, deadline))
+                    overdue_by_phase[phase].append(barangay_names[barangay_id])
+
+        for barangay_status in deadline_service.get_deadline_status(db, cycle.id):
+            barangay_id = barangay_status["barangay_id"]
+            barangay_names[barangay_id] = barangay_status["barangay_name"]
+            note(
+                barangay_id,
+                "phase1",
+                barangay_status["phase1"]["status"],
+                datetime.fromisoformat(barangay_status["phase1"]["deadline"]),
+            )
+
+        # The board works from each barangay's latest submission, so it can't
+        # tell who owes a rework; those are the barangays whose assessment in
+        # the cycle's year was sent back
+        rework_deadline = cycle.rework_deadline
+        if rework_deadline.tzinfo is None:
+            rework_deadline = rework_deadline.replace(tzinfo=timezone.utc)
+        rework_status = (
+            DeadlineStatusType.PENDING.value
+            if now < rework_deadline
+            else DeadlineStatusType.OVERDUE.value
+        )
+        for barangay_id, barangay_name in db.execute(
+            select(Barangay.id, Barangay.name)
+            .join(User, User.barangay_id == Barangay.id)
+            .join(Assessment, Assessment.blgu_user_id == User.id)
+            .where(
+                Assessment.status.in_(REWORK_STATUSES),
+                Assessment.submitted_at >= datetime(cycle.year, 1, 1),
+                Assessment.submitted_at < datetime(cycle.year + 1, 1, 1),
+            )
+            .distinct()
+            .order_by(Barangay.id)
+        ):
+            barangay_names[barangay_id] = barangay_name
+            note(barangay_id, "rework", rework_status, rework_deadline)
+
+        if not due:
+            return []
+
+        today = now.date().isoformat()
+        messages: List[OutgoingMessage] = []
+
+        # barangay_id -> [(user_id, email)]
+        recipients: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        for user_id, email, barangay_id in db.execute(
+            select(User.id, User.email, User.barangay_id)
+            .where(
+                User.barangay_id.in_(list(due)),
+                User.role == UserRole.BLGU_USER,
+                User.is_active == True,
+            )
+            .order_by(User.id)
+        ):
+            recipients[barangay_id].append((user_id, email))
+
+        # One rendering per barangay, shared by all of its BLGU users
+        for barangay_id, users in recipients.items():
+            overdue = any(
+                status == DeadlineStatusType.OVERDUE.value for status, _, _ in due[barangay_id]
+            )
+            messages.extend(
+                notification_service.render_batch(
+                    kind="deadline_overdue" if overdue else "deadline_reminder",
+                    key_prefix=f"deadline-reminder:{cycle.id}",
+                    subject=f"{cycle.name}: "
+                    + ("submission overdue" if overdue else "upcoming submission deadline"),
+                    template="deadline_reminder",
+                    context={
+                        "barangay_name": barangay_names[barangay_id],
+                        "cycle_name": cycle.name,
+                        "items": [
+                            {
+                                "label": REMINDER_PHASES[phase],
+                                "overdue": status == DeadlineStatusType.OVERDUE.value,
+                                "deadline": deadline.strftime("%B %d, %Y at %I:%M %p UTC"),
+                            }
+                            for status, phase, deadline in due[barangay_id]
+                        ],
+                    },
+                    recipients=[(f"{user_id}:{today}", email) for user_id, email in users],
+                )
+            )
+
+        if overdue_by_phase:
+            admins = db.execute(
+                select(User.id, User.email)
+                .where(
+                    User.role == UserRole.MLGOO_DILG,
+                    User.is_active == True,
+                )
+                .order_by(User.id)
+            ).all()
+            messages.extend(
+                notification_service.render_batch(
+                    kind="deadline_escalation",
+                    key_prefix=f"deadline-escalation:{cycle.id}",
+                    subject=f"{cycle.name}: overdue barangay submissions",
+                    template="deadline_escalation",
+                    context={
+                        "cycle_name": cycle.name,
+                        "phases": [
+                            {"label": REMINDER_PHASES[phase], "barangays": sorted(names)}
+                            for phase, names in overdue_by_phase.items()
+                        ],
+                    },
+                    recipients=[(f"{admin_id}:{today}", email) for admin_id, email in admins],
+                )
+            )
+
+        return messages
+
+
+deadline_reminder_service = DeadlineReminderService()
@@ -2,13 +2,20 @@
 # Business logic for managing assessment cycles and deadline overrides
 
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
+import copy
 import csv
+import itertools
+import threading
+import time
 from io import StringIO
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.table_cache import subscribe
 
 from app.db.models.admin import AssessmentCycle, DeadlineOverride
 from app.db.models.barangay import Barangay
@@ -16,6 +23,7 @@ from app.db.models.governance_area import Indicator
 from app.db.models.user import User
 from app.db.models.assessment import Assessment
 from app.db.enums import AssessmentStatus
+from app.services.reference_data_service import AssessmentCycleRef, reference_data_service
 from app.workers.notifications import send_deadline_extension_notification
 
 
@@ -28,6 +36,28 @@ class DeadlineStatusType(str, Enum):
     OVERDUE = "overdue"  # Not submitted, deadline passed
 
 
+# Deadline phases in order, with the AssessmentCycle column holding each deadline
+DEADLINE_PHASES = (
+    ("phase1", "phase1_deadline"),
+    ("rework", "rework_deadline"),
+    ("phase2", "phase2_deadline"),
+    ("calibration", "calibration_deadline"),
+)
+
+# Tables whose committed writes can change a barangay's deadline status
+STATUS_TABLES = {
+    "assessments",
+    "deadline_overrides",
+    "assessment_cycles",
+    "barangays",
+    "users",
+}
+
+# Phase extended by deadline overrides (apply_deadline_override grants them
+# against phase2_deadline)
+OVERRIDE_PHASE = "phase2"
+
+
 class DeadlineService:
     """
     Service for managing assessment cycles and deadline overrides.
@@ -41,7 +71,25 @@ class DeadlineService:
 
     def __init__(self):
         """Initialize the deadline service."""
-        pass
+        # cycle_id -> (generation, computed_at, valid_until, status_results)
+        self._status_cache: Dict[
+            int, Tuple[int, float, Optional[datetime], List[Dict[str, Any]]]
+        ] = {}
+        self._status_cache_lock = threading.Lock()
+        # Bumped after every commit that writes one of STATUS_TABLES
+        self._generation = itertools.count()
+        self._current_generation = next(self._generation)
+        subscribe(STATUS_TABLES, lambda written: self.invalidate_status_cache())
+
+    def invalidate_status_cache(self) -> None:
+        """Mark every cached deadline status as stale."""
+        with self._status_cache_lock:
+            self._current_generation = next(self._generation)
+
+    def clear_status_cache(self) -> None:
+        """Drop all cached deadline statuses (mainly for tests)."""
+        with self._status_cache_lock:
+            self._status_cache.clear()
 
     def create_assessment_cycle(
         self,
@@ -232,6 +280,10 @@ class DeadlineService:
         - pending: Not submitted, deadline not yet passed
         - overdue: Not submitted, deadline passed
 
+        Results are cached per cycle until a submission, override, cycle or
+        barangay change is committed, the next deadline passes, or
+        DEADLINE_STATUS_CACHE_TTL_SECONDS elapses.
+
         Args:
             db: Database session
             cycle_id: Optional cycle ID to check (defaults to active cycle)
@@ -243,82 +295,114 @@ class DeadlineService:
         if cycle_id:
             cycle = db.query(AssessmentCycle).filter(AssessmentCycle.id == cycle_id).first()
         else:
-            cycle = self.get_active_cycle(db)
+            cycle = reference_data_service.get_active_cycle(db)
 
         if not cycle:
             return []
 
-        # Get all barangays
-        barangays = db.query(Barangay).all()
-
-        # Get all assessments for this cycle (we'll use submission timestamps)
-        # For simplicity, we'll check assessments by their submitted_at timestamp
-        assessments = (
-            db.query(Assessment)
-            .join(User, Assessment.blgu_user_id == User.id)
-            .options(joinedload(Assessment.blgu_user))
-            .filter(User.barangay_id.isnot(None))
-            .all()
-        )
-
-        # Build assessment lookup by barangay_id
-        assessment_by_barangay = {}
-        for assessment in assessments:
-            barangay_id = assessment.blgu_user.barangay_id
-            if barangay_id not in assessment_by_barangay:
-                assessment_by_barangay[barangay_id] = []
-            assessment_by_barangay[barangay_id].append(assessment)
-
-        # Get deadline overrides for this cycle
-        overrides = (
-            db.query(DeadlineOverride)
-            .filter(DeadlineOverride.cycle_id == cycle.id)
-            .all()
-        )
+        now = datetime.now(timezone.utc)
+        with self._status_cache_lock:
+            generation = self._current_generation
+            cached = self._status_cache.get(cycle.id)
+        if (
+            cached is not None
+            and cached[0] == generation
+            and time.monotonic() - cached[1] < settings.DEADLINE_STATUS_CACHE_TTL_SECONDS
+            and (cached[2] is None or now < cached[2])
+        ):
+            return copy.deepcopy(cached[3])
+
+        status_results, valid_until = self._compute_deadline_status(db, cycle, now)
+        with self._status_cache_lock:
+            self._status_cache[cycle.id] = (
+                generation,
+                time.monotonic(),
+                valid_until,
+                status_results,
+            )
+        return copy.deepcopy(status_results)
 
-        # Build override lookup by (barangay_id, indicator_id)
-        override_lookup = {}
-        for override in overrides:
-            key = (override.barangay_id, override.indicator_id)
-            override_lookup[key] = override.new_deadline
+    def _compute_deadline_status(
+        self, db: Session, cycle: AssessmentCycle | AssessmentCycleRef, now: datetime
+    ) -> Tuple[List[Dict[str, Any]], Optional[datetime]]:
+        """
+        Compute every barangay's phase statuses for a cycle.
 
-        now = datetime.now(timezone.utc)
-        status_results = []
+        The latest submission per barangay within the cycle's year comes from
+        a single grouped query; overrides (max new deadline per barangay) from
+        a second one. Overrides extend OVERRIDE_PHASE.
 
-        for barangay in barangays:
-            barangay_assessments = assessment_by_barangay.get(barangay.id, [])
+        Returns:
+            tuple: (status_results, valid_until) where valid_until is the next
+                deadline still in the future, at which a pending status turns
+                overdue (None if all deadlines have passed)
+        """
+        deadlines = {
+            phase: self._ensure_timezone_aware(getattr(cycle, column))
+            for phase, column in DEADLINE_PHASES
+        }
 
-            # Determine status for each phase
-            phase1_status = self._determine_phase_status(
-                barangay_assessments, cycle.phase1_deadline, now, phase="phase1"
-            )
-            rework_status = self._determine_phase_status(
-                barangay_assessments, cycle.rework_deadline, now, phase="rework"
+        # Latest non-draft submission per barangay in the cycle's year
+        year_start = datetime(cycle.year, 1, 1)
+        year_end = datetime(cycle.year + 1, 1, 1)
+        latest_submission = (
+            select(
+                User.barangay_id.label("barangay_id"),
+                func.max(Assessment.submitted_at).label("submitted_at"),
             )
-            phase2_status = self._determine_phase_status(
-                barangay_assessments, cycle.phase2_deadline, now, phase="phase2"
-            )
-            calibration_status = self._determine_phase_status(
-                barangay_assessments,
-                cycle.calibration_deadline,
-                now,
-                phase="calibration",
+            .join(User, Assessment.blgu_user_id == User.id)
+            .where(
+                User.barangay_id.isnot(None),
+                Assessment.status != AssessmentStatus.DRAFT,
+                Assessment.submitted_at >= year_start,
+                Assessment.submitted_at < year_end,
             )
+            .group_by(User.barangay_id)
+            .subquery()
+        )
+        rows = db.execute(
+            select(Barangay.id, Barangay.name, latest_submission.c.submitted_at)
+            .outerjoin(latest_submission, latest_submission.c.barangay_id == Barangay.id)
+            .order_by(Barangay.id)
+        ).all()
+
+        # Extended deadlines per (barangay, phase). Overrides belong to
+        # OVERRIDE_PHASE whatever its deadline was when they were granted, so
+        # they still apply after the cycle's deadline is edited.
+        extensions: Dict[Tuple[int, str], datetime] = {}
+        overrides = db.execute(
+            select(DeadlineOverride.barangay_id, func.max(DeadlineOverride.new_deadline))
+            .where(DeadlineOverride.cycle_id == cycle.id)
+            .group_by(DeadlineOverride.barangay_id)
+        ).all()
+        for barangay_id, new_deadline in overrides:
+            new_deadline = self._ensure_timezone_aware(new_deadline)
+            if new_deadline > deadlines[OVERRIDE_PHASE]:
+                extensions[(barangay_id, OVERRIDE_PHASE)] = new_deadline
 
-            status_results.append(
-                {
-                    "barangay_id": barangay.id,
-                    "barangay_name": barangay.name,
-                    "cycle_id": cycle.id,
-                    "cycle_name": cycle.name,
-                    "phase1": phase1_status,
-                    "rework": rework_status,
-                    "phase2": phase2_status,
-                    "calibration": calibration_status,
-                }
-            )
+        status_results = []
+        for barangay_id, barangay_name, submitted_at in rows:
+            if submitted_at is not None:
+                submitted_at = self._ensure_timezone_aware(submitted_at)
+
+            result = {
+                "barangay_id": barangay_id,
+                "barangay_name": barangay_name,
+                "cycle_id": cycle.id,
+                "cycle_name": cycle.name,
+            }
+            for phase, deadline in deadlines.items():
+                result[phase] = self._phase_status(
+                    submitted_at, extensions.get((barangay_id, phase), deadline), now
+                )
+            status_results.append(result)
 
-        return status_results
+        future_deadlines = [
+            deadline
+            for deadline in itertools.chain(deadlines.values(), extensions.values())
+            if deadline > now
+        ]
+        return status_results, min(future_deadlines, default=None)
 
     def _ensure_timezone_aware(self, dt: datetime) -> datetime:
         """
@@ -330,42 +414,18 @@ class DeadlineService:
             return dt.replace(tzinfo=timezone.utc)
         return dt
 
-    def _determine_phase_status(
-        self,
-        assessments: List[Assessment],
-        deadline: datetime,
-        now: datetime,
-        phase: str,
+    def _phase_status(
+        self, submitted_at: Optional[datetime], deadline: datetime, now: datetime
     ) -> Dict[str, Any]:
         """
-        Helper method to determine status for a specific phase.
+        Status of one phase given the latest (timezone-aware) submission time.
 
         Args:
-            assessments: List of assessments for the barangay
-            deadline: Deadline for this phase
+            submitted_at: Latest submission, or None if not submitted
+            deadline: Timezone-aware deadline for this phase
             now: Current timestamp
-            phase: Phase name (for context)
-
-        Returns:
-            Dictionary with status and additional info
         """
-        # Ensure deadline is timezone-aware
-        deadline = self._ensure_timezone_aware(deadline)
-
-        # Check if there's a submitted assessment
-        submitted_assessments = [
-            a
-            for a in assessments
-            if a.submitted_at and a.status != AssessmentStatus.DRAFT
-        ]
-
-        if submitted_assessments:
-            # Get the latest submission
-            latest_submission = max(submitted_assessments, key=lambda a: a.submitted_at)
-
-            # Ensure submitted_at is timezone-aware
-            submitted_at = self._ensure_timezone_aware(latest_submission.submitted_at)
-
+        if submitted_at is not None:
             if submitted_at <= deadline:
                 return {
                     "status": DeadlineStatusType.SUBMITTED_ON_TIME.value,
@@ -453,10 +513,8 @@ class DeadlineService:
                 f"Provided: {new_deadline.isoformat()}, Current time: {now.isoformat()}"
             )
 
-        # Determine original deadline based on current phase
-        # We'll use the phase2_deadline as the base original deadline
-        # (this could be made more sophisticated to determine which phase the indicator is in)
-        original_deadline = cycle.phase2_deadline
+        # Overrides extend OVERRIDE_PHASE; record its deadline at the time of granting
+        original_deadline = getattr(cycle, dict(DEADLINE_PHASES)[OVERRIDE_PHASE])
 
         # Create the override record
         override = DeadlineOverride(
@@ -0,0 +1,168 @@
+"""
+💓 Health Service
+Cached connection health for health, liveness and readiness probes
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.db.base import check_all_connections
+
+logger = logging.getLogger(__name__)
+
+
+class HealthService:
+    """
+    Service that serves connection health from a short-lived cache.
+
+    Load balancers probe far more often than the database or Supabase can
+    change state, so probe results are cached for HEALTH_CHECK_CACHE_TTL_SECONDS
+    and refreshed by a background task started with the application. Requests
+    that find the cache stale refresh it themselves, and concurrent requests
+    share a single refresh.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._checked_at: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.started_at = time.monotonic()
+
+    @property
+    def ttl_seconds(self) -> float:
+        return settings.HEALTH_CHECK_CACHE_TTL_SECONDS
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return a refresh lock bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._checked_at < self.ttl_seconds
+        )
+
+    def _with_age(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **snapshot,
+            "cache_age_seconds": round(time.monotonic() - self._checked_at, 3),
+        }
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next request probes again."""
+        self._snapshot = None
+        self._checked_at = 0.0
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Probe all connections now and replace the cached snapshot.
+
+        Returns:
+            Dict containing overall health status and connection details
+        """
+        try:
+            snapshot = await check_all_connections()
+        except Exception as e:
+            logger.error(f"Health check failed: {str(e)}")
+            snapshot = {"overall_status": "unhealthy", "error": str(e)}
+
+        snapshot["timestamp"] = datetime.now().isoformat()
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        return snapshot
+
+    async def get_health_status(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get connection health, probing only when the cache is stale.
+
+        Args:
+            force_refresh: Probe even if the cached snapshot is still fresh
+
+        Returns:
+            Dict containing overall health status, connection details, the
+            time the probes ran and the age of the cached result
+        """
+        if not force_refresh and self._is_fresh():
+            return self._with_age(self._snapshot)
+
+        async with self._get_lock():
+            # Another request may have refreshed while we waited for the lock
+            if force_refresh or not self._is_fresh():
+                await self.refresh()
+            return self._with_age(self._snapshot)
+
+    def get_liveness(self) -> Dict[str, Any]:
+        """
+        Liveness: the process is up and serving requests. Touches no I/O.
+
+        Returns:
+            Dict with status and process uptime
+        """
+        return {
+            "status": "alive",
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3),
+        }
+
+    async def get_readiness(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Readiness: the required connections are healthy, from the cached snapshot.
+
+        PostgreSQL is always required; Supabase is required only when
+        REQUIRE_ALL_CONNECTIONS is enabled.
+
+        Returns:
+            Tuple of (is_ready, response payload)
+        """
+        health = await self.get_health_status()
+        database_ok = health.get("database", {}).get("connected", False)
+        supabase_ok = health.get("supabase", {}).get("connected", False)
+
+        ready = database_ok and (supabase_ok or not settings.REQUIRE_ALL_CONNECTIONS)
+        return ready, {
+            "status": "ready" if ready else "not_ready",
+            "database": database_ok,
+            "supabase": supabase_ok,
+            "timestamp": health.get("timestamp"),
+            "cache_age_seconds": health.get("cache_age_seconds"),
+        }
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:  # pragma: no cover - refresh already guards
+                logger.warning(f"⚠️ Background health refresh failed: {str(e)}")
+            await asyncio.sleep(self.ttl_seconds)
+
+    def start_background_refresh(self) -> None:
+        """Start refreshing the cache every TTL on the running event loop."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_loop()
+        )
+
+    async def stop_background_refresh(self) -> None:
+        """Cancel the background refresh task, if running."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+# Singleton instance for use across the application
+health_service = HealthService()
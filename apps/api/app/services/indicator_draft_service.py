@@ -7,17 +7,27 @@ This service handles:
 - Optimistic locking to prevent concurrent edit conflicts
 - Draft lock acquisition and release
 - Draft listing and retrieval
+
+Autosaves are stored as an append-only log of per-indicator patches
+(indicator_draft_patches) on top of the snapshot in ``IndicatorDraft.data``.
+Each indicator carries its own version, so concurrent edits only conflict
+when they touch the same indicator, and a save writes just the indicators
+that changed instead of rewriting the whole draft. Once the log grows past
+COMPACTION_THRESHOLD patches it is folded back into the snapshot.
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
 from loguru import logger
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.db.models.governance_area import GovernanceArea, IndicatorDraft
+from app.db.models.governance_area import GovernanceArea, IndicatorDraft, IndicatorDraftPatch
 from app.db.models.user import User
 
 
@@ -31,6 +41,9 @@ class IndicatorDraftService:
     # Lock expiration time (30 minutes)
     LOCK_EXPIRATION_MINUTES = 30
 
+    # Patches kept in the log before they are folded into the snapshot
+    COMPACTION_THRESHOLD = 100
+
     def create_draft(
         self,
         db: Session,
@@ -185,7 +198,7 @@ class IndicatorDraftService:
         if "status" in update_data:
             draft.status = update_data["status"]
         if "data" in update_data:
-            draft.data = update_data["data"]
+            self._replace_data(db, draft, update_data["data"])
         if "title" in update_data:
             draft.title = update_data["title"]
 
@@ -196,6 +209,7 @@ class IndicatorDraftService:
 
         db.commit()
         db.refresh(draft)
+        self._materialize(db, draft)
 
         logger.info(
             f"Saved draft {draft_id} (version {draft.version}) for user {user_id}"
@@ -218,6 +232,9 @@ class IndicatorDraftService:
 
         This is a performance-optimized version of save_draft that only updates
         the indicators that have changed, reducing payload size by ~95%.
+        Changes are appended to the patch log rather than rewriting the
+        draft's data. Conflicts are still checked against the draft-level
+        version; use append_patches for per-indicator conflict detection.
 
         Args:
             db: Database session
@@ -304,19 +321,14 @@ class IndicatorDraftService:
             draft.locked_by_user_id = user_id
             draft.locked_at = datetime.utcnow()
 
-        # Delta merge: Update only changed indicators
-        # Build a lookup dictionary from existing data
-        existing_indicators = {ind.get("temp_id"): ind for ind in draft.data if isinstance(ind, dict) and "temp_id" in ind}
-
-        # Update changed indicators in the lookup
-        for changed_ind in changed_indicators:
-            temp_id = changed_ind.get("temp_id")
-            if temp_id:
-                existing_indicators[temp_id] = changed_ind
-                logger.debug(f"Updated indicator {temp_id} in draft {draft_id}")
-
-        # Convert back to list
-        draft.data = list(existing_indicators.values())
+        # Delta merge: append only the changed indicators to the patch log
+        changes = {
+            ind["temp_id"]: ind
+            for ind in changed_indicators
+            if isinstance(ind, dict) and ind.get("temp_id")
+        }
+        current_versions = self._current_versions(db, draft, changes)
+        self._insert_patches(db, draft, user_id, changes, current_versions)
 
         # Update metadata fields if provided
         if metadata:
@@ -332,8 +344,15 @@ class IndicatorDraftService:
         draft.last_accessed_at = datetime.utcnow()
         draft.version += 1
 
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            # An append_patches writer added the same indicator version first
+            db.rollback()
+            self._raise_conflict(self._current_versions(db, draft, changes))
+        self._compact_if_needed(db, draft_id)
         db.refresh(draft)
+        self._materialize(db, draft)
 
         logger.info(
             f"Saved draft {draft_id} (version {draft.version}) with delta update: "
@@ -342,6 +361,282 @@ class IndicatorDraftService:
 
         return draft
 
+    def append_patches(
+        self,
+        db: Session,
+        draft_id: UUID,
+        user_id: int,
+        changed_indicators: List[Dict[str, Any]],
+        base_versions: Dict[str, int],
+        deleted_ids: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, int]:
+        """
+        Append per-indicator changes to a draft's patch log.
+
+        Only the changed indicators are written; the draft row is not read
+        FOR UPDATE and its data is not rewritten. Each change must be based
+        on the indicator's current version (0 for new indicators), so two
+        editors only conflict when they change the same indicator.
+
+        Args:
+            db: Database session
+            draft_id: Draft UUID
+            user_id: ID of user saving the draft
+            changed_indicators: Changed indicator nodes (each with a temp_id)
+            base_versions: Version each changed/deleted indicator was edited from
+            deleted_ids: temp_ids of indicators removed from the draft
+            metadata: Optional metadata (current_step, status, title)
+
+        Returns:
+            New version of every changed or deleted indicator, by temp_id
+
+        Raises:
+            HTTPException: 404/403 as for save_draft, 423 if locked by another
+                user, 409 listing the indicators whose base version is stale
+        """
+        draft = db.query(IndicatorDraft).filter(IndicatorDraft.id == draft_id).first()
+
+        if not draft:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Draft with ID {draft_id} not found",
+            )
+
+        if draft.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to edit this draft",
+            )
+
+        draft_values: Dict[str, Any] = {}
+        if draft.locked_by_user_id != user_id:
+            if (
+                draft.locked_by_user_id
+                and draft.locked_at
+                and datetime.utcnow()
+                < draft.locked_at + timedelta(minutes=self.LOCK_EXPIRATION_MINUTES)
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_423_LOCKED,
+                    detail=f"Draft is locked by user {draft.locked_by_user_id}",
+                )
+            draft_values.update(
+                lock_token=uuid4(), locked_by_user_id=user_id, locked_at=datetime.utcnow()
+            )
+
+        changes: Dict[str, Optional[Dict[str, Any]]] = {
+            ind["temp_id"]: ind
+            for ind in changed_indicators
+            if isinstance(ind, dict) and ind.get("temp_id")
+        }
+        for temp_id in deleted_ids or []:
+            changes[temp_id] = None
+
+        current_versions = self._current_versions(db, draft, changes)
+        conflicts = {
+            temp_id: current_versions.get(temp_id, 0)
+            for temp_id in changes
+            if base_versions.get(temp_id, 0) != current_versions.get(temp_id, 0)
+        }
+        if conflicts:
+            self._raise_conflict(conflicts)
+
+        new_versions = self._insert_patches(db, draft, user_id, changes, current_versions)
+
+        # Metadata and timestamps are a small in-place update of the draft row
+        for field in ("current_step", "status", "title"):
+            if metadata and field in metadata:
+                draft_values[field] = metadata[field]
+        now = datetime.utcnow()
+        db.execute(
+            update(IndicatorDraft)
+            .where(IndicatorDraft.id == draft_id)
+            .values(updated_at=now, last_accessed_at=now, **draft_values)
+        )
+
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another writer appended the same indicator version first
+            db.rollback()
+            self._raise_conflict(self._current_versions(db, draft, changes))
+
+        self._compact_if_needed(db, draft_id)
+
+        logger.debug(f"Appended {len(changes)} patches to draft {draft_id}")
+        return new_versions
+
+    def compact_draft(self, db: Session, draft_id: UUID) -> int:
+        """
+        Fold a draft's patch log into its snapshot.
+
+        Args:
+            db: Database session
+            draft_id: Draft UUID
+
+        Returns:
+            Number of patches folded (committed)
+        """
+        draft = (
+            db.query(IndicatorDraft)
+            .filter(IndicatorDraft.id == draft_id)
+            .with_for_update()
+            .first()
+        )
+        if not draft:
+            return 0
+
+        patches = self._load_patches(db, draft_id)
+        if not patches:
+            db.commit()
+            return 0
+
+        data, versions = self._apply_patches(draft.data, draft.indicator_versions, patches)
+        draft.data = data
+        draft.indicator_versions = versions
+        db.execute(
+            delete(IndicatorDraftPatch).where(
+                IndicatorDraftPatch.id.in_([patch.id for patch in patches])
+            )
+        )
+        db.commit()
+
+        logger.info(f"Compacted {len(patches)} patches into draft {draft_id}")
+        return len(patches)
+
+    # ========================================================================
+    # Patch log internals
+    # ========================================================================
+
+    @staticmethod
+    def _raise_conflict(conflicts: Dict[str, int]) -> None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Some indicators were modified by another process.",
+                "conflicts": conflicts,
+            },
+        )
+
+    @staticmethod
+    def _load_patches(db: Session, draft_id: UUID) -> List[IndicatorDraftPatch]:
+        return list(
+            db.scalars(
+                select(IndicatorDraftPatch)
+                .where(IndicatorDraftPatch.draft_id == draft_id)
+                .order_by(IndicatorDraftPatch.id)
+            )
+        )
+
+    @staticmethod
+    def _apply_patches(
+        snapshot: List[Dict[str, Any]],
+        snapshot_versions: Dict[str, int],
+        patches: Iterable[IndicatorDraftPatch],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Replay patches over a snapshot; returns the new data and versions."""
+        versions = dict(snapshot_versions or {})
+        nodes: Dict[Any, Optional[Dict[str, Any]]] = {}
+        for position, node in enumerate(snapshot or []):
+            key = node.get("temp_id") if isinstance(node, dict) else None
+            nodes[key if key else ("__position__", position)] = node
+
+        for patch in patches:
+            # Skip patches already folded into the snapshot
+            if patch.version <= versions.get(patch.temp_id, 0):
+                continue
+            versions[patch.temp_id] = patch.version
+            nodes[patch.temp_id] = patch.data
+
+        return [node for node in nodes.values() if node is not None], versions
+
+    def _current_versions(
+        self, db: Session, draft: IndicatorDraft, temp_ids: Iterable[str]
+    ) -> Dict[str, int]:
+        temp_ids = list(temp_ids)
+        versions = {
+            temp_id: (draft.indicator_versions or {}).get(temp_id, 0) for temp_id in temp_ids
+        }
+        if not temp_ids:
+            return versions
+
+        rows = db.execute(
+            select(IndicatorDraftPatch.temp_id, func.max(IndicatorDraftPatch.version))
+            .where(
+                IndicatorDraftPatch.draft_id == draft.id,
+                IndicatorDraftPatch.temp_id.in_(temp_ids),
+            )
+            .group_by(IndicatorDraftPatch.temp_id)
+        )
+        for temp_id, version in rows:
+            versions[temp_id] = max(versions[temp_id], version)
+        return versions
+
+    @staticmethod
+    def _insert_patches(
+        db: Session,
+        draft: IndicatorDraft,
+        user_id: int,
+        changes: Dict[str, Optional[Dict[str, Any]]],
+        current_versions: Dict[str, int],
+    ) -> Dict[str, int]:
+        new_versions = {temp_id: current_versions.get(temp_id, 0) + 1 for temp_id in changes}
+        if changes:
+            db.execute(
+                insert(IndicatorDraftPatch),
+                [
+                    {
+                        "draft_id": draft.id,
+                        "temp_id": temp_id,
+                        "version": new_versions[temp_id],
+                        "data": node,
+                        "user_id": user_id,
+                    }
+                    for temp_id, node in changes.items()
+                ],
+            )
+        return new_versions
+
+    def _replace_data(
+        self, db: Session, draft: IndicatorDraft, data: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Replace the whole draft (full save): new snapshot, empty patch log.
+
+        Every indicator's version is bumped so patches based on the old
+        content are rejected as conflicts.
+        """
+        _, versions = self._apply_patches([], draft.indicator_versions, self._load_patches(db, draft.id))
+        temp_ids = set(versions) | {
+            node["temp_id"] for node in data or [] if isinstance(node, dict) and node.get("temp_id")
+        }
+        draft.data = data
+        draft.indicator_versions = {temp_id: versions.get(temp_id, 0) + 1 for temp_id in temp_ids}
+        db.execute(delete(IndicatorDraftPatch).where(IndicatorDraftPatch.draft_id == draft.id))
+
+    def _materialize(self, db: Session, draft: IndicatorDraft) -> IndicatorDraft:
+        """
+        Populate ``draft.data`` and ``draft.indicator_versions`` from snapshot plus patch log.
+
+        Values are set as committed state, so nothing is written back.
+        """
+        patches = self._load_patches(db, draft.id)
+        if patches:
+            data, versions = self._apply_patches(draft.data, draft.indicator_versions, patches)
+            set_committed_value(draft, "data", data)
+            set_committed_value(draft, "indicator_versions", versions)
+        return draft
+
+    def _compact_if_needed(self, db: Session, draft_id: UUID) -> None:
+        pending = db.scalar(
+            select(func.count())
+            .select_from(IndicatorDraftPatch)
+            .where(IndicatorDraftPatch.draft_id == draft_id)
+        )
+        if pending >= self.COMPACTION_THRESHOLD:
+            self.compact_draft(db, draft_id)
+
     def get_user_drafts(
         self,
         db: Session,
@@ -425,7 +720,8 @@ class IndicatorDraftService:
         db.commit()
         db.refresh(draft)
 
-        return draft
+        # Snapshot plus any patches appended since the last compaction
+        return self._materialize(db, draft)
 
     def delete_draft(
         self,
@@ -8,23 +8,34 @@ This service handles:
 - Seed/utility methods for development/testing
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from loguru import logger
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.db.models.governance_area import GovernanceArea, Indicator, IndicatorHistory
 from app.db.models.user import User
 from app.schemas.form_schema import FormSchema
 from app.schemas.calculation_schema import CalculationSchema
+from app.services.indicator_hierarchy_service import indicator_hierarchy_service
+from app.services.indicator_version_service import indicator_version_service
 from app.services.form_schema_validator import (
     generate_validation_errors,
     validate_calculation_schema_field_references,
 )
+from app.core.pagination import keyset_page
 from app.core.security import sanitize_rich_text, sanitize_text_input
 
+# Bulk imports above this size validate schemas on a thread pool
+BULK_VALIDATION_PARALLEL_THRESHOLD = 50
+BULK_VALIDATION_MAX_WORKERS = 4
+
+# Keyset sort order for indicator pages (same order as list_indicators)
+INDICATOR_KEYSET = (Indicator.governance_area_id, Indicator.name, Indicator.id)
+
 
 class IndicatorService:
     """
@@ -77,6 +88,49 @@ class IndicatorService:
                     detail=f"Parent indicator with ID {parent_id} not found",
                 )
 
+        self._validate_indicator_schemas(data)
+
+        # Sanitize text fields to prevent XSS
+        sanitized_description = sanitize_text_input(data.get("description"))
+        sanitized_technical_notes = sanitize_rich_text(data.get("technical_notes_text"))
+
+        # Create indicator with version 1
+        indicator = Indicator(
+            name=data["name"],
+            description=sanitized_description,
+            version=1,
+            is_active=data.get("is_active", True),
+            is_auto_calculable=data.get("is_auto_calculable", False),
+            is_profiling_only=data.get("is_profiling_only", False),
+            form_schema=data.get("form_schema"),
+            calculation_schema=data.get("calculation_schema"),
+            remark_schema=data.get("remark_schema"),
+            technical_notes_text=sanitized_technical_notes,
+            governance_area_id=data["governance_area_id"],
+            parent_id=parent_id,
+        )
+
+        db.add(indicator)
+        db.commit()
+        db.refresh(indicator)
+
+        logger.info(
+            f"Created indicator '{indicator.name}' (ID: {indicator.id}) by user {user_id}"
+        )
+
+        return indicator
+
+    def _validate_indicator_schemas(self, data: Dict[str, Any]) -> None:
+        """
+        Validate the form and calculation schemas of an indicator payload.
+
+        Pure CPU work with no database access, so bulk creation can run it
+        for many payloads concurrently.
+
+        Raises:
+            ValueError: If a schema is malformed or calculation field
+                references don't exist in the form schema
+        """
         # Validate form_schema if provided
         form_schema = data.get("form_schema")
         if form_schema:
@@ -96,7 +150,7 @@ class IndicatorService:
         if calculation_schema:
             # Convert dict to Pydantic model for validation
             try:
-                calculation_schema_obj = CalculationSchema(**calculation_schema)
+                CalculationSchema(**calculation_schema)
                 # Pydantic validation already happened, schema structure is valid
             except Exception as e:
                 raise ValueError(f"Invalid calculation schema format: {str(e)}")
@@ -118,36 +172,6 @@ class IndicatorService:
                 except Exception as e:
                     raise ValueError(f"Error validating calculation schema field references: {str(e)}")
 
-        # Sanitize text fields to prevent XSS
-        sanitized_description = sanitize_text_input(data.get("description"))
-        sanitized_technical_notes = sanitize_rich_text(data.get("technical_notes_text"))
-
-        # Create indicator with version 1
-        indicator = Indicator(
-            name=data["name"],
-            description=sanitized_description,
-            version=1,
-            is_active=data.get("is_active", True),
-            is_auto_calculable=data.get("is_auto_calculable", False),
-            is_profiling_only=data.get("is_profiling_only", False),
-            form_schema=data.get("form_schema"),
-            calculation_schema=data.get("calculation_schema"),
-            remark_schema=data.get("remark_schema"),
-            technical_notes_text=sanitized_technical_notes,
-            governance_area_id=data["governance_area_id"],
-            parent_id=parent_id,
-        )
-
-        db.add(indicator)
-        db.commit()
-        db.refresh(indicator)
-
-        logger.info(
-            f"Created indicator '{indicator.name}' (ID: {indicator.id}) by user {user_id}"
-        )
-
-        return indicator
-
     def get_indicator(self, db: Session, indicator_id: int) -> Optional[Indicator]:
         """
         Get an indicator by ID with relationships loaded.
@@ -193,6 +217,49 @@ class IndicatorService:
         Returns:
             List of Indicator instances
         """
+        query = self._filtered_indicators_query(db, governance_area_id, is_active, search)
+
+        # Order by governance_area_id, then name (id keeps equal names stable)
+        query = query.order_by(*INDICATOR_KEYSET)
+
+        # Apply pagination
+        indicators = query.offset(skip).limit(limit).all()
+
+        return indicators
+
+    def list_indicators_page(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        governance_area_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> Tuple[List[Indicator], Optional[str]]:
+        """
+        List indicators using keyset pagination on (governance_area_id, name, id).
+
+        Args:
+            db: Database session
+            cursor: Opaque cursor from the previous page (None for the first page)
+            limit: Maximum number of records to return
+            governance_area_id: Filter by governance area
+            is_active: Filter by active status
+            search: Search in name (case-insensitive)
+
+        Returns:
+            tuple: (indicators, next_cursor or None on the last page)
+        """
+        query = self._filtered_indicators_query(db, governance_area_id, is_active, search)
+        return keyset_page(query, INDICATOR_KEYSET, cursor, limit)
+
+    def _filtered_indicators_query(
+        self,
+        db: Session,
+        governance_area_id: Optional[int],
+        is_active: Optional[bool],
+        search: Optional[str],
+    ):
         query = db.query(Indicator).options(
             joinedload(Indicator.governance_area)
         )
@@ -207,13 +274,7 @@ class IndicatorService:
         if search:
             query = query.filter(Indicator.name.ilike(f"%{search}%"))
 
-        # Order by governance_area_id, then name
-        query = query.order_by(Indicator.governance_area_id, Indicator.name)
-
-        # Apply pagination
-        indicators = query.offset(skip).limit(limit).all()
-
-        return indicators
+        return query
 
     def update_indicator(
         self, db: Session, indicator_id: int, data: Dict[str, Any], user_id: int
@@ -297,27 +358,8 @@ class IndicatorService:
         )
 
         if schema_changed:
-            # Archive current version
-            history = IndicatorHistory(
-                indicator_id=indicator.id,
-                version=indicator.version,
-                name=indicator.name,
-                description=indicator.description,
-                is_active=indicator.is_active,
-                is_auto_calculable=indicator.is_auto_calculable,
-                is_profiling_only=indicator.is_profiling_only,
-                form_schema=indicator.form_schema,
-                calculation_schema=indicator.calculation_schema,
-                remark_schema=indicator.remark_schema,
-                technical_notes_text=indicator.technical_notes_text,
-                governance_area_id=indicator.governance_area_id,
-                parent_id=indicator.parent_id,
-                created_at=indicator.created_at,
-                updated_at=indicator.updated_at,
-                archived_at=datetime.utcnow(),
-                archived_by=user_id,
-            )
-            db.add(history)
+            # Archive current version (delta-encoded against the previous one)
+            indicator_version_service.archive_version(db, indicator, user_id)
 
             # Increment version
             indicator.version += 1
@@ -419,22 +461,34 @@ class IndicatorService:
                 detail=f"Indicator with ID {indicator_id} not found",
             )
 
-        # Get all archived versions
-        history = (
-            db.query(IndicatorHistory)
-            .options(joinedload(IndicatorHistory.archived_by_user))
-            .filter(IndicatorHistory.indicator_id == indicator_id)
-            .order_by(IndicatorHistory.version.desc())
-            .all()
-        )
+        # Get all archived versions with delta-encoded schemas reconstructed
+        return indicator_version_service.get_history(db, indicator_id)
+
+    def get_indicator_as_of(
+        self, db: Session, indicator_id: int, version: int
+    ) -> Indicator | IndicatorHistory:
+        """
+        Get an indicator as it was at a specific version.
 
-        return history
+        Args:
+            db: Database session
+            indicator_id: ID of indicator
+            version: Version number to read
+
+        Returns:
+            The current Indicator if ``version`` is current, otherwise the
+            archived IndicatorHistory row with schemas reconstructed
+
+        Raises:
+            HTTPException: If the indicator or version doesn't exist
+        """
+        return indicator_version_service.get_indicator_as_of(db, indicator_id, version)
 
     def _check_circular_parent(
         self, db: Session, indicator_id: int, parent_id: int
     ) -> bool:
         """
-        Helper to recursively check for circular parent relationships.
+        Check that giving an indicator a new parent doesn't create a cycle.
 
         Args:
             db: Database session
@@ -450,29 +504,12 @@ class IndicatorService:
         if indicator_id == parent_id:
             raise ValueError("An indicator cannot be its own parent")
 
-        # Recursively check if parent_id eventually leads back to indicator_id
-        current_id = parent_id
-        visited = set()
-
-        while current_id is not None:
-            if current_id in visited:
-                # Infinite loop detected in parent chain (shouldn't happen with proper data)
-                raise ValueError("Circular parent chain detected in database")
-
-            if current_id == indicator_id:
-                raise ValueError(
-                    f"Circular relationship: indicator {indicator_id} cannot have "
-                    f"parent {parent_id} as it would create a cycle"
-                )
-
-            visited.add(current_id)
-
-            # Get next parent
-            parent = db.query(Indicator).filter(Indicator.id == current_id).first()
-            if parent:
-                current_id = parent.parent_id
-            else:
-                break
+        # One recursive query walks the whole proposed parent chain
+        if indicator_hierarchy_service.find_cycles(db, {indicator_id: parent_id}):
+            raise ValueError(
+                f"Circular relationship: indicator {indicator_id} cannot have "
+                f"parent {parent_id} as it would create a cycle"
+            )
 
         return False
 
@@ -490,8 +527,12 @@ class IndicatorService:
         """
         Create multiple indicators in bulk with proper dependency ordering.
 
-        Uses topological sorting to ensure parents are created before children.
-        All operations are wrapped in a transaction for atomicity.
+        Every payload is validated up front (concurrently for large payloads),
+        then the tree is inserted one depth level at a time with a single
+        multi-row ``INSERT ... RETURNING`` per level, resolving each child's
+        parent_temp_id to the id returned for the level above. Nothing is
+        written unless every payload is valid, and the whole import is
+        committed once.
 
         Args:
             db: Database session
@@ -522,71 +563,44 @@ class IndicatorService:
 
         created_indicators: List[Indicator] = []
         temp_id_mapping: Dict[str, int] = {}
-        errors: List[Dict[str, str]] = []
 
         try:
-            # Topological sort by dependency
-            sorted_indicators = self._topological_sort_indicators(indicators_data)
-
-            # Create indicators in dependency order
-            for indicator_data in sorted_indicators:
-                temp_id = indicator_data.get("temp_id")
-                parent_temp_id = indicator_data.get("parent_temp_id")
-
-                try:
-                    # Resolve parent_id if parent_temp_id is provided
-                    parent_id = None
-                    if parent_temp_id:
-                        parent_id = temp_id_mapping.get(parent_temp_id)
-                        if parent_id is None:
-                            raise ValueError(
-                                f"Parent temp_id {parent_temp_id} not found in mapping"
-                            )
-
-                    # Prepare indicator data
-                    create_data = {
-                        "name": indicator_data["name"],
-                        "description": indicator_data.get("description"),
-                        "governance_area_id": governance_area_id,
-                        "parent_id": parent_id,
-                        "is_active": indicator_data.get("is_active", True),
-                        "is_auto_calculable": indicator_data.get("is_auto_calculable", False),
-                        "is_profiling_only": indicator_data.get("is_profiling_only", False),
-                        "form_schema": indicator_data.get("form_schema"),
-                        "calculation_schema": indicator_data.get("calculation_schema"),
-                        "remark_schema": indicator_data.get("remark_schema"),
-                        "technical_notes_text": indicator_data.get("technical_notes_text"),
-                    }
-
-                    # Create the indicator (reusing existing validation logic)
-                    indicator = self.create_indicator(db, create_data, user_id)
+            # Group by depth so every parent is inserted before its children
+            levels = self._topological_levels(indicators_data)
 
-                    # Store mapping
-                    temp_id_mapping[temp_id] = indicator.id
-                    created_indicators.append(indicator)
+            # Validate everything before touching the database
+            errors = self._validate_bulk_payloads(indicators_data)
+            if errors:
+                logger.warning(
+                    f"Bulk creation rejected with {len(errors)} invalid indicators, nothing written"
+                )
+                return [], {}, errors
 
-                    logger.info(
-                        f"Created indicator '{indicator.name}' (temp_id: {temp_id}, real_id: {indicator.id})"
+            for level in levels:
+                rows = [
+                    self._bulk_indicator_row(
+                        indicator_data,
+                        governance_area_id,
+                        temp_id_mapping.get(indicator_data.get("parent_temp_id")),
                     )
+                    for indicator_data in level
+                ]
+                inserted = db.scalars(
+                    insert(Indicator).returning(Indicator, sort_by_parameter_order=True),
+                    rows,
+                ).all()
 
-                except Exception as e:
-                    logger.error(f"Error creating indicator with temp_id {temp_id}: {str(e)}")
-                    errors.append({"temp_id": temp_id, "error": str(e)})
-                    # Continue processing other indicators if possible
-                    # Or raise to rollback all if strict atomicity is required
-                    # For now, we'll continue and report errors
-
-            # If any errors occurred, rollback the transaction
-            if errors:
-                db.rollback()
-                logger.warning(f"Bulk creation failed with {len(errors)} errors, transaction rolled back")
-                return [], {}, errors
+                for indicator_data, indicator in zip(level, inserted):
+                    temp_id_mapping[indicator_data["temp_id"]] = indicator.id
+                created_indicators.extend(inserted)
 
-            # Commit transaction
             db.commit()
-            logger.info(f"Successfully created {len(created_indicators)} indicators in bulk")
+            logger.info(
+                f"Created {len(created_indicators)} indicators in {len(levels)} levels "
+                f"for governance area {governance_area_id} by user {user_id}"
+            )
 
-            return created_indicators, temp_id_mapping, errors
+            return created_indicators, temp_id_mapping, []
 
         except Exception as e:
             db.rollback()
@@ -596,6 +610,56 @@ class IndicatorService:
                 detail=f"Bulk indicator creation failed: {str(e)}",
             )
 
+    def _validate_bulk_payloads(
+        self, indicators_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """
+        Validate the schemas of every bulk payload.
+
+        Payloads above BULK_VALIDATION_PARALLEL_THRESHOLD are validated on a
+        thread pool. Errors are returned in payload order.
+
+        Returns:
+            List of error dictionaries with temp_id and error message
+        """
+
+        def validate(indicator_data: Dict[str, Any]) -> Optional[Dict[str, str]]:
+            try:
+                self._validate_indicator_schemas(indicator_data)
+            except ValueError as e:
+                return {"temp_id": indicator_data.get("temp_id"), "error": str(e)}
+            return None
+
+        if len(indicators_data) > BULK_VALIDATION_PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=BULK_VALIDATION_MAX_WORKERS) as executor:
+                results = list(executor.map(validate, indicators_data))
+        else:
+            results = [validate(indicator_data) for indicator_data in indicators_data]
+
+        return [error for error in results if error is not None]
+
+    def _bulk_indicator_row(
+        self,
+        indicator_data: Dict[str, Any],
+        governance_area_id: int,
+        parent_id: Optional[int],
+    ) -> Dict[str, Any]:
+        """Build the INSERT parameters for one bulk payload (version 1, sanitized text)."""
+        return {
+            "name": indicator_data["name"],
+            "description": sanitize_text_input(indicator_data.get("description")),
+            "version": 1,
+            "is_active": indicator_data.get("is_active", True),
+            "is_auto_calculable": indicator_data.get("is_auto_calculable", False),
+            "is_profiling_only": indicator_data.get("is_profiling_only", False),
+            "form_schema": indicator_data.get("form_schema"),
+            "calculation_schema": indicator_data.get("calculation_schema"),
+            "remark_schema": indicator_data.get("remark_schema"),
+            "technical_notes_text": sanitize_rich_text(indicator_data.get("technical_notes_text")),
+            "governance_area_id": governance_area_id,
+            "parent_id": parent_id,
+        }
+
     def _topological_sort_indicators(
         self, indicators_data: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -611,54 +675,68 @@ class IndicatorService:
         Raises:
             ValueError: If circular dependencies are detected
         """
-        # Build adjacency list and in-degree count
-        graph: Dict[str, List[str]] = {}
-        in_degree: Dict[str, int] = {}
+        return [
+            indicator
+            for level in self._topological_levels(indicators_data)
+            for indicator in level
+        ]
+
+    def _topological_levels(
+        self, indicators_data: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Group indicators into depth levels (roots first) using Kahn's algorithm.
+
+        Every indicator's parent lives in an earlier level, so each level can
+        be inserted in one statement once the previous level's ids are known.
+
+        Args:
+            indicators_data: List of indicator dictionaries with temp_id and parent_temp_id
+
+        Returns:
+            List of levels, each a list of indicator dictionaries in payload order
+
+        Raises:
+            ValueError: If a parent_temp_id is unknown or circular dependencies are detected
+        """
+        children: Dict[str, List[str]] = {}
         node_data: Dict[str, Dict[str, Any]] = {}
 
-        # Initialize
         for indicator in indicators_data:
-            temp_id = indicator["temp_id"]
-            parent_temp_id = indicator.get("parent_temp_id")
-
-            node_data[temp_id] = indicator
-            in_degree[temp_id] = 0
-            graph[temp_id] = []
+            node_data[indicator["temp_id"]] = indicator
+            children[indicator["temp_id"]] = []
 
-        # Build graph
+        roots: List[str] = []
         for indicator in indicators_data:
             temp_id = indicator["temp_id"]
             parent_temp_id = indicator.get("parent_temp_id")
 
             if parent_temp_id:
-                if parent_temp_id not in graph:
+                if parent_temp_id not in children:
                     raise ValueError(
                         f"Parent temp_id {parent_temp_id} not found for indicator {temp_id}"
                     )
-                graph[parent_temp_id].append(temp_id)
-                in_degree[temp_id] += 1
-
-        # Kahn's algorithm for topological sort
-        queue = [node for node in in_degree if in_degree[node] == 0]
-        sorted_nodes = []
-
-        while queue:
-            current = queue.pop(0)
-            sorted_nodes.append(current)
-
-            for neighbor in graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        # Check for circular dependencies
-        if len(sorted_nodes) != len(indicators_data):
+                children[parent_temp_id].append(temp_id)
+            else:
+                roots.append(temp_id)
+
+        # Each node has at most one parent, so a node becomes ready as soon as
+        # its parent's level has been emitted
+        levels: List[List[Dict[str, Any]]] = []
+        frontier = roots
+        visited = 0
+        while frontier:
+            levels.append([node_data[temp_id] for temp_id in frontier])
+            visited += len(frontier)
+            frontier = [child for temp_id in frontier for child in children[temp_id]]
+
+        # Nodes on a cycle are never reachable from a root
+        if visited != len(indicators_data):
             raise ValueError(
                 "Circular dependency detected in indicator hierarchy"
             )
 
-        # Return sorted indicator data
-        return [node_data[temp_id] for temp_id in sorted_nodes]
+        return levels
 
     def reorder_indicators(
         self,
@@ -680,33 +758,37 @@ class IndicatorService:
         Raises:
             HTTPException: If circular references are detected
         """
-        updated_indicators: List[Indicator] = []
-
         try:
-            # Validate no circular references
-            self._validate_no_circular_references(db, reorder_data)
-
-            # Update each indicator
-            for update in reorder_data:
-                indicator_id = update["id"]
-                indicator = db.query(Indicator).filter(Indicator.id == indicator_id).first()
-
-                if not indicator:
+            # Load every indicator in the batch with one query
+            requested_ids = [update["id"] for update in reorder_data]
+            indicators_by_id = {
+                indicator.id: indicator
+                for indicator in db.scalars(
+                    select(Indicator).where(Indicator.id.in_(requested_ids))
+                )
+            }
+            for indicator_id in requested_ids:
+                if indicator_id not in indicators_by_id:
                     logger.warning(f"Indicator ID {indicator_id} not found, skipping")
-                    continue
-
-                # Update fields
-                if "code" in update:
-                    # Assuming we add a 'code' field to indicators later
-                    # For now, we can update the name to include the code
-                    pass
 
-                if "parent_id" in update:
-                    indicator.parent_id = update["parent_id"]
+            # Codes are not stored yet; only parent changes are persisted
+            parent_changes = {
+                update["id"]: update["parent_id"]
+                for update in reorder_data
+                if "parent_id" in update and update["id"] in indicators_by_id
+            }
 
-                updated_indicators.append(indicator)
+            # Validate no circular references
+            self._validate_no_circular_references(db, parent_changes)
 
+            indicator_hierarchy_service.apply_parent_changes(db, parent_changes)
             db.commit()
+
+            updated_indicators = [
+                indicators_by_id[indicator_id]
+                for indicator_id in dict.fromkeys(requested_ids)
+                if indicator_id in indicators_by_id
+            ]
             logger.info(f"Reordered {len(updated_indicators)} indicators")
 
             return updated_indicators
@@ -720,36 +802,26 @@ class IndicatorService:
             )
 
     def _validate_no_circular_references(
-        self, db: Session, reorder_data: List[Dict[str, Any]]
+        self, db: Session, parent_changes: Dict[int, Optional[int]]
     ) -> None:
         """
         Validate that the proposed reorder doesn't create circular references.
 
+        The batch is checked against the stored tree, so a move that only
+        forms a cycle together with indicators outside the batch is caught.
+
         Args:
             db: Database session
-            reorder_data: List of dicts with {id, parent_id}
+            parent_changes: Mapping of indicator ID to its proposed parent ID
 
         Raises:
             ValueError: If circular references are detected
         """
-        # Build parent map from reorder data
-        parent_map: Dict[int, Optional[int]] = {}
-        for update in reorder_data:
-            parent_map[update["id"]] = update.get("parent_id")
-
-        # Check each node for cycles
-        for indicator_id in parent_map:
-            visited = set()
-            current = indicator_id
-
-            while current is not None:
-                if current in visited:
-                    raise ValueError(
-                        f"Circular reference detected: indicator {indicator_id}"
-                    )
-
-                visited.add(current)
-                current = parent_map.get(current)
+        cyclic_ids = indicator_hierarchy_service.find_cycles(db, parent_changes)
+        if cyclic_ids:
+            raise ValueError(
+                f"Circular reference detected: indicators {', '.join(map(str, cyclic_ids))}"
+            )
 
     def validate_tree_structure(
         self,
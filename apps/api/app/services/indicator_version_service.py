@@ -0,0 +1,388 @@
+"""
+🕰️ Indicator Version Service
+Delta-encoded indicator history and point-in-time ("as of") reads.
+
+Archived versions store their schema fields as a JSON patch against the
+previous archived version, with a full snapshot every
+HISTORY_SNAPSHOT_INTERVAL versions so reconstruction never replays more than
+that many patches. Deltas point backwards to archived (immutable) versions
+rather than to the live indicator, because the live row's technical notes
+and metadata are edited in place without bumping the version.
+
+Reconstructed versions are cached; archived rows never change, so entries
+never need invalidating.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException, status
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.json_patch import apply_patch, make_patch
+from app.db.models.assessment import AssessmentResponse
+from app.db.models.governance_area import Indicator, IndicatorHistory
+
+# Versioned content that is delta-encoded; the remaining columns are small
+# scalars and are always stored in full
+SCHEMA_FIELDS = ("form_schema", "calculation_schema", "remark_schema", "technical_notes_text")
+
+# Versions 1, 1 + N, 1 + 2N, ... are stored as full snapshots
+HISTORY_SNAPSHOT_INTERVAL = 10
+
+# Maximum number of reconstructed versions kept in memory
+HISTORY_CACHE_SIZE = 2048
+
+SchemaDocument = Dict[str, Any]
+# (indicator_id, version, archived_at): archived_at guards against ID reuse
+# after deletes, which SQLite does
+_CacheKey = Tuple[int, int, Optional[datetime]]
+
+
+class IndicatorVersionService:
+    """
+    Service for archiving indicator versions and reading them back.
+
+    IndicatorService calls archive_version() whenever a schema change bumps
+    an indicator's version; everything that needs an old version goes
+    through get_indicator_as_of() or hydrate_history().
+    """
+
+    def __init__(self):
+        self._cache: "OrderedDict[_CacheKey, SchemaDocument]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    # ========================================================================
+    # Writing
+    # ========================================================================
+
+    def archive_version(
+        self, db: Session, indicator: Indicator, user_id: Optional[int]
+    ) -> IndicatorHistory:
+        """
+        Archive the indicator's current version before it is modified.
+
+        The row is added to the session but not committed.
+
+        Args:
+            db: Database session
+            indicator: Indicator whose current version is being archived
+            user_id: ID of user triggering the new version
+
+        Returns:
+            The new IndicatorHistory row (snapshot or delta)
+        """
+        document = self.schema_document(indicator)
+        history = IndicatorHistory(
+            indicator_id=indicator.id,
+            version=indicator.version,
+            name=indicator.name,
+            description=indicator.description,
+            is_active=indicator.is_active,
+            is_auto_calculable=indicator.is_auto_calculable,
+            is_profiling_only=indicator.is_profiling_only,
+            governance_area_id=indicator.governance_area_id,
+            parent_id=indicator.parent_id,
+            created_at=indicator.created_at,
+            updated_at=indicator.updated_at,
+            archived_at=datetime.utcnow(),
+            archived_by=user_id,
+        )
+
+        previous = None
+        if not self._is_snapshot_version(indicator.version):
+            previous = self._document_as_of(db, indicator.id, indicator.version - 1)
+
+        if previous is None:
+            self._store_snapshot(history, document)
+        else:
+            self._store_delta(history, make_patch(previous, document))
+
+        db.add(history)
+        return history
+
+    def compact_history(self, db: Session, indicator_id: Optional[int] = None) -> int:
+        """
+        Rewrite full-copy history rows as deltas where the snapshot interval allows.
+
+        Args:
+            db: Database session
+            indicator_id: Only compact this indicator (all indicators when None)
+
+        Returns:
+            Number of rows converted to deltas (committed)
+        """
+        return self._rewrite_history(db, indicator_id, delta_encode=True)
+
+    def expand_history(self, db: Session, indicator_id: Optional[int] = None) -> int:
+        """
+        Rewrite delta history rows as full snapshots (e.g. before a downgrade).
+
+        Args:
+            db: Database session
+            indicator_id: Only expand this indicator (all indicators when None)
+
+        Returns:
+            Number of rows converted to snapshots (committed)
+        """
+        return self._rewrite_history(db, indicator_id, delta_encode=False)
+
+    # ========================================================================
+    # Reading
+    # ========================================================================
+
+    def get_indicator_as_of(
+        self, db: Session, indicator_id: int, version: int
+    ) -> Union[Indicator, IndicatorHistory]:
+        """
+        Get an indicator as it was at a given version.
+
+        Returns the live Indicator for its current version, otherwise the
+        archived row with its schema fields reconstructed. Both expose the
+        same attributes (form_schema, calculation_schema, remark_schema,
+        technical_notes_text, name, ...), so callers can use either.
+
+        Args:
+            db: Database session
+            indicator_id: ID of the indicator
+            version: Version number to read
+
+        Returns:
+            Indicator or IndicatorHistory instance
+
+        Raises:
+            HTTPException: If the indicator or version doesn't exist
+        """
+        indicator = db.get(Indicator, indicator_id)
+        if not indicator:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Indicator with ID {indicator_id} not found",
+            )
+        if version == indicator.version:
+            return indicator
+
+        history = db.scalars(
+            select(IndicatorHistory).where(
+                IndicatorHistory.indicator_id == indicator_id,
+                IndicatorHistory.version == version,
+            )
+        ).first()
+        if not history:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Version {version} of indicator {indicator_id} not found",
+            )
+
+        if not history.is_snapshot:
+            document = self._cache_get(self._cache_key(history))
+            if document is None:
+                document = self._document_as_of(db, indicator_id, version)
+            self._populate(history, document)
+        return history
+
+    def get_pinned_indicator(
+        self, db: Session, response: AssessmentResponse
+    ) -> Union[Indicator, IndicatorHistory]:
+        """
+        Get the indicator version a response was answered against.
+
+        Falls back to the current indicator for responses created before
+        versions were pinned.
+        """
+        indicator = response.indicator
+        if response.indicator_version is None or response.indicator_version == indicator.version:
+            return indicator
+        return self.get_indicator_as_of(db, response.indicator_id, response.indicator_version)
+
+    def get_history(self, db: Session, indicator_id: int) -> List[IndicatorHistory]:
+        """
+        Get every archived version of an indicator, newest first, with schema fields populated.
+        """
+        history = list(
+            db.scalars(
+                select(IndicatorHistory)
+                .options(joinedload(IndicatorHistory.archived_by_user))
+                .where(IndicatorHistory.indicator_id == indicator_id)
+                .order_by(IndicatorHistory.version.desc())
+            ).unique()
+        )
+        self.hydrate_history(history)
+        return history
+
+    def hydrate_history(self, history: List[IndicatorHistory]) -> None:
+        """
+        Populate the schema fields of delta rows in place.
+
+        Expects the rows of a single indicator, complete from a snapshot
+        onwards (as returned by get_history). Values are set as committed
+        state, so the rows are not marked dirty and nothing is written back.
+        """
+        document: Optional[SchemaDocument] = None
+        for row in sorted(history, key=lambda h: h.version):
+            if row.is_snapshot:
+                document = self.schema_document(row)
+            else:
+                cached = self._cache_get(self._cache_key(row))
+                if cached is not None:
+                    document = cached
+                elif document is None:
+                    raise ValueError(
+                        f"History for indicator {row.indicator_id} has no snapshot before version {row.version}"
+                    )
+                else:
+                    document = apply_patch(document, row.schema_patch or [])
+                    self._cache_put(self._cache_key(row), document)
+                self._populate(row, document)
+
+    def clear_cache(self) -> None:
+        """Drop all reconstructed versions (mainly for tests)."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def schema_document(source: Union[Indicator, IndicatorHistory]) -> SchemaDocument:
+        """Extract the delta-encoded fields of an indicator or history row."""
+        return {field: copy.deepcopy(getattr(source, field)) for field in SCHEMA_FIELDS}
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    @staticmethod
+    def _is_snapshot_version(version: int) -> bool:
+        return (version - 1) % HISTORY_SNAPSHOT_INTERVAL == 0
+
+    @staticmethod
+    def _store_snapshot(history: IndicatorHistory, document: SchemaDocument) -> None:
+        history.is_snapshot = True
+        history.schema_patch = None
+        for field in SCHEMA_FIELDS:
+            setattr(history, field, copy.deepcopy(document[field]))
+
+    @staticmethod
+    def _store_delta(history: IndicatorHistory, patch: List[Dict[str, Any]]) -> None:
+        history.is_snapshot = False
+        history.schema_patch = patch
+        for field in SCHEMA_FIELDS:
+            setattr(history, field, None)
+
+    @staticmethod
+    def _populate(history: IndicatorHistory, document: SchemaDocument) -> None:
+        for field in SCHEMA_FIELDS:
+            set_committed_value(history, field, copy.deepcopy(document[field]))
+
+    def _document_as_of(
+        self, db: Session, indicator_id: int, version: int
+    ) -> Optional[SchemaDocument]:
+        """
+        Reconstruct the schema document of an archived version.
+
+        Loads only the rows from the nearest snapshot at or below ``version``
+        (one query) and replays their patches.
+
+        Returns:
+            The document, or None if no snapshot precedes the version
+        """
+        latest_snapshot = (
+            select(func.max(IndicatorHistory.version))
+            .where(
+                IndicatorHistory.indicator_id == indicator_id,
+                IndicatorHistory.version <= version,
+                IndicatorHistory.is_snapshot.is_(True),
+            )
+            .scalar_subquery()
+        )
+        chain = list(
+            db.scalars(
+                select(IndicatorHistory)
+                .where(
+                    IndicatorHistory.indicator_id == indicator_id,
+                    IndicatorHistory.version >= latest_snapshot,
+                    IndicatorHistory.version <= version,
+                )
+                .order_by(IndicatorHistory.version)
+            )
+        )
+        if not chain or chain[-1].version != version:
+            return None
+
+        document: Optional[SchemaDocument] = None
+        for row in chain:
+            key = self._cache_key(row)
+            cached = self._cache_get(key)
+            if cached is not None:
+                document = cached
+            elif row.is_snapshot:
+                document = self.schema_document(row)
+            else:
+                document = apply_patch(document, row.schema_patch or [])
+                self._cache_put(key, document)
+        return document
+
+    def _rewrite_history(
+        self, db: Session, indicator_id: Optional[int], delta_encode: bool
+    ) -> int:
+        query = select(IndicatorHistory).order_by(
+            IndicatorHistory.indicator_id, IndicatorHistory.version
+        )
+        if indicator_id is not None:
+            query = query.where(IndicatorHistory.indicator_id == indicator_id)
+
+        rewritten = 0
+        previous_row: Optional[IndicatorHistory] = None
+        previous_document: Optional[SchemaDocument] = None
+        for row in db.scalars(query):
+            if previous_row is not None and previous_row.indicator_id != row.indicator_id:
+                previous_row, previous_document = None, None
+
+            if row.is_snapshot:
+                document = self.schema_document(row)
+            else:
+                document = apply_patch(previous_document, row.schema_patch or [])
+
+            consecutive = previous_row is not None and previous_row.version == row.version - 1
+            want_delta = (
+                delta_encode and consecutive and not self._is_snapshot_version(row.version)
+            )
+            if want_delta and row.is_snapshot:
+                self._store_delta(row, make_patch(previous_document, document))
+                rewritten += 1
+            elif not want_delta and not row.is_snapshot:
+                self._store_snapshot(row, document)
+                rewritten += 1
+
+            previous_row, previous_document = row, document
+
+        db.commit()
+        logger.info(
+            f"Rewrote {rewritten} indicator history rows as {'deltas' if delta_encode else 'snapshots'}"
+        )
+        return rewritten
+
+    @staticmethod
+    def _cache_key(history: IndicatorHistory) -> _CacheKey:
+        return (history.indicator_id, history.version, history.archived_at)
+
+    def _cache_get(self, key: _CacheKey) -> Optional[SchemaDocument]:
+        with self._cache_lock:
+            document = self._cache.get(key)
+            if document is not None:
+                self._cache.move_to_end(key)
+        return document
+
+    def _cache_put(self, key: _CacheKey, document: SchemaDocument) -> None:
+        with self._cache_lock:
+            self._cache[key] = document
+            self._cache.move_to_end(key)
+            while len(self._cache) > HISTORY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+
+indicator_version_service = IndicatorVersionService()
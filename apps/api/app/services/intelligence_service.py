@@ -5,10 +5,11 @@ import json
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 
-import google.generativeai as genai
 from loguru import logger
 
 from app.core.config import settings
+from app.core.lazy_imports import lazy_import
+from app.core.metrics import record_cache_lookup
 from app.db.enums import ComplianceStatus, ValidationStatus
 from app.db.models.assessment import Assessment, AssessmentResponse
 from app.db.models.governance_area import GovernanceArea, Indicator
@@ -23,8 +24,13 @@ from app.schemas.calculation_schema import (
     OrAnyRule,
     PercentageThresholdRule,
 )
+from app.services.analytics_cache_service import analytics_cache_service
+from app.services.reference_data_service import reference_data_service
 from sqlalchemy.orm import Session, joinedload
 
+# The Gemini SDK adds over a second of import time; load it on the first API call
+genai = lazy_import("google.generativeai")
+
 # Core governance areas (must all pass for compliance)
 CORE_AREAS = [
     "Financial Administration and Sustainability",
@@ -370,6 +376,31 @@ class IntelligenceService:
         if not indicator:
             raise ValueError(f"Indicator with ID {indicator_id} not found")
 
+        return self.evaluate_indicator(indicator, assessment_data)
+
+    def evaluate_indicator(
+        self,
+        indicator: Indicator,
+        assessment_data: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Evaluate an already loaded indicator's calculation schema.
+
+        Same as evaluate_indicator_calculation without the indicator query,
+        for callers that load a batch of indicators at once.
+
+        Args:
+            indicator: The indicator to evaluate
+            assessment_data: Dictionary containing assessment response data
+
+        Returns:
+            "Pass" or "Fail", or None if the indicator isn't auto-calculable
+
+        Raises:
+            ValueError: If the calculation schema is invalid
+        """
+        indicator_id = indicator.id
+
         # Check is_auto_calculable flag
         if not indicator.is_auto_calculable:
             # Not auto-calculable, return None (manual validation required)
@@ -474,14 +505,39 @@ class IntelligenceService:
         Raises:
             ValueError: If indicator not found or template rendering fails
         """
-        from jinja2 import Template, TemplateSyntaxError, UndefinedError
-        from app.schemas.remark_schema import RemarkSchema
-
         # Get the indicator with its remark schema
         indicator = db.query(Indicator).filter(Indicator.id == indicator_id).first()
         if not indicator:
             raise ValueError(f"Indicator with ID {indicator_id} not found")
 
+        return self.render_indicator_remark(indicator, indicator_status, assessment_data)
+
+    def render_indicator_remark(
+        self,
+        indicator: Indicator,
+        indicator_status: Optional[str],
+        assessment_data: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Generate a remark for an already loaded indicator.
+
+        Same as generate_indicator_remark without the indicator query, for
+        callers that load a batch of indicators at once.
+
+        Args:
+            indicator: The indicator whose remark_schema is rendered
+            indicator_status: Pass/Fail status of the indicator (or None)
+            assessment_data: Dictionary containing assessment response data
+
+        Returns:
+            Generated remark string, or None if no remark_schema defined
+
+        Raises:
+            ValueError: If the schema is invalid or template rendering fails
+        """
+        from jinja2 import Template, TemplateSyntaxError, UndefinedError
+        from app.schemas.remark_schema import RemarkSchema
+
         # Check if remark_schema exists
         if not indicator.remark_schema:
             return None
@@ -582,7 +638,7 @@ class IntelligenceService:
             True if all indicators in the area passed, False otherwise
         """
         # Get all indicators for this governance area
-        area = db.query(GovernanceArea).filter(GovernanceArea.name == area_name).first()
+        area = reference_data_service.get_governance_area_by_name(db, area_name)
         if not area:
             return False
 
@@ -707,7 +763,9 @@ class IntelligenceService:
         else:
             return ComplianceStatus.FAILED
 
-    def classify_assessment(self, db: Session, assessment_id: int) -> dict[str, Any]:
+    def classify_assessment(
+        self, db: Session, assessment_id: int, use_pinned_version: bool = False
+    ) -> dict[str, Any]:
         """
         Run the complete classification algorithm and store results.
 
@@ -716,9 +774,15 @@ class IntelligenceService:
         2. Applies the "3+1" rule to determine overall compliance status
         3. Stores results in the database
 
+        With ``use_pinned_version``, auto-calculable responses are first
+        re-evaluated against the indicator version each was answered against,
+        so later edits to an indicator's rules don't change the result.
+
         Args:
             db: Database session
             assessment_id: ID of the assessment to classify
+            use_pinned_version: Re-evaluate auto-calculable responses against
+                their pinned indicator versions before classifying
 
         Returns:
             Dictionary with classification results
@@ -731,6 +795,15 @@ class IntelligenceService:
         if not assessment:
             raise ValueError(f"Assessment {assessment_id} not found")
 
+        if use_pinned_version:
+            from app.services.compliance_validation_service import (
+                compliance_validation_service,
+            )
+
+            compliance_validation_service.bulk_validate_assessment(
+                db, assessment_id, use_pinned_version=True
+            )
+
         # Get area-level results
         area_results = self.get_all_area_results(db, assessment_id)
 
@@ -745,6 +818,9 @@ class IntelligenceService:
         db.commit()
         db.refresh(assessment)
 
+        # Dashboards and reports now show this result
+        analytics_cache_service.invalidate()
+
         return {
             "success": True,
             "assessment_id": assessment_id,
@@ -1022,6 +1098,7 @@ Focus on:
             raise ValueError(f"Assessment {assessment_id} not found")
 
         # Check if ai_recommendations already exists (caching)
+        record_cache_lookup("ai_recommendations", hit=bool(assessment.ai_recommendations))
         if assessment.ai_recommendations:
             return assessment.ai_recommendations
 
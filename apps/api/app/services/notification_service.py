@@ -0,0 +1,336 @@
+# 📬 Notification Service
+# Idempotent, batched delivery of outgoing notifications with a retry queue
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import notifications_total
+from app.db.models.notification import NotificationDelivery
+from app.services.notification_transport import (
+    NotificationTransport,
+    OutgoingMessage,
+    get_transport,
+)
+
+logger = logging.getLogger(__name__)
+
+# Email templates: emails/<name>.txt (required) and emails/<name>.html (optional)
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Compiled templates are cached by the environment for the life of the process
+_templates = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+class NotificationService:
+    """
+    Service for rendering and delivering notifications.
+
+    - Templates are rendered once per batch: every recipient of a batch
+      shares the same rendered subject, text and HTML.
+    - Each message is claimed in notification_deliveries by idempotency
+      key before it is handed to the transport, so reruns of a scheduled
+      job and duplicated tasks never send the same message twice.
+    - Messages the transport does not accept go to a retry queue with
+      exponential backoff, and are marked failed after
+      NOTIFICATION_MAX_ATTEMPTS attempts.
+    """
+
+    def render_batch(
+        self,
+        kind: str,
+        key_prefix: str,
+        subject: str,
+        template: str,
+        context: Dict[str, Any],
+        recipients: Sequence[Tuple[Any, str]],
+    ) -> List[OutgoingMessage]:
+        """
+        Render a template once and address it to many recipients.
+
+        Args:
+            kind: Notification kind (e.g. "deadline_extension")
+            key_prefix: Idempotency key prefix identifying the event
+            subject: Email subject
+            template: Template name under templates/emails (without extension)
+            context: Template variables shared by all recipients
+            recipients: (recipient key, email) pairs; the recipient key
+                completes the idempotency key (normally the user ID)
+
+        Returns:
+            One message per recipient
+        """
+        context = {"portal_url": settings.NOTIFICATION_PORTAL_URL, **context}
+        body = _templates.get_template(f"emails/{template}.txt").render(context)
+        try:
+            html: Optional[str] = _templates.get_template(f"emails/{template}.html").render(context)
+        except TemplateNotFound:
+            html = None
+
+        return [
+            OutgoingMessage(
+                idempotency_key=f"{key_prefix}:{recipient_key}",
+                kind=kind,
+                recipient=email,
+                subject=subject,
+                body=body,
+                html=html,
+            )
+            for recipient_key, email in recipients
+            if email
+        ]
+
+    def filter_unsent(
+        self, db: Session, messages: Sequence[OutgoingMessage]
+    ) -> List[OutgoingMessage]:
+        """
+        Drop duplicate keys and keys that were already claimed.
+
+        Used before fanning out so delivery tasks only carry new messages;
+        deliver() still re-checks when it claims them.
+        """
+        unique = list({message.idempotency_key: message for message in messages}.values())
+        if not unique:
+            return []
+
+        claimed = set(
+            db.scalars(
+                select(NotificationDelivery.idempotency_key).where(
+                    NotificationDelivery.idempotency_key.in_([m.idempotency_key for m in unique])
+                )
+            )
+        )
+        return [message for message in unique if message.idempotency_key not in claimed]
+
+    def deliver(
+        self,
+        db: Session,
+        messages: Sequence[OutgoingMessage],
+        transport: Optional[NotificationTransport] = None,
+    ) -> Dict[str, int]:
+        """
+        Claim and send a batch of messages through one transport call.
+
+        Returns:
+            dict: Counts of sent, retrying, failed and skipped (already
+                claimed) messages
+        """
+        claimed = self._claim(db, messages)
+        skipped = len({message.idempotency_key for message in messages}) - len(claimed)
+        owned = {message.idempotency_key for message in claimed}
+        for message in messages:
+            if message.idempotency_key not in owned:
+                notifications_total.labels(kind=message.kind, outcome="skipped").inc()
+        return self._send(db, claimed, transport or get_transport(), skipped=skipped)
+
+    def retry_due(
+        self,
+        db: Session,
+        transport: Optional[NotificationTransport] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Resend queued deliveries whose next attempt is due.
+
+        Due rows are retries whose backoff has elapsed and claimed
+        ("pending") rows whose send lease expired, i.e. the worker that
+        claimed them crashed or timed out before recording the outcome.
+        Those may have reached the transport already, so this is
+        at-least-once for them.
+
+        On PostgreSQL the due rows are locked with SKIP LOCKED, so concurrent
+        retry runs pick disjoint batches.
+        """
+        now = datetime.utcnow()
+        query = (
+            select(NotificationDelivery)
+            .where(
+                or_(
+                    and_(
+                        NotificationDelivery.status.in_(("retry", "pending")),
+                        NotificationDelivery.next_attempt_at <= now,
+                    ),
+                    # Claimed before leases were recorded
+                    and_(
+                        NotificationDelivery.status == "pending",
+                        NotificationDelivery.next_attempt_at.is_(None),
+                        NotificationDelivery.created_at
+                        <= now - timedelta(seconds=settings.NOTIFICATION_SEND_LEASE_SECONDS),
+                    ),
+                )
+            )
+            .order_by(NotificationDelivery.next_attempt_at)
+            .limit(limit or settings.NOTIFICATION_BATCH_SIZE)
+        )
+        if db.get_bind().dialect.name == "postgresql":
+            query = query.with_for_update(skip_locked=True)
+        rows = db.scalars(query).all()
+        if not rows:
+            db.commit()
+            return {"sent": 0, "retrying": 0, "failed": 0, "skipped": 0}
+
+        messages = [
+            OutgoingMessage(
+                idempotency_key=row.idempotency_key,
+                kind=row.kind,
+                recipient=row.recipient,
+                subject=row.subject,
+                body=row.body,
+                html=row.html,
+            )
+            for row in rows
+        ]
+        db.execute(
+            update(NotificationDelivery)
+            .where(NotificationDelivery.id.in_([row.id for row in rows]))
+            .values(status="pending", next_attempt_at=self._lease_expiry())
+        )
+        db.commit()
+        return self._send(db, messages, transport or get_transport(), skipped=0)
+
+    def _send(
+        self,
+        db: Session,
+        messages: Sequence[OutgoingMessage],
+        transport: NotificationTransport,
+        skipped: int,
+    ) -> Dict[str, int]:
+        """Send claimed messages; record which were sent and queue the rest for retry."""
+        if not messages:
+            return {"sent": 0, "retrying": 0, "failed": 0, "skipped": skipped}
+
+        error = "Not accepted by transport"
+        try:
+            delivered = set(transport.send(messages))
+        except Exception as e:
+            logger.warning("Transport %s failed for %d message(s): %s", transport.name, len(messages), e)
+            delivered, error = set(), str(e) or e.__class__.__name__
+
+        if delivered:
+            db.execute(
+                update(NotificationDelivery)
+                .where(NotificationDelivery.idempotency_key.in_(list(delivered)))
+                .values(status="sent", sent_at=datetime.utcnow(), last_error=None)
+            )
+        undelivered = [m.idempotency_key for m in messages if m.idempotency_key not in delivered]
+        gave_up = self._schedule_retries(db, undelivered, error)
+        db.commit()
+
+        outcomes: Counter = Counter()
+        for message in messages:
+            if message.idempotency_key in delivered:
+                outcome = "sent"
+            elif message.idempotency_key in gave_up:
+                outcome = "failed"
+            else:
+                outcome = "retrying"
+            outcomes[outcome] += 1
+            notifications_total.labels(kind=message.kind, outcome=outcome).inc()
+
+        logger.info(
+            "Delivered %d notification(s) via %s (%d retrying, %d failed, %d skipped)",
+            outcomes["sent"],
+            transport.name,
+            outcomes["retrying"],
+            outcomes["failed"],
+            skipped,
+        )
+        return {
+            "sent": outcomes["sent"],
+            "retrying": outcomes["retrying"],
+            "failed": outcomes["failed"],
+            "skipped": skipped,
+        }
+
+    def _schedule_retries(self, db: Session, keys: Sequence[str], error: str) -> set:
+        """Queue undelivered messages with exponential backoff; return the keys given up on."""
+        if not keys:
+            return set()
+
+        now = datetime.utcnow()
+        gave_up = set()
+        updates = []
+        rows = db.execute(
+            select(
+                NotificationDelivery.id,
+                NotificationDelivery.idempotency_key,
+                NotificationDelivery.attempts,
+            ).where(NotificationDelivery.idempotency_key.in_(list(keys)))
+        ).all()
+        for row_id, key, attempts in rows:
+            attempts += 1
+            if attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+                gave_up.add(key)
+                updates.append(
+                    {"id": row_id, "attempts": attempts, "status": "failed", "last_error": error}
+                )
+            else:
+                delay = settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+                updates.append(
+                    {
+                        "id": row_id,
+                        "attempts": attempts,
+                        "status": "retry",
+                        "last_error": error,
+                        "next_attempt_at": now + timedelta(seconds=delay),
+                    }
+                )
+        for status in ("failed", "retry"):
+            batch = [values for values in updates if values["status"] == status]
+            if batch:
+                db.execute(update(NotificationDelivery), batch)
+        return gave_up
+
+    @staticmethod
+    def _lease_expiry() -> datetime:
+        """When a claimed row counts as abandoned if its outcome wasn't recorded."""
+        return datetime.utcnow() + timedelta(seconds=settings.NOTIFICATION_SEND_LEASE_SECONDS)
+
+    def _claim(self, db: Session, messages: Sequence[OutgoingMessage]) -> List[OutgoingMessage]:
+        """Insert pending rows for unclaimed keys; return the messages this call now owns."""
+        unique = {message.idempotency_key: message for message in messages}
+        if not unique:
+            return []
+
+        dialect = db.get_bind().dialect.name
+        insert_stmt = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        now = datetime.utcnow()
+        rows = [
+            {
+                "idempotency_key": message.idempotency_key,
+                "kind": message.kind,
+                "recipient": message.recipient,
+                "subject": message.subject,
+                "body": message.body,
+                "html": message.html,
+                "status": "pending",
+                "attempts": 0,
+                "next_attempt_at": self._lease_expiry(),
+                "created_at": now,
+            }
+            for message in unique.values()
+        ]
+        owned = db.scalars(
+            insert_stmt(NotificationDelivery)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["idempotency_key"])
+            .returning(NotificationDelivery.idempotency_key)
+        ).all()
+        db.commit()
+        return [unique[key] for key in owned]
+
+
+notification_service = NotificationService()
@@ -0,0 +1,233 @@
+# 📮 Notification Transports
+# Pluggable delivery backends for outgoing notifications
+
+import logging
+import os
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.metrics import smtp_connections_opened_total
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OutgoingMessage:
+    """A rendered notification for a single recipient."""
+
+    idempotency_key: str
+    kind: str
+    recipient: str
+    subject: str
+    body: str
+    html: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serialisable form (for Celery task arguments)."""
+        return asdict(self)
+
+
+class NotificationTransport:
+    """
+    Base class for delivery backends.
+
+    send() hands a batch of messages to the backend and returns the
+    idempotency keys of the messages it accepted. Messages it did not
+    accept are retried later; raising means none of them were accepted.
+    """
+
+    name = "base"
+
+    def send(self, messages: Sequence[OutgoingMessage]) -> List[str]:
+        raise NotImplementedError
+
+
+class LoggingTransport(NotificationTransport):
+    """Debug stand-in: logs each message instead of delivering it."""
+
+    name = "log"
+
+    def send(self, messages: Sequence[OutgoingMessage]) -> List[str]:
+        for message in messages:
+            logger.info(
+                "NOTIFICATION [%s] to %s: %s\n%s",
+                message.kind,
+                message.recipient,
+                message.subject,
+                message.body,
+            )
+        return [message.idempotency_key for message in messages]
+
+
+class SMTPConnectionPool:
+    """
+    Per-process pool of persistent, authenticated SMTP connections.
+
+    Connections are reused across batches and tasks, so a worker pays the
+    connect/STARTTLS/AUTH handshake once instead of once per notification.
+    A pooled connection idle for longer than SMTP_POOL_IDLE_SECONDS is
+    checked with NOOP before reuse and reopened if the server dropped it.
+    """
+
+    def __init__(self) -> None:
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+
+    def _open(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT or 25, timeout=30)
+        if settings.SMTP_TLS:
+            connection.starttls()
+        if settings.SMTP_USER:
+            connection.login(settings.SMTP_USER, settings.SMTP_PASSWORD or "")
+        smtp_connections_opened_total.inc()
+        return connection
+
+    @staticmethod
+    def _is_alive(connection: smtplib.SMTP) -> bool:
+        try:
+            return connection.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    @staticmethod
+    def _close(connection: smtplib.SMTP) -> None:
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                connection, returned_at = self._idle.pop()
+            if time.monotonic() - returned_at < settings.SMTP_POOL_IDLE_SECONDS:
+                return connection
+            if self._is_alive(connection):
+                return connection
+            self._close(connection)
+        return self._open()
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a connection for one batch.
+
+        The connection goes back to the pool if the block completes, and is
+        discarded if it raises (the session may be in an unknown state).
+        """
+        connection = self._checkout()
+        try:
+            yield connection
+        except BaseException:
+            self._close(connection)
+            raise
+        with self._lock:
+            if len(self._idle) < settings.SMTP_POOL_SIZE:
+                self._idle.append((connection, time.monotonic()))
+                return
+        self._close(connection)
+
+    def close_all(self) -> None:
+        """Close every pooled connection (worker shutdown, tests)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._close(connection)
+
+    def _forget(self) -> None:
+        # In a forked child the parent's sockets must not be used or QUIT
+        self._idle = []
+        self._lock = threading.Lock()
+
+
+smtp_pool = SMTPConnectionPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=smtp_pool._forget)
+
+
+class SMTPTransport(NotificationTransport):
+    """
+    Email over SMTP through the per-process connection pool.
+
+    Works against any SMTP server, including a local debugging server
+    (e.g. ``python -m aiosmtpd -n -l localhost:1025`` with SMTP_TLS=false).
+    """
+
+    name = "smtp"
+
+    def __init__(self, pool: Optional[SMTPConnectionPool] = None):
+        self.pool = pool or smtp_pool
+
+    def _build(self, message: OutgoingMessage) -> EmailMessage:
+        email = EmailMessage()
+        email["From"] = formataddr(
+            (settings.EMAILS_FROM_NAME or settings.PROJECT_NAME, settings.EMAILS_FROM_EMAIL or "")
+        )
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email["Message-ID"] = f"<{message.idempotency_key}@vantage>"
+        email.set_content(message.body)
+        if message.html:
+            email.add_alternative(message.html, subtype="html")
+        return email
+
+    def send(self, messages: Sequence[OutgoingMessage]) -> List[str]:
+        if not messages:
+            return []
+
+        delivered: List[str] = []
+        try:
+            with self.pool.connection() as connection:
+                for message in messages:
+                    try:
+                        connection.send_message(self._build(message))
+                        delivered.append(message.idempotency_key)
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as e:
+                        # A refused message shouldn't fail the rest of the batch
+                        logger.warning("SMTP rejected message to %s: %s", message.recipient, e)
+        except (smtplib.SMTPException, OSError) as e:
+            # Connection lost mid-batch: report what was accepted, retry the rest
+            if not delivered:
+                raise
+            logger.warning(
+                "SMTP connection lost after %d of %d messages: %s",
+                len(delivered),
+                len(messages),
+                e,
+            )
+        return delivered
+
+
+# Transports selectable through settings.NOTIFICATION_TRANSPORT
+TRANSPORTS = {
+    LoggingTransport.name: LoggingTransport,
+    SMTPTransport.name: SMTPTransport,
+}
+
+
+def get_transport() -> NotificationTransport:
+    """
+    Return the transport configured by NOTIFICATION_TRANSPORT.
+
+    Falls back to the logging stand-in when SMTP is selected but no
+    SMTP_HOST is configured (local development).
+    """
+    name = settings.NOTIFICATION_TRANSPORT
+    if name == SMTPTransport.name and not settings.SMTP_HOST:
+        logger.warning("NOTIFICATION_TRANSPORT=smtp but SMTP_HOST is not set; logging instead")
+        name = LoggingTransport.name
+    try:
+        return TRANSPORTS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown notification transport: {name}")
@@ -0,0 +1,307 @@
+# 📚 Reference Data Service
+# In-process cache of governance areas, barangays and the active assessment cycle
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.etag import compute_etag
+from app.core.metrics import record_cache_lookup
+from app.core.redis_client import BackgroundAnnouncer, RedisConnection
+from app.core.table_cache import subscribe
+from app.db.enums import AreaType
+from app.db.models.admin import AssessmentCycle
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Tables whose commits make every process reload its reference data
+REFERENCE_TABLES = frozenset(
+    {GovernanceArea.__tablename__, Barangay.__tablename__, AssessmentCycle.__tablename__}
+)
+
+# Redis counter holding the shared version, and the channel announcing bumps
+VERSION_KEY = "vantage:reference_data:version"
+CHANNEL = "vantage:reference_data"
+
+
+@dataclass(frozen=True)
+class GovernanceAreaRef:
+    id: int
+    name: str
+    area_type: AreaType
+
+
+@dataclass(frozen=True)
+class BarangayRef:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class AssessmentCycleRef:
+    id: int
+    name: str
+    year: int
+    phase1_deadline: datetime
+    rework_deadline: datetime
+    phase2_deadline: datetime
+    calibration_deadline: datetime
+    is_active: bool
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """One immutable snapshot of the reference tables."""
+
+    version: int
+    governance_areas: Tuple[GovernanceAreaRef, ...]  # By id
+    barangays: Tuple[BarangayRef, ...]  # By name
+    active_cycle: Optional[AssessmentCycleRef]
+    areas_by_id: Dict[int, GovernanceAreaRef] = field(repr=False)
+    barangays_by_id: Dict[int, BarangayRef] = field(repr=False)
+    # Lookup endpoint payloads and their ETags, computed once per snapshot
+    governance_areas_payload: List[Dict[str, Any]] = field(repr=False)
+    barangays_payload: List[Dict[str, Any]] = field(repr=False)
+    governance_areas_etag: str = field(repr=False)
+    barangays_etag: str = field(repr=False)
+
+
+class ReferenceDataService:
+    """
+    Cached reference data shared by the lookup endpoints and other services.
+
+    The snapshot is versioned by a counter that only moves forward. A
+    commit in this process that writes governance areas, barangays or
+    assessment cycles bumps it. When Redis is available, a background
+    thread also bumps the shared counter and publishes the new value;
+    commits never wait on Redis. Processes running the listener (started
+    by the API lifespan and in every Celery worker process) drop their
+    snapshots when a bump is announced. Snapshots also expire after
+    REFERENCE_DATA_CACHE_TTL_SECONDS in case an announcement is missed.
+
+    Snapshots reflect committed data only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ReferenceData] = None
+        self._loaded_at = 0.0
+        self._version = 0
+        # Highest shared (Redis) version applied, to skip our own announcements
+        self._shared_version = 0
+        self._redis_connection = RedisConnection(
+            "reference data versions", settings.REFERENCE_DATA_REDIS_RETRY_SECONDS
+        )
+        self._listener: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        # Shares local writes through Redis off the commit path
+        self._announcer = BackgroundAnnouncer("reference-data-announcer", self._announce)
+        subscribe(REFERENCE_TABLES, self._on_local_write)
+
+    @property
+    def version(self) -> int:
+        """Current local version of the reference data."""
+        return self._version
+
+    def get(self, db: Session) -> ReferenceData:
+        """Return the current snapshot, loading it (three queries) if stale."""
+        with self._lock:
+            snapshot = self._snapshot
+            version = self._version
+            fresh = (
+                snapshot is not None
+                and time.monotonic() - self._loaded_at < settings.REFERENCE_DATA_CACHE_TTL_SECONDS
+            )
+        record_cache_lookup("reference_data", hit=fresh)
+        if fresh:
+            return snapshot
+
+        snapshot = self._load(db, version)
+        with self._lock:
+            # Don't keep a snapshot loaded while a newer version was announced
+            if self._version == version:
+                self._snapshot = snapshot
+                self._loaded_at = time.monotonic()
+        return snapshot
+
+    def get_governance_areas(self, db: Session) -> Tuple[GovernanceAreaRef, ...]:
+        """All governance areas, ordered by ID."""
+        return self.get(db).governance_areas
+
+    def get_governance_area(
+        self, db: Session, area_id: Optional[int]
+    ) -> Optional[GovernanceAreaRef]:
+        """A governance area by ID, or None."""
+        return self.get(db).areas_by_id.get(area_id)
+
+    def get_governance_area_by_name(
+        self, db: Session, name: str
+    ) -> Optional[GovernanceAreaRef]:
+        """A governance area by exact name, or None."""
+        areas = self.get(db).governance_areas
+        return next((area for area in areas if area.name == name), None)
+
+    def get_barangays(self, db: Session) -> Tuple[BarangayRef, ...]:
+        """All barangays, ordered by name."""
+        return self.get(db).barangays
+
+    def get_barangay(self, db: Session, barangay_id: Optional[int]) -> Optional[BarangayRef]:
+        """A barangay by ID, or None."""
+        return self.get(db).barangays_by_id.get(barangay_id)
+
+    def get_active_cycle(self, db: Session) -> Optional[AssessmentCycleRef]:
+        """The active assessment cycle (read-only snapshot), or None."""
+        return self.get(db).active_cycle
+
+    def invalidate(self) -> None:
+        """Move to a new version; the next read reloads."""
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+
+    # ----- Loading -----
+
+    @staticmethod
+    def _load(db: Session, version: int) -> ReferenceData:
+        areas = tuple(
+            GovernanceAreaRef(id=row.id, name=row.name, area_type=row.area_type)
+            for row in db.execute(
+                select(GovernanceArea.id, GovernanceArea.name, GovernanceArea.area_type)
+                .order_by(GovernanceArea.id)
+            )
+        )
+        barangays = tuple(
+            BarangayRef(id=row.id, name=row.name)
+            for row in db.execute(
+                select(Barangay.id, Barangay.name).order_by(Barangay.name, Barangay.id)
+            )
+        )
+        cycle = db.execute(
+            select(
+                AssessmentCycle.id,
+                AssessmentCycle.name,
+                AssessmentCycle.year,
+                AssessmentCycle.phase1_deadline,
+                AssessmentCycle.rework_deadline,
+                AssessmentCycle.phase2_deadline,
+                AssessmentCycle.calibration_deadline,
+                AssessmentCycle.is_active,
+            )
+            .where(AssessmentCycle.is_active.is_(True))
+            .order_by(AssessmentCycle.id)
+            .limit(1)
+        ).first()
+
+        areas_payload = [
+            {"id": area.id, "name": area.name, "area_type": area.area_type.value}
+            for area in areas
+        ]
+        barangays_payload = [{"id": b.id, "name": b.name} for b in barangays]
+        return ReferenceData(
+            version=version,
+            governance_areas=areas,
+            barangays=barangays,
+            active_cycle=AssessmentCycleRef(**cycle._mapping) if cycle else None,
+            areas_by_id={area.id: area for area in areas},
+            barangays_by_id={b.id: b for b in barangays},
+            governance_areas_payload=areas_payload,
+            barangays_payload=barangays_payload,
+            governance_areas_etag=compute_etag(areas_payload),
+            barangays_etag=compute_etag(barangays_payload),
+        )
+
+    # ----- Cross-process invalidation -----
+
+    def _on_local_write(self, tables: Set[str]) -> None:
+        """A commit in this process changed reference data: bump it now, announce it later."""
+        self.invalidate()
+        if self._redis_connection.configured:
+            self._announcer.request()
+
+    def _announce(self) -> None:
+        """Bump the shared version and publish it to the other processes."""
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            shared = int(client.incr(VERSION_KEY))
+            with self._lock:
+                self._shared_version = max(self._shared_version, shared)
+            client.publish(CHANNEL, shared)
+        except Exception as e:
+            self._redis_connection.failed(e)
+
+    def _apply_shared_version(self, shared: int) -> None:
+        """Another process announced a version; reload unless it's already applied."""
+        with self._lock:
+            if shared <= self._shared_version:
+                return
+            self._shared_version = shared
+        self.invalidate()
+
+    def start_listener(self) -> None:
+        """Start the thread applying other processes' announcements (idempotent)."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        if not self._redis_connection.configured:
+            return
+        self._stopping.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="reference-data-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self, timeout: Optional[float] = 2.0) -> None:
+        """Stop the announcement listener."""
+        self._stopping.set()
+        listener = self._listener
+        if listener is not None and listener is not threading.current_thread():
+            listener.join(timeout)
+        self._listener = None
+
+    def _listen(self) -> None:
+        import redis
+
+        # Own connection without a read timeout: it blocks waiting for messages
+        client = redis.Redis.from_url(settings.CELERY_BROKER_URL, socket_connect_timeout=0.5)
+        connected = False
+        while not self._stopping.is_set():
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(CHANNEL)
+                connected = True
+                # Catch up on bumps announced while we weren't subscribed
+                current = client.get(VERSION_KEY)
+                if current is not None:
+                    self._apply_shared_version(int(current))
+                while not self._stopping.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._apply_shared_version(int(message["data"]))
+            except Exception as e:
+                logger.debug(f"Reference data listener disconnected: {str(e)}")
+                if connected:
+                    # Announcements may be missed while disconnected
+                    connected = False
+                    self.invalidate()
+                self._stopping.wait(settings.REFERENCE_DATA_REDIS_RETRY_SECONDS)
+            finally:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+        client.close()
+
+    def _redis(self):
+        return self._redis_connection.client()
+
+# Create a single instance to be used across the application
+reference_data_service = ReferenceDataService()
@@ -0,0 +1,469 @@
+"""
+🧩 Schema Validation Service
+Incremental validation of form and calculation schemas for the indicator builder.
+
+Each validated form schema is kept as a dependency graph (fields, their
+conditional MOV references and the errors found so far), cached by a hash
+of the schema's content. Validating the next version of a schema diffs it
+against a cached base by per-field digest and re-checks only the fields
+that changed plus the fields whose MOV logic points at them; cycles are
+re-walked only from those fields. Every error is produced by that one
+traversal, so the builder's keystroke validation no longer re-runs the
+separate DFS passes in form_schema_validator.
+
+Calculation schemas are indexed once per content hash into the set of
+field_ids their rules reference, and checked against a cached form graph.
+
+Cached graphs are never mutated: deriving a new graph copies the base's
+dicts and replaces only the affected entries.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.metrics import record_cache_lookup
+from app.schemas.calculation_schema import CalculationSchema
+from app.schemas.form_schema import (
+    CheckboxGroupField,
+    FileUploadField,
+    FormField,
+    FormSchema,
+    RadioButtonField,
+)
+
+# Maximum number of schema graphs (and calculation rule indexes) kept in memory
+SCHEMA_GRAPH_CACHE_SIZE = 512
+
+# Rule types that read a form field
+FIELD_RULE_TYPES = ("PERCENTAGE_THRESHOLD", "COUNT_THRESHOLD", "MATCH_VALUE")
+
+
+@dataclass(frozen=True)
+class FieldNode:
+    """One form field as seen by the validator."""
+
+    field_id: str
+    digest: str
+    # Field this field's conditional MOV logic reads, if any
+    depends_on: Optional[str] = None
+    # "Checkbox group" / "Radio button" for option fields without options
+    missing_options: Optional[str] = None
+
+
+@dataclass
+class SchemaGraph:
+    """A validated form schema. Instances in the cache are treated as immutable."""
+
+    schema_hash: str
+    nodes: Dict[str, FieldNode]
+    # Position of each field in the schema (gaps are left by removals)
+    order: Dict[str, int]
+    # field_id -> ids of the fields whose MOV logic references it
+    dependents: Dict[str, FrozenSet[str]]
+    field_errors: Dict[str, Tuple[str, ...]]
+    # field_id -> the cycle it lies on, starting at its earliest field
+    cycles: Dict[str, Tuple[str, ...]]
+    duplicates: Tuple[str, ...] = ()
+    next_position: int = 0
+    # Fields re-checked to produce this graph
+    rechecked: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha1(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    ).hexdigest()
+
+
+def _field_node(form_field: FormField) -> FieldNode:
+    depends_on = None
+    if isinstance(form_field, FileUploadField) and form_field.conditional_mov_requirement:
+        depends_on = form_field.conditional_mov_requirement.field_id
+
+    missing_options = None
+    if isinstance(form_field, (CheckboxGroupField, RadioButtonField)) and not form_field.options:
+        missing_options = (
+            "Checkbox group" if isinstance(form_field, CheckboxGroupField) else "Radio button"
+        )
+
+    return FieldNode(
+        field_id=form_field.field_id,
+        digest=_digest(form_field.model_dump(mode="json")),
+        depends_on=depends_on,
+        missing_options=missing_options,
+    )
+
+
+def _schema_hash(nodes: Dict[str, FieldNode]) -> str:
+    return hashlib.sha1(
+        "\n".join(f"{node.field_id}:{node.digest}" for node in nodes.values()).encode()
+    ).hexdigest()
+
+
+_EMPTY_GRAPH = SchemaGraph(
+    schema_hash="", nodes={}, order={}, dependents={}, field_errors={}, cycles={}
+)
+
+
+class SchemaValidationService:
+    """
+    Service for validating indicator builder schemas incrementally.
+
+    validate_form_schema() takes a whole schema (optionally with the hash
+    of the version it was edited from), apply_form_schema_edits() takes
+    just the changed fields, and validate_calculation_schema() checks rule
+    field references against a cached form schema.
+    """
+
+    def __init__(self):
+        self._graphs: "OrderedDict[str, SchemaGraph]" = OrderedDict()
+        self._rule_indexes: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    # ========================================================================
+    # Form schemas
+    # ========================================================================
+
+    def validate_form_schema(
+        self, form_schema: FormSchema, base_hash: Optional[str] = None
+    ) -> SchemaGraph:
+        """
+        Validate a whole form schema.
+
+        Args:
+            form_schema: The schema to validate
+            base_hash: Hash of the schema version this one was edited from;
+                only fields that differ from it are re-checked. Unknown
+                hashes fall back to a full check.
+
+        Returns:
+            The schema's graph; ``errors`` is empty when the schema is valid
+        """
+        nodes: Dict[str, FieldNode] = {}
+        seen: Set[str] = set()
+        duplicates: Set[str] = set()
+        for form_field in form_schema.fields:
+            node = _field_node(form_field)
+            if node.field_id in seen:
+                duplicates.add(node.field_id)
+            seen.add(node.field_id)
+            nodes[node.field_id] = node
+
+        schema_hash = _schema_hash(nodes)
+        cached = self._cache_get(self._graphs, schema_hash)
+        record_cache_lookup("schema_validation", hit=cached is not None and not duplicates)
+        if cached is not None and not duplicates:
+            return cached
+
+        base = (self._cache_get(self._graphs, base_hash) if base_hash else None) or _EMPTY_GRAPH
+        changed = {
+            field_id
+            for field_id, node in nodes.items()
+            if field_id not in base.nodes or base.nodes[field_id].digest != node.digest
+        }
+        changed.update(field_id for field_id in base.nodes if field_id not in nodes)
+
+        graph = self._derive(
+            base,
+            nodes,
+            {field_id: position for position, field_id in enumerate(nodes)},
+            changed,
+            schema_hash,
+            duplicates=tuple(sorted(duplicates)),
+        )
+        # A schema with duplicate ids has no single graph to build edits on
+        if not duplicates:
+            self._cache_put(self._graphs, schema_hash, graph)
+        return graph
+
+    def apply_form_schema_edits(
+        self,
+        base_hash: str,
+        upsert_fields: Iterable[FormField] = (),
+        removed_field_ids: Iterable[str] = (),
+    ) -> SchemaGraph:
+        """
+        Validate a cached form schema with a few fields added, changed or removed.
+
+        Work is proportional to the number of edited fields, not the size
+        of the schema. New fields are appended; changed fields keep their
+        position.
+
+        Raises:
+            HTTPException: 409 if ``base_hash`` is not cached (the caller
+                should validate the whole schema instead)
+        """
+        base = self._require_graph(base_hash)
+
+        nodes = dict(base.nodes)
+        order = dict(base.order)
+        next_position = base.next_position
+        changed: Set[str] = set()
+
+        for field_id in removed_field_ids:
+            if nodes.pop(field_id, None) is not None:
+                order.pop(field_id, None)
+                changed.add(field_id)
+
+        for form_field in upsert_fields:
+            node = _field_node(form_field)
+            previous = nodes.get(node.field_id)
+            if previous is not None and previous.digest == node.digest:
+                continue
+            if node.field_id not in order:
+                order[node.field_id] = next_position
+                next_position += 1
+            nodes[node.field_id] = node
+            changed.add(node.field_id)
+
+        schema_hash = _schema_hash(nodes) if changed else base.schema_hash
+        cached = self._cache_get(self._graphs, schema_hash)
+        record_cache_lookup("schema_validation", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        graph = self._derive(base, nodes, order, changed, schema_hash, next_position=next_position)
+        self._cache_put(self._graphs, schema_hash, graph)
+        return graph
+
+    # ========================================================================
+    # Calculation schemas
+    # ========================================================================
+
+    def validate_calculation_schema(
+        self,
+        calculation_schema: CalculationSchema,
+        form_schema_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Check a calculation schema's field references against a cached form schema.
+
+        Args:
+            calculation_schema: The (already structurally valid) schema
+            form_schema_hash: Hash returned when the form schema was
+                validated; without it only the structure is checked
+
+        Returns:
+            dict: {"schema_hash", "referenced_field_ids", "errors"}
+
+        Raises:
+            HTTPException: 409 if ``form_schema_hash`` is not cached
+        """
+        schema_hash = _digest(calculation_schema.model_dump(mode="json"))
+        referenced = self._cache_get(self._rule_indexes, schema_hash)
+        if referenced is None:
+            referenced = frozenset(self._referenced_field_ids(calculation_schema))
+            self._cache_put(self._rule_indexes, schema_hash, referenced)
+
+        errors: List[str] = []
+        if form_schema_hash:
+            graph = self._require_graph(form_schema_hash)
+            errors = [
+                f"Calculation schema references field '{field_id}' which does not exist in form schema"
+                for field_id in sorted(referenced)
+                if field_id not in graph.nodes
+            ]
+
+        return {
+            "schema_hash": schema_hash,
+            "referenced_field_ids": sorted(referenced),
+            "errors": errors,
+        }
+
+    def get_graph(self, schema_hash: str) -> Optional[SchemaGraph]:
+        """Return the cached graph for a form schema hash, if any."""
+        return self._cache_get(self._graphs, schema_hash)
+
+    def clear_cache(self) -> None:
+        """Drop every cached graph and rule index."""
+        with self._cache_lock:
+            self._graphs.clear()
+            self._rule_indexes.clear()
+
+    # ========================================================================
+    # Graph derivation
+    # ========================================================================
+
+    def _derive(
+        self,
+        base: SchemaGraph,
+        nodes: Dict[str, FieldNode],
+        order: Dict[str, int],
+        changed: Set[str],
+        schema_hash: str,
+        duplicates: Tuple[str, ...] = (),
+        next_position: Optional[int] = None,
+    ) -> SchemaGraph:
+        """Build the graph for ``nodes`` from ``base``, re-checking only what ``changed`` touches."""
+        dependents = dict(base.dependents)
+        for field_id in changed:
+            previous, current = base.nodes.get(field_id), nodes.get(field_id)
+            old_target = previous.depends_on if previous else None
+            new_target = current.depends_on if current else None
+            if old_target == new_target:
+                continue
+            if old_target is not None:
+                remaining = dependents.get(old_target, frozenset()) - {field_id}
+                if remaining:
+                    dependents[old_target] = remaining
+                else:
+                    dependents.pop(old_target, None)
+            if new_target is not None:
+                dependents[new_target] = dependents.get(new_target, frozenset()) | {field_id}
+
+        # Fields whose own errors may differ: the changed ones, and the ones
+        # whose MOV logic references a field that was added or removed
+        affected = set(changed)
+        for field_id in changed:
+            affected.update(dependents.get(field_id, ()))
+            affected.update(base.dependents.get(field_id, ()))
+
+        field_errors = dict(base.field_errors)
+        for field_id in affected:
+            field_errors.pop(field_id, None)
+            node = nodes.get(field_id)
+            if node is not None:
+                problems = self._check_field(node, nodes)
+                if problems:
+                    field_errors[field_id] = problems
+
+        # Every field has at most one outgoing edge, so any new cycle runs
+        # through a changed field and a broken one contained a changed field
+        cycles = dict(base.cycles)
+        starts = set(changed)
+        for field_id in changed:
+            starts.update(cycles.get(field_id, ()))
+        for field_id in starts:
+            cycles.pop(field_id, None)
+        for field_id in starts:
+            if field_id in nodes and field_id not in cycles:
+                cycle = self._find_cycle(field_id, nodes, order, cycles)
+                for member in cycle:
+                    cycles[member] = cycle
+
+        graph = SchemaGraph(
+            schema_hash=schema_hash,
+            nodes=nodes,
+            order=order,
+            dependents=dependents,
+            field_errors=field_errors,
+            cycles=cycles,
+            duplicates=duplicates,
+            next_position=len(order) if next_position is None else next_position,
+            rechecked=len(affected | starts),
+        )
+        graph.errors = self._collect_errors(graph)
+        return graph
+
+    @staticmethod
+    def _check_field(node: FieldNode, nodes: Dict[str, FieldNode]) -> Tuple[str, ...]:
+        problems = []
+        if node.depends_on == node.field_id:
+            problems.append(
+                f"Field '{node.field_id}' references itself in conditional MOV logic"
+            )
+        elif node.depends_on is not None and node.depends_on not in nodes:
+            problems.append(
+                f"Field '{node.field_id}' has invalid conditional MOV logic: "
+                f"referenced field '{node.depends_on}' does not exist"
+            )
+        if node.missing_options:
+            problems.append(
+                f"{node.missing_options} field '{node.field_id}' must have at least one option"
+            )
+        return tuple(problems)
+
+    @staticmethod
+    def _find_cycle(
+        start: str,
+        nodes: Dict[str, FieldNode],
+        order: Dict[str, int],
+        cycles: Dict[str, Tuple[str, ...]],
+    ) -> Tuple[str, ...]:
+        """Follow MOV references from ``start``; return the cycle it reaches, if new."""
+        path: List[str] = []
+        index: Dict[str, int] = {}
+        current: Optional[str] = start
+        while current is not None and current in nodes:
+            if current in cycles:
+                # Runs into a cycle that is already known
+                return ()
+            if current in index:
+                cycle = path[index[current]:]
+                # Self-references are reported by _check_field
+                if len(cycle) < 2:
+                    return ()
+                first = min(range(len(cycle)), key=lambda i: order.get(cycle[i], 0))
+                return tuple(cycle[first:] + cycle[:first])
+            index[current] = len(path)
+            path.append(current)
+            current = nodes[current].depends_on
+        return ()
+
+    @staticmethod
+    def _collect_errors(graph: SchemaGraph) -> List[str]:
+        if not graph.nodes:
+            return ["Form schema must have at least one field"]
+
+        errors: List[str] = []
+        if graph.duplicates:
+            errors.append(f"Duplicate field_ids found: {', '.join(graph.duplicates)}")
+
+        position = graph.order.get
+        for field_id in sorted(graph.field_errors, key=position):
+            errors.extend(graph.field_errors[field_id])
+
+        for cycle in sorted(set(graph.cycles.values()), key=lambda c: position(c[0])):
+            errors.append(
+                "Circular reference detected in field dependencies: "
+                + " -> ".join(cycle + (cycle[0],))
+            )
+        return errors
+
+    @staticmethod
+    def _referenced_field_ids(calculation_schema: CalculationSchema) -> Set[str]:
+        referenced: Set[str] = set()
+        pending = [rule for group in calculation_schema.condition_groups for rule in group.rules]
+        while pending:
+            rule = pending.pop()
+            if rule.rule_type in FIELD_RULE_TYPES:
+                referenced.add(rule.field_id)
+            pending.extend(getattr(rule, "conditions", None) or ())
+        return referenced
+
+    # ========================================================================
+    # Cache
+    # ========================================================================
+
+    def _require_graph(self, schema_hash: str) -> SchemaGraph:
+        graph = self._cache_get(self._graphs, schema_hash)
+        if graph is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Form schema {schema_hash} is not cached; validate the full form schema",
+            )
+        return graph
+
+    def _cache_get(self, cache: OrderedDict, key: str) -> Any:
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any) -> None:
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > SCHEMA_GRAPH_CACHE_SIZE:
+                cache.popitem(last=False)
+
+
+schema_validation_service = SchemaValidationService()
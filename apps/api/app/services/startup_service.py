@@ -3,22 +3,30 @@
 Handles application startup checks and initialization
 """
 
+import hashlib
+import inspect
+import json
 import logging
+import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from app.core.config import settings
 from app.core.security import get_password_hash
 from app.db.base import (
     SessionLocal,
-    check_all_connections,
     validate_connections_startup,
 )
 from app.db.enums import UserRole
 from app.db.models.barangay import Barangay
+from app.db.models.system import SeedVersion
 from app.db.models.user import User
 from app.services.governance_area_service import governance_area_service
+from app.services.health_service import health_service
 from app.services.indicator_service import indicator_service
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session  # type: ignore[reportMissingImports]
 
 logger = logging.getLogger(__name__)
@@ -52,6 +60,15 @@ BARANGAYS = [
     "Waterfall",
 ]
 
+# Seed bookkeeping: bump SEED_VERSION to force a reseed without code changes
+# to the seeders; any change to BARANGAYS or a seeder's source also changes
+# the fingerprint and triggers a reseed on the next boot.
+SEED_NAME = "initial_data"
+SEED_VERSION = 1
+
+# PostgreSQL advisory lock key held by the worker that is seeding
+SEED_ADVISORY_LOCK_KEY = 0x56414E54_53454544  # "VANTSEED"
+
 
 class StartupService:
     """
@@ -82,8 +99,8 @@ class StartupService:
         # Validate database connections
         await self._validate_database_connections()
 
-        # Seed initial data
-        self._seed_initial_data()
+        # Seed initial data (no-op when the recorded seed version is current)
+        self.seed_initial_data()
 
         # Create first superuser if needed
         self._create_first_superuser()
@@ -101,55 +118,151 @@ class StartupService:
         logger.info(f"🔧 Debug mode: {settings.DEBUG}")
         logger.info(f"📝 Project: {settings.PROJECT_NAME} v{settings.VERSION}")
 
-    def _seed_initial_data(self) -> None:
-        """Seed the database with initial required data."""
-        import os
-        # Skip seeding in tests to speed up test runs
-        if os.getenv("SKIP_STARTUP_SEEDING") == "true":
-            logger.info("⏭️  Skipping startup seeding (test mode)")
+    def _seed_steps(self) -> List[Tuple[str, Callable[[Session], None]]]:
+        """Ordered seeding steps; each is idempotent and commits its own work."""
+        return [
+            ("Seeding 25 barangays for Sulop", self._seed_barangays),
+            ("Seeding SGLGB governance areas", governance_area_service.seed_governance_areas),
+            ("Seeding mock indicators for testing", indicator_service.seed_mock_indicators),
+            (
+                "Enforcing Area 1 as a single indicator (sub-indicators in schema)",
+                indicator_service.enforce_area1_as_single_indicator,
+            ),
+            (
+                "Standardizing indicator names to official area names",
+                indicator_service.standardize_indicator_area_names,
+            ),
+            (
+                "Seeding indicators for governance areas 2-6",
+                indicator_service.seed_areas_2_to_6_indicators,
+            ),
+        ]
+
+    def seed_fingerprint(self) -> str:
+        """
+        Fingerprint of the current seed definitions.
+
+        Combines SEED_VERSION, the barangay list and the source of every
+        seeding step, so editing a seeder invalidates the stored fingerprint.
+        """
+        sources = []
+        for label, step in self._seed_steps():
+            try:
+                sources.append(inspect.getsource(step))
+            except (OSError, TypeError):
+                sources.append(label)
+        payload = json.dumps(
+            {"version": SEED_VERSION, "barangays": BARANGAYS, "steps": sources},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _seed_barangays(self, db: Session) -> None:
+        if db.query(Barangay.id).first() is not None:
             return
+        db.add_all([Barangay(name=name) for name in BARANGAYS])
+        db.commit()
 
-        logger.info("🌱 Seeding initial data...")
-        db: Session = SessionLocal()
+    def _stored_seed_fingerprint(self, db: Session) -> Optional[str]:
+        """Single-query lookup of the recorded fingerprint (None if absent)."""
         try:
-            # Check if barangays already exist
-            count = db.query(Barangay).count()
-            if count == 0:
-                logger.info("  - Seeding 25 barangays for Sulop...")
-                for name in BARANGAYS:
-                    db_barangay = Barangay(name=name)
-                    db.add(db_barangay)
-                db.commit()
-                logger.info("  - Barangay seeding complete.")
-            else:
-                logger.info("  - Barangays already seeded. Skipping.")
+            return (
+                db.query(SeedVersion.fingerprint)
+                .filter(SeedVersion.name == SEED_NAME)
+                .scalar()
+            )
+        except SQLAlchemyError as e:
+            # seed_versions missing (migrations not applied yet): seed anyway
+            logger.warning(f"⚠️  Could not read seed version: {str(e)}")
+            db.rollback()
+            return None
+
+    @contextmanager
+    def _seed_lock(self, db: Session) -> Iterator[bool]:
+        """
+        Hold a PostgreSQL advisory lock while seeding.
 
-            # Seed governance areas
-            logger.info("  - Seeding SGLGB governance areas...")
-            governance_area_service.seed_governance_areas(db)
-            logger.info("  - Governance areas seeding complete.")
+        Uses a try-lock on a dedicated connection, so workers that lose the
+        race start serving immediately instead of queueing behind the seeder.
+        Other databases (SQLite in tests) have no concurrent workers and
+        always acquire.
+        """
+        bind = db.get_bind()
+        if bind.dialect.name != "postgresql":
+            yield True
+            return
 
-            # Seed mock indicators
-            logger.info("  - Seeding mock indicators for testing...")
-            indicator_service.seed_mock_indicators(db)
-            logger.info("  - Mock indicators seeding complete.")
+        with bind.connect() as conn:
+            acquired = bool(
+                conn.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"),
+                    {"key": SEED_ADVISORY_LOCK_KEY},
+                ).scalar()
+            )
+            conn.commit()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    conn.execute(
+                        text("SELECT pg_advisory_unlock(:key)"),
+                        {"key": SEED_ADVISORY_LOCK_KEY},
+                    )
+                    conn.commit()
+
+    def seed_initial_data(self, session_factory=None) -> str:
+        """
+        Seed the database with initial required data, once per seed definition.
 
-            # Ensure Area 1 exists as a SINGLE indicator (sub-items live in schema only)
-            logger.info("  - Enforcing Area 1 as a single indicator (sub-indicators in schema)...")
-            indicator_service.enforce_area1_as_single_indicator(db)
-            logger.info("  - Area 1 DB indicator enforced as single.")
+        Args:
+            session_factory: Session factory to use (defaults to SessionLocal)
 
-            # Ensure official governance area names are used as indicator names
-            indicator_service.standardize_indicator_area_names(db)
+        Returns:
+            Outcome: "seeded", "up_to_date", "locked" (another worker is
+            seeding), "skipped" (test mode) or "failed"
+        """
+        # Skip seeding in tests to speed up test runs
+        if os.getenv("SKIP_STARTUP_SEEDING") == "true":
+            logger.info("⏭️  Skipping startup seeding (test mode)")
+            return "skipped"
 
-            # Seed indicators for areas 2-6 with specific codes (2.1.1, 3.1.1, 4.1.1, 5.1.1, 6.1.1)
-            logger.info("  - Seeding indicators for governance areas 2-6...")
-            indicator_service.seed_areas_2_to_6_indicators(db)
-            logger.info("  - Areas 2-6 indicators seeding complete.")
+        fingerprint = self.seed_fingerprint()
+        db: Session = (session_factory or SessionLocal)()
+        try:
+            if self._stored_seed_fingerprint(db) == fingerprint:
+                logger.info(f"🌱 Seed data up to date (v{SEED_VERSION}). Skipping.")
+                return "up_to_date"
+
+            with self._seed_lock(db) as acquired:
+                if not acquired:
+                    logger.info("🌱 Another worker is seeding. Skipping.")
+                    return "locked"
+
+                # The lock holder before us may have just finished
+                if self._stored_seed_fingerprint(db) == fingerprint:
+                    return "up_to_date"
+
+                logger.info("🌱 Seeding initial data...")
+                for label, step in self._seed_steps():
+                    logger.info(f"  - {label}...")
+                    step(db)
+
+                db.merge(
+                    SeedVersion(
+                        name=SEED_NAME,
+                        version=SEED_VERSION,
+                        fingerprint=fingerprint,
+                        applied_at=datetime.utcnow(),
+                    )
+                )
+                db.commit()
+                logger.info(f"  - Seeding complete (v{SEED_VERSION}).")
+                return "seeded"
 
         except Exception as e:
             logger.warning(f"⚠️  Could not seed initial data: {str(e)}")
             db.rollback()
+            return "failed"
         finally:
             db.close()
 
@@ -215,9 +328,9 @@ class StartupService:
             raise
 
     async def _log_connection_details(self) -> None:
-        """Log detailed status of individual connections"""
+        """Log detailed status of individual connections (and prime the health cache)"""
         try:
-            connection_details = await check_all_connections()
+            connection_details = await health_service.refresh()
 
             # Log PostgreSQL connection status
             if connection_details["database"]["connected"]:
@@ -259,20 +372,13 @@ class StartupService:
         """
         Get current health status for health check endpoints.
 
+        Served from the health service cache, so frequent probes do not
+        open a database connection or call Supabase each time.
+
         Returns:
             Dict containing overall health status and connection details
         """
-        try:
-            connection_details = await check_all_connections()
-            connection_details["timestamp"] = datetime.now().isoformat()
-            return connection_details
-        except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
-            return {
-                "overall_status": "unhealthy",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat(),
-            }
+        return await health_service.get_health_status()
 
 
 # Singleton instance for use across the application
@@ -5,47 +5,41 @@ import logging
 import re
 import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict
 from uuid import uuid4
 
 from app.core.config import settings
+from app.core.metrics import track_storage_upload
+from app.db.base import get_supabase_admin
 from app.db.enums import AssessmentStatus
 from app.db.models.assessment import Assessment, AssessmentResponse, MOVFile
 from fastapi import UploadFile, HTTPException
-from supabase import Client, create_client
 from sqlalchemy.orm import Session
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Initialize Supabase admin client with service-role key for server-side operations
-_supabase_client: Optional[Client] = None
-
 
-def _get_supabase_client() -> Client:
+def _get_supabase_client() -> "Client":
     """
-    Get or initialize the Supabase admin client.
+    Get the shared Supabase admin client.
 
-    Uses service-role key for server-side operations with full access.
+    Uses service-role key for server-side operations with full access. The
+    client (and the SDK import) is created on first use and shared with
+    app.db.base.
     """
-    global _supabase_client
-
-    if _supabase_client is None:
-        if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY:
-            raise ValueError(
-                "Supabase storage not configured. Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY."
-            )
-
-        try:
-            _supabase_client = create_client(
-                settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY
-            )
-            logger.info("Supabase storage client initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Supabase storage client: {str(e)}")
-            raise
+    if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY:
+        raise ValueError(
+            "Supabase storage not configured. Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY."
+        )
 
-    return _supabase_client
+    try:
+        return get_supabase_admin()
+    except RuntimeError:
+        raise ValueError("Supabase storage client could not be initialized.")
 
 
 class StorageService:
@@ -120,16 +114,17 @@ class StorageService:
 
         # Upload to Supabase Storage
         try:
-            result = supabase.storage.from_("movs").upload(
-                path=storage_path,
-                file=file_contents,
-                file_options={"content-type": file.content_type or "application/octet-stream"},
-            )
+            with track_storage_upload("movs", file_size):
+                result = supabase.storage.from_("movs").upload(
+                    path=storage_path,
+                    file=file_contents,
+                    file_options={"content-type": file.content_type or "application/octet-stream"},
+                )
 
-            # Check for errors (following pattern from assessment_service.py)
-            # The supabase-py client raises on HTTP/storage network error, but check for errors in resp too
-            if isinstance(result, dict) and result.get("error"):
-                raise Exception(f"Supabase upload error: {result['error']}")
+                # Check for errors (following pattern from assessment_service.py)
+                # The supabase-py client raises on HTTP/storage network error, but check for errors in resp too
+                if isinstance(result, dict) and result.get("error"):
+                    raise Exception(f"Supabase upload error: {result['error']}")
 
             logger.info(
                 f"Successfully uploaded MOV file {stored_filename} for response {response_id} "
@@ -251,15 +246,16 @@ class StorageService:
 
         # Upload to Supabase Storage
         try:
-            result = supabase.storage.from_(self.MOV_FILES_BUCKET).upload(
-                path=storage_path,
-                file=file_contents,
-                file_options={"content-type": content_type},
-            )
+            with track_storage_upload(self.MOV_FILES_BUCKET, file_size):
+                result = supabase.storage.from_(self.MOV_FILES_BUCKET).upload(
+                    path=storage_path,
+                    file=file_contents,
+                    file_options={"content-type": content_type},
+                )
 
-            # Check for errors in response
-            if isinstance(result, dict) and result.get("error"):
-                raise Exception(f"Supabase upload error: {result['error']}")
+                # Check for errors in response
+                if isinstance(result, dict) and result.get("error"):
+                    raise Exception(f"Supabase upload error: {result['error']}")
 
             logger.info(
                 f"Successfully uploaded MOV file {unique_filename} for "
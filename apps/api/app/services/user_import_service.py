@@ -0,0 +1,241 @@
+# 📥 User Import Service
+# Bulk provisioning of users from CSV or JSON files
+
+import csv
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea
+from app.db.models.user import User
+from app.schemas.user import UserAdminCreate
+from app.services.user_service import user_service
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# Called with (rows processed, total rows) after each inserted batch
+ProgressCallback = Callable[[int, int], None]
+
+
+class UserImportService:
+    """Service class for bulk user imports."""
+
+    def parse_file(self, content: bytes, filename: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Parse an uploaded import file into raw rows.
+
+        CSV files need a header row using the UserAdminCreate field names;
+        empty cells are treated as missing. JSON files hold a list of
+        objects (or {"users": [...]}).
+
+        Raises:
+            HTTPException: 400 if the file can't be parsed or is too large
+        """
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Import file must be UTF-8 encoded",
+            )
+
+        if (filename or "").lower().endswith(".json") or text.lstrip().startswith(("[", "{")):
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid JSON import file: {e}",
+                )
+            rows = data.get("users") if isinstance(data, dict) else data
+            if not isinstance(rows, list):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="JSON import file must contain a list of users",
+                )
+        else:
+            rows = [
+                {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key and isinstance(value, str) and value.strip()
+                }
+                for row in csv.DictReader(io.StringIO(text))
+            ]
+
+        if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Import files are limited to {settings.USER_IMPORT_MAX_ROWS} users",
+            )
+        return rows
+
+    def validate_rows(
+        self, db: Session, rows: List[Dict[str, Any]]
+    ) -> Tuple[List[Tuple[int, UserAdminCreate]], List[Dict[str, Any]]]:
+        """
+        Validate every row before anything is written.
+
+        Existing emails are found with one IN query and barangay / area IDs
+        are checked against lookup sets, so the query count doesn't depend
+        on the number of rows.
+
+        Returns:
+            tuple: ([(row number, user)] for valid rows, [row error])
+        """
+        valid: List[Tuple[int, UserAdminCreate]] = []
+        errors: List[Dict[str, Any]] = []
+        seen_emails: Dict[str, int] = {}
+
+        for number, raw in enumerate(rows, start=1):
+            email = raw.get("email") if isinstance(raw, dict) else None
+            try:
+                user_create = UserAdminCreate.model_validate(raw)
+            except ValidationError as e:
+                first = e.errors()[0]
+                location = ".".join(str(part) for part in first["loc"])
+                message = f"{location}: {first['msg']}" if location else first["msg"]
+                errors.append(_row_error(number, email, message))
+                continue
+
+            error = user_service.apply_role_assignments(user_create)
+            if error is None and user_create.email in seen_emails:
+                error = f"Duplicate email (also on row {seen_emails[user_create.email]})"
+            if error:
+                errors.append(_row_error(number, user_create.email, error))
+                continue
+            seen_emails[user_create.email] = number
+            valid.append((number, user_create))
+
+        if not valid:
+            return valid, errors
+
+        existing = set(
+            db.scalars(select(User.email).where(User.email.in_(seen_emails)))
+        )
+        barangay_ids = set(
+            db.scalars(
+                select(Barangay.id).where(
+                    Barangay.id.in_({u.barangay_id for _, u in valid if u.barangay_id})
+                )
+            )
+        )
+        area_ids = set(
+            db.scalars(
+                select(GovernanceArea.id).where(
+                    GovernanceArea.id.in_(
+                        {u.validator_area_id for _, u in valid if u.validator_area_id}
+                    )
+                )
+            )
+        )
+
+        checked: List[Tuple[int, UserAdminCreate]] = []
+        for number, user_create in valid:
+            if user_create.email in existing:
+                error = "Email already registered"
+            elif user_create.barangay_id and user_create.barangay_id not in barangay_ids:
+                error = f"Barangay {user_create.barangay_id} not found"
+            elif user_create.validator_area_id and user_create.validator_area_id not in area_ids:
+                error = f"Governance area {user_create.validator_area_id} not found"
+            else:
+                checked.append((number, user_create))
+                continue
+            errors.append(_row_error(number, user_create.email, error))
+
+        errors.sort(key=lambda error: error["row"])
+        return checked, errors
+
+    def import_users(
+        self,
+        db: Session,
+        rows: List[Dict[str, Any]],
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate and create users in batches.
+
+        Valid rows are created and invalid rows are reported; one bad row
+        doesn't stop the import. Passwords are hashed in a thread pool and
+        each batch is written with a multi-row INSERT ... ON CONFLICT DO
+        NOTHING RETURNING, so an email registered concurrently is reported
+        as a row error instead of failing the batch.
+
+        Args:
+            db: Database session
+            rows: Raw rows (see parse_file)
+            progress: Optional callback, called after each batch
+
+        Returns:
+            dict: total, created, users [{row, id, email}] and errors
+                [{row, email, error}]
+        """
+        valid, errors = self.validate_rows(db, rows)
+        total = len(rows)
+        created: List[Dict[str, Any]] = []
+        processed = total - len(valid)
+        if progress:
+            progress(processed, total)
+
+        batch_size = settings.USER_IMPORT_BATCH_SIZE
+        with ThreadPoolExecutor(max_workers=settings.USER_IMPORT_HASH_WORKERS) as pool:
+            for start in range(0, len(valid), batch_size):
+                batch = valid[start : start + batch_size]
+                hashes = pool.map(get_password_hash, [user.password for _, user in batch])
+                inserted = self._insert_batch(db, [user for _, user in batch], hashes)
+                db.commit()
+
+                for number, user_create in batch:
+                    user_id = inserted.get(user_create.email)
+                    if user_id is None:
+                        errors.append(
+                            _row_error(number, user_create.email, "Email already registered")
+                        )
+                    else:
+                        created.append({"row": number, "id": user_id, "email": user_create.email})
+
+                processed += len(batch)
+                if progress:
+                    progress(processed, total)
+
+        errors.sort(key=lambda error: error["row"])
+        return {"total": total, "created": len(created), "users": created, "errors": errors}
+
+    @staticmethod
+    def _insert_batch(db: Session, users: List[UserAdminCreate], hashes: Any) -> Dict[str, int]:
+        """Insert one batch; return {email: id} for the rows actually inserted."""
+        dialect = db.get_bind().dialect.name
+        insert_stmt = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        now = datetime.utcnow()
+        values = [
+            {
+                **user.model_dump(exclude={"password"}),
+                "hashed_password": hashed,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user, hashed in zip(users, hashes)
+        ]
+        rows = db.execute(
+            insert_stmt(User)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.email, User.id)
+        )
+        return {email: user_id for email, user_id in rows}
+
+
+def _row_error(row: int, email: Optional[str], error: str) -> Dict[str, Any]:
+    return {"row": row, "email": email, "error": error}
+
+
+# Create service instance
+user_import_service = UserImportService()
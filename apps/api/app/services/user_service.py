@@ -3,13 +3,24 @@
 
 from typing import List, Optional
 
+from app.core.config import settings
+from app.core.pagination import CountMode, count_rows, keyset_page
 from app.core.security import get_password_hash, verify_password
+from app.core.table_cache import TableCache
 from app.db.enums import UserRole
 from app.db.models.user import User
 from app.schemas.user import UserAdminCreate, UserAdminUpdate, UserCreate, UserUpdate
 from fastapi import HTTPException, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session
+
+# Keyset sort order for user pages
+USER_KEYSET = (User.name, User.id)
+
+# Dashboard user statistics, recomputed after commits that write users
+user_stats_cache = TableCache(
+    "user_stats", {User.__tablename__}, settings.DASHBOARD_STATS_CACHE_TTL_SECONDS
+)
 
 
 class UserService:
@@ -31,13 +42,53 @@ class UserService:
         search: Optional[str] = None,
         role: Optional[str] = None,
         is_active: Optional[bool] = None,
-    ) -> tuple[List[User], int]:
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[List[User], Optional[int]]:
         """
         Get a paginated list of users with optional filtering.
 
         Returns:
-            tuple: (users, total_count)
+            tuple: (users, total_count or None when count is CountMode.NONE)
+        """
+        query, filtered = self._filtered_users_query(db, search, role, is_active)
+
+        # Get total count before pagination
+        total = count_rows(db, query, count, None if filtered else User.__tablename__)
+
+        # Apply pagination (same order as get_users_page so both can be mixed)
+        users = query.order_by(*USER_KEYSET).offset(skip).limit(limit).all()
+
+        return users, total
+
+    def get_users_page(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        search: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> tuple[List[User], Optional[int], Optional[str]]:
+        """
+        Get one page of users ordered by (name, id) using keyset pagination.
+
+        Returns:
+            tuple: (users, total_count or None, next_cursor or None)
         """
+        query, filtered = self._filtered_users_query(db, search, role, is_active)
+        total = count_rows(db, query, count, None if filtered else User.__tablename__)
+        users, next_cursor = keyset_page(query, USER_KEYSET, cursor, limit)
+        return users, total, next_cursor
+
+    def _filtered_users_query(
+        self,
+        db: Session,
+        search: Optional[str],
+        role: Optional[str],
+        is_active: Optional[bool],
+    ) -> tuple[Query, bool]:
+        """Build the filtered user query; also reports whether any filter applied."""
         query = db.query(User)
 
         # Apply filters
@@ -52,13 +103,7 @@ class UserService:
         if is_active is not None:
             query = query.filter(User.is_active == is_active)
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination
-        users = query.offset(skip).limit(limit).all()
-
-        return users, total
+        return query, bool(search or role or is_active is not None)
 
     def create_user(self, db: Session, user_create: UserCreate) -> User:
         """Create a new user (regular user creation)."""
@@ -85,39 +130,47 @@ class UserService:
                 detail="Email already registered",
             )
 
-        # Business logic for role-specific fields
+        error = self.apply_role_assignments(user_create)
+        if error:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=error)
+
+        db_user = User(
+            **user_create.model_dump(exclude={"password"}),
+            hashed_password=get_password_hash(user_create.password),
+        )
+
+        db.add(db_user)
+        db.commit()
+        db.refresh(db_user)
+        return db_user
+
+    @staticmethod
+    def apply_role_assignments(user_create: UserAdminCreate) -> Optional[str]:
+        """
+        Enforce role-specific assignment fields on a new user.
+
+        Clears the assignments the role doesn't use.
+
+        Returns:
+            The error message if a required assignment is missing, else None
+        """
         if user_create.role == UserRole.VALIDATOR:
             # VALIDATOR role requires validator_area_id
             if not user_create.validator_area_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Governance area is required for Validator role.",
-                )
+                return "Governance area is required for Validator role."
             # Ensure barangay_id is null for validators
             user_create.barangay_id = None
         elif user_create.role == UserRole.BLGU_USER:
             # BLGU_USER role requires barangay_id
             if not user_create.barangay_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Barangay is required for BLGU User role.",
-                )
+                return "Barangay is required for BLGU User role."
             # Ensure validator_area_id is null for BLGU users
             user_create.validator_area_id = None
         elif user_create.role in (UserRole.ASSESSOR, UserRole.MLGOO_DILG):
             # ASSESSOR and MLGOO_DILG roles should not have any assignments
             user_create.validator_area_id = None
             user_create.barangay_id = None
-
-        db_user = User(
-            **user_create.model_dump(exclude={"password"}),
-            hashed_password=get_password_hash(user_create.password),
-        )
-
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
-        return db_user
+        return None
 
     def update_user(
         self, db: Session, user_id: int, user_update: UserUpdate
@@ -253,23 +306,35 @@ class UserService:
         return db_user
 
     def get_user_stats(self, db: Session) -> dict:
-        """Get user statistics for admin dashboard."""
-        total_users = db.query(User).count()
-        active_users = db.query(User).filter(User.is_active).count()
-        inactive_users = total_users - active_users
-        users_need_password_change = (
-            db.query(User).filter(User.must_change_password, User.is_active).count()
-        )
+        """
+        Get user statistics for admin dashboard.
 
-        # Users by role
-        role_stats = db.query(User.role, func.count(User.id)).group_by(User.role).all()  # type: ignore
+        Computed with one grouped aggregate query and cached until a commit
+        writes the users table.
+        """
+        return user_stats_cache.get("user_stats", lambda: self._compute_user_stats(db))
+
+    @staticmethod
+    def _compute_user_stats(db: Session) -> dict:
+        # One row per role; the totals are the sums of the rows
+        role_stats = db.execute(
+            select(
+                User.role,
+                func.count(),
+                func.count().filter(User.is_active),
+                func.count().filter(User.is_active, User.must_change_password),
+            ).group_by(User.role)
+        ).all()
+
+        total_users = sum(row[1] for row in role_stats)
+        active_users = sum(row[2] for row in role_stats)
 
         return {
             "total_users": total_users,
             "active_users": active_users,
-            "inactive_users": inactive_users,
-            "users_need_password_change": users_need_password_change,
-            "users_by_role": {role: count for role, count in role_stats},
+            "inactive_users": total_users - active_users,
+            "users_need_password_change": sum(row[3] for row in role_stats),
+            "users_by_role": {row[0]: row[1] for row in role_stats},
         }
 
 
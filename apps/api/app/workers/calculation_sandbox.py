@@ -0,0 +1,106 @@
+# 🧪 Calculation Sandbox Worker
+# Background what-if replays of draft rules too large to evaluate in a request
+
+import logging
+from typing import Any, Dict, Optional
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.schemas.calculation_schema import CalculationSchema
+from app.services.calculation_sandbox_service import calculation_sandbox_service
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name="sandbox.run_what_if")
+def run_what_if(
+    self: Any,
+    target: str,
+    target_id: int,
+    draft: Dict[str, Any],
+    cycle_id: Optional[int] = None,
+    max_responses: Optional[int] = None,
+    db: Session | None = None,
+) -> Dict[str, Any]:
+    """
+    Replay a draft rule over stored submissions in the background.
+
+    Args:
+        target: "indicator" (draft is a calculation schema) or "bbi" (draft
+            is a mapping rules object)
+        target_id: Indicator or BBI ID
+        draft: The draft rule
+        cycle_id: Only replay submissions from this cycle's year
+        max_responses: Replay at most this many rows
+        db: Optional database session (primarily for testing)
+
+    Returns:
+        dict: The what-if result, or the error
+    """
+    db_provided = db is not None
+    if not db_provided:
+        db = SessionLocal()
+
+    try:
+        time_budget = settings.WHAT_IF_WORKER_TIME_BUDGET_SECONDS
+        if target == "indicator":
+            result = calculation_sandbox_service.evaluate_indicator_what_if(
+                db,
+                target_id,
+                CalculationSchema(**draft),
+                cycle_id=cycle_id,
+                max_responses=max_responses,
+                time_budget=time_budget,
+            )
+        elif target == "bbi":
+            result = calculation_sandbox_service.evaluate_bbi_what_if(
+                db,
+                target_id,
+                draft,
+                cycle_id=cycle_id,
+                max_responses=max_responses,
+                time_budget=time_budget,
+            )
+        else:
+            return {"success": False, "error": f"Unknown what-if target: {target}"}
+
+        logger.info(
+            "WHAT-IF: %s %s replayed over %d row(s), %d changed",
+            target,
+            target_id,
+            result["evaluated"],
+            result["changed"],
+        )
+        return {"success": True, **result}
+
+    except Exception as e:
+        logger.error("Error running what-if for %s %s: %s", target, target_id, str(e))
+        return {"success": False, "error": getattr(e, "detail", None) or str(e)}
+
+    finally:
+        if not db_provided:
+            db.close()
+
+
+def get_what_if_status(task_id: str) -> Dict[str, Any]:
+    """
+    Poll a background what-if replay.
+
+    Returns:
+        dict: {"status": "processing"} while it runs, then the task result
+            with status "completed" (or "failed")
+    """
+    task = run_what_if.AsyncResult(task_id)
+    if not task.ready():
+        return {"task_id": task_id, "status": "processing"}
+    if task.failed():
+        return {"task_id": task_id, "status": "failed", "error": str(task.result)}
+    result = dict(task.result or {})
+    return {
+        "task_id": task_id,
+        "status": "completed" if result.pop("success", False) else "failed",
+        **result,
+    }
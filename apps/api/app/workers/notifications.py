@@ -1,16 +1,20 @@
 # 📧 Notification Worker
 # Background tasks for handling notifications
 
+import hashlib
 import logging
 from typing import Any, Dict, List
 from datetime import datetime
 
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.db.base import SessionLocal
 from app.db.models import Assessment, User
 from app.db.models.admin import DeadlineOverride
 from app.db.models.barangay import Barangay
 from app.db.models.governance_area import Indicator
+from app.services.notification_service import notification_service
+from app.services.notification_transport import OutgoingMessage
 from sqlalchemy.orm import Session
 
 # Configure logging
@@ -52,7 +56,6 @@ def send_rework_notification(self: Any, assessment_id: int) -> Dict[str, Any]:
             )
             return {"success": False, "error": "BLGU user not found"}
 
-        # Log the notification (for now, email integration will come later)
         logger.info(
             "REWORK NOTIFICATION: Assessment %s needs rework. BLGU User: %s (%s)",
             assessment_id,
@@ -60,13 +63,7 @@ def send_rework_notification(self: Any, assessment_id: int) -> Dict[str, Any]:
             blgu_user.email,
         )
 
-        # TODO: In the future, this is where we would:
-        # 1. Send email notification to BLGU user
-        # 2. Send SMS notification if configured
-        # 3. Create in-app notification
-        # 4. Send webhook notification to external systems
-
-        # For now, we'll just log the notification details
+        barangay_name = blgu_user.barangay.name if blgu_user.barangay else "your barangay"
         notification_details = {
             "assessment_id": assessment_id,
             "blgu_user_name": blgu_user.name,
@@ -74,9 +71,22 @@ def send_rework_notification(self: Any, assessment_id: int) -> Dict[str, Any]:
             "barangay": blgu_user.barangay.name if blgu_user.barangay else "Unknown",
             "assessment_status": assessment.status,
             "rework_count": assessment.rework_count,
-            "message": f"Your assessment for {blgu_user.barangay.name if blgu_user.barangay else 'your barangay'} needs rework. Please review the assessor feedback and resubmit.",
+            "message": f"Your assessment for {barangay_name} needs rework. Please review the assessor feedback and resubmit.",
         }
 
+        # One message per rework round; a re-queued task never resends it
+        notification_details["delivery"] = notification_service.deliver(
+            db,
+            notification_service.render_batch(
+                kind="rework_requested",
+                key_prefix=f"rework:{assessment_id}:{assessment.rework_count}",
+                subject="Your SGLGB assessment needs rework",
+                template="rework_requested",
+                context={"barangay_name": barangay_name, "rework_count": assessment.rework_count},
+                recipients=[(blgu_user.id, blgu_user.email)],
+            ),
+        )
+
         logger.info("Notification details: %s", notification_details)
 
         return {
@@ -134,7 +144,6 @@ def send_validation_complete_notification(
             )
             return {"success": False, "error": "BLGU user not found"}
 
-        # Log the notification
         logger.info(
             "VALIDATION COMPLETE NOTIFICATION: Assessment %s has been validated. BLGU User: %s (%s)",
             assessment_id,
@@ -142,17 +151,28 @@ def send_validation_complete_notification(
             blgu_user.email,
         )
 
-        # TODO: In the future, this is where we would send actual notifications
-
+        barangay_name = blgu_user.barangay.name if blgu_user.barangay else "your barangay"
         notification_details = {
             "assessment_id": assessment_id,
             "blgu_user_name": blgu_user.name,
             "blgu_user_email": blgu_user.email,
             "barangay": blgu_user.barangay.name if blgu_user.barangay else "Unknown",
             "assessment_status": assessment.status,
-            "message": f"Congratulations! Your assessment for {blgu_user.barangay.name if blgu_user.barangay else 'your barangay'} has been validated and is now complete.",
+            "message": f"Congratulations! Your assessment for {barangay_name} has been validated and is now complete.",
         }
 
+        notification_details["delivery"] = notification_service.deliver(
+            db,
+            notification_service.render_batch(
+                kind="validation_complete",
+                key_prefix=f"validation-complete:{assessment_id}",
+                subject="Your SGLGB assessment has been validated",
+                template="validation_complete",
+                context={"barangay_name": barangay_name},
+                recipients=[(blgu_user.id, blgu_user.email)],
+            ),
+        )
+
         logger.info(
             "Validation complete notification details: %s", notification_details
         )
@@ -258,13 +278,31 @@ def send_deadline_extension_notification(
             formatted_deadline,
         )
 
-        # TODO: In the future, this is where we would:
-        # 1. Send email notification to BLGU users
-        # 2. Send SMS notification if configured
-        # 3. Create in-app notification
-        # 4. Send webhook notification to external systems
+        # One batch for every BLGU user of the barangay: rendered once,
+        # delivered over one pooled connection, keyed per extension event
+        indicator_key = hashlib.sha1(
+            ",".join(str(ind.id) for ind in sorted(indicators, key=lambda ind: ind.id)).encode()
+        ).hexdigest()[:12]
+        delivery = notification_service.deliver(
+            db,
+            notification_service.render_batch(
+                kind="deadline_extension",
+                key_prefix=f"deadline-extension:{barangay_id}:{new_deadline}:{indicator_key}",
+                subject=f"Deadline extended for {barangay.name}",
+                template="deadline_extension",
+                context={
+                    "barangay_name": barangay.name,
+                    "formatted_deadline": formatted_deadline,
+                    "granted_by": admin_name,
+                    "indicator_count": len(indicators),
+                    "indicator_names": indicator_names,
+                    "reason": reason,
+                    "current_year": datetime.utcnow().year,
+                },
+                recipients=[(user.id, user.email) for user in blgu_users],
+            ),
+        )
 
-        # For now, we'll just log the notification details
         notification_details = {
             "barangay_id": barangay_id,
             "barangay_name": barangay.name,
@@ -277,6 +315,7 @@ def send_deadline_extension_notification(
                 {"name": user.name, "email": user.email} for user in blgu_users
             ],
             "message": f"Good news! The deadline for {len(indicators)} indicator(s) in {barangay.name} has been extended to {formatted_deadline}. Reason: {reason}",
+            "delivery": delivery,
         }
 
         logger.info("Deadline extension notification details: %s", notification_details)
@@ -299,3 +338,103 @@ def send_deadline_extension_notification(
         # Only close the session if we created it (not provided for testing)
         if not db_provided:
             db.close()
+
+
+@celery_app.task(bind=True, name="notifications.send_deadline_reminders")
+def send_deadline_reminders(self: Any) -> Dict[str, Any]:
+    """
+    Plan today's deadline reminders and escalations and fan them out.
+
+    Scheduled daily by Celery beat. Messages already sent today (same
+    idempotency key) are dropped, and the rest are split into batches of
+    NOTIFICATION_BATCH_SIZE, each delivered by one rate-limited task.
+
+    Returns:
+        dict: Number of new messages and delivery batches queued
+    """
+    # Imported here: deadline_service imports this module for its extension task
+    from app.services.deadline_reminder_service import deadline_reminder_service
+
+    db: Session = SessionLocal()
+
+    try:
+        messages = notification_service.filter_unsent(db, deadline_reminder_service.plan(db))
+        batch_size = settings.NOTIFICATION_BATCH_SIZE
+        batches = [messages[i : i + batch_size] for i in range(0, len(messages), batch_size)]
+        for batch in batches:
+            deliver_notification_batch.delay([message.to_dict() for message in batch])
+
+        logger.info(
+            "DEADLINE REMINDERS: queued %d message(s) in %d batch(es)",
+            len(messages),
+            len(batches),
+        )
+        return {"success": True, "messages": len(messages), "batches": len(batches)}
+
+    except Exception as e:
+        logger.error("Error planning deadline reminders: %s", str(e))
+        return {"success": False, "error": str(e)}
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="notifications.deliver_notification_batch",
+    rate_limit=settings.NOTIFICATION_BATCH_RATE_LIMIT,
+)
+def deliver_notification_batch(self: Any, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Deliver one batch of rendered messages through the configured transport.
+
+    Messages are claimed by idempotency key first, so a duplicated task
+    never sends the same message twice. Messages the transport does not
+    accept are queued for retry_notifications rather than retrying the
+    whole batch.
+
+    Args:
+        messages: OutgoingMessage.to_dict() payloads
+
+    Returns:
+        dict: Counts of sent, retrying, failed and skipped messages
+    """
+    db: Session = SessionLocal()
+
+    try:
+        result = notification_service.deliver(
+            db, [OutgoingMessage(**message) for message in messages]
+        )
+        return {"success": True, **result}
+
+    except Exception as e:
+        logger.error("Error delivering notification batch: %s", str(e))
+        return {"success": False, "error": str(e)}
+
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, name="notifications.retry_notifications")
+def retry_notifications(self: Any) -> Dict[str, Any]:
+    """
+    Resend queued notifications whose backoff has elapsed.
+
+    Scheduled every few minutes by Celery beat. Each run handles up to
+    NOTIFICATION_BATCH_SIZE due messages.
+
+    Returns:
+        dict: Counts of sent, retrying, failed and skipped messages
+    """
+    db: Session = SessionLocal()
+
+    try:
+        result = notification_service.retry_due(db)
+        return {"success": True, **result}
+
+    except Exception as e:
+        logger.error("Error retrying notifications: %s", str(e))
+        return {"success": False, "error": str(e)}
+
+    finally:
+        db.close()
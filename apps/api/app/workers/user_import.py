@@ -0,0 +1,88 @@
+# 📥 User Import Worker
+# Background bulk user imports with progress reporting
+
+import logging
+from typing import Any, Dict
+
+from app.core.celery_app import celery_app
+from app.core.security import decrypt_payload
+from app.db.base import SessionLocal
+from app.services.user_import_service import user_import_service
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, name="users.import_users")
+def import_users(
+    self: Any,
+    encrypted_rows: str,
+    db: Session | None = None,
+) -> Dict[str, Any]:
+    """
+    Create users from parsed import rows in the background.
+
+    Progress is published as a PROGRESS task state with
+    {"processed": n, "total": m} after each inserted batch.
+
+    The rows hold plaintext passwords, so they arrive encrypted with
+    encrypt_payload rather than readable in the broker.
+
+    Args:
+        encrypted_rows: encrypt_payload(rows), rows being the raw rows
+            from UserImportService.parse_file
+        db: Optional database session (primarily for testing)
+
+    Returns:
+        dict: The import result, or the error
+    """
+    db_provided = db is not None
+    if not db_provided:
+        db = SessionLocal()
+
+    def report(processed: int, total: int) -> None:
+        if self.request.id:
+            self.update_state(state="PROGRESS", meta={"processed": processed, "total": total})
+
+    try:
+        rows = decrypt_payload(encrypted_rows)
+        result = user_import_service.import_users(db, rows, progress=report)
+        logger.info(
+            "USER IMPORT: %d of %d row(s) created, %d error(s)",
+            result["created"],
+            result["total"],
+            len(result["errors"]),
+        )
+        return {"success": True, **result}
+
+    except Exception as e:
+        db.rollback()
+        logger.error("Error importing users: %s", str(e))
+        return {"success": False, "error": getattr(e, "detail", None) or str(e)}
+
+    finally:
+        if not db_provided:
+            db.close()
+
+
+def get_import_status(task_id: str) -> Dict[str, Any]:
+    """
+    Poll a background user import.
+
+    Returns:
+        dict: {"status": "processing", "processed": n, "total": m} while it
+            runs, then the import result with status "completed" (or "failed")
+    """
+    task = import_users.AsyncResult(task_id)
+    if not task.ready():
+        progress = task.info if task.state == "PROGRESS" and isinstance(task.info, dict) else {}
+        return {"task_id": task_id, "status": "processing", **progress}
+    if task.failed():
+        return {"task_id": task_id, "status": "failed", "error": str(task.result)}
+    result = dict(task.result or {})
+    return {
+        "task_id": task_id,
+        "status": "completed" if result.pop("success", False) else "failed",
+        **result,
+    }
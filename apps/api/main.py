@@ -1,20 +1,28 @@
 # 🚀 VANTAGE API Main Application
 # FastAPI application entry point with configuration and middleware setup
 
+import asyncio
 import logging
+import secrets
 from contextlib import asynccontextmanager
 
 from app.api.v1 import api_router as api_router_v1
 
 # Import from our restructured modules
 from app.core.config import settings
+from app.core.metrics import register_collectors, render_latest
 from app.middleware import (
+    MetricsMiddleware,
     RateLimitMiddleware,
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
 )
+from app.services.audit_service import audit_log_writer
+from app.services.health_service import health_service
+from app.services.reference_data_service import reference_data_service
 from app.services.startup_service import startup_service
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # Setup logging
@@ -38,10 +46,19 @@ async def lifespan(app: FastAPI):
         logger.warning(f"⚠️ Startup checks failed but continuing: {str(e)}")
         logger.warning("⚠️ Some features may be unavailable")
 
+    # Keep the health cache warm so probes never wait on connection checks
+    health_service.start_background_refresh()
+    # Drop cached reference data when another process changes it
+    reference_data_service.start_listener()
+
     # Application is running
     yield
 
     # Shutdown
+    await health_service.stop_background_refresh()
+    await asyncio.to_thread(reference_data_service.stop_listener)
+    # Write any buffered audit events before the process exits
+    await asyncio.to_thread(audit_log_writer.stop)
     startup_service.log_shutdown()
 
 
@@ -62,18 +79,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Keyset pagination cursor on list endpoints
 )
 
-# Add security middleware (order matters - applied in reverse order)
-# 1. Request logging (outermost - logs everything)
+# Add security middleware (order matters - the last one added runs first,
+# so a request passes Metrics -> Security headers -> Rate limiting ->
+# Request logging -> route)
+# 1. Request logging (innermost - logs requests that reach the routes)
 app.add_middleware(RequestLoggingMiddleware)
 
-# 2. Rate limiting (before security headers)
+# 2. Rate limiting (rejected requests never reach logging or the routes)
 app.add_middleware(RateLimitMiddleware)
 
-# 3. Security headers (innermost - adds headers to all responses)
+# 3. Security headers (added to every response, including rate-limited ones)
 app.add_middleware(SecurityHeadersMiddleware)
 
+# 4. Metrics (outermost - times the whole stack, including rate-limited responses)
+app.add_middleware(MetricsMiddleware)
+register_collectors()
+
 
 # Health check endpoint
 @app.get("/health")
@@ -81,11 +105,60 @@ async def health_check():
     """
     Health check endpoint for monitoring and load balancers.
 
-    Returns detailed status of all system components.
+    Returns detailed status of all system components, cached for
+    HEALTH_CHECK_CACHE_TTL_SECONDS.
     """
     return await startup_service.get_health_status()
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """
+    Liveness probe: the process is up. Performs no I/O.
+    """
+    return health_service.get_liveness()
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: required connections are healthy (cached result).
+
+    Returns 503 while the API should not receive traffic.
+    """
+    ready, payload = await health_service.get_readiness()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=payload,
+    )
+
+
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str | None = Header(None)):
+    """
+    Prometheus scrape endpoint.
+
+    Exposes request latency by route, DB pool usage, Celery queue depth and
+    task durations, calculation-engine, storage upload and cache metrics.
+
+    Scrapers authenticate with ``Authorization: Bearer <METRICS_TOKEN>``.
+    Without METRICS_TOKEN configured the endpoint is disabled (404).
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not secrets.compare_digest(
+        (authorization or "").encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
+
+
 # Include the V1 API router
 # All routes from auth.py, users.py, etc., will be available under the /api/v1 prefix
 app.include_router(api_router_v1, prefix="/api/v1")
@@ -0,0 +1,207 @@
+"""
+Tests for Admin Audit Log API endpoints (app/api/v1/admin.py)
+
+Focus on keyset pagination, count modes and the streaming CSV export.
+"""
+
+import csv
+import io
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.config import settings
+from app.core.pagination import clear_count_cache, decode_cursor, encode_cursor
+from app.db.enums import UserRole
+from app.db.models.admin import AuditLog
+from app.db.models.user import User
+
+AUDIT_LOG_COUNT = 25
+
+
+@pytest.fixture(autouse=True)
+def clear_overrides(client):
+    """Clear auth overrides and cached counts after each test"""
+    clear_count_cache()
+    yield
+    client.app.dependency_overrides.pop(deps.get_current_active_user, None)
+    clear_count_cache()
+
+
+@pytest.fixture
+def admin_user(db_session: Session, client: TestClient):
+    user = User(
+        email=f"audit_admin_{uuid.uuid4().hex[:8]}@example.com",
+        name="Audit Admin",
+        hashed_password="hashed",
+        role=UserRole.MLGOO_DILG,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    client.app.dependency_overrides[deps.get_current_active_user] = lambda: user
+    return user
+
+
+@pytest.fixture
+def audit_logs(db_session: Session, admin_user: User):
+    """Audit logs where several share a timestamp, so ordering relies on the id tiebreaker."""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    db_session.execute(
+        insert(AuditLog),
+        [
+            {
+                "user_id": admin_user.id,
+                "entity_type": "indicator" if i % 2 else "bbi",
+                "entity_id": i,
+                "action": "update",
+                "changes": {"name": {"before": i, "after": i + 1}},
+                "created_at": base + timedelta(minutes=i // 3),
+            }
+            for i in range(AUDIT_LOG_COUNT)
+        ],
+    )
+    db_session.commit()
+    return [
+        log_id
+        for (log_id,) in db_session.query(AuditLog.id).order_by(
+            AuditLog.created_at.desc(), AuditLog.id.desc()
+        )
+    ]
+
+
+def _walk_pages(client: TestClient, **params):
+    ids, cursor, pages = [], None, 0
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get("/api/v1/admin/audit-logs", params=query)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        ids.extend(item["id"] for item in body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids, pages, body
+
+
+def test_cursor_pages_cover_every_log_once_in_order(client, audit_logs):
+    ids, pages, _ = _walk_pages(client, limit=10)
+
+    assert ids == audit_logs
+    assert pages == 3
+
+
+def test_cursor_pages_respect_filters(client, audit_logs, db_session):
+    ids, _, last_page = _walk_pages(client, limit=4, entity_type="indicator")
+
+    expected = [
+        log_id
+        for log_id in audit_logs
+        if db_session.get(AuditLog, log_id).entity_type == "indicator"
+    ]
+    assert ids == expected
+    assert last_page["total"] == len(expected)
+
+
+def test_deep_pages_do_not_use_offset(client, audit_logs, db_session):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM audit_logs" in statement:
+            statements.append((statement, parameters))
+
+    first = client.get("/api/v1/admin/audit-logs", params={"limit": 5, "count": "none"}).json()
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            "/api/v1/admin/audit-logs",
+            params={"limit": 5, "count": "none", "cursor": first["next_cursor"]},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == audit_logs[5:10]
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    assert "(audit_logs.created_at, audit_logs.id) < (" in statement
+    # SQLite always renders OFFSET; nothing is skipped
+    assert "OFFSET" not in statement or parameters[-1] == 0
+
+
+def test_count_modes(client, audit_logs):
+    default = client.get("/api/v1/admin/audit-logs").json()
+    exact = client.get("/api/v1/admin/audit-logs", params={"count": "exact"}).json()
+    estimated = client.get("/api/v1/admin/audit-logs", params={"count": "estimated"}).json()
+    skipped = client.get("/api/v1/admin/audit-logs", params={"count": "none"}).json()
+
+    assert default["total"] == AUDIT_LOG_COUNT and not default["total_estimated"]
+    assert exact["total"] == AUDIT_LOG_COUNT and not exact["total_estimated"]
+    assert estimated["total"] == AUDIT_LOG_COUNT and estimated["total_estimated"]
+    assert skipped["total"] is None and not skipped["total_estimated"]
+
+
+def test_offset_pagination_still_supported(client, audit_logs):
+    response = client.get("/api/v1/admin/audit-logs", params={"skip": 20, "limit": 10})
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == audit_logs[20:]
+
+
+def test_invalid_cursor_is_rejected(client, audit_logs):
+    for cursor in ("not-a-cursor", encode_cursor([1, 2, 3])):
+        response = client.get("/api/v1/admin/audit-logs", params={"cursor": cursor})
+        assert response.status_code == 400
+
+
+def test_cursor_round_trips_datetimes():
+    values = [datetime(2025, 1, 1, 12, 30, 15, 123456), 42]
+
+    assert decode_cursor(encode_cursor(values), 2) == values
+
+
+def test_export_streams_every_matching_log(client, audit_logs, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 4)
+
+    with client.stream("GET", "/api/v1/admin/audit-logs/export") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        chunks = list(response.iter_text())
+
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows[0][0] == "ID"
+    assert [int(row[0]) for row in rows[1:]] == audit_logs
+    assert rows[1][3].startswith("audit_admin_")
+
+
+def test_export_reads_users_eagerly_and_returns_its_connection(
+    client, audit_logs, db_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 4)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    checked_out = engine.pool.checkedout()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with client.stream("GET", "/api/v1/admin/audit-logs/export") as response:
+            rows = list(csv.reader(io.StringIO("".join(response.iter_text()))))
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(rows) == AUDIT_LOG_COUNT + 1
+    # One query per keyset page, users joined in rather than loaded per row
+    first_page = next(i for i, s in enumerate(statements) if "FROM audit_logs" in s)
+    export = statements[first_page:]
+    assert len(export) == AUDIT_LOG_COUNT // 4 + 1
+    assert all("FROM audit_logs" in s and "JOIN users" in s for s in export)
+    assert engine.pool.checkedout() == checked_out
@@ -548,3 +548,35 @@ def test_get_bbi_results_no_results(client: TestClient, db_session: Session, adm
     data = response.json()
     assert isinstance(data, list)
     assert len(data) == 0
+
+
+# ====================================================================
+# POST /api/v1/bbis/{id}/what-if - What-If Mapping
+# ====================================================================
+
+
+def test_what_if_unknown_bbi_is_not_queued(
+    client: TestClient, db_session: Session, admin_user: User, monkeypatch
+):
+    """What-if against a missing BBI is a 404, even when the replay would be queued"""
+    from app.core.config import settings
+    from app.services.calculation_sandbox_service import calculation_sandbox_service
+    from app.workers import calculation_sandbox
+
+    queued = []
+    monkeypatch.setattr(settings, "WHAT_IF_SYNC_MAX_RESPONSES", 10)
+    monkeypatch.setattr(calculation_sandbox_service, "count_assessments", lambda *args: 25)
+    monkeypatch.setattr(
+        calculation_sandbox.run_what_if,
+        "delay",
+        lambda *args, **kwargs: queued.append((args, kwargs)),
+    )
+    _override_admin(client, admin_user, db_session)
+
+    response = client.post(
+        "/api/v1/bbis/99999/what-if",
+        json={"mapping_rules": {"operator": "AND", "conditions": []}},
+    )
+
+    assert response.status_code == 404
+    assert queued == []
@@ -768,3 +768,184 @@ def test_get_form_schema_excludes_calculation_schema(
     assert "calculation_schema" not in data
     # Also check it's not nested in form_schema
     assert "calculation_schema" not in data["form_schema"]
+
+
+# ====================================================================
+# POST /api/v1/indicators/{id}/what-if - What-If Calculation
+# ====================================================================
+
+
+WHAT_IF_SCHEMA = {
+    "condition_groups": [
+        {
+            "operator": "AND",
+            "rules": [
+                {
+                    "rule_type": "PERCENTAGE_THRESHOLD",
+                    "field_id": "completion_rate",
+                    "operator": ">=",
+                    "threshold": 80,
+                }
+            ],
+        }
+    ]
+}
+
+
+def test_what_if_evaluates_small_replays_in_request(
+    client: TestClient, db_session: Session, admin_user: User, test_indicator: Indicator
+):
+    """Small replays return the what-if result directly"""
+    _override_admin_and_db(client, admin_user, db_session)
+
+    response = client.post(
+        f"/api/v1/indicators/{test_indicator.id}/what-if",
+        json={"calculation_schema": WHAT_IF_SCHEMA},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["indicator_id"] == test_indicator.id
+    assert data["evaluated"] == 0
+    assert data["baseline"] == "validation_status"
+
+
+def test_what_if_hands_large_replays_to_worker(
+    client: TestClient,
+    db_session: Session,
+    admin_user: User,
+    test_indicator: Indicator,
+    monkeypatch,
+):
+    """Replays above WHAT_IF_SYNC_MAX_RESPONSES are queued and return 202"""
+    from app.core.config import settings
+    from app.services.calculation_sandbox_service import calculation_sandbox_service
+    from app.workers import calculation_sandbox
+
+    queued = []
+
+    class _Task:
+        id = "task-1"
+
+    monkeypatch.setattr(settings, "WHAT_IF_SYNC_MAX_RESPONSES", 10)
+    monkeypatch.setattr(
+        calculation_sandbox_service, "count_indicator_responses", lambda *args: 25
+    )
+    monkeypatch.setattr(
+        calculation_sandbox.run_what_if,
+        "delay",
+        lambda *args, **kwargs: queued.append((args, kwargs)) or _Task(),
+    )
+    _override_admin_and_db(client, admin_user, db_session)
+
+    response = client.post(
+        f"/api/v1/indicators/{test_indicator.id}/what-if",
+        json={"calculation_schema": WHAT_IF_SCHEMA},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {"status": "processing", "task_id": "task-1", "responses": 25}
+    assert queued[0][0][:2] == ("indicator", test_indicator.id)
+
+
+def test_what_if_unknown_indicator(client: TestClient, db_session: Session, admin_user: User):
+    """What-if against a missing indicator is a 404"""
+    _override_admin_and_db(client, admin_user, db_session)
+
+    response = client.post(
+        "/api/v1/indicators/99999/what-if", json={"calculation_schema": WHAT_IF_SCHEMA}
+    )
+
+    assert response.status_code == 404
+
+
+# ====================================================================
+# Builder Validation Tests
+# ====================================================================
+
+BUILDER_FORM_SCHEMA = {
+    "fields": [
+        {"field_id": "completion_rate", "field_type": "number_input", "label": "Completion"},
+        {"field_id": "proof", "field_type": "file_upload", "label": "Proof"},
+    ]
+}
+
+
+def test_validate_form_schema_then_edits(client: TestClient, db_session: Session, admin_user: User):
+    """Edits are validated against the schema_hash of the previous validation"""
+    _override_admin_and_db(client, admin_user, db_session)
+
+    response = client.post("/api/v1/indicators/validate-form-schema", json=BUILDER_FORM_SCHEMA)
+    assert response.status_code == 200
+    base_hash = response.json()["schema_hash"]
+
+    response = client.post(
+        "/api/v1/indicators/validate-form-schema/edits",
+        json={
+            "base_hash": base_hash,
+            "upsert_fields": [
+                {
+                    "field_id": "proof",
+                    "field_type": "file_upload",
+                    "label": "Proof",
+                    "conditional_mov_requirement": {
+                        "field_id": "status",
+                        "operator": "equals",
+                        "value": "yes",
+                    },
+                }
+            ],
+        },
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"]["errors"] == [
+        "Field 'proof' has invalid conditional MOV logic: referenced field 'status' does not exist"
+    ]
+
+    response = client.post(
+        "/api/v1/indicators/validate-form-schema/edits",
+        json={"base_hash": "unknown", "removed_field_ids": ["proof"]},
+    )
+    assert response.status_code == 409
+
+
+def test_validate_calculation_schema_against_form_schema(
+    client: TestClient, db_session: Session, admin_user: User
+):
+    """Rules may only read fields of the validated form schema"""
+    _override_admin_and_db(client, admin_user, db_session)
+    form_hash = client.post(
+        "/api/v1/indicators/validate-form-schema", json=BUILDER_FORM_SCHEMA
+    ).json()["schema_hash"]
+
+    valid = client.post(
+        "/api/v1/indicators/validate-calculation-schema",
+        params={"form_schema_hash": form_hash},
+        json=WHAT_IF_SCHEMA,
+    )
+    invalid_schema = {
+        "condition_groups": [
+            {
+                "operator": "AND",
+                "rules": [
+                    {
+                        "rule_type": "MATCH_VALUE",
+                        "field_id": "status",
+                        "operator": "==",
+                        "expected_value": "done",
+                    }
+                ],
+            }
+        ]
+    }
+    invalid = client.post(
+        "/api/v1/indicators/validate-calculation-schema",
+        params={"form_schema_hash": form_hash},
+        json=invalid_schema,
+    )
+
+    assert valid.status_code == 200 and valid.json()["valid"] is True
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"]["errors"] == [
+        "Calculation schema references field 'status' which does not exist in form schema"
+    ]
@@ -940,3 +940,88 @@ def test_validator_cannot_access_user_management(
     # Try to access user list
     response = client.get("/api/v1/users/")
     assert response.status_code == 403
+
+
+# ====================================================================
+# POST /api/v1/users/import - Bulk Import
+# ====================================================================
+
+
+def test_import_users_from_csv_as_admin(
+    client: TestClient, db_session: Session, admin_user: User
+):
+    """Test admin can bulk-create users from a CSV file, with per-row errors"""
+    _override_user_and_db(client, admin_user, db_session)
+
+    csv_file = (
+        "email,name,password,role\n"
+        "assessor_import@example.com,Imported Assessor,password123,ASSESSOR\n"
+        f"{admin_user.email},Duplicate Admin,password123,ASSESSOR\n"
+    )
+    response = client.post(
+        "/api/v1/users/import",
+        files={"file": ("users.csv", csv_file, "text/csv")},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 1
+    assert data["errors"] == [
+        {"row": 2, "email": admin_user.email, "error": "Email already registered"}
+    ]
+    imported = db_session.query(User).filter(User.email == "assessor_import@example.com").first()
+    assert imported is not None and imported.role == UserRole.ASSESSOR
+
+
+def test_large_import_is_queued_without_plaintext_passwords(
+    client: TestClient, db_session: Session, admin_user: User, monkeypatch
+):
+    """Test large imports reach the worker encrypted, not as readable rows"""
+    from app.core.config import settings
+    from app.core.security import decrypt_payload
+    from app.workers.user_import import import_users as import_users_task
+
+    _override_user_and_db(client, admin_user, db_session)
+    monkeypatch.setattr(settings, "USER_IMPORT_SYNC_MAX_ROWS", 1)
+    queued = []
+
+    class _Task:
+        id = "task-1"
+
+    def fake_delay(*args):
+        queued.extend(args)
+        return _Task()
+
+    monkeypatch.setattr(import_users_task, "delay", fake_delay)
+
+    csv_file = (
+        "email,name,password,role\n"
+        "queued1@example.com,Queued One,hunter2secret,ASSESSOR\n"
+        "queued2@example.com,Queued Two,hunter2secret,ASSESSOR\n"
+    )
+    response = client.post(
+        "/api/v1/users/import",
+        files={"file": ("users.csv", csv_file, "text/csv")},
+    )
+
+    assert response.status_code == 202
+    assert response.json() == {"status": "processing", "task_id": "task-1", "total": 2}
+    assert len(queued) == 1
+    assert "hunter2secret" not in repr(queued)
+    assert [row["password"] for row in decrypt_payload(queued[0])] == [
+        "hunter2secret",
+        "hunter2secret",
+    ]
+
+
+def test_import_users_forbidden_for_non_admin(
+    client: TestClient, db_session: Session, blgu_user: User
+):
+    """Test non-admin users cannot bulk import"""
+    _override_user_and_db(client, blgu_user, db_session)
+
+    response = client.post(
+        "/api/v1/users/import",
+        files={"file": ("users.csv", "email,name,password\n", "text/csv")},
+    )
+    assert response.status_code == 403
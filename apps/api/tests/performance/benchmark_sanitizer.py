@@ -0,0 +1,136 @@
+"""
+HTML Sanitizer Micro-Benchmark
+
+Times sanitize_text_input / sanitize_rich_text on comment- and
+technical-notes-shaped payloads of growing size, next to the previous
+multi-pass regex implementation, and reports the time per character so
+linear scaling is visible at a glance.
+
+Usage:
+    uv run python -m tests.performance.benchmark_sanitizer --sizes 1000 10000 100000 \
+        --output sanitizer-benchmark.json
+"""
+
+import argparse
+import html
+import json
+import platform
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.core.security import sanitize_rich_text, sanitize_text_input  # noqa: E402
+
+from tests.performance.benchmark_workflows import summarize  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_REPEAT = 5
+
+_LEGACY_DANGEROUS_TAGS = [
+    "script", "iframe", "object", "embed", "applet",
+    "link", "style", "meta", "base", "form",
+]
+_LEGACY_DANGEROUS_ATTRS = [
+    "onload", "onerror", "onclick", "onmouseover", "onmouseout",
+    "onkeydown", "onkeyup", "onkeypress", "onfocus", "onblur",
+    "onchange", "onsubmit", "onreset", "onselect", "onabort",
+    "javascript:", "data:", "vbscript:",
+]
+_LEGACY_RICH_TAGS = {
+    "b", "i", "u", "strong", "em", "p", "br", "ul", "ol", "li", "h1", "h2", "h3", "h4", "h5", "h6",
+}
+
+
+def legacy_sanitize_html(text: str, allow_basic_formatting: bool = False) -> str:
+    """The multi-pass implementation sanitize_html replaced (kept as a baseline)."""
+    for tag in _LEGACY_DANGEROUS_TAGS:
+        text = re.sub(f"<{tag}[^>]*>.*?</{tag}>", "", text, flags=re.IGNORECASE | re.DOTALL)
+        text = re.sub(f"<{tag}[^>]*/>", "", text, flags=re.IGNORECASE)
+    for attr in _LEGACY_DANGEROUS_ATTRS:
+        text = re.sub(f"{attr}\\s*=\\s*[\"']?[^\"'\\s>]*[\"']?", "", text, flags=re.IGNORECASE)
+    if not allow_basic_formatting:
+        text = re.sub("<[^>]+>", "", text)
+        text = html.escape(text)
+    return text.strip()
+
+
+def legacy_sanitize_rich_text(text: str) -> str:
+    """The multi-pass implementation sanitize_rich_text replaced (kept as a baseline)."""
+
+    def replace_tag(match):
+        tag = match.group(1).lower().lstrip("/")
+        return match.group(0) if tag in _LEGACY_RICH_TAGS else ""
+
+    return re.sub(
+        r"<(/?\w+)(?:\s[^>]*)?>",
+        replace_tag,
+        legacy_sanitize_html(text, allow_basic_formatting=True),
+        flags=re.IGNORECASE,
+    )
+
+
+def make_payload(size: int, kind: str) -> str:
+    """A comment (plain text) or technical notes (formatted) payload of ~``size`` chars."""
+    if kind == "comment":
+        unit = "The MOV for indicator 2.1 is missing the signed resolution & annex. "
+    else:
+        unit = (
+            "<p>Verify the <b>approved</b> barangay budget and the <em>posted</em> "
+            "ordinance.</p><ul><li>Minutes of the session</li><li>Photo documentation</li></ul>"
+        )
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+# case -> (sanitizer, payload kind)
+CASES: Dict[str, Tuple[Callable[[str], Any], str]] = {
+    "comment": (sanitize_text_input, "comment"),
+    "comment_legacy": (legacy_sanitize_html, "comment"),
+    "technical_notes": (sanitize_rich_text, "notes"),
+    "technical_notes_legacy": (legacy_sanitize_rich_text, "notes"),
+}
+
+
+def run_sanitizer_benchmark(sizes: List[int], repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """Time every case at every payload size; returns the JSON report."""
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        for case, (fn, kind) in CASES.items():
+            payload = make_payload(size, kind)
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                fn(payload)
+                samples.append(time.perf_counter() - started)
+            stats = summarize(samples)
+            stats["ns_per_char"] = round(stats["median_ms"] * 1_000_000 / size, 2)
+            results.setdefault(str(size), {})[case] = stats
+    return {
+        "benchmark": "html_sanitizer",
+        "generated_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    report = run_sanitizer_benchmark(args.sizes, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
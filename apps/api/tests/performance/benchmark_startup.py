@@ -0,0 +1,165 @@
+"""
+Startup Seeding Benchmark
+
+Measures the seeding step of application startup on a fresh database (cold:
+every seeder runs) and on an already-seeded one (warm: the recorded seed
+version matches and seeding is skipped), with statement counts for each.
+
+Usage:
+    uv run python -m tests.performance.benchmark_startup --repeat 20 \
+        --output startup-benchmark.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.db import models  # noqa: E402,F401  (register all tables)
+from app.db.base import Base  # noqa: E402
+from app.services.startup_service import StartupService  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from tests.performance.benchmark_workflows import summarize  # noqa: E402
+
+DEFAULT_REPEAT = 10
+
+
+@contextmanager
+def count_statements(engine: Engine) -> Iterator[List[str]]:
+    """Collect every SQL statement executed on ``engine`` inside the block."""
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+@contextmanager
+def seeding_enabled() -> Iterator[None]:
+    """Temporarily clear SKIP_STARTUP_SEEDING (set by the test suite)."""
+    previous = os.environ.pop("SKIP_STARTUP_SEEDING", None)
+    try:
+        yield
+    finally:
+        if previous is not None:
+            os.environ["SKIP_STARTUP_SEEDING"] = previous
+
+
+def _engine(database_url: Optional[str], workdir: Path) -> Engine:
+    if database_url:
+        return create_engine(database_url, pool_pre_ping=True)
+    return create_engine(
+        f"sqlite:///{workdir / 'startup.db'}",
+        connect_args={"check_same_thread": False},
+    )
+
+
+def _timed_seed(service: StartupService, engine: Engine, session_factory) -> Dict[str, Any]:
+    with count_statements(engine) as statements:
+        start = time.perf_counter()
+        outcome = service.seed_initial_data(session_factory=session_factory)
+        elapsed = time.perf_counter() - start
+    return {"outcome": outcome, "seconds": elapsed, "statements": len(statements)}
+
+
+def run_startup_benchmark(
+    repeat: int = DEFAULT_REPEAT,
+    database_url: Optional[str] = None,
+    output_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Benchmark one cold seeding pass followed by ``repeat`` warm restarts.
+
+    Args:
+        repeat: Number of warm (already seeded) runs to time
+        database_url: Optional PostgreSQL URL (defaults to a throwaway SQLite file)
+        output_path: Where to write the JSON report (skipped when None)
+
+    Returns:
+        The report that was (optionally) written to ``output_path``
+    """
+    with tempfile.TemporaryDirectory(prefix="vantage-startup-") as tmp, seeding_enabled():
+        engine = _engine(database_url, Path(tmp))
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        service = StartupService()
+        start = time.perf_counter()
+        fingerprint = service.seed_fingerprint()
+        fingerprint_seconds = time.perf_counter() - start
+
+        cold = _timed_seed(service, engine, session_factory)
+        warm_runs = [_timed_seed(service, engine, session_factory) for _ in range(repeat)]
+        engine.dispose()
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(),
+        "database": "postgresql" if database_url else "sqlite",
+        "python": platform.python_version(),
+        "fingerprint": fingerprint,
+        "fingerprint_ms": round(fingerprint_seconds * 1000, 3),
+        "cold": {
+            "outcome": cold["outcome"],
+            "ms": round(cold["seconds"] * 1000, 3),
+            "statements": cold["statements"],
+        },
+        "warm": {
+            **summarize([run["seconds"] for run in warm_runs]),
+            "outcomes": sorted({run["outcome"] for run in warm_runs}),
+            "statements": max(run["statements"] for run in warm_runs),
+        },
+    }
+
+    if output_path is not None:
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2))
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark VANTAGE startup seeding")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("VANTAGE_BENCHMARK_DATABASE_URL"),
+        help="PostgreSQL URL to benchmark against (default: temporary SQLite)",
+    )
+    parser.add_argument("--output", type=Path, default=Path("startup-benchmark.json"))
+    args = parser.parse_args(argv)
+
+    report = run_startup_benchmark(
+        repeat=args.repeat, database_url=args.database_url, output_path=args.output
+    )
+
+    cold, warm = report["cold"], report["warm"]
+    print(f"\n🚀 Cold seed: {cold['ms']:.1f} ms, {cold['statements']} statements ({cold['outcome']})")
+    print(
+        f"♻️  Warm boot: median {warm['median_ms']:.2f} ms, "
+        f"{warm['statements']} statement(s) ({', '.join(warm['outcomes'])})"
+    )
+    print(f"\n✅ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+"""
+Assessment Workflow Benchmark Harness
+
+Times the key API flows against a synthetic dataset at several scales and
+emits the results as JSON for trend tracking.
+
+Runs entirely locally: SQLite by default (a throwaway file per scale) or any
+PostgreSQL database passed via --database-url / VANTAGE_BENCHMARK_DATABASE_URL.
+Celery is pointed at an in-memory broker so queued notifications never need Redis.
+
+Each scale DROPS AND RECREATES EVERY TABLE in the target database. A
+--database-url that already has tables is refused unless --allow-destroy
+(or VANTAGE_BENCHMARK_ALLOW_DESTROY=1) says it is a throwaway database;
+never point it at a database whose data you want to keep.
+
+Usage:
+    uv run python -m tests.performance.benchmark_workflows --scales 25 500 5000 \
+        --output benchmark-results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.core.celery_app import celery_app  # noqa: E402
+from app.core.security import create_access_token  # noqa: E402
+from app.db import models  # noqa: E402,F401  (register all tables)
+from app.db.base import Base  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, inspect, make_url  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from tests.performance.data_generator import (  # noqa: E402
+    GeneratedDataset,
+    SyntheticDataGenerator,
+)
+
+DEFAULT_SCALES = (25, 500, 5000)
+DEFAULT_REPEAT = 5
+
+FLOWS = (
+    "my_assessment",
+    "blgu_dashboard",
+    "assessor_queue",
+    "assessor_details",
+    "finalize_and_classify",
+    "analytics_dashboard",
+    "analytics_reports",
+)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize wall-clock samples (seconds) as milliseconds."""
+    ordered = sorted(samples)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        "runs": len(ordered),
+        "min_ms": round(ordered[0] * 1000, 3),
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p95_ms": round(ordered[p95_index] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+@contextmanager
+def local_celery() -> Iterator[None]:
+    """Route Celery at an in-memory broker so .delay() never touches Redis."""
+    previous = {
+        "broker_url": celery_app.conf.broker_url,
+        "result_backend": celery_app.conf.result_backend,
+    }
+    celery_app.conf.update(broker_url="memory://", result_backend="cache+memory://")
+    try:
+        yield
+    finally:
+        celery_app.conf.update(**previous)
+
+
+@contextmanager
+def benchmark_client(session_factory: sessionmaker) -> Iterator[TestClient]:
+    """
+    TestClient for the real app bound to the benchmark database.
+
+    The lifespan is not entered (no startup seeding or connection checks) and
+    any dependency overrides installed by the surrounding test session are
+    restored afterwards.
+    """
+    from app.api import deps
+    from app.db.base import get_db
+    from main import app
+
+    def _get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    saved_overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[deps.get_db] = _get_db
+    try:
+        # Server errors are recorded as 5xx status codes in the report rather
+        # than aborting the run, so a broken flow shows up in the trend data.
+        yield TestClient(app, raise_server_exceptions=False)
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(saved_overrides)
+
+
+class WorkflowBenchmark:
+    """Runs every flow ``repeat`` times against one generated dataset."""
+
+    def __init__(self, client: TestClient, dataset: GeneratedDataset, repeat: int):
+        self.client = client
+        self.dataset = dataset
+        self.repeat = repeat
+        # Each simulated request gets its own client address, the same way
+        # real traffic arrives from many barangays, so the per-IP rate limiter
+        # measures its bookkeeping cost without throttling the benchmark.
+        self._ip_counter = count(1)
+
+    def _headers(self, user_id: int) -> Dict[str, str]:
+        n = next(self._ip_counter)
+        return {
+            "Authorization": f"Bearer {create_access_token(subject=user_id)}",
+            "X-Forwarded-For": f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}",
+        }
+
+    def _time(self, request: Callable[[int], Any]) -> Dict[str, Any]:
+        samples: List[float] = []
+        statuses: Dict[str, int] = {}
+        for i in range(self.repeat):
+            start = time.perf_counter()
+            response = request(i)
+            samples.append(time.perf_counter() - start)
+            key = str(response.status_code)
+            statuses[key] = statuses.get(key, 0) + 1
+        return {**summarize(samples), "status_codes": statuses}
+
+    def _sample(self, items: List[int], i: int) -> int:
+        return items[(i * 7919) % len(items)]
+
+    def _blgu_dashboard(self, i: int):
+        user_id = self._sample(self.dataset.blgu_user_ids, i)
+        assessment_id = self.dataset.assessment_ids_by_user[user_id]
+        return self.client.get(
+            f"/api/v1/blgu-dashboard/{assessment_id}", headers=self._headers(user_id)
+        )
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        ds = self.dataset
+        blgu_ids = ds.blgu_user_ids
+        submitted = ds.submitted_assessment_ids or list(ds.assessment_ids_by_user.values())
+        validator_id = ds.validator_user_ids[1]
+
+        flows: Dict[str, Callable[[int], Any]] = {
+            "my_assessment": lambda i: self.client.get(
+                "/api/v1/assessments/my-assessment",
+                headers=self._headers(self._sample(blgu_ids, i)),
+            ),
+            "blgu_dashboard": self._blgu_dashboard,
+            "assessor_queue": lambda i: self.client.get(
+                "/api/v1/assessor/queue", headers=self._headers(validator_id)
+            ),
+            "assessor_details": lambda i: self.client.get(
+                f"/api/v1/assessor/assessments/{self._sample(submitted, i)}",
+                headers=self._headers(validator_id),
+            ),
+            "finalize_and_classify": lambda i: self.client.post(
+                f"/api/v1/assessor/assessments/"
+                f"{ds.finalizable_assessment_ids[i % len(ds.finalizable_assessment_ids)]}/finalize",
+                headers=self._headers(validator_id),
+            ),
+            "analytics_dashboard": lambda i: self.client.get(
+                "/api/v1/analytics/dashboard",
+                headers=self._headers(ds.mlgoo_user_id),
+            ),
+            "analytics_reports": lambda i: self.client.get(
+                "/api/v1/analytics/reports",
+                params={"page": 1, "page_size": 50},
+                headers=self._headers(ds.mlgoo_user_id),
+            ),
+        }
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for name in FLOWS:
+            if name == "finalize_and_classify" and not ds.finalizable_assessment_ids:
+                continue
+            results[name] = self._time(flows[name])
+        return results
+
+
+def _engine_for_scale(database_url: Optional[str], workdir: Path, scale: int) -> Engine:
+    if database_url:
+        return create_engine(database_url, pool_pre_ping=True)
+    return create_engine(
+        f"sqlite:///{workdir / f'benchmark_{scale}.db'}",
+        connect_args={"check_same_thread": False},
+    )
+
+
+def ensure_disposable(database_url: Optional[str], allow_destroy: bool) -> None:
+    """
+    Refuse to benchmark against a database that already has tables.
+
+    run_scale drops every table, so an existing database is only used when
+    the caller explicitly allows it. The default SQLite files are always fine.
+
+    Raises:
+        RuntimeError: If database_url has tables and allow_destroy is False
+    """
+    if not database_url or allow_destroy:
+        return
+    engine = create_engine(database_url)
+    try:
+        tables = inspect(engine).get_table_names()
+    finally:
+        engine.dispose()
+    if tables:
+        raise RuntimeError(
+            f"{make_url(database_url).render_as_string(hide_password=True)} already has "
+            f"{len(tables)} table(s) and the benchmark drops every table; pass "
+            "--allow-destroy (allow_destroy=True) if it is a throwaway database"
+        )
+
+
+def run_scale(
+    scale: int,
+    repeat: int,
+    database_url: Optional[str],
+    workdir: Path,
+    seed: int,
+    indicators_per_area: int,
+    children_per_indicator: int,
+) -> Dict[str, Any]:
+    """
+    Generate the dataset for one scale, run all flows and return the result row.
+
+    Drops and recreates every table first; see ensure_disposable.
+    """
+    engine = _engine_for_scale(database_url, workdir, scale)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db: Session = session_factory()
+    try:
+        start = time.perf_counter()
+        dataset = SyntheticDataGenerator(db, seed=seed).generate(
+            num_barangays=scale,
+            indicators_per_area=indicators_per_area,
+            children_per_indicator=children_per_indicator,
+            finalizable=repeat,
+        )
+        seed_seconds = time.perf_counter() - start
+    finally:
+        db.close()
+
+    with local_celery(), benchmark_client(session_factory) as client:
+        flows = WorkflowBenchmark(client, dataset, repeat).run()
+
+    engine.dispose()
+    return {
+        "scale": scale,
+        "seed_seconds": round(seed_seconds, 3),
+        "row_counts": dataset.row_counts,
+        "flows": flows,
+    }
+
+
+def run_benchmarks(
+    scales=DEFAULT_SCALES,
+    repeat: int = DEFAULT_REPEAT,
+    database_url: Optional[str] = None,
+    output_path: Optional[Path] = None,
+    seed: int = 20251,
+    indicators_per_area: int = 3,
+    children_per_indicator: int = 2,
+    allow_destroy: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark suite for every requested scale.
+
+    Args:
+        scales: Barangay counts to benchmark
+        repeat: Timed requests per flow per scale
+        database_url: Optional PostgreSQL URL (defaults to throwaway SQLite files)
+        output_path: Where to write the JSON report (skipped when None)
+        seed: Random seed for the data generator
+        indicators_per_area: Top-level indicators per governance area
+        children_per_indicator: Child indicators per top-level indicator
+        allow_destroy: Use database_url even if it already has tables (they
+            are all dropped)
+
+    Returns:
+        The report that was (optionally) written to ``output_path``
+
+    Raises:
+        RuntimeError: If database_url has tables and allow_destroy is False
+    """
+    ensure_disposable(database_url, allow_destroy)
+    os.environ.setdefault("SKIP_STARTUP_SEEDING", "true")
+
+    with tempfile.TemporaryDirectory(prefix="vantage-bench-") as tmp:
+        workdir = Path(tmp)
+        results = [
+            run_scale(
+                scale,
+                repeat,
+                database_url,
+                workdir,
+                seed,
+                indicators_per_area,
+                children_per_indicator,
+            )
+            for scale in scales
+        ]
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(),
+        "database": "postgresql" if database_url else "sqlite",
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "seed": seed,
+        "indicators_per_area": indicators_per_area,
+        "children_per_indicator": children_per_indicator,
+        "results": results,
+    }
+
+    if output_path is not None:
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2))
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark VANTAGE assessment workflows")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("VANTAGE_BENCHMARK_DATABASE_URL"),
+        help="PostgreSQL URL to benchmark against (default: temporary SQLite)",
+    )
+    parser.add_argument(
+        "--allow-destroy",
+        action="store_true",
+        default=os.getenv("VANTAGE_BENCHMARK_ALLOW_DESTROY") == "1",
+        help="Drop all tables of --database-url even if it already has some",
+    )
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--seed", type=int, default=20251)
+    parser.add_argument("--indicators-per-area", type=int, default=3)
+    parser.add_argument("--children-per-indicator", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    try:
+        ensure_disposable(args.database_url, args.allow_destroy)
+    except RuntimeError as e:
+        parser.error(str(e))
+
+    report = run_benchmarks(
+        scales=args.scales,
+        repeat=args.repeat,
+        database_url=args.database_url,
+        output_path=args.output,
+        seed=args.seed,
+        indicators_per_area=args.indicators_per_area,
+        children_per_indicator=args.children_per_indicator,
+        allow_destroy=args.allow_destroy,
+    )
+
+    for row in report["results"]:
+        print(f"\n📊 {row['scale']} barangays (seeded in {row['seed_seconds']}s)")
+        for flow, stats in row["flows"].items():
+            print(
+                f"  {flow:<24} median {stats['median_ms']:>9.1f} ms  "
+                f"p95 {stats['p95_ms']:>9.1f} ms  {stats['status_codes']}"
+            )
+    print(f"\n✅ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
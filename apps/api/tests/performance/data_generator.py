@@ -0,0 +1,543 @@
+"""
+Synthetic Data Generator for Workflow Benchmarks
+
+Builds a deterministic, seeded SGLGB dataset (barangays, BLGU users, indicator
+trees with realistic form/calculation schemas, assessments, responses, MOV files
+and assessor feedback) directly through bulk inserts so that large scales
+(thousands of barangays) can be generated in seconds on SQLite or PostgreSQL.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from app.db.enums import (
+    AreaType,
+    AssessmentStatus,
+    ComplianceStatus,
+    UserRole,
+    ValidationStatus,
+)
+from app.db.models.admin import AssessmentCycle
+from app.db.models.assessment import (
+    Assessment,
+    AssessmentResponse,
+    FeedbackComment,
+    MOVFile,
+)
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+# The six official SGLGB governance areas (ids must match the production seed)
+GOVERNANCE_AREAS = [
+    (1, "Financial Administration and Sustainability", AreaType.CORE),
+    (2, "Disaster Preparedness", AreaType.CORE),
+    (3, "Safety, Peace and Order", AreaType.CORE),
+    (4, "Social Protection and Sensitivity", AreaType.ESSENTIAL),
+    (5, "Business-Friendliness and Competitiveness", AreaType.ESSENTIAL),
+    (6, "Environmental Management", AreaType.ESSENTIAL),
+]
+
+REQUIRED_DOCUMENTS = ["budget", "ordinance", "minutes", "photos", "report"]
+
+# Placeholder hash - benchmarks authenticate with minted JWTs, never passwords
+BENCHMARK_PASSWORD_HASH = "$2b$12$benchmark.synthetic.password.hash.not.usable"
+
+# Rows per executemany batch (keeps parameter lists well below driver limits)
+INSERT_BATCH_SIZE = 5000
+
+
+@dataclass
+class GeneratedDataset:
+    """Identifiers of the generated rows that the benchmark flows act on."""
+
+    num_barangays: int
+    indicators_per_area: int
+    children_per_indicator: int
+    seed: int
+    cycle_id: int
+    mlgoo_user_id: int
+    validator_user_ids: Dict[int, int] = field(default_factory=dict)
+    blgu_user_ids: List[int] = field(default_factory=list)
+    assessment_ids_by_user: Dict[int, int] = field(default_factory=dict)
+    submitted_assessment_ids: List[int] = field(default_factory=list)
+    finalizable_assessment_ids: List[int] = field(default_factory=list)
+    row_counts: Dict[str, int] = field(default_factory=dict)
+
+
+def build_form_schema(code: str) -> Dict[str, Any]:
+    """Build a realistic Epic 3 form schema for a leaf indicator."""
+    return {
+        "fields": [
+            {
+                "field_id": "completion_rate",
+                "field_type": "number_input",
+                "label": f"{code} Physical accomplishment (%)",
+                "required": True,
+                "min_value": 0,
+                "max_value": 100,
+            },
+            {
+                "field_id": "required_documents",
+                "field_type": "checkbox_group",
+                "label": f"{code} Documents posted",
+                "required": True,
+                "options": [
+                    {"label": doc.title(), "value": doc} for doc in REQUIRED_DOCUMENTS
+                ],
+            },
+            {
+                "field_id": "status",
+                "field_type": "radio_button",
+                "label": f"{code} Was the requirement met?",
+                "required": True,
+                "options": [
+                    {"label": "Yes", "value": "yes"},
+                    {"label": "No", "value": "no"},
+                ],
+            },
+            {
+                "field_id": "remarks",
+                "field_type": "text_area",
+                "label": "Remarks",
+                "required": False,
+                "max_length": 2000,
+            },
+            {
+                "field_id": "mov_upload",
+                "field_type": "file_upload",
+                "label": "Means of Verification",
+                "required": False,
+                "allowed_file_types": ["pdf", "jpg", "png"],
+                "conditional_mov_requirement": {
+                    "field_id": "status",
+                    "operator": "equals",
+                    "value": "yes",
+                },
+            },
+        ]
+    }
+
+
+def build_calculation_schema() -> Dict[str, Any]:
+    """Build a nested calculation schema exercising several rule types."""
+    return {
+        "condition_groups": [
+            {
+                "operator": "AND",
+                "rules": [
+                    {
+                        "rule_type": "PERCENTAGE_THRESHOLD",
+                        "field_id": "completion_rate",
+                        "operator": ">=",
+                        "threshold": 75.0,
+                    },
+                    {
+                        "rule_type": "OR_ANY",
+                        "conditions": [
+                            {
+                                "rule_type": "COUNT_THRESHOLD",
+                                "field_id": "required_documents",
+                                "operator": ">=",
+                                "threshold": 3,
+                            },
+                            {
+                                "rule_type": "MATCH_VALUE",
+                                "field_id": "status",
+                                "operator": "==",
+                                "expected_value": "yes",
+                            },
+                        ],
+                    },
+                ],
+            }
+        ],
+        "output_status_on_pass": "Pass",
+        "output_status_on_fail": "Fail",
+    }
+
+
+class SyntheticDataGenerator:
+    """
+    Seeded generator for benchmark datasets.
+
+    All primary keys are assigned explicitly so the generated dataset is
+    identical for a given seed and the whole load is done with executemany
+    inserts instead of per-row ORM flushes.
+    """
+
+    def __init__(self, db: Session, seed: int = 20251):
+        self.db = db
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.now = datetime(2025, 6, 1, 8, 0, 0)
+
+    def generate(
+        self,
+        num_barangays: int,
+        indicators_per_area: int = 3,
+        children_per_indicator: int = 2,
+        finalizable: int = 5,
+    ) -> GeneratedDataset:
+        """
+        Generate a full dataset and commit it.
+
+        Args:
+            num_barangays: Number of barangays (one BLGU user and assessment each)
+            indicators_per_area: Top-level indicators per governance area
+            children_per_indicator: Child indicators nested under each top-level one
+            finalizable: Submitted assessments left fully validated (all Pass)
+                so the finalize + classification flow has fresh targets
+
+        Returns:
+            GeneratedDataset with the identifiers needed by the benchmark flows
+        """
+        cycle_id = self._insert_cycle()
+        self._insert_governance_areas()
+        leaf_indicators = self._insert_indicators(
+            indicators_per_area, children_per_indicator
+        )
+        self._insert_barangays(num_barangays)
+
+        dataset = GeneratedDataset(
+            num_barangays=num_barangays,
+            indicators_per_area=indicators_per_area,
+            children_per_indicator=children_per_indicator,
+            seed=self.seed,
+            cycle_id=cycle_id,
+            mlgoo_user_id=0,
+        )
+        self._insert_users(dataset, num_barangays)
+        self._insert_assessments(dataset, leaf_indicators, finalizable)
+
+        self.db.commit()
+        self._sync_sequences()
+        dataset.row_counts = self._count_rows()
+        return dataset
+
+    # ------------------------------------------------------------------
+    # Reference data
+    # ------------------------------------------------------------------
+
+    def _insert_cycle(self) -> int:
+        phase1 = datetime(2025, 7, 1, tzinfo=timezone.utc)
+        self._bulk_insert(
+            AssessmentCycle,
+            [
+                {
+                    "id": 1,
+                    "name": "SGLGB 2025",
+                    "year": 2025,
+                    "phase1_deadline": phase1,
+                    "rework_deadline": phase1 + timedelta(days=14),
+                    "phase2_deadline": phase1 + timedelta(days=30),
+                    "calibration_deadline": phase1 + timedelta(days=45),
+                    "is_active": True,
+                }
+            ],
+        )
+        return 1
+
+    def _insert_governance_areas(self) -> None:
+        self._bulk_insert(
+            GovernanceArea,
+            [
+                {"id": area_id, "name": name, "area_type": area_type}
+                for area_id, name, area_type in GOVERNANCE_AREAS
+            ],
+        )
+
+    def _insert_indicators(
+        self, indicators_per_area: int, children_per_indicator: int
+    ) -> List[Dict[str, Any]]:
+        """Insert indicator trees and return the leaf indicators (rows responses attach to)."""
+        rows: List[Dict[str, Any]] = []
+        leaves: List[Dict[str, Any]] = []
+        next_id = 1
+        calculation_schema = build_calculation_schema()
+
+        for area_id, area_name, _ in GOVERNANCE_AREAS:
+            for i in range(1, indicators_per_area + 1):
+                code = f"{area_id}.{i}"
+                parent = {
+                    "id": next_id,
+                    "name": f"{code} {area_name} Indicator {i}",
+                    "description": f"Synthetic indicator {code}",
+                    "governance_area_id": area_id,
+                    "parent_id": None,
+                    "form_schema": build_form_schema(code),
+                    "calculation_schema": calculation_schema,
+                    "is_auto_calculable": children_per_indicator == 0,
+                    "technical_notes_text": f"Technical notes for {code}. " * 10,
+                }
+                rows.append(parent)
+                next_id += 1
+
+                if children_per_indicator == 0:
+                    leaves.append(parent)
+                    continue
+
+                for j in range(1, children_per_indicator + 1):
+                    child_code = f"{code}.{j}"
+                    child = {
+                        "id": next_id,
+                        "name": f"{child_code} Sub-indicator",
+                        "description": f"Synthetic sub-indicator {child_code}",
+                        "governance_area_id": area_id,
+                        "parent_id": parent["id"],
+                        "form_schema": build_form_schema(child_code),
+                        "calculation_schema": calculation_schema,
+                        "is_auto_calculable": True,
+                        "technical_notes_text": f"Technical notes for {child_code}.",
+                    }
+                    rows.append(child)
+                    leaves.append(child)
+                    next_id += 1
+
+        self._bulk_insert(Indicator, rows)
+        return leaves
+
+    def _insert_barangays(self, num_barangays: int) -> None:
+        self._bulk_insert(
+            Barangay,
+            [
+                {"id": i, "name": f"Barangay {i:05d}"}
+                for i in range(1, num_barangays + 1)
+            ],
+        )
+
+    def _insert_users(self, dataset: GeneratedDataset, num_barangays: int) -> None:
+        rows: List[Dict[str, Any]] = []
+        next_id = 1
+
+        def user_row(user_id: int, email: str, name: str, role: UserRole, **extra):
+            return {
+                "id": user_id,
+                "email": email,
+                "name": name,
+                "role": role,
+                "hashed_password": BENCHMARK_PASSWORD_HASH,
+                "must_change_password": False,
+                "is_active": True,
+                "is_superuser": role == UserRole.MLGOO_DILG,
+                "validator_area_id": None,
+                "barangay_id": None,
+                "created_at": self.now,
+                "updated_at": self.now,
+                **extra,
+            }
+
+        rows.append(
+            user_row(next_id, "mlgoo@bench.local", "Benchmark MLGOO", UserRole.MLGOO_DILG)
+        )
+        dataset.mlgoo_user_id = next_id
+        next_id += 1
+
+        for area_id, _, _ in GOVERNANCE_AREAS:
+            rows.append(
+                user_row(
+                    next_id,
+                    f"validator{area_id}@bench.local",
+                    f"Benchmark Validator {area_id}",
+                    UserRole.VALIDATOR,
+                    validator_area_id=area_id,
+                )
+            )
+            dataset.validator_user_ids[area_id] = next_id
+            next_id += 1
+
+        for barangay_id in range(1, num_barangays + 1):
+            rows.append(
+                user_row(
+                    next_id,
+                    f"blgu{barangay_id:05d}@bench.local",
+                    f"BLGU Secretary {barangay_id:05d}",
+                    UserRole.BLGU_USER,
+                    barangay_id=barangay_id,
+                )
+            )
+            dataset.blgu_user_ids.append(next_id)
+            next_id += 1
+
+        self._bulk_insert(User, rows)
+
+    # ------------------------------------------------------------------
+    # Assessment workload
+    # ------------------------------------------------------------------
+
+    def _pick_status(self) -> AssessmentStatus:
+        roll = self.rng.random()
+        if roll < 0.10:
+            return AssessmentStatus.DRAFT
+        if roll < 0.70:
+            return AssessmentStatus.SUBMITTED_FOR_REVIEW
+        if roll < 0.80:
+            return AssessmentStatus.NEEDS_REWORK
+        return AssessmentStatus.VALIDATED
+
+    def _response_data(self) -> Dict[str, Any]:
+        docs = self.rng.sample(REQUIRED_DOCUMENTS, self.rng.randint(0, len(REQUIRED_DOCUMENTS)))
+        return {
+            "completion_rate": self.rng.randint(40, 100),
+            "required_documents": docs,
+            "status": self.rng.choice(["yes", "no"]),
+            "remarks": "Synthetic response " * self.rng.randint(1, 5),
+        }
+
+    def _insert_assessments(
+        self,
+        dataset: GeneratedDataset,
+        leaf_indicators: List[Dict[str, Any]],
+        finalizable: int,
+    ) -> None:
+        assessments: List[Dict[str, Any]] = []
+        responses: List[Dict[str, Any]] = []
+        mov_files: List[Dict[str, Any]] = []
+        comments: List[Dict[str, Any]] = []
+        response_id = 1
+        validator_ids = dataset.validator_user_ids
+
+        for assessment_id, user_id in enumerate(dataset.blgu_user_ids, start=1):
+            status = self._pick_status()
+            ready_to_finalize = False
+            if (
+                status == AssessmentStatus.SUBMITTED_FOR_REVIEW
+                and len(dataset.finalizable_assessment_ids) < finalizable
+            ):
+                ready_to_finalize = True
+                dataset.finalizable_assessment_ids.append(assessment_id)
+
+            submitted = status != AssessmentStatus.DRAFT
+            submitted_at = self.now - timedelta(days=self.rng.randint(1, 60))
+            validated = status == AssessmentStatus.VALIDATED
+            assessments.append(
+                {
+                    "id": assessment_id,
+                    "blgu_user_id": user_id,
+                    "status": status,
+                    "rework_count": 1 if status == AssessmentStatus.NEEDS_REWORK else 0,
+                    "submitted_at": submitted_at if submitted else None,
+                    "validated_at": submitted_at + timedelta(days=7) if validated else None,
+                    "final_compliance_status": self.rng.choice(list(ComplianceStatus))
+                    if validated
+                    else None,
+                    "created_at": submitted_at - timedelta(days=30),
+                    "updated_at": submitted_at,
+                }
+            )
+            dataset.assessment_ids_by_user[user_id] = assessment_id
+            if submitted:
+                dataset.submitted_assessment_ids.append(assessment_id)
+
+            for indicator in leaf_indicators:
+                if ready_to_finalize:
+                    validation_status: Optional[ValidationStatus] = ValidationStatus.PASS
+                elif submitted and self.rng.random() < 0.7:
+                    validation_status = self.rng.choice(list(ValidationStatus))
+                else:
+                    validation_status = None
+
+                responses.append(
+                    {
+                        "id": response_id,
+                        "assessment_id": assessment_id,
+                        "indicator_id": indicator["id"],
+                        "response_data": self._response_data(),
+                        "is_completed": submitted or self.rng.random() < 0.5,
+                        "requires_rework": status == AssessmentStatus.NEEDS_REWORK,
+                        "validation_status": validation_status,
+                        "created_at": submitted_at - timedelta(days=20),
+                        "updated_at": submitted_at,
+                    }
+                )
+
+                for n in range(self.rng.randint(0, 2)):
+                    mov_files.append(
+                        {
+                            "assessment_id": assessment_id,
+                            "indicator_id": indicator["id"],
+                            "uploaded_by": user_id,
+                            "file_name": f"mov-{response_id}-{n}.pdf",
+                            "file_url": f"https://storage.local/{assessment_id}/{indicator['id']}/mov-{response_id}-{n}.pdf",
+                            "file_type": "application/pdf",
+                            "file_size": self.rng.randint(50_000, 5_000_000),
+                            "uploaded_at": submitted_at - timedelta(days=5),
+                        }
+                    )
+
+                if validation_status is not None and self.rng.random() < 0.3:
+                    comments.append(
+                        {
+                            "response_id": response_id,
+                            "assessor_id": validator_ids[indicator["governance_area_id"]],
+                            "comment": "Please attach the signed ordinance. " * self.rng.randint(1, 4),
+                            "comment_type": "validation",
+                            "is_internal_note": self.rng.random() < 0.2,
+                            "created_at": submitted_at + timedelta(days=2),
+                        }
+                    )
+
+                response_id += 1
+
+        self._bulk_insert(Assessment, assessments)
+        self._bulk_insert(AssessmentResponse, responses)
+        self._bulk_insert(MOVFile, mov_files)
+        self._bulk_insert(FeedbackComment, comments)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _bulk_insert(self, model, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert rows with executemany in fixed-size batches.
+
+        Every row must carry the same keys: executemany compiles the INSERT
+        from the first row, so keys missing there are silently dropped.
+        """
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            batch = rows[start : start + INSERT_BATCH_SIZE]
+            if batch:
+                self.db.execute(insert(model.__table__), batch)
+
+    def _sync_sequences(self) -> None:
+        """Advance PostgreSQL id sequences past the explicitly assigned keys."""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        for model in (
+            AssessmentCycle,
+            GovernanceArea,
+            Indicator,
+            Barangay,
+            User,
+            Assessment,
+            AssessmentResponse,
+            MOVFile,
+            FeedbackComment,
+        ):
+            table = model.__tablename__
+            self.db.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+                )
+            )
+        self.db.commit()
+
+    def _count_rows(self) -> Dict[str, int]:
+        counts = {}
+        for model in (
+            Barangay,
+            User,
+            Indicator,
+            Assessment,
+            AssessmentResponse,
+            MOVFile,
+            FeedbackComment,
+        ):
+            counts[model.__tablename__] = self.db.query(model).count()
+        return counts
@@ -0,0 +1,127 @@
+"""
+Import-Time Budget Tests
+
+Cold start of the API and of Celery workers is dominated by imports. These
+tests run each entry point in a fresh interpreter under ``python -X importtime``
+and fail when:
+- a heavy SDK (Gemini, Supabase) is imported eagerly again
+- importing ``main`` exceeds the time budget
+- a worker process (celery_app + included task modules) exceeds the RSS budget
+
+Budgets can be tuned per machine:
+
+    VANTAGE_IMPORT_BUDGET_SECONDS=3.0 VANTAGE_WORKER_RSS_BUDGET_MB=128 \
+        pytest tests/performance/test_import_budget.py
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+API_ROOT = Path(__file__).resolve().parents[2]
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("VANTAGE_IMPORT_BUDGET_SECONDS", "3.0"))
+WORKER_RSS_BUDGET_MB = float(os.getenv("VANTAGE_WORKER_RSS_BUDGET_MB", "128"))
+
+# Loaded on first use only, never at import time
+DEFERRED_MODULES = ("google.generativeai", "supabase")
+
+# Peak RSS comes from /proc VmHWM on Linux: ru_maxrss survives fork/exec there
+# and would report the pytest parent's peak instead of the child's.
+_REPORT_LOADED = (
+    "import json, re, resource, sys\n"
+    "try:\n"
+    "    status = open('/proc/self/status').read()\n"
+    "    peak_kb = int(re.search(r'VmHWM:\\s+(\\d+)', status).group(1))\n"
+    "except (OSError, AttributeError):\n"
+    "    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+    "print(json.dumps({"
+    "'loaded': sorted(m for m in sys.modules if m.split('.')[0] in ('google', 'supabase')), "
+    "'maxrss_kb': peak_kb}))"
+)
+
+
+def _run(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    return subprocess.run(
+        args + ["-c", code],
+        cwd=API_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _report(result: subprocess.CompletedProcess) -> dict:
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _cumulative_seconds(importtime_stderr: str, module: str) -> float:
+    pattern = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s*" + re.escape(module) + r"$")
+    for line in importtime_stderr.splitlines():
+        match = pattern.match(line)
+        if match:
+            return int(match.group(1)) / 1_000_000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def _deferred_loaded(loaded: list[str]) -> list[str]:
+    return [
+        m for m in loaded if any(m == d or m.startswith(d + ".") for d in DEFERRED_MODULES)
+    ]
+
+
+def test_api_import_defers_heavy_sdks():
+    """Importing the FastAPI app must not pull in Gemini or Supabase."""
+    report = _report(_run(f"import main\n{_REPORT_LOADED}"))
+
+    assert _deferred_loaded(report["loaded"]) == []
+
+
+def test_api_import_time_budget():
+    """``import main`` stays within the cold-start budget."""
+    result = _run("import main", importtime=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    seconds = _cumulative_seconds(result.stderr, "main")
+    assert seconds < IMPORT_BUDGET_SECONDS, (
+        f"import main took {seconds:.2f}s (budget {IMPORT_BUDGET_SECONDS}s)"
+    )
+
+
+def test_worker_import_defers_gemini_and_stays_within_rss_budget():
+    """A worker loading every task module does not load the Gemini SDK."""
+    code = (
+        "from app.core.celery_app import celery_app\n"
+        "celery_app.loader.import_default_modules()\n"
+        f"{_REPORT_LOADED}"
+    )
+    report = _report(_run(code))
+
+    assert _deferred_loaded(report["loaded"]) == []
+
+    rss_mb = report["maxrss_kb"] / 1024
+    assert rss_mb < WORKER_RSS_BUDGET_MB, (
+        f"worker RSS {rss_mb:.0f} MB (budget {WORKER_RSS_BUDGET_MB} MB)"
+    )
+
+
+def test_lazy_module_loads_on_first_use():
+    """The Gemini stand-in imports the SDK on first attribute access only."""
+    code = (
+        "import sys; "
+        "from app.services.intelligence_service import genai; "
+        "before = 'google.generativeai' in sys.modules; "
+        "genai.configure; "
+        "print(before, 'google.generativeai' in sys.modules, genai.is_loaded)"
+    )
+    result = _run(code)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    assert result.stdout.strip().splitlines()[-1] == "False True True"
@@ -0,0 +1,98 @@
+"""
+Startup Seeding Tests
+
+Seeding runs once per seed definition: a warm boot costs a single query,
+and changing the seed definitions triggers exactly one reseed.
+"""
+
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.models.barangay import Barangay
+from app.db.models.system import SeedVersion
+from app.services.startup_service import BARANGAYS, SEED_NAME, StartupService
+from tests.performance.benchmark_startup import (
+    count_statements,
+    run_startup_benchmark,
+    seeding_enabled,
+)
+
+
+@pytest.fixture
+def seed_db(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'seed.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    with seeding_enabled():
+        yield engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def test_first_boot_seeds_and_records_version(seed_db):
+    engine, session_factory = seed_db
+    service = StartupService()
+
+    assert service.seed_initial_data(session_factory=session_factory) == "seeded"
+
+    db = session_factory()
+    try:
+        assert db.query(Barangay).count() == len(BARANGAYS)
+        record = db.get(SeedVersion, SEED_NAME)
+        assert record.fingerprint == service.seed_fingerprint()
+    finally:
+        db.close()
+
+
+def test_warm_boot_is_a_single_query(seed_db):
+    engine, session_factory = seed_db
+    service = StartupService()
+    service.seed_initial_data(session_factory=session_factory)
+
+    with count_statements(engine) as statements:
+        outcome = service.seed_initial_data(session_factory=session_factory)
+
+    assert outcome == "up_to_date"
+    assert len(statements) == 1
+
+
+def test_changed_seed_definition_reseeds_once(seed_db, monkeypatch):
+    engine, session_factory = seed_db
+    service = StartupService()
+    service.seed_initial_data(session_factory=session_factory)
+
+    startup_module = sys.modules[StartupService.__module__]
+    monkeypatch.setattr(startup_module, "SEED_VERSION", startup_module.SEED_VERSION + 1)
+
+    assert service.seed_initial_data(session_factory=session_factory) == "seeded"
+    assert service.seed_initial_data(session_factory=session_factory) == "up_to_date"
+
+    db = session_factory()
+    try:
+        # Seeders are idempotent: no duplicate barangays after the reseed
+        assert db.query(Barangay).count() == len(BARANGAYS)
+    finally:
+        db.close()
+
+
+def test_skip_flag_short_circuits(seed_db, monkeypatch):
+    _, session_factory = seed_db
+    monkeypatch.setenv("SKIP_STARTUP_SEEDING", "true")
+
+    assert StartupService().seed_initial_data(session_factory=session_factory) == "skipped"
+
+
+def test_startup_benchmark_report(tmp_path):
+    output = tmp_path / "startup.json"
+    report = run_startup_benchmark(repeat=3, output_path=output)
+
+    assert output.exists()
+    assert report["cold"]["outcome"] == "seeded"
+    assert report["warm"]["outcomes"] == ["up_to_date"]
+    assert report["warm"]["statements"] == 1
+    assert report["warm"]["runs"] == 3
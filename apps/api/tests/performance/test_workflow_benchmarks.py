@@ -0,0 +1,139 @@
+"""
+Workflow Benchmark Smoke Tests
+
+Runs the workflow benchmark harness at the smallest scale so the generator
+and every timed flow stay runnable. Larger scales are opt-in:
+
+    VANTAGE_BENCHMARK_SCALES=25,500,5000 pytest tests/performance/test_workflow_benchmarks.py
+
+Set VANTAGE_BENCHMARK_OUTPUT to keep the JSON report for trend tracking.
+A VANTAGE_BENCHMARK_DATABASE_URL that already has tables also needs
+VANTAGE_BENCHMARK_ALLOW_DESTROY=1; every table in it is dropped.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.enums import AssessmentStatus, ValidationStatus
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.governance_area import Indicator
+from tests.performance.benchmark_workflows import FLOWS, ensure_disposable, run_benchmarks
+from tests.performance.data_generator import SyntheticDataGenerator
+
+
+def _configured_scales() -> list[int]:
+    raw = os.getenv("VANTAGE_BENCHMARK_SCALES", "25")
+    return [int(part) for part in raw.split(",") if part.strip()]
+
+
+@pytest.fixture
+def generator_session(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'generator.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_generator_is_deterministic_and_shaped(generator_session):
+    """Generator creates nested indicators, one assessment per barangay and finalize targets."""
+    dataset = SyntheticDataGenerator(generator_session, seed=7).generate(
+        num_barangays=10, indicators_per_area=2, children_per_indicator=3, finalizable=2
+    )
+
+    # 6 areas x (2 parents + 2*3 children)
+    assert dataset.row_counts["indicators"] == 6 * (2 + 6)
+    assert dataset.row_counts["barangays"] == 10
+    assert dataset.row_counts["assessments"] == 10
+    # Responses attach to leaf indicators only
+    assert dataset.row_counts["assessment_responses"] == 10 * 6 * 6
+
+    children = generator_session.query(Indicator).filter(Indicator.parent_id.isnot(None)).all()
+    assert children and all(c.calculation_schema["condition_groups"] for c in children)
+    assert all(
+        f["field_id"] for c in children for f in c.form_schema["fields"]
+    )
+
+    for assessment_id in dataset.finalizable_assessment_ids:
+        assessment = generator_session.get(Assessment, assessment_id)
+        assert assessment.status == AssessmentStatus.SUBMITTED_FOR_REVIEW
+        statuses = {
+            r.validation_status
+            for r in generator_session.query(AssessmentResponse).filter(
+                AssessmentResponse.assessment_id == assessment_id
+            )
+        }
+        assert statuses == {ValidationStatus.PASS}
+
+
+def test_generator_same_seed_same_data(tmp_path):
+    """Two runs with the same seed produce identical response payloads."""
+    payloads = []
+    for run in range(2):
+        engine = create_engine(f"sqlite:///{tmp_path / f'seed{run}.db'}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        SyntheticDataGenerator(session, seed=99).generate(num_barangays=3)
+        payloads.append(
+            [
+                r.response_data
+                for r in session.query(AssessmentResponse).order_by(AssessmentResponse.id)
+            ]
+        )
+        session.close()
+        engine.dispose()
+
+    assert payloads[0] == payloads[1]
+
+
+def test_workflow_benchmarks_emit_json_report(tmp_path):
+    """Every key flow is timed at each configured scale and reported as JSON."""
+    output = Path(os.getenv("VANTAGE_BENCHMARK_OUTPUT", tmp_path / "benchmark.json"))
+
+    report = run_benchmarks(
+        scales=_configured_scales(),
+        repeat=2,
+        database_url=os.getenv("VANTAGE_BENCHMARK_DATABASE_URL"),
+        output_path=output,
+        allow_destroy=os.getenv("VANTAGE_BENCHMARK_ALLOW_DESTROY") == "1",
+    )
+
+    written = json.loads(output.read_text())
+    assert written["results"] == report["results"]
+
+    for row in report["results"]:
+        assert set(row["flows"]) == set(FLOWS)
+        for flow, stats in row["flows"].items():
+            assert stats["runs"] == 2
+            assert stats["min_ms"] <= stats["median_ms"] <= stats["max_ms"]
+            # The harness records failures instead of raising; a timed error isn't a benchmark
+            assert all(code.startswith("2") for code in stats["status_codes"]), (
+                flow,
+                stats["status_codes"],
+            )
+
+
+def test_benchmark_refuses_a_database_with_tables(tmp_path):
+    """An existing database is only dropped with allow_destroy."""
+    empty_url = f"sqlite:///{tmp_path / 'empty.db'}"
+    used_url = f"sqlite:///{tmp_path / 'used.db'}"
+    engine = create_engine(used_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    ensure_disposable(empty_url, allow_destroy=False)
+    ensure_disposable(used_url, allow_destroy=True)
+    with pytest.raises(RuntimeError, match="allow-destroy"):
+        run_benchmarks(scales=[1], repeat=1, database_url=used_url)
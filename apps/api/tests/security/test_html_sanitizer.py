@@ -0,0 +1,193 @@
+"""
+🧼 HTML Sanitizer Tests
+
+Tests:
+- Property/fuzz: same output as the previous multi-pass implementation on
+  safe inputs (text, allowed formatting, harmless tags and attributes)
+- Dangerous elements, event handlers and script URLs are removed, including
+  inputs the previous implementation let through
+- Property/fuzz: handlers never survive behind quoted attribute values
+  containing ">"
+- Linear time on adversarial inputs
+- Micro-benchmark harness stays runnable
+"""
+
+import random
+import time
+
+import pytest
+
+from app.core.html_sanitizer import Mode, sanitize
+from app.core.security import sanitize_html, sanitize_rich_text, sanitize_text_input
+from tests.performance.benchmark_sanitizer import (
+    legacy_sanitize_html,
+    legacy_sanitize_rich_text,
+    run_sanitizer_benchmark,
+)
+
+# Building blocks of safe inputs: text (including characters that need
+# escaping), allowlisted tags and harmless tags the allowlist removes
+_TEXT = [
+    "Hello", "barangay", "MOV", "2.1", "ñ", "Año", "&", "&amp;", '"', "'", ">", ";",
+    "data", "on time", "javascript", "script", "=", "a=b", " ", "  ", "\n", "\t",
+]
+_ALLOWED = [
+    "<b>", "</b>", "<i>", "</i>", "<strong>", "</strong>", "<em>", "</em>", "<p>", "</p>",
+    "<p class=\"note\">", "<P>", "</P>", "<br>", "<br/>", "<br />", "<ul>", "</ul>",
+    "<li>", "</li>", "<h2>", "</h2>", "<ol start='3'>", "</ol>",
+]
+_OTHER_TAGS = [
+    "<div>", "</div>", "<span title=\"x\">", "</span>", "<a href=\"https://example.com\">",
+    "</a>", "<table>", "<td>", "<SPAN>",
+]
+
+
+def _safe_input(rng: random.Random) -> str:
+    pieces = []
+    for _ in range(rng.randint(0, 30)):
+        bucket = rng.random()
+        if bucket < 0.6:
+            pieces.append(rng.choice(_TEXT))
+        elif bucket < 0.85:
+            pieces.append(rng.choice(_ALLOWED))
+        else:
+            pieces.append(rng.choice(_OTHER_TAGS))
+    return "".join(pieces)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_previous_implementation_on_safe_inputs(seed):
+    rng = random.Random(seed)
+    for _ in range(400):
+        text = _safe_input(rng)
+        assert sanitize_html(text) == legacy_sanitize_html(text), text
+        assert sanitize_html(text, allow_basic_formatting=True) == legacy_sanitize_html(
+            text, allow_basic_formatting=True
+        ), text
+        assert sanitize_rich_text(text) == legacy_sanitize_rich_text(text), text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (None, None),
+        ("", ""),
+        ("  plain  ", "plain"),
+        ("<b>Bold</b> & <i>it</i>", "Bold &amp; it"),
+        ("<script>alert('xss')</script>Hello", "Hello"),
+        ("<SCRIPT type='text/javascript'>alert(1)</SCRIPT>ok", "ok"),
+    ],
+)
+def test_text_input(text, expected):
+    assert sanitize_text_input(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("<p>Keep <b>this</b></p><div>not this</div>", "<p>Keep <b>this</b></p>not this"),
+        ("<iframe src='x'></iframe><p>after</p>", "<p>after</p>"),
+        ("<style>p { color: red }</style><p>x</p>", "<p>x</p>"),
+        ("<embed src='x.swf'/><p>x</p>", "<p>x</p>"),
+        ("<p onclick=\"steal()\">x</p>", "<p >x</p>"),
+        ("<p><!-- note --></p>", "<p></p>"),
+        # Unclosed dangerous element: everything after it is dropped
+        ("<p>x</p><script>alert(1)", "<p>x</p>"),
+        # Removed markup must not splice a new tag together
+        ("<scr<script>x</script>ipt>alert(1)</script>", "&lt;script>alert(1)"),
+    ],
+)
+def test_rich_text(text, expected):
+    assert sanitize_rich_text(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "<img src=x onerror=alert(1)>",
+        "<svg/onload=alert(1)>",
+        "<a href=\"javascript:alert(1)\">x</a>",
+        "<a href=' java&#x09;script:alert(1)'>x</a>",
+        "<a HREF=JaVaScRiPt:alert(1)>x</a>",
+        "<img src=\"data:text/html;base64,PHNjcmlwdD4=\">",
+        "<a href=\"vbscript:msgbox(1)\">x</a>",
+        "<body onpageshow=alert(1)>",
+        "<p title=\"x>y\" onmouseover=\"alert(1)\">hi</p>",
+        "<p title='a>b' onclick=alert(1)>hi</p>",
+        "<a title=\">\" href=\"javascript:alert(1)\">x</a>",
+        "<img alt=\"><\" src=x onerror=alert(1)>",
+    ],
+)
+def test_formatting_drops_dangerous_attributes(text):
+    result = sanitize_html(text, allow_basic_formatting=True).lower()
+
+    assert "alert" not in result and "data:" not in result and "msgbox" not in result
+    assert " on" not in result and "/on" not in result
+
+
+def test_quoted_greater_than_does_not_end_the_tag():
+    text = '<p title="x>y" onmouseover="alert(1)">hi</p>'
+
+    assert sanitize_rich_text(text) == '<p title="x>y" >hi</p>'
+    assert sanitize_html(text) == "hi"
+
+
+_QUOTED_VALUES = ['"x>y"', "'a>b'", '">"', "'>>'", '"a\'>b"', "'a\">b'", '"<>"', "plain"]
+_HANDLERS = ["onclick=alert(1)", 'onmouseover="alert(1)"', "onerror='alert(1)'", "ONLOAD=alert(1)"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_handlers_never_survive_quoted_greater_than(seed):
+    rng = random.Random(seed)
+    for _ in range(400):
+        attributes = [
+            f"title={rng.choice(_QUOTED_VALUES)}" if rng.random() < 0.6 else rng.choice(_HANDLERS)
+            for _ in range(rng.randint(1, 5))
+        ]
+        tag = rng.choice(["p", "b", "div", "img", "a"])
+        text = f"<{tag} {' '.join(attributes)}>text</{tag}>"
+        for result in (
+            sanitize_html(text, allow_basic_formatting=True),
+            sanitize_rich_text(text),
+            sanitize_html(text),
+        ):
+            assert "alert" not in result, text
+
+
+def test_attributes_are_kept_verbatim_when_harmless():
+    text = "<a href='https://example.com/?q=1&amp;on=2' title=\"Guide\">link</a>"
+
+    assert sanitize_html(text, allow_basic_formatting=True) == text
+
+
+@pytest.mark.parametrize(
+    "unit",
+    [
+        "<script>", "<", "<a", "<p onclick=x ", "</", "<scr<script>ipt>", "<!--",
+        '<p title=">', '<a "<" ', "<b '",
+    ],
+)
+def test_adversarial_inputs_scale_linearly(unit):
+    def timed(repeats):
+        text = unit * repeats
+        started = time.perf_counter()
+        for mode in Mode:
+            sanitize(text, mode)
+        return time.perf_counter() - started
+
+    small, large = timed(5_000), timed(50_000)
+
+    # 10x the input; a quadratic scan would take ~100x as long
+    assert large < max(small, 0.005) * 30
+
+
+def test_benchmark_harness_reports_every_case():
+    report = run_sanitizer_benchmark([500], repeat=1)
+
+    assert set(report["results"]["500"]) == {
+        "comment",
+        "comment_legacy",
+        "technical_notes",
+        "technical_notes_legacy",
+    }
+    assert all(stats["ns_per_char"] >= 0 for stats in report["results"]["500"].values())
@@ -0,0 +1,249 @@
+"""
+📊 Analytics Cache Service Tests
+
+Tests:
+- Dashboard responses are computed once and reused across views
+- Classification marks responses stale: served once more while recomputed in the background
+- Concurrent misses for one key compute it once (single-flight)
+- Structure changes drop responses instead of serving them stale, without
+  the commit waiting on Redis
+- Entries and invalidations are shared across processes through Redis
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.enums import ComplianceStatus, UserRole
+from app.db.models import Assessment, Barangay, User
+from app.services.analytics_cache_service import (
+    FLOOR_KEY,
+    AnalyticsCacheService,
+    analytics_cache_service,
+)
+from app.services.analytics_service import ReportsFilters
+from app.services.intelligence_service import intelligence_service
+
+
+class SharedRedis:
+    """Just the commands the cache uses; one instance stands in for the shared server."""
+
+    def __init__(self):
+        self.values = {}
+        self.reachable = threading.Event()
+        self.reachable.set()
+
+    def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    def incr(self, key):
+        self.reachable.wait(5)
+        value = int(self.values.get(key, 0)) + 1
+        self.values[key] = str(value).encode()
+        return value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture
+def local_cache(db_session, monkeypatch):
+    """The application cache, in process memory, refreshing on the test database."""
+    monkeypatch.setattr(analytics_cache_service, "_redis", lambda: None)
+    monkeypatch.setattr(
+        analytics_cache_service, "_session_factory", sessionmaker(bind=db_session.get_bind())
+    )
+    return analytics_cache_service
+
+
+@pytest.fixture
+def assessments(db_session):
+    barangay = Barangay(name="San Roque")
+    db_session.add(barangay)
+    db_session.flush()
+    blgu = User(
+        email="blgu@example.com",
+        name="BLGU",
+        hashed_password="x",
+        role=UserRole.BLGU_USER,
+        barangay_id=barangay.id,
+    )
+    db_session.add(blgu)
+    db_session.flush()
+    classified = Assessment(
+        blgu_user_id=blgu.id, final_compliance_status=ComplianceStatus.PASSED
+    )
+    pending = Assessment(blgu_user_id=blgu.id)
+    db_session.add_all([classified, pending])
+    db_session.commit()
+    return classified, pending
+
+
+def _count_queries(db_session, call):
+    """Statements issued by ``call`` itself, not by refreshes it starts in the background."""
+    statements = []
+    caller = threading.get_ident()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == caller:
+            statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def _wait_for_refreshes(cache, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while cache._flights and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not cache._flights
+
+
+def test_dashboard_is_computed_once(db_session, local_cache, assessments):
+    first, queries = _count_queries(
+        db_session, lambda: local_cache.get_dashboard_kpis(db_session)
+    )
+    again, cached_queries = _count_queries(
+        db_session, lambda: local_cache.get_dashboard_kpis(db_session)
+    )
+    other_cycle, cycle_queries = _count_queries(
+        db_session, lambda: local_cache.get_dashboard_kpis(db_session, cycle_id=2)
+    )
+
+    assert queries > 0 and cached_queries == 0 and cycle_queries > 0
+    assert again == first == other_cycle
+    assert first.overall_compliance_rate.total_barangays == 1
+    assert first.completion_status.failed == 1
+
+
+def test_classification_serves_stale_then_refreshes(db_session, local_cache, assessments):
+    _, pending = assessments
+    before = local_cache.get_dashboard_kpis(db_session)
+
+    intelligence_service.classify_assessment(db_session, pending.id)
+    stale, queries = _count_queries(
+        db_session, lambda: local_cache.get_dashboard_kpis(db_session)
+    )
+    _wait_for_refreshes(local_cache)
+    refreshed, refreshed_queries = _count_queries(
+        db_session, lambda: local_cache.get_dashboard_kpis(db_session)
+    )
+
+    # The viewer right after the change doesn't wait on the recomputation
+    assert queries == 0 and stale == before
+    assert refreshed_queries == 0
+    assert refreshed.overall_compliance_rate.total_barangays == 2
+    assert refreshed.completion_status.failed == 0
+
+
+def test_concurrent_misses_compute_once(local_cache):
+    calls = []
+    results = []
+
+    def compute(db):
+        calls.append(1)
+        time.sleep(0.2)
+        return {"views": len(calls)}
+
+    def view():
+        results.append(local_cache._get(None, "dashboard", None, {}, "all", compute))
+
+    threads = [threading.Thread(target=view) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"views": 1}] * 8
+
+
+def test_structure_changes_drop_cached_responses(db_session, local_cache, assessments):
+    local_cache.get_dashboard_kpis(db_session)
+
+    db_session.add(Barangay(name="Poblacion"))
+    db_session.commit()
+    _, queries = _count_queries(db_session, lambda: local_cache.get_dashboard_kpis(db_session))
+
+    assert queries > 0
+    assert not local_cache._flights
+
+
+def test_structure_changes_are_shared_in_the_background(db_session, assessments, monkeypatch):
+    redis = SharedRedis()
+    monkeypatch.setattr(settings, "CELERY_BROKER_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(analytics_cache_service, "_redis", lambda: redis)
+
+    # A slow Redis doesn't hold up the commit
+    redis.reachable.clear()
+    db_session.add(Barangay(name="Poblacion"))
+    db_session.commit()
+    assert FLOOR_KEY not in redis.values
+
+    redis.reachable.set()
+    deadline = time.monotonic() + 5.0
+    while FLOOR_KEY not in redis.values and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The fixture's own commits may still be announcing, so the floor is at least 1
+    assert FLOOR_KEY in redis.values and int(redis.values[FLOOR_KEY]) >= 1
+
+
+def test_entries_and_invalidations_shared_through_redis(db_session, assessments, monkeypatch):
+    redis = SharedRedis()
+    worker_a = AnalyticsCacheService(session_factory=sessionmaker(bind=db_session.get_bind()))
+    worker_b = AnalyticsCacheService(session_factory=sessionmaker(bind=db_session.get_bind()))
+    for worker in (worker_a, worker_b):
+        monkeypatch.setattr(worker, "_redis", lambda: redis)
+    mlgoo = User(email="mlgoo@example.com", name="MLGOO", role=UserRole.MLGOO_DILG)
+
+    first = worker_a.get_reports_data(
+        db_session, ReportsFilters(barangay_ids=[3, 1, 3], governance_area_codes=[]), mlgoo
+    )
+    shared, queries = _count_queries(
+        db_session,
+        lambda: worker_b.get_reports_data(db_session, ReportsFilters(barangay_ids=[1, 3]), mlgoo),
+    )
+    assert queries == 0 and shared == first
+    assert first.metadata.barangay_ids == [1, 3]
+    assert first.metadata.governance_areas is None
+
+    # Another page is another entry; no lock is left behind
+    _, page_queries = _count_queries(
+        db_session,
+        lambda: worker_b.get_reports_data(db_session, ReportsFilters(), mlgoo, page=2),
+    )
+    assert page_queries > 0
+    assert not [key for key in redis.values if key.endswith(":lock")]
+
+    worker_a.invalidate()
+    stale, stale_queries = _count_queries(
+        db_session,
+        lambda: worker_b.get_reports_data(db_session, ReportsFilters(barangay_ids=[1, 3]), mlgoo),
+    )
+    _wait_for_refreshes(worker_b)
+    assert stale_queries == 0 and stale == first
+
+    worker_a.invalidate(hard=True)
+    _, hard_queries = _count_queries(
+        db_session,
+        lambda: worker_b.get_reports_data(db_session, ReportsFilters(barangay_ids=[1, 3]), mlgoo),
+    )
+    assert hard_queries > 0
@@ -0,0 +1,243 @@
+"""
+🗺️ Assessment Area Status Service Tests
+
+Tests:
+- assessment_area_status rows follow response inserts, validations and deletes
+- Refreshes upsert rows in place, so concurrent refreshes can't collide on the key
+- rebuild() reproduces the maintained rows
+- Assessor queue and analytics read area membership from the status table
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, select
+
+from app.db.enums import AreaType, AssessmentStatus, UserRole, ValidationStatus
+from app.db.models.assessment import Assessment, AssessmentAreaStatus, AssessmentResponse
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from app.services.assessment_area_status_service import assessment_area_status_service
+from app.services.assessor_service import assessor_service
+
+
+def _status_rows(db_session):
+    db_session.expire_all()
+    return {
+        (row.assessment_id, row.governance_area_id): row
+        for row in db_session.scalars(select(AssessmentAreaStatus))
+    }
+
+
+@pytest.fixture
+def areas(db_session):
+    """Two areas with two indicators each; returns {area_id: [indicator_id, ...]}."""
+    result = {}
+    for area_id in (1, 2):
+        db_session.add(GovernanceArea(id=area_id, name=f"Area {area_id}", area_type=AreaType.CORE))
+        db_session.flush()
+        indicators = [
+            Indicator(name=f"Area {area_id} Ind {n}", governance_area_id=area_id) for n in (1, 2)
+        ]
+        db_session.add_all(indicators)
+        db_session.flush()
+        result[area_id] = [indicator.id for indicator in indicators]
+    db_session.commit()
+    return result
+
+
+def _make_assessment(db_session, barangay_name, status=AssessmentStatus.SUBMITTED_FOR_REVIEW):
+    barangay = Barangay(name=barangay_name)
+    db_session.add(barangay)
+    db_session.flush()
+    blgu = User(
+        email=f"{barangay_name.lower()}@example.com",
+        name=f"BLGU {barangay_name}",
+        hashed_password="x",
+        role=UserRole.BLGU_USER,
+        barangay_id=barangay.id,
+    )
+    db_session.add(blgu)
+    db_session.flush()
+    assessment = Assessment(
+        blgu_user_id=blgu.id,
+        status=status,
+        submitted_at=datetime.utcnow() - timedelta(days=2),
+    )
+    db_session.add(assessment)
+    db_session.commit()
+    return assessment.id
+
+
+@pytest.fixture
+def assessor(db_session, areas):
+    user = User(
+        email="validator@example.com",
+        name="Area 1 Validator",
+        hashed_password="x",
+        role=UserRole.VALIDATOR,
+        validator_area_id=1,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+class TestMaintenance:
+    def test_rows_track_response_writes(self, db_session, areas):
+        assessment_id = _make_assessment(db_session, "Alpha")
+        responses = [
+            AssessmentResponse(
+                assessment_id=assessment_id, indicator_id=indicator_id, is_completed=True
+            )
+            for indicator_id in areas[1] + areas[2][:1]
+        ]
+        db_session.add_all(responses)
+        db_session.commit()
+
+        rows = _status_rows(db_session)
+        assert set(rows) == {(assessment_id, 1), (assessment_id, 2)}
+        assert rows[(assessment_id, 1)].response_count == 2
+        assert rows[(assessment_id, 1)].completed_count == 2
+        assert rows[(assessment_id, 1)].reviewed_count == 0
+        assert rows[(assessment_id, 1)].first_reviewed_at is None
+        assert rows[(assessment_id, 2)].response_count == 1
+
+        # Validation
+        responses[0].validation_status = ValidationStatus.FAIL
+        responses[1].validation_status = ValidationStatus.PASS
+        responses[1].requires_rework = True
+        db_session.commit()
+
+        area_row = _status_rows(db_session)[(assessment_id, 1)]
+        assert (area_row.reviewed_count, area_row.pass_count, area_row.fail_count) == (2, 1, 1)
+        assert area_row.rework_count == 1
+        assert area_row.first_reviewed_at is not None
+        assert area_row.last_activity_at is not None
+
+        # Deleting the only area-2 response removes that membership
+        db_session.delete(responses[2])
+        db_session.commit()
+
+        assert set(_status_rows(db_session)) == {(assessment_id, 1)}
+
+    def test_refresh_upserts_rows_in_place(self, db_session, areas):
+        assessment_id = _make_assessment(db_session, "Kilo")
+        db_session.add(AssessmentResponse(assessment_id=assessment_id, indicator_id=areas[1][0]))
+        db_session.commit()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(" ".join(statement.split()).upper())
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            # Refreshing an assessment whose rows already exist, as a second
+            # transaction touching the same assessment would
+            assessment_area_status_service.refresh(db_session, [assessment_id])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        db_session.commit()
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        assert len(inserts) == 1 and "ON CONFLICT (ASSESSMENT_ID, GOVERNANCE_AREA_ID) DO UPDATE" in inserts[0]
+        assert not any(s.startswith("DELETE") and "NOT (EXISTS" not in s for s in statements)
+        assert _status_rows(db_session)[(assessment_id, 1)].response_count == 1
+
+    def test_rebuild_matches_maintained_rows(self, db_session, areas):
+        assessment_id = _make_assessment(db_session, "Bravo")
+        db_session.add_all(
+            AssessmentResponse(
+                assessment_id=assessment_id,
+                indicator_id=indicator_id,
+                validation_status=ValidationStatus.PASS,
+            )
+            for indicator_id in areas[1]
+        )
+        db_session.commit()
+        maintained = {
+            key: (row.response_count, row.pass_count, row.reviewed_count)
+            for key, row in _status_rows(db_session).items()
+        }
+
+        assert assessment_area_status_service.rebuild(db_session) == 1
+        rebuilt = {
+            key: (row.response_count, row.pass_count, row.reviewed_count)
+            for key, row in _status_rows(db_session).items()
+        }
+        assert rebuilt == maintained == {(assessment_id, 1): (2, 2, 2)}
+
+
+class TestAssessorReads:
+    @pytest.fixture
+    def submissions(self, db_session, areas):
+        """Three area-1 submissions (one draft) and one area-2-only submission."""
+        ids = {}
+        fail, passed = ValidationStatus.FAIL, ValidationStatus.PASS
+        for name, indicator_ids, verdicts, status in [
+            ("Charlie", areas[1], [fail, fail], AssessmentStatus.SUBMITTED_FOR_REVIEW),
+            ("Delta", areas[1][:1], [fail], AssessmentStatus.VALIDATED),
+            ("Echo", areas[1], [None, None], AssessmentStatus.DRAFT),
+            ("Foxtrot", areas[2], [passed, passed], AssessmentStatus.NEEDS_REWORK),
+        ]:
+            assessment_id = _make_assessment(db_session, name, status)
+            db_session.add_all(
+                AssessmentResponse(
+                    assessment_id=assessment_id,
+                    indicator_id=indicator_id,
+                    validation_status=verdict,
+                )
+                for indicator_id, verdict in zip(indicator_ids, verdicts)
+            )
+            db_session.commit()
+            ids[name] = assessment_id
+        return ids
+
+    def test_queue_reads_status_table_with_pagination(self, db_session, assessor, submissions):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            queue = assessor_service.get_assessor_queue(db_session, assessor)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert [item["assessment_id"] for item in queue] == [
+            submissions["Charlie"],
+            submissions["Delta"],
+        ]
+        assert queue[0]["barangay_name"] == "Charlie"
+        assert not any("assessment_responses" in statement for statement in statements)
+
+        page = assessor_service.get_assessor_queue(db_session, assessor, skip=1, limit=1)
+        assert [item["assessment_id"] for item in page] == [submissions["Delta"]]
+
+    def test_analytics_aggregates(self, db_session, areas, assessor, submissions):
+        analytics = assessor_service.get_analytics(db_session, assessor)
+
+        overview = analytics["overview"]
+        assert (overview["total_assessed"], overview["passed"], overview["failed"]) == (2, 0, 2)
+        assert sum(point["assessed"] for point in overview["trend_series"]) == 2
+        assert analytics["governance_area_name"] == "Area 1"
+
+        hotspots = analytics["hotspots"]
+        assert [(h["indicator_id"], h["failed_count"]) for h in hotspots] == [
+            (areas[1][0], 2),
+            (areas[1][1], 1),
+        ]
+        assert hotspots[0]["barangays"] == ["Charlie", "Delta"]
+        assert hotspots[1]["barangays"] == ["Charlie"]
+
+        workflow = analytics["workflow"]
+        assert workflow["total_reviewed"] == 2
+        assert workflow["counts_by_status"] == {
+            AssessmentStatus.SUBMITTED_FOR_REVIEW.value: 1,
+            AssessmentStatus.VALIDATED.value: 1,
+        }
+        assert workflow["avg_time_to_first_review"] > 0
@@ -0,0 +1,265 @@
+"""
+✅ Assessor Bulk Validation Tests
+
+Tests:
+- Statuses, comments and area statuses are written in one transaction
+- Responses outside the assessor's area (or missing) reject the whole batch
+- One audit event per batch
+- Generated remarks come from indicators loaded once per batch
+- Endpoint wiring and duplicate-item validation
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event, select
+
+from app.db.enums import AreaType, AssessmentStatus, UserRole, ValidationStatus
+from app.db.models.assessment import (
+    Assessment,
+    AssessmentAreaStatus,
+    AssessmentResponse,
+    FeedbackComment,
+)
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from app.schemas.assessor import BulkValidationItem
+from app.services.assessor_service import assessor_service
+from app.services.audit_service import audit_service
+
+
+@pytest.fixture
+def audit_events(monkeypatch):
+    events = []
+    monkeypatch.setattr(audit_service, "log_audit_event", lambda **kwargs: events.append(kwargs))
+    return events
+
+
+@pytest.fixture
+def review(db_session):
+    """Five area-1 responses and one area-2 response on a submitted assessment."""
+    indicators = {}
+    for name in ("Area 1", "Area 2"):
+        area = GovernanceArea(name=name, area_type=AreaType.CORE)
+        db_session.add(area)
+        db_session.flush()
+        indicators[name] = [
+            Indicator(name=f"{name} Indicator {n}", governance_area_id=area.id) for n in range(5)
+        ]
+        db_session.add_all(indicators[name])
+        db_session.flush()
+
+    blgu = User(
+        email="blgu@example.com", name="BLGU", hashed_password="x", role=UserRole.BLGU_USER
+    )
+    db_session.add(blgu)
+    db_session.flush()
+    assessment = Assessment(
+        blgu_user_id=blgu.id,
+        status=AssessmentStatus.SUBMITTED_FOR_REVIEW,
+        submitted_at=datetime(2025, 3, 1),
+    )
+    db_session.add(assessment)
+    db_session.flush()
+    responses = [
+        AssessmentResponse(assessment_id=assessment.id, indicator_id=indicator.id, is_completed=True)
+        for indicator in indicators["Area 1"] + indicators["Area 2"][:1]
+    ]
+    db_session.add_all(responses)
+    assessor = User(
+        email="validator@example.com",
+        name="Validator",
+        hashed_password="x",
+        role=UserRole.VALIDATOR,
+        validator_area_id=indicators["Area 1"][0].governance_area_id,
+    )
+    db_session.add(assessor)
+    db_session.commit()
+    return assessor, assessment, responses
+
+
+def test_bulk_validation_writes_everything_at_once(db_session, review, audit_events):
+    assessor, assessment, responses = review
+    items = [
+        BulkValidationItem(
+            response_id=response.id,
+            validation_status=ValidationStatus.PASS if n % 2 else ValidationStatus.FAIL,
+            public_comment=f"Comment {n}" if n < 3 else None,
+            assessor_remarks="Check the annex" if n == 0 else None,
+        )
+        for n, response in enumerate(responses[:5])
+    ]
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = assessor_service.bulk_validate_assessment_responses(
+            db_session, assessor, items, ip_address="10.0.0.1"
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert result == {
+        "success": True,
+        "message": "Validated 5 assessment responses",
+        "validated_count": 5,
+        "errors": [],
+    }
+    db_session.expire_all()
+    statuses = {r.id: r.validation_status for r in db_session.scalars(select(AssessmentResponse))}
+    assert [statuses[r.id] for r in responses] == [
+        ValidationStatus.FAIL,
+        ValidationStatus.PASS,
+        ValidationStatus.FAIL,
+        ValidationStatus.PASS,
+        ValidationStatus.FAIL,
+        None,
+    ]
+    comments = db_session.scalars(select(FeedbackComment).order_by(FeedbackComment.id)).all()
+    assert [(c.comment, c.is_internal_note) for c in comments] == [
+        ("Comment 0", False),
+        ("Check the annex", True),
+        ("Comment 1", False),
+        ("Comment 2", False),
+    ]
+
+    updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE ASSESSMENT_RESPONSES")]
+    inserts = [s for s in statements if "INSERT INTO feedback_comments" in s]
+    assert len(updates) == 1 and len(inserts) == 1
+
+    area_status = db_session.scalars(
+        select(AssessmentAreaStatus).where(
+            AssessmentAreaStatus.governance_area_id == assessor.validator_area_id
+        )
+    ).one()
+    assert (area_status.reviewed_count, area_status.pass_count, area_status.fail_count) == (5, 2, 3)
+
+    assert len(audit_events) == 1
+    assert audit_events[0]["action"] == "bulk_validate"
+    assert audit_events[0]["ip_address"] == "10.0.0.1"
+    assert audit_events[0]["changes"]["comments"] == 4
+
+
+def test_generated_remarks_load_indicators_once(db_session, review, audit_events):
+    assessor, _, responses = review
+    area_responses = responses[:5]
+    for n, response in enumerate(area_responses):
+        indicator = db_session.get(Indicator, response.indicator_id)
+        indicator.is_auto_calculable = True
+        indicator.calculation_schema = {
+            "condition_groups": [
+                {
+                    "operator": "AND",
+                    "rules": [
+                        {
+                            "rule_type": "PERCENTAGE_THRESHOLD",
+                            "field_id": "completion_rate",
+                            "operator": ">=",
+                            "threshold": 75.0,
+                        }
+                    ],
+                }
+            ],
+            "output_status_on_pass": "Pass",
+            "output_status_on_fail": "Fail",
+        }
+        indicator.remark_schema = {
+            "conditional_remarks": [],
+            "default_template": "{{ indicator_name }}: {{ status }}",
+        }
+        response.response_data = {"completion_rate": 90.0 if n % 2 else 50.0}
+    db_session.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = assessor_service.bulk_validate_assessment_responses(
+            db_session,
+            assessor,
+            [
+                BulkValidationItem(response_id=r.id, validation_status=ValidationStatus.PASS)
+                for r in area_responses
+            ],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert result["success"] is True
+    db_session.expire_all()
+    assert [db_session.get(AssessmentResponse, r.id).generated_remark for r in area_responses] == [
+        f"Area 1 Indicator {n}: {'Pass' if n % 2 else 'Fail'}" for n in range(5)
+    ]
+    indicator_loads = [
+        s for s in statements if s.lstrip().upper().startswith("SELECT INDICATORS.")
+    ]
+    assert len(indicator_loads) == 1
+
+
+def test_out_of_area_or_missing_responses_reject_the_batch(db_session, review, audit_events):
+    assessor, _, responses = review
+    items = [
+        BulkValidationItem(response_id=responses[0].id, validation_status=ValidationStatus.PASS),
+        BulkValidationItem(response_id=responses[5].id, validation_status=ValidationStatus.PASS),
+        BulkValidationItem(response_id=99999, validation_status=ValidationStatus.FAIL),
+    ]
+
+    result = assessor_service.bulk_validate_assessment_responses(db_session, assessor, items)
+
+    assert result["success"] is False and result["validated_count"] == 0
+    assert result["errors"] == [
+        {
+            "response_id": responses[5].id,
+            "error": "Assessment response is not in your governance area",
+        },
+        {"response_id": 99999, "error": "Assessment response not found"},
+    ]
+    db_session.expire_all()
+    assert db_session.get(AssessmentResponse, responses[0].id).validation_status is None
+    assert audit_events == []
+
+
+def test_bulk_validate_endpoint(client, db_session, review, audit_events):
+    from app.api import deps
+
+    assessor, _, responses = review
+    client.app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    client.app.dependency_overrides[deps.get_db] = lambda: db_session
+    try:
+        ok = client.post(
+            "/api/v1/assessor/assessment-responses/bulk-validate",
+            json={
+                "items": [
+                    {"response_id": responses[0].id, "validation_status": "Pass"},
+                    {
+                        "response_id": responses[1].id,
+                        "validation_status": "Fail",
+                        "public_comment": "Missing signature",
+                    },
+                ]
+            },
+        )
+        duplicate = client.post(
+            "/api/v1/assessor/assessment-responses/bulk-validate",
+            json={
+                "items": [
+                    {"response_id": responses[0].id, "validation_status": "Pass"},
+                    {"response_id": responses[0].id, "validation_status": "Fail"},
+                ]
+            },
+        )
+    finally:
+        client.app.dependency_overrides.pop(deps.get_current_area_assessor_user, None)
+        client.app.dependency_overrides.pop(deps.get_db, None)
+
+    assert ok.status_code == 200
+    assert ok.json()["validated_count"] == 2
+    assert duplicate.status_code == 422
@@ -0,0 +1,221 @@
+"""
+🧭 Assessor Queue Tests
+
+Tests:
+- Cursor pages cover the whole queue once, in every sort order
+- Status, barangay, submission date and rework round filters
+- counts_by_status ignores the status filter and honours the others
+- Page size, not queue size, bounds the rows read
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from app.schemas.assessor import AssessorQueueSort
+from app.services.assessor_service import assessor_service
+
+STATUSES = [
+    AssessmentStatus.SUBMITTED_FOR_REVIEW,
+    AssessmentStatus.NEEDS_REWORK,
+    AssessmentStatus.VALIDATED,
+]
+BASE_TIME = datetime(2025, 3, 1)
+
+
+@pytest.fixture
+def queue(db_session):
+    """Twelve area-1 submissions across three barangays, a draft and an area-2 one."""
+    areas = []
+    for name in ("Area 1", "Area 2"):
+        area = GovernanceArea(name=name, area_type=AreaType.CORE)
+        db_session.add(area)
+        db_session.flush()
+        indicator = Indicator(name=f"{name} Indicator", governance_area_id=area.id)
+        db_session.add(indicator)
+        db_session.flush()
+        areas.append((area, indicator))
+
+    barangays = []
+    for n in range(3):
+        barangay = Barangay(name=f"Barangay {n}")
+        db_session.add(barangay)
+        db_session.flush()
+        blgu = User(
+            email=f"blgu{n}@example.com",
+            name=f"BLGU {n}",
+            hashed_password="x",
+            role=UserRole.BLGU_USER,
+            barangay_id=barangay.id,
+        )
+        db_session.add(blgu)
+        db_session.flush()
+        barangays.append((barangay, blgu))
+
+    def submit(n, status, area_index=0, submitted=True):
+        _, blgu = barangays[n % 3]
+        assessment = Assessment(
+            blgu_user_id=blgu.id,
+            status=status,
+            rework_count=n % 2,
+            submitted_at=BASE_TIME + timedelta(days=n) if submitted else None,
+            # Updated in the opposite order to submission
+            updated_at=BASE_TIME + timedelta(days=30 - n),
+        )
+        db_session.add(assessment)
+        db_session.flush()
+        db_session.add(
+            AssessmentResponse(assessment_id=assessment.id, indicator_id=areas[area_index][1].id)
+        )
+        return assessment
+
+    assessments = [submit(n, STATUSES[n % 3]) for n in range(12)]
+    submit(12, AssessmentStatus.DRAFT, submitted=False)
+    submit(13, AssessmentStatus.SUBMITTED_FOR_REVIEW, area_index=1)
+
+    assessor = User(
+        email="validator@example.com",
+        name="Area 1 Validator",
+        hashed_password="x",
+        role=UserRole.VALIDATOR,
+        validator_area_id=areas[0][0].id,
+    )
+    db_session.add(assessor)
+    db_session.commit()
+    return assessor, assessments, [barangay for barangay, _ in barangays]
+
+
+def _all_pages(db_session, assessor, **kwargs):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = assessor_service.get_assessor_queue_page(
+            db_session, assessor, cursor=cursor, limit=5, **kwargs
+        )
+        ids.extend(item["assessment_id"] for item in page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+
+@pytest.mark.parametrize(
+    "sort, key, reverse",
+    [
+        (AssessorQueueSort.SUBMITTED_DESC, "submitted_at", True),
+        (AssessorQueueSort.SUBMITTED_ASC, "submitted_at", False),
+        (AssessorQueueSort.UPDATED_DESC, "updated_at", True),
+        (AssessorQueueSort.UPDATED_ASC, "updated_at", False),
+    ],
+)
+def test_pages_cover_queue_in_sort_order(db_session, queue, sort, key, reverse):
+    assessor, assessments, _ = queue
+
+    ids, pages = _all_pages(db_session, assessor, sort=sort, include_counts=False)
+
+    expected = sorted(assessments, key=lambda a: (getattr(a, key), a.id), reverse=reverse)
+    assert ids == [a.id for a in expected]
+    assert pages == 3
+
+
+def test_filters(db_session, queue):
+    assessor, assessments, barangays = queue
+
+    def ids(**kwargs):
+        return _all_pages(db_session, assessor, **kwargs)[0]
+
+    assert set(ids(statuses=[AssessmentStatus.NEEDS_REWORK])) == {
+        a.id for a in assessments if a.status == AssessmentStatus.NEEDS_REWORK
+    }
+    assert ids(statuses=[AssessmentStatus.DRAFT]) == []
+    assert set(ids(barangay_id=barangays[1].id)) == {a.id for a in assessments[1::3]}
+    assert set(
+        ids(submitted_from=BASE_TIME + timedelta(days=3), submitted_to=BASE_TIME + timedelta(days=5))
+    ) == {a.id for a in assessments[3:6]}
+    assert set(ids(rework_round=1)) == {a.id for a in assessments[1::2]}
+
+
+def test_counts_by_status(db_session, queue):
+    assessor, _, barangays = queue
+
+    page = assessor_service.get_assessor_queue_page(
+        db_session, assessor, limit=2, statuses=[AssessmentStatus.VALIDATED]
+    )
+    by_barangay = assessor_service.get_assessor_queue_page(
+        db_session, assessor, barangay_id=barangays[0].id
+    )
+
+    assert page["counts_by_status"] == {
+        "SUBMITTED_FOR_REVIEW": 4,
+        "NEEDS_REWORK": 4,
+        "VALIDATED": 4,
+    }
+    # Barangay 0 has submissions 0, 3, 6 and 9, all submitted for review
+    assert by_barangay["counts_by_status"] == {
+        "SUBMITTED_FOR_REVIEW": 4,
+        "NEEDS_REWORK": 0,
+        "VALIDATED": 0,
+    }
+
+
+def test_page_reads_only_limit_plus_one_rows(db_session, queue):
+    assessor, _, _ = queue
+    assessor_area_id = assessor.validator_area_id  # load before recording
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assessor_service.get_assessor_queue_page(
+            db_session, assessor, limit=3, include_counts=False
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert assessor_area_id in statements[0][1]
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    assert "LIMIT" in statement and "assessment_responses" not in statement
+    assert 4 in tuple(parameters)
+
+
+def test_queue_page_endpoint(client, db_session, queue):
+    from app.api import deps
+
+    assessor, assessments, _ = queue
+    client.app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    client.app.dependency_overrides[deps.get_db] = lambda: db_session
+    try:
+        first = client.get("/api/v1/assessor/queue/page", params={"limit": 10, "sort": "submitted_at"})
+        second = client.get(
+            "/api/v1/assessor/queue/page",
+            params={
+                "limit": 10,
+                "sort": "submitted_at",
+                "cursor": first.json()["next_cursor"],
+                "include_counts": False,
+            },
+        )
+        bad_cursor = client.get("/api/v1/assessor/queue/page", params={"cursor": "nope"})
+    finally:
+        client.app.dependency_overrides.pop(deps.get_current_area_assessor_user, None)
+        client.app.dependency_overrides.pop(deps.get_db, None)
+
+    assert first.status_code == 200
+    body = first.json()
+    assert [item["assessment_id"] for item in body["items"]] == [a.id for a in assessments[:10]]
+    assert body["items"][0]["barangay_name"] == "Barangay 0"
+    assert sum(body["counts_by_status"].values()) == 12
+    assert [item["assessment_id"] for item in second.json()["items"]] == [
+        a.id for a in assessments[10:]
+    ]
+    assert second.json()["next_cursor"] is None and second.json()["counts_by_status"] is None
+    assert bad_cursor.status_code == 400
@@ -0,0 +1,235 @@
+"""
+📑 Assessor Review Section Tests
+
+Tests:
+- Summary: metadata, per-area counts and per-indicator status lines
+- Summary query count doesn't grow with MOVs and comments
+- Area and indicator details match the legacy details payload
+- 403/404 for other areas and unknown assessments
+- ETag / If-None-Match round trip on the endpoints
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.db.enums import AreaType, AssessmentStatus, UserRole, ValidationStatus
+from app.db.models.assessment import (
+    MOV,
+    Assessment,
+    AssessmentResponse,
+    FeedbackComment,
+)
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from app.services.assessor_service import assessor_service
+
+
+@pytest.fixture
+def review(db_session):
+    """Three area-1 responses (one with MOVs and a comment) and one area-2 response."""
+    areas = []
+    indicators = []
+    for name in ("Area 1", "Area 2"):
+        area = GovernanceArea(name=name, area_type=AreaType.CORE)
+        db_session.add(area)
+        db_session.flush()
+        areas.append(area)
+        count = 3 if name == "Area 1" else 1
+        indicators += [
+            Indicator(name=f"{name} Indicator {n}", governance_area_id=area.id, description="Notes")
+            for n in range(count)
+        ]
+    db_session.add_all(indicators)
+    db_session.flush()
+
+    barangay = Barangay(name="Barangay 1")
+    db_session.add(barangay)
+    db_session.flush()
+    blgu = User(
+        email="blgu@example.com",
+        name="BLGU",
+        hashed_password="x",
+        role=UserRole.BLGU_USER,
+        barangay_id=barangay.id,
+    )
+    assessor = User(
+        email="validator@example.com",
+        name="Validator",
+        hashed_password="x",
+        role=UserRole.VALIDATOR,
+        validator_area_id=areas[0].id,
+    )
+    db_session.add_all([blgu, assessor])
+    db_session.flush()
+    assessment = Assessment(
+        blgu_user_id=blgu.id,
+        status=AssessmentStatus.SUBMITTED_FOR_REVIEW,
+        submitted_at=datetime(2025, 3, 1),
+    )
+    db_session.add(assessment)
+    db_session.flush()
+    responses = [
+        AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=indicator.id,
+            is_completed=True,
+            response_data={"answer": "yes"},
+        )
+        for indicator in indicators
+    ]
+    responses[0].validation_status = ValidationStatus.PASS
+    db_session.add_all(responses)
+    db_session.flush()
+    _add_movs(db_session, responses[0], 2)
+    db_session.add(
+        FeedbackComment(
+            comment="Looks good", response_id=responses[0].id, assessor_id=assessor.id
+        )
+    )
+    db_session.commit()
+    return assessor, assessment, areas, responses
+
+
+def _add_movs(db_session, response, count):
+    db_session.add_all(
+        MOV(
+            filename=f"mov-{response.id}-{n}.pdf",
+            original_filename=f"MOV {n}.pdf",
+            file_size=100,
+            content_type="application/pdf",
+            storage_path=f"movs/{response.id}/{n}.pdf",
+            response_id=response.id,
+        )
+        for n in range(count)
+    )
+
+
+def _count_queries(db_session, call):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def test_summary_has_counts_and_indicator_statuses(db_session, review):
+    assessor, assessment, areas, responses = review
+
+    summary = assessor_service.get_assessment_review_summary(db_session, assessment.id, assessor)
+
+    assert summary["assessment"]["id"] == assessment.id
+    assert summary["assessment"]["blgu_user"]["barangay"]["name"] == "Barangay 1"
+    assert [(a["governance_area_id"], a["response_count"], a["pass_count"]) for a in summary["areas"]] == [
+        (areas[0].id, 3, 1),
+        (areas[1].id, 1, 0),
+    ]
+    assert [i["response_id"] for i in summary["indicators"]] == [r.id for r in responses[:3]]
+    first = summary["indicators"][0]
+    assert first["validation_status"] == "Pass"
+    assert (first["mov_count"], first["comment_count"]) == (2, 1)
+    assert "movs" not in first and "response_data" not in first
+
+
+def test_summary_query_count_is_independent_of_movs(db_session, review):
+    assessor, assessment, _, responses = review
+    assessor_id = assessor.id
+
+    def summary():
+        db_session.expire_all()
+        assessor_service.get_assessment_review_summary(
+            db_session, assessment.id, db_session.get(User, assessor_id)
+        )
+
+    before = _count_queries(db_session, summary)
+    for response in responses:
+        _add_movs(db_session, response, 20)
+    db_session.commit()
+
+    assert _count_queries(db_session, summary) == before
+
+
+def test_area_and_indicator_details_match_legacy_payload(db_session, review):
+    assessor, assessment, areas, responses = review
+
+    legacy = assessor_service.get_assessment_details_for_assessor(
+        db_session, assessment.id, assessor
+    )
+    area = assessor_service.get_assessment_area_details(
+        db_session, assessment.id, areas[0].id, assessor
+    )
+    indicator = assessor_service.get_assessment_indicator_details(
+        db_session, assessment.id, responses[0].indicator_id, assessor
+    )
+
+    assert area["responses"] == legacy["assessment"]["responses"]
+    assert indicator["response"] == legacy["assessment"]["responses"][0]
+    assert len(indicator["response"]["movs"]) == 2
+    assert indicator["response"]["feedback_comments"][0]["assessor"]["name"] == "Validator"
+
+
+def test_sections_enforce_assessor_area(db_session, review):
+    assessor, assessment, areas, responses = review
+
+    checks = [
+        lambda: assessor_service.get_assessment_review_summary(db_session, 99999, assessor),
+        lambda: assessor_service.get_assessment_area_details(
+            db_session, assessment.id, areas[1].id, assessor
+        ),
+        lambda: assessor_service.get_assessment_indicator_details(
+            db_session, assessment.id, responses[3].indicator_id, assessor
+        ),
+        lambda: assessor_service.get_assessment_indicator_details(
+            db_session, assessment.id, 99999, assessor
+        ),
+    ]
+    codes = []
+    for check in checks:
+        with pytest.raises(HTTPException) as exc_info:
+            check()
+        codes.append(exc_info.value.status_code)
+
+    assert codes == [404, 403, 403, 404]
+
+    assessor.validator_area_id = None
+    with pytest.raises(HTTPException) as exc_info:
+        assessor_service.get_assessment_review_summary(db_session, assessment.id, assessor)
+    assert exc_info.value.status_code == 403
+
+
+def test_section_endpoints_support_etags(client, db_session, review):
+    from app.api import deps
+
+    assessor, assessment, areas, responses = review
+    client.app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    client.app.dependency_overrides[deps.get_db] = lambda: db_session
+    base = f"/api/v1/assessor/assessments/{assessment.id}"
+    try:
+        summary = client.get(f"{base}/summary")
+        area = client.get(f"{base}/areas/{areas[0].id}")
+        indicator = client.get(f"{base}/indicators/{responses[0].indicator_id}")
+        etag = summary.headers["etag"]
+        unchanged = client.get(f"{base}/summary", headers={"If-None-Match": etag})
+
+        responses[1].requires_rework = True
+        db_session.commit()
+        changed = client.get(f"{base}/summary", headers={"If-None-Match": etag})
+    finally:
+        client.app.dependency_overrides.pop(deps.get_current_area_assessor_user, None)
+        client.app.dependency_overrides.pop(deps.get_db, None)
+
+    assert summary.status_code == area.status_code == indicator.status_code == 200
+    assert summary.headers["cache-control"] == "private, no-cache"
+    assert len(area.json()["responses"]) == 3
+    assert unchanged.status_code == 304 and unchanged.content == b""
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
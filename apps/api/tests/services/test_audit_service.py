@@ -0,0 +1,161 @@
+"""
+🔒 Audit Log Writer Tests
+
+Covers the write-behind audit pipeline:
+- Events are written on the writer's own session, never the caller's
+- Events are written in batches (one INSERT + commit per batch)
+- A full queue makes the caller flush inline instead of dropping events
+- stop() drains everything; failed batches are retried, then dropped
+"""
+
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models.admin import AuditLog
+from app.db.models.barangay import Barangay
+from app.services.audit_service import AuditLogWriter, audit_service
+
+
+def _sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def _event(i=0, user_id=1):
+    return {
+        "user_id": user_id,
+        "entity_type": "indicator",
+        "entity_id": i,
+        "action": "update",
+        "changes": {"name": {"before": "a", "after": "b"}},
+        "ip_address": "127.0.0.1",
+    }
+
+
+@pytest.fixture
+def session_factory(db_session, mlgoo_user):
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+
+
+@pytest.fixture
+def writer(session_factory):
+    # Long interval: only explicit flushes (or a full batch) write anything
+    writer = AuditLogWriter(
+        session_factory=session_factory, max_queue_size=1000, batch_size=500, flush_interval=3600
+    )
+    yield writer
+    writer.stop()
+
+
+def test_events_are_written_in_batches(writer, session_factory, mlgoo_user):
+    inserts = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO audit_logs"):
+            inserts.append(statement)
+
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        writer._batch_size = 400
+        for i in range(900):
+            writer.enqueue(_event(i, mlgoo_user.id))
+        writer.stop()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    db = session_factory()
+    try:
+        assert db.query(AuditLog).count() == 900
+    finally:
+        db.close()
+    assert len(inserts) == 3
+    assert writer.pending == 0
+
+
+def test_log_audit_event_does_not_commit_callers_session(
+    db_session, writer, session_factory, mlgoo_user, monkeypatch
+):
+    audit_module = __import__("sys").modules[AuditLogWriter.__module__]
+    monkeypatch.setattr(audit_module, "audit_log_writer", writer)
+
+    # Caller has half-finished work in its session
+    db_session.add(Barangay(name="Uncommitted Barangay"))
+    audit_service.log_audit_event(
+        user_id=mlgoo_user.id, entity_type="barangay", entity_id=None, action="create"
+    )
+    writer.flush()
+    db_session.rollback()
+
+    db = session_factory()
+    try:
+        assert db.query(AuditLog).filter_by(entity_type="barangay").count() == 1
+        assert db.query(Barangay).filter_by(name="Uncommitted Barangay").count() == 0
+    finally:
+        db.close()
+
+
+def test_full_queue_applies_backpressure_without_dropping(session_factory, mlgoo_user):
+    writer = AuditLogWriter(
+        session_factory=session_factory, max_queue_size=5, batch_size=100, flush_interval=3600
+    )
+    before = _sample("vantage_audit_backpressure_total")
+    try:
+        for i in range(12):
+            writer.enqueue(_event(i, mlgoo_user.id))
+
+        assert _sample("vantage_audit_backpressure_total") - before >= 1
+        assert writer.pending <= 5
+    finally:
+        writer.stop()
+
+    db = session_factory()
+    try:
+        assert db.query(AuditLog).count() == 12
+    finally:
+        db.close()
+
+
+def test_background_thread_flushes_on_interval(session_factory, mlgoo_user):
+    writer = AuditLogWriter(session_factory=session_factory, flush_interval=0.05)
+    try:
+        writer.enqueue(_event(1, mlgoo_user.id))
+        deadline = time.monotonic() + 2
+        while writer.pending and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        db = session_factory()
+        try:
+            for _ in range(50):
+                if db.query(AuditLog).count() == 1:
+                    break
+                time.sleep(0.02)
+            assert db.query(AuditLog).count() == 1
+        finally:
+            db.close()
+    finally:
+        writer.stop()
+
+
+def test_failed_batches_are_retried_then_dropped(tmp_path):
+    # No tables in this database, so every INSERT fails
+    broken = sessionmaker(bind=create_engine(f"sqlite:///{tmp_path / 'empty.db'}"))
+    writer = AuditLogWriter(session_factory=broken, batch_size=10, flush_interval=3600)
+    dropped_before = _sample("vantage_audit_events_total", {"outcome": "dropped"})
+
+    try:
+        writer.enqueue(_event())
+        writer.enqueue(_event())
+
+        assert writer.flush() == 0
+        assert writer.pending == 2  # requeued for retry
+        writer.flush()
+        writer.flush()
+        assert writer.pending == 0
+    finally:
+        writer.stop()
+
+    assert _sample("vantage_audit_events_total", {"outcome": "dropped"}) - dropped_before == 2
@@ -0,0 +1,283 @@
+"""
+🧪 Calculation Sandbox Service Tests
+
+Tests:
+- Compiled rules agree with the intelligence service rule engine
+- Indicator what-if: distributions, deltas and transitions vs the saved schema
+- Cycle scoping, draft exclusion, evaluation errors and the time budget
+- BBI what-if over recorded indicator statuses
+- Background replay task
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from app.db.enums import AreaType, AssessmentStatus, UserRole, ValidationStatus
+from app.db.models.admin import AssessmentCycle
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.barangay import Barangay
+from app.db.models.bbi import BBI
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from app.schemas.calculation_schema import CalculationSchema
+from app.services import calculation_sandbox_service as sandbox
+from app.services.calculation_sandbox_service import (
+    calculation_sandbox_service,
+    compile_calculation_schema,
+)
+from app.services.intelligence_service import intelligence_service
+from app.workers.calculation_sandbox import run_what_if
+
+
+def _threshold_schema(threshold: float) -> dict:
+    return {
+        "condition_groups": [
+            {
+                "operator": "AND",
+                "rules": [
+                    {
+                        "rule_type": "PERCENTAGE_THRESHOLD",
+                        "field_id": "completion_rate",
+                        "operator": ">=",
+                        "threshold": threshold,
+                    }
+                ],
+            }
+        ]
+    }
+
+
+MIXED_SCHEMA = {
+    "condition_groups": [
+        {
+            "operator": "OR",
+            "rules": [
+                {
+                    "rule_type": "AND_ALL",
+                    "conditions": [
+                        {
+                            "rule_type": "COUNT_THRESHOLD",
+                            "field_id": "documents",
+                            "operator": ">=",
+                            "threshold": 2,
+                        },
+                        {
+                            "rule_type": "MATCH_VALUE",
+                            "field_id": "status",
+                            "operator": "contains",
+                            "expected_value": "ok",
+                        },
+                    ],
+                },
+                {
+                    "rule_type": "BBI_FUNCTIONALITY_CHECK",
+                    "bbi_id": 3,
+                    "expected_status": "Functional",
+                },
+            ],
+        },
+        {
+            "operator": "AND",
+            "rules": [
+                {
+                    "rule_type": "MATCH_VALUE",
+                    "field_id": "status",
+                    "operator": "not_contains",
+                    "expected_value": "revoked",
+                }
+            ],
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize("schema", [_threshold_schema(75), MIXED_SCHEMA])
+def test_compiled_schema_matches_rule_engine(schema):
+    rng = random.Random(11)
+    parsed = CalculationSchema(**schema)
+    compiled = compile_calculation_schema(parsed)
+
+    for _ in range(300):
+        data = {
+            "completion_rate": rng.choice([0, 74.9, 75, 100, "80", "n/a", None]),
+            "documents": rng.choice([[], ["a"], ["a", "b"], "a,b"]),
+            "status": rng.choice(["ok", "not ok", "revoked ok", 5, ["ok"]]),
+            "bbi_3_status": rng.choice(["Functional", "Non-Functional"]),
+        }
+        for key in list(data):
+            if rng.random() < 0.1:
+                del data[key]
+
+        try:
+            expected = (
+                parsed.output_status_on_pass
+                if intelligence_service.evaluate_calculation_schema(parsed, data)
+                else parsed.output_status_on_fail
+            )
+        except ValueError:
+            with pytest.raises(ValueError):
+                compiled(data)
+            continue
+        assert compiled(data) == expected, data
+
+
+@pytest.fixture
+def scenario(db_session):
+    """An indicator (>= 75 to pass) answered by five barangays, plus one draft."""
+    area = GovernanceArea(name="Financial Administration", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.flush()
+    indicator = Indicator(
+        name="Budget utilization",
+        governance_area_id=area.id,
+        calculation_schema=_threshold_schema(75),
+        is_auto_calculable=True,
+    )
+    db_session.add(indicator)
+    db_session.flush()
+
+    rates = [60, 76, 78, 85, 95, 90]
+    assessments = []
+    for i, rate in enumerate(rates):
+        barangay = Barangay(name=f"Barangay {i}")
+        db_session.add(barangay)
+        db_session.flush()
+        user = User(
+            email=f"blgu{i}@example.com",
+            name=f"BLGU {i}",
+            hashed_password="x",
+            role=UserRole.BLGU_USER,
+            barangay_id=barangay.id,
+            is_active=True,
+        )
+        db_session.add(user)
+        db_session.flush()
+        is_draft = i == len(rates) - 1
+        assessment = Assessment(
+            blgu_user_id=user.id,
+            status=AssessmentStatus.DRAFT if is_draft else AssessmentStatus.SUBMITTED,
+            submitted_at=None if is_draft else datetime(2025, 3, 1),
+        )
+        db_session.add(assessment)
+        db_session.flush()
+        db_session.add(
+            AssessmentResponse(
+                assessment_id=assessment.id,
+                indicator_id=indicator.id,
+                response_data={"completion_rate": rate},
+                validation_status=ValidationStatus.PASS if rate >= 75 else ValidationStatus.FAIL,
+            )
+        )
+        assessments.append(assessment)
+    db_session.commit()
+    return indicator, assessments
+
+
+def test_indicator_what_if_reports_distribution_deltas(db_session, scenario):
+    indicator, _ = scenario
+
+    result = calculation_sandbox_service.evaluate_indicator_what_if(
+        db_session, indicator.id, CalculationSchema(**_threshold_schema(80))
+    )
+
+    assert result["evaluated"] == 5  # the draft assessment is excluded
+    assert result["baseline"] == "calculation_schema"
+    assert result["current"] == {"Pass": 4, "Fail": 1}
+    assert result["draft"] == {"Pass": 2, "Fail": 3}
+    assert result["delta"] == {"Pass": -2, "Fail": 2}
+    assert result["transitions"] == {"Pass -> Fail": 2}
+    assert sorted(s["barangay_name"] for s in result["changed_samples"]) == [
+        "Barangay 1",
+        "Barangay 2",
+    ]
+    assert result["truncated"] is False
+
+
+def test_indicator_without_schema_compares_with_recorded_statuses(db_session, scenario):
+    indicator, _ = scenario
+    indicator.calculation_schema = None
+    db_session.commit()
+
+    result = calculation_sandbox_service.evaluate_indicator_what_if(
+        db_session, indicator.id, CalculationSchema(**_threshold_schema(90))
+    )
+
+    assert result["baseline"] == "validation_status"
+    assert result["transitions"] == {"Pass -> Fail": 3}
+
+
+def test_cycle_scope_and_evaluation_errors(db_session, scenario):
+    indicator, assessments = scenario
+    assessments[0].submitted_at = datetime(2024, 11, 1)
+    assessments[1].responses[0].response_data = {"other": 1}
+    cycle = AssessmentCycle(
+        name="SGLGB 2025",
+        year=2025,
+        phase1_deadline=datetime(2025, 4, 1),
+        rework_deadline=datetime(2025, 5, 1),
+        phase2_deadline=datetime(2025, 6, 1),
+        calibration_deadline=datetime(2025, 7, 1),
+    )
+    db_session.add(cycle)
+    db_session.commit()
+
+    result = calculation_sandbox_service.evaluate_indicator_what_if(
+        db_session, indicator.id, CalculationSchema(**_threshold_schema(75)), cycle_id=cycle.id
+    )
+
+    assert result["evaluated"] == 4
+    assert result["current"]["Error"] == 1 and result["draft"]["Error"] == 1
+    assert result["changed"] == 0
+    assert "completion_rate" in result["error_samples"][0]["error"]
+
+
+def test_time_budget_stops_evaluation(db_session, scenario, monkeypatch):
+    indicator, _ = scenario
+    monkeypatch.setattr(sandbox, "_BUDGET_CHECK_EVERY", 1)
+
+    result = calculation_sandbox_service.evaluate_indicator_what_if(
+        db_session, indicator.id, CalculationSchema(**_threshold_schema(80)), time_budget=0
+    )
+
+    assert result["truncated"] is True
+    assert result["evaluated"] == 1
+
+
+def test_bbi_what_if_uses_recorded_statuses(db_session, scenario):
+    indicator, _ = scenario
+    bbi = BBI(
+        name="Barangay Development Council",
+        abbreviation="BDC",
+        governance_area_id=indicator.governance_area_id,
+        mapping_rules={
+            "operator": "AND",
+            "conditions": [{"indicator_id": indicator.id, "required_status": "Pass"}],
+        },
+    )
+    db_session.add(bbi)
+    db_session.commit()
+
+    result = calculation_sandbox_service.evaluate_bbi_what_if(
+        db_session,
+        bbi.id,
+        {
+            "operator": "AND",
+            "conditions": [{"indicator_id": indicator.id, "required_status": "Fail"}],
+        },
+    )
+
+    assert result["current"] == {"FUNCTIONAL": 4, "NON_FUNCTIONAL": 1}
+    assert result["draft"] == {"FUNCTIONAL": 1, "NON_FUNCTIONAL": 4}
+    assert result["transitions"] == {"FUNCTIONAL -> NON_FUNCTIONAL": 4, "NON_FUNCTIONAL -> FUNCTIONAL": 1}
+
+
+def test_background_task_runs_the_same_replay(db_session, scenario):
+    indicator, _ = scenario
+
+    result = run_what_if("indicator", indicator.id, _threshold_schema(80), db=db_session)
+    missing = run_what_if("indicator", 99999, _threshold_schema(80), db=db_session)
+
+    assert result["success"] is True and result["delta"] == {"Pass": -2, "Fail": 2}
+    assert missing == {"success": False, "error": "Indicator with ID 99999 not found"}
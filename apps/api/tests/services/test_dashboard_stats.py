@@ -0,0 +1,168 @@
+"""
+📈 Dashboard Stats Tests
+
+Tests:
+- User and assessment stats are computed with exactly one query
+- Cached stats are reused until a commit writes the underlying tables
+- ORM flushes and bulk DML statements both invalidate; rollbacks don't
+- TTL expiry and invalidation racing a computation
+"""
+
+from sqlalchemy import event, insert
+
+from app.core.table_cache import TableCache, invalidate_tables
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.db.models.user import User
+from app.services.assessment_service import assessment_service
+from app.services.user_service import user_service
+
+
+def _count_queries(db_session, call):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def _user(email, role=UserRole.BLGU_USER, **fields):
+    return User(email=email, name=email, hashed_password="x", role=role, **fields)
+
+
+def test_user_stats_single_query_and_cached(db_session):
+    db_session.add_all(
+        [
+            _user("a@example.com", must_change_password=True),
+            _user("b@example.com", must_change_password=False),
+            _user("c@example.com", is_active=False),
+            _user("d@example.com", role=UserRole.ASSESSOR, must_change_password=False),
+        ]
+    )
+    db_session.commit()
+
+    stats, queries = _count_queries(db_session, lambda: user_service.get_user_stats(db_session))
+    _, cached_queries = _count_queries(db_session, lambda: user_service.get_user_stats(db_session))
+
+    assert queries == 1 and cached_queries == 0
+    assert stats == {
+        "total_users": 4,
+        "active_users": 3,
+        "inactive_users": 1,
+        "users_need_password_change": 1,
+        "users_by_role": {UserRole.BLGU_USER: 3, UserRole.ASSESSOR: 1},
+    }
+
+
+def test_user_stats_invalidated_by_commits_not_rollbacks(db_session):
+    assert user_service.get_user_stats(db_session)["total_users"] == 0
+
+    db_session.add(_user("rolled-back@example.com"))
+    db_session.flush()
+    db_session.rollback()
+    _, queries = _count_queries(db_session, lambda: user_service.get_user_stats(db_session))
+    assert queries == 0
+
+    db_session.add(_user("a@example.com"))
+    db_session.commit()
+    assert user_service.get_user_stats(db_session)["total_users"] == 1
+
+    db_session.execute(
+        insert(User).values(
+            email="bulk@example.com", name="Bulk", hashed_password="x", role=UserRole.ASSESSOR
+        )
+    )
+    db_session.commit()
+    assert user_service.get_user_stats(db_session)["total_users"] == 2
+
+    user = db_session.query(User).filter(User.email == "a@example.com").one()
+    user.is_active = False
+    db_session.commit()
+    assert user_service.get_user_stats(db_session)["active_users"] == 1
+
+
+def test_assessment_stats_single_query(db_session):
+    area = GovernanceArea(name="Area", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.flush()
+    indicators = [Indicator(name=f"Indicator {n}", governance_area_id=area.id) for n in range(3)]
+    blgu = _user("blgu@example.com")
+    db_session.add_all(indicators + [blgu])
+    db_session.flush()
+    assessments = [
+        Assessment(blgu_user_id=blgu.id, status=AssessmentStatus.DRAFT),
+        Assessment(blgu_user_id=blgu.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW),
+        Assessment(blgu_user_id=blgu.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW),
+    ]
+    db_session.add_all(assessments)
+    db_session.flush()
+    db_session.add_all(
+        [
+            AssessmentResponse(
+                assessment_id=assessments[1].id, indicator_id=indicator.id, is_completed=True
+            )
+            for indicator in indicators
+        ]
+        + [
+            AssessmentResponse(
+                assessment_id=assessments[2].id,
+                indicator_id=indicators[0].id,
+                is_completed=False,
+                requires_rework=True,
+            )
+        ]
+    )
+    db_session.commit()
+
+    stats, queries = _count_queries(
+        db_session, lambda: assessment_service.get_assessment_stats(db_session)
+    )
+
+    assert queries == 1
+    assert stats == {
+        "total_assessments": 3,
+        "assessments_by_status": {
+            AssessmentStatus.DRAFT: 1,
+            AssessmentStatus.SUBMITTED_FOR_REVIEW: 2,
+        },
+        "total_responses": 4,
+        "completed_responses": 3,
+        "responses_requiring_rework": 1,
+    }
+
+    db_session.query(AssessmentResponse).filter(
+        AssessmentResponse.assessment_id == assessments[2].id
+    ).update({AssessmentResponse.requires_rework: False})
+    db_session.commit()
+    assert assessment_service.get_assessment_stats(db_session)["responses_requiring_rework"] == 0
+
+
+def test_table_cache_ttl_and_racing_invalidation():
+    cache = TableCache("test_table_cache", {"test_table_cache_rows"}, ttl_seconds=60)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    def compute_during_commit():
+        invalidate_tables({"test_table_cache_rows"})
+        return compute()
+
+    assert cache.get("k", compute_during_commit) == {"value": 1}
+    assert cache.get("k", compute) == {"value": 2}
+    assert cache.get("k", compute) == {"value": 2}
+
+    cache.get("k", compute)["value"] = 99
+    assert cache.get("k", compute) == {"value": 2}
+
+    cache.ttl_seconds = 0
+    assert cache.get("k", compute) == {"value": 3}
@@ -0,0 +1,203 @@
+"""
+⏰ Deadline Reminder & Notification Delivery Tests
+
+Tests:
+- Reminders for pending barangays close to a deadline
+- Overdue notices and the MLGOO-DILG escalation digest
+- Rework reminders only for barangays whose assessment was sent back
+- Idempotent delivery (one message per key, failed sends queued for retry)
+- Daily Celery beat schedule
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.celery_app import celery_app
+from app.db.enums import AssessmentStatus, UserRole
+from app.db.models.admin import AssessmentCycle
+from app.db.models.assessment import Assessment
+from app.db.models.barangay import Barangay
+from app.db.models.notification import NotificationDelivery
+from app.db.models.user import User
+from app.services.deadline_reminder_service import deadline_reminder_service
+from app.services.deadline_service import deadline_service
+from app.services.notification_service import notification_service
+from app.services.notification_transport import LoggingTransport, NotificationTransport
+
+
+@pytest.fixture(autouse=True)
+def fresh_status_cache():
+    deadline_service.clear_status_cache()
+    yield
+    deadline_service.clear_status_cache()
+
+
+@pytest.fixture
+def people(db_session):
+    """Two barangays with one BLGU user each (Bravo has submitted) and one admin."""
+    users = {}
+    for name in ("Alpha", "Bravo"):
+        barangay = Barangay(name=f"Barangay {name}")
+        db_session.add(barangay)
+        db_session.flush()
+        user = User(
+            email=f"{name.lower()}@example.com",
+            name=f"{name} Secretary",
+            hashed_password="x",
+            role=UserRole.BLGU_USER,
+            barangay_id=barangay.id,
+            is_active=True,
+        )
+        db_session.add(user)
+        users[name] = user
+    users["admin"] = User(
+        email="mlgoo@example.com",
+        name="MLGOO",
+        hashed_password="x",
+        role=UserRole.MLGOO_DILG,
+        is_active=True,
+    )
+    db_session.add(users["admin"])
+    db_session.flush()
+    db_session.add(
+        Assessment(
+            blgu_user_id=users["Bravo"].id,
+            status=AssessmentStatus.SUBMITTED,
+            submitted_at=datetime.utcnow(),
+        )
+    )
+    db_session.commit()
+    return users
+
+
+def _cycle(db_session, phase1_in: timedelta):
+    now = datetime.now(timezone.utc)
+    cycle = AssessmentCycle(
+        name="SGLGB Test",
+        year=now.year,
+        phase1_deadline=now + phase1_in,
+        rework_deadline=now + phase1_in + timedelta(days=10),
+        phase2_deadline=now + phase1_in + timedelta(days=20),
+        calibration_deadline=now + phase1_in + timedelta(days=30),
+        is_active=True,
+    )
+    db_session.add(cycle)
+    db_session.commit()
+    return cycle
+
+
+def test_pending_barangays_near_deadline_are_reminded(db_session, people):
+    _cycle(db_session, phase1_in=timedelta(days=2))
+
+    messages = deadline_reminder_service.plan(db_session)
+
+    assert [(m.recipient, m.kind) for m in messages] == [("alpha@example.com", "deadline_reminder")]
+    assert "Phase 1 submission: due" in messages[0].body
+
+
+def test_nothing_is_planned_far_from_deadlines(db_session, people):
+    _cycle(db_session, phase1_in=timedelta(days=20))
+
+    assert deadline_reminder_service.plan(db_session) == []
+
+
+def test_overdue_barangays_are_escalated(db_session, people):
+    _cycle(db_session, phase1_in=-timedelta(days=1))
+
+    messages = {m.recipient: m for m in deadline_reminder_service.plan(db_session)}
+
+    assert set(messages) == {"alpha@example.com", "mlgoo@example.com"}
+    assert messages["alpha@example.com"].kind == "deadline_overdue"
+    digest = messages["mlgoo@example.com"]
+    assert digest.kind == "deadline_escalation"
+    assert "- Barangay Alpha" in digest.body
+    assert "Barangay Bravo" not in digest.body
+
+
+def test_rework_reminders_follow_assessment_status(db_session, people):
+    # Alpha never submitted; Bravo's submission was sent back for rework.
+    # Phase 1 closed long enough ago that it is no longer escalated.
+    db_session.query(Assessment).update({"status": AssessmentStatus.REWORK})
+    db_session.commit()
+    cycle = _cycle(db_session, phase1_in=-timedelta(days=8))
+
+    messages = deadline_reminder_service.plan(db_session)
+
+    assert [(m.recipient, m.kind) for m in messages] == [("bravo@example.com", "deadline_reminder")]
+    assert "Rework submission: due" in messages[0].body
+
+    cycle.rework_deadline = datetime.now(timezone.utc) - timedelta(days=1)
+    db_session.commit()
+
+    messages = {m.recipient: m for m in deadline_reminder_service.plan(db_session)}
+
+    assert set(messages) == {"bravo@example.com", "mlgoo@example.com"}
+    assert messages["bravo@example.com"].kind == "deadline_overdue"
+    digest = messages["mlgoo@example.com"].body
+    assert "Rework submission" in digest and "- Barangay Bravo" in digest
+    assert "Barangay Alpha" not in digest
+
+
+def test_delivery_is_idempotent(db_session, people):
+    _cycle(db_session, phase1_in=-timedelta(days=1))
+    messages = deadline_reminder_service.plan(db_session)
+
+    first = notification_service.deliver(db_session, messages, transport=LoggingTransport())
+    second = notification_service.deliver(db_session, messages, transport=LoggingTransport())
+
+    assert first == {"sent": 2, "retrying": 0, "failed": 0, "skipped": 0}
+    assert second == {"sent": 0, "retrying": 0, "failed": 0, "skipped": 2}
+    assert notification_service.filter_unsent(db_session, messages) == []
+    assert {row.status for row in db_session.query(NotificationDelivery)} == {"sent"}
+
+
+def test_transport_failure_queues_retries(db_session, people):
+    class BrokenTransport(NotificationTransport):
+        name = "broken"
+
+        def send(self, messages):
+            raise ConnectionError("SMTP server unavailable")
+
+    _cycle(db_session, phase1_in=timedelta(days=1))
+    messages = deadline_reminder_service.plan(db_session)
+
+    result = notification_service.deliver(db_session, messages, transport=BrokenTransport())
+
+    assert result == {"sent": 0, "retrying": len(messages), "failed": 0, "skipped": 0}
+    rows = db_session.query(NotificationDelivery).all()
+    assert {(row.status, row.attempts) for row in rows} == {("retry", 1)}
+    assert rows[0].last_error == "SMTP server unavailable"
+    assert rows[0].body == messages[0].body
+    # The scheduled run does not resend them before their retry is due
+    assert notification_service.deliver(db_session, messages)["skipped"] == len(messages)
+
+
+def test_messages_are_rendered_once_per_barangay(db_session, people):
+    db_session.add(
+        User(
+            email="alpha2@example.com",
+            name="Alpha Treasurer",
+            hashed_password="x",
+            role=UserRole.BLGU_USER,
+            barangay_id=people["Alpha"].barangay_id,
+            is_active=True,
+        )
+    )
+    db_session.commit()
+    _cycle(db_session, phase1_in=timedelta(days=2))
+
+    messages = deadline_reminder_service.plan(db_session)
+
+    assert [m.recipient for m in messages] == ["alpha@example.com", "alpha2@example.com"]
+    assert messages[0].body is messages[1].body
+    assert "Dear Barangay Alpha BLGU Team" in messages[0].body
+    assert len({m.idempotency_key for m in messages}) == 2
+
+
+def test_reminders_are_scheduled_daily():
+    entry = celery_app.conf.beat_schedule["send-deadline-reminders"]
+
+    assert entry["task"] == "notifications.send_deadline_reminders"
+    assert entry["task"] in celery_app.tasks
+    assert "notifications.retry_notifications" in celery_app.tasks
@@ -0,0 +1,180 @@
+"""
+Tests for HealthService
+
+Covers the cached health snapshot used by /health, /health/live and
+/health/ready:
+- Probes run at most once per TTL
+- Concurrent requests share a single refresh
+- Readiness honours REQUIRE_ALL_CONNECTIONS
+- Blocking probes run concurrently in threads, with a timeout
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.db import base as db_base
+from app.services import health_service as health_module
+from app.services.health_service import HealthService
+
+
+def _connections(database=True, supabase=True):
+    return {
+        "overall_status": "healthy" if database and supabase else "unhealthy",
+        "database": {"connected": database},
+        "supabase": {"connected": supabase},
+        "timestamp": None,
+    }
+
+
+@pytest.fixture
+def probe_calls(monkeypatch):
+    """Replace the real connection checks with a counting fake."""
+    calls = {"count": 0, "result": _connections()}
+
+    async def fake_check_all_connections():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return dict(calls["result"])
+
+    monkeypatch.setattr(health_module, "check_all_connections", fake_check_all_connections)
+    return calls
+
+
+class TestHealthCache:
+    """Probe results are reused within the TTL."""
+
+    def test_second_call_within_ttl_uses_cache(self, probe_calls, monkeypatch):
+        monkeypatch.setattr(health_module.settings, "HEALTH_CHECK_CACHE_TTL_SECONDS", 60)
+        service = HealthService()
+
+        async def run():
+            first = await service.get_health_status()
+            second = await service.get_health_status()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert probe_calls["count"] == 1
+        assert first["timestamp"] == second["timestamp"]
+        assert second["cache_age_seconds"] >= 0
+
+    def test_stale_cache_is_refreshed(self, probe_calls, monkeypatch):
+        monkeypatch.setattr(health_module.settings, "HEALTH_CHECK_CACHE_TTL_SECONDS", 0)
+        service = HealthService()
+
+        async def run():
+            await service.get_health_status()
+            await service.get_health_status()
+
+        asyncio.run(run())
+        assert probe_calls["count"] == 2
+
+    def test_concurrent_requests_share_one_refresh(self, probe_calls, monkeypatch):
+        monkeypatch.setattr(health_module.settings, "HEALTH_CHECK_CACHE_TTL_SECONDS", 60)
+        service = HealthService()
+
+        async def run():
+            return await asyncio.gather(*(service.get_health_status() for _ in range(20)))
+
+        results = asyncio.run(run())
+
+        assert probe_calls["count"] == 1
+        assert all(r["overall_status"] == "healthy" for r in results)
+
+    def test_force_refresh_bypasses_cache(self, probe_calls, monkeypatch):
+        monkeypatch.setattr(health_module.settings, "HEALTH_CHECK_CACHE_TTL_SECONDS", 60)
+        service = HealthService()
+
+        async def run():
+            await service.get_health_status()
+            await service.get_health_status(force_refresh=True)
+
+        asyncio.run(run())
+        assert probe_calls["count"] == 2
+
+    def test_probe_failure_is_reported_unhealthy(self, monkeypatch):
+        async def broken():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(health_module, "check_all_connections", broken)
+        status = asyncio.run(HealthService().get_health_status())
+
+        assert status["overall_status"] == "unhealthy"
+        assert "boom" in status["error"]
+
+
+class TestLivenessAndReadiness:
+    """Lightweight probe semantics."""
+
+    def test_liveness_does_not_probe(self, probe_calls):
+        liveness = HealthService().get_liveness()
+
+        assert liveness["status"] == "alive"
+        assert probe_calls["count"] == 0
+
+    @pytest.mark.parametrize(
+        "database,supabase,require_all,expected",
+        [
+            (True, True, True, True),
+            (True, False, True, False),
+            (True, False, False, True),
+            (False, True, False, False),
+        ],
+    )
+    def test_readiness(self, probe_calls, monkeypatch, database, supabase, require_all, expected):
+        probe_calls["result"] = _connections(database=database, supabase=supabase)
+        monkeypatch.setattr(health_module.settings, "REQUIRE_ALL_CONNECTIONS", require_all)
+
+        ready, payload = asyncio.run(HealthService().get_readiness())
+
+        assert ready is expected
+        assert payload["status"] == ("ready" if expected else "not_ready")
+
+
+class TestBackgroundRefresh:
+    """The background task keeps the snapshot warm."""
+
+    def test_background_refresh_populates_cache(self, probe_calls, monkeypatch):
+        monkeypatch.setattr(health_module.settings, "HEALTH_CHECK_CACHE_TTL_SECONDS", 60)
+        service = HealthService()
+
+        async def run():
+            service.start_background_refresh()
+            await asyncio.sleep(0.05)
+            status = await service.get_health_status()
+            await service.stop_background_refresh()
+            return status
+
+        status = asyncio.run(run())
+        assert probe_calls["count"] == 1
+        assert status["overall_status"] == "healthy"
+
+
+class TestConnectionProbes:
+    """Blocking probes run in threads, concurrently and with a timeout."""
+
+    def test_probes_run_concurrently(self, monkeypatch):
+        def slow_probe():
+            time.sleep(0.2)
+            return {"connected": True}
+
+        monkeypatch.setattr(db_base, "_probe_database", slow_probe)
+        monkeypatch.setattr(db_base, "_probe_supabase", slow_probe)
+
+        start = time.perf_counter()
+        result = asyncio.run(db_base.check_all_connections())
+        elapsed = time.perf_counter() - start
+
+        assert result["overall_status"] == "healthy"
+        assert elapsed < 0.35
+
+    def test_hung_probe_times_out(self, monkeypatch):
+        monkeypatch.setattr(db_base.settings, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(db_base, "_probe_database", lambda: time.sleep(0.3))
+
+        result = asyncio.run(db_base.check_database_connection())
+
+        assert result["connected"] is False
+        assert "timed out" in result["error"]
@@ -8,13 +8,16 @@ Tests:
 - Optimistic locking
 - Draft listing and retrieval
 - Lock management
+- Append-only patch log (per-indicator versions, compaction)
 """
 
 import pytest
 from datetime import datetime, timedelta
 from fastapi import HTTPException
 
-from app.db.models.governance_area import GovernanceArea, IndicatorDraft
+from sqlalchemy import event
+
+from app.db.models.governance_area import GovernanceArea, IndicatorDraft, IndicatorDraftPatch
 from app.db.models.user import User
 from app.db.enums import UserRole
 from app.services.indicator_draft_service import indicator_draft_service
@@ -563,3 +566,191 @@ class TestLockCleanup:
         assert updated_draft.lock_token is None
         assert updated_draft.locked_by_user_id is None
         assert updated_draft.locked_at is None
+
+
+def _node(temp_id, name):
+    return {"temp_id": temp_id, "name": name, "children": []}
+
+
+@pytest.fixture
+def large_draft(db_session, test_user, test_governance_area):
+    """A draft with 300 indicators in its snapshot."""
+    return indicator_draft_service.create_draft(
+        db=db_session,
+        user_id=test_user.id,
+        governance_area_id=test_governance_area.id,
+        creation_mode="incremental",
+        data=[_node(f"ind-{i}", f"Indicator {i}") for i in range(300)],
+    )
+
+
+class TestPatchLog:
+    """Tests for append-only per-indicator draft patches."""
+
+    def test_append_writes_only_changed_indicators(self, db_session, test_user, large_draft):
+        """An autosave inserts one small row per change and never rewrites the draft data."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            versions = indicator_draft_service.append_patches(
+                db=db_session,
+                draft_id=large_draft.id,
+                user_id=test_user.id,
+                changed_indicators=[_node("ind-7", "Renamed")],
+                base_versions={"ind-7": 0},
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert versions == {"ind-7": 1}
+        written = sum(
+            len(str(parameters))
+            for statement, parameters in statements
+            if statement.startswith(("INSERT", "UPDATE"))
+        )
+        assert written < 1000
+        assert not any("FOR UPDATE" in statement for statement, _ in statements)
+
+    def test_load_reads_snapshot_plus_tail(self, db_session, test_user, large_draft):
+        """Loading applies pending patches (replace, add, delete) in order."""
+        for name, base in (("First", 0), ("Second", 1)):
+            indicator_draft_service.append_patches(
+                db=db_session,
+                draft_id=large_draft.id,
+                user_id=test_user.id,
+                changed_indicators=[_node("ind-0", name)],
+                base_versions={"ind-0": base},
+            )
+        indicator_draft_service.append_patches(
+            db=db_session,
+            draft_id=large_draft.id,
+            user_id=test_user.id,
+            changed_indicators=[_node("new-1", "Added")],
+            deleted_ids=["ind-1"],
+            base_versions={"ind-1": 0},
+            metadata={"current_step": 3},
+        )
+
+        draft = indicator_draft_service.load_draft(db_session, large_draft.id, test_user.id)
+
+        assert draft.data[0]["name"] == "Second"
+        assert "ind-1" not in [node["temp_id"] for node in draft.data]
+        assert draft.data[-1]["temp_id"] == "new-1"
+        assert len(draft.data) == 300
+        assert draft.indicator_versions == {"ind-0": 2, "ind-1": 1, "new-1": 1}
+        assert draft.current_step == 3
+        assert not db_session.dirty
+
+    def test_conflicts_are_per_indicator(self, db_session, test_user, large_draft):
+        """A stale base only conflicts for the indicator that changed underneath it."""
+        indicator_draft_service.append_patches(
+            db=db_session,
+            draft_id=large_draft.id,
+            user_id=test_user.id,
+            changed_indicators=[_node("ind-0", "Editor A")],
+            base_versions={"ind-0": 0},
+        )
+
+        # Editor B started from the same snapshot but edits another indicator
+        indicator_draft_service.append_patches(
+            db=db_session,
+            draft_id=large_draft.id,
+            user_id=test_user.id,
+            changed_indicators=[_node("ind-5", "Editor B")],
+            base_versions={"ind-5": 0},
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            indicator_draft_service.append_patches(
+                db=db_session,
+                draft_id=large_draft.id,
+                user_id=test_user.id,
+                changed_indicators=[_node("ind-0", "Stale"), _node("ind-9", "Fine")],
+                base_versions={"ind-0": 0, "ind-9": 0},
+            )
+
+        assert exc_info.value.status_code == 409
+        assert exc_info.value.detail["conflicts"] == {"ind-0": 1}
+        # Nothing from the rejected save was written
+        assert db_session.query(IndicatorDraftPatch).filter_by(temp_id="ind-9").count() == 0
+
+    def test_append_respects_edit_lock(self, db_session, test_user, second_test_user, large_draft):
+        """Another user's active lock blocks appends."""
+        large_draft.user_id = second_test_user.id
+        large_draft.locked_by_user_id = test_user.id
+        large_draft.locked_at = datetime.utcnow()
+        db_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            indicator_draft_service.append_patches(
+                db=db_session,
+                draft_id=large_draft.id,
+                user_id=second_test_user.id,
+                changed_indicators=[_node("ind-0", "Blocked")],
+                base_versions={},
+            )
+
+        assert exc_info.value.status_code == 423
+
+    def test_compaction_folds_tail_into_snapshot(
+        self, db_session, test_user, large_draft, monkeypatch
+    ):
+        """Past the threshold the log is folded into the snapshot and emptied."""
+        monkeypatch.setattr(indicator_draft_service, "COMPACTION_THRESHOLD", 5)
+        for version in range(5):
+            indicator_draft_service.append_patches(
+                db=db_session,
+                draft_id=large_draft.id,
+                user_id=test_user.id,
+                changed_indicators=[_node("ind-2", f"Edit {version}")],
+                base_versions={"ind-2": version},
+            )
+
+        assert db_session.query(IndicatorDraftPatch).filter_by(draft_id=large_draft.id).count() == 0
+        db_session.expire_all()
+        stored = db_session.get(IndicatorDraft, large_draft.id)
+        assert stored.data[2]["name"] == "Edit 4"
+        assert stored.indicator_versions == {"ind-2": 5}
+
+        # Versions carry on from the snapshot after compaction
+        with pytest.raises(HTTPException):
+            indicator_draft_service.append_patches(
+                db=db_session,
+                draft_id=large_draft.id,
+                user_id=test_user.id,
+                changed_indicators=[_node("ind-2", "Stale")],
+                base_versions={"ind-2": 4},
+            )
+
+    def test_delta_save_appends_and_full_save_resets_log(
+        self, db_session, test_user, large_draft
+    ):
+        """The draft-level delta save uses the log; a full save replaces it."""
+        draft = indicator_draft_service.save_draft_delta(
+            db=db_session,
+            draft_id=large_draft.id,
+            user_id=test_user.id,
+            changed_indicators=[_node("ind-3", "Delta")],
+            changed_ids=["ind-3"],
+            version=1,
+        )
+        assert draft.version == 2
+        assert draft.data[3]["name"] == "Delta"
+        assert db_session.query(IndicatorDraftPatch).filter_by(draft_id=large_draft.id).count() == 1
+
+        draft = indicator_draft_service.save_draft(
+            db=db_session,
+            draft_id=large_draft.id,
+            user_id=test_user.id,
+            update_data={"data": [_node("ind-3", "Full")]},
+            version=2,
+        )
+
+        assert draft.data == [_node("ind-3", "Full")]
+        assert draft.indicator_versions["ind-3"] == 2
+        assert db_session.query(IndicatorDraftPatch).filter_by(draft_id=large_draft.id).count() == 0
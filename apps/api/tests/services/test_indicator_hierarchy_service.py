@@ -0,0 +1,176 @@
+"""
+🌳 Indicator Hierarchy Service Tests
+
+Tests:
+- Subtree and ancestor lookups via recursive CTEs
+- Batch cycle detection against the stored tree
+- Batch parent changes applied in a single UPDATE
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.db.enums import AreaType
+from app.db.models.governance_area import GovernanceArea, Indicator
+from app.services.indicator_hierarchy_service import indicator_hierarchy_service
+from app.services.indicator_service import indicator_service
+
+
+@pytest.fixture
+def tree(db_session):
+    """
+    Build a small tree and return indicator IDs by name:
+
+        root
+        ├── a
+        │   ├── a1
+        │   └── a2
+        │       └── a2x
+        └── b
+    """
+    area = GovernanceArea(id=1, name="Test Area", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.flush()
+
+    nodes = {}
+
+    def add(name, parent=None):
+        node = Indicator(
+            name=name,
+            governance_area_id=area.id,
+            parent_id=parent.id if parent else None,
+        )
+        db_session.add(node)
+        db_session.flush()
+        nodes[name] = node
+        return node
+
+    root = add("root")
+    a = add("a", root)
+    add("a1", a)
+    a2 = add("a2", a)
+    add("a2x", a2)
+    add("b", root)
+    db_session.commit()
+    return {name: node.id for name, node in nodes.items()}
+
+
+@pytest.fixture
+def statements(db_session):
+    """Record every SQL statement executed during the test."""
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", record)
+
+
+class TestTreeQueries:
+    def test_subtree_is_breadth_first(self, db_session, tree, statements):
+        subtree = indicator_hierarchy_service.get_subtree(db_session, tree["a"])
+
+        assert [n.name for n in subtree] == ["a", "a1", "a2", "a2x"]
+        assert len(statements) == 1
+
+    def test_subtree_without_root(self, db_session, tree):
+        subtree = indicator_hierarchy_service.get_subtree(
+            db_session, tree["root"], include_root=False
+        )
+
+        assert {n.name for n in subtree} == {"a", "a1", "a2", "a2x", "b"}
+
+    def test_ancestors_root_first(self, db_session, tree, statements):
+        ancestors = indicator_hierarchy_service.get_ancestors(db_session, tree["a2x"])
+
+        assert [n.name for n in ancestors] == ["root", "a", "a2"]
+        assert len(statements) == 1
+
+    def test_root_has_no_ancestors(self, db_session, tree):
+        assert indicator_hierarchy_service.get_ancestors(db_session, tree["root"]) == []
+
+
+class TestCycleDetection:
+    def test_moving_under_own_descendant_is_a_cycle(self, db_session, tree, statements):
+        cycles = indicator_hierarchy_service.find_cycles(
+            db_session, {tree["a"]: tree["a2x"]}
+        )
+
+        assert cycles == [tree["a"]]
+        assert len(statements) == 1
+
+    def test_self_parent_is_a_cycle(self, db_session, tree):
+        node_id = tree["b"]
+
+        assert indicator_hierarchy_service.find_cycles(db_session, {node_id: node_id}) == [node_id]
+
+    def test_valid_moves(self, db_session, tree):
+        changes = {
+            tree["a2x"]: tree["b"],
+            tree["a"]: None,
+            tree["a1"]: tree["a2x"],
+        }
+
+        assert indicator_hierarchy_service.find_cycles(db_session, changes) == []
+
+    def test_batch_is_judged_as_a_whole(self, db_session, tree):
+        # Each move alone is fine; together b -> a1 -> b
+        changes = {tree["b"]: tree["a1"], tree["a1"]: tree["b"]}
+
+        assert indicator_hierarchy_service.find_cycles(db_session, changes) == sorted(changes)
+
+        # Detaching a first makes moving root under a2x legal
+        assert indicator_hierarchy_service.find_cycles(
+            db_session, {tree["a"]: None, tree["root"]: tree["a2x"]}
+        ) == []
+
+    def test_check_circular_parent_raises(self, db_session, tree):
+        with pytest.raises(ValueError, match="Circular relationship"):
+            indicator_service._check_circular_parent(db_session, tree["root"], tree["a2"])
+
+        assert indicator_service._check_circular_parent(
+            db_session, tree["b"], tree["a2"]
+        ) is False
+
+
+class TestReorder:
+    def test_parent_changes_apply_in_one_update(self, db_session, tree, statements):
+        changes = {tree["a2x"]: tree["b"], tree["a1"]: None}
+
+        updated = indicator_hierarchy_service.apply_parent_changes(db_session, changes)
+        db_session.commit()
+
+        assert updated == 2
+        assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 1
+        db_session.expire_all()
+        assert db_session.get(Indicator, tree["a2x"]).parent_id == tree["b"]
+        assert db_session.get(Indicator, tree["a1"]).parent_id is None
+
+    def test_reorder_round_trips_do_not_grow_with_batch(self, db_session, tree, statements):
+        reorder_data = [
+            {"id": tree[name], "parent_id": tree["b"]}
+            for name in ("a1", "a2", "a2x")
+        ]
+
+        updated = indicator_service.reorder_indicators(db_session, reorder_data, user_id=1)
+        issued = len(statements)
+
+        # load batch + cycle check + update, whatever the batch size
+        assert issued == 3
+        assert [n.id for n in updated] == [item["id"] for item in reorder_data]
+        assert all(n.parent_id == tree["b"] for n in updated)
+
+    def test_reorder_rejects_cycle_through_stored_tree(self, db_session, tree):
+        # Only root moves, but its new parent is its own descendant
+        with pytest.raises(HTTPException) as exc_info:
+            indicator_service.reorder_indicators(
+                db_session, [{"id": tree["root"], "parent_id": tree["a2x"]}], user_id=1
+            )
+
+        assert "Circular reference" in str(exc_info.value.detail)
+        db_session.expire_all()
+        assert db_session.get(Indicator, tree["root"]).parent_id is None
@@ -8,8 +8,11 @@ Tests:
 - Tree structure validation
 """
 
+import time
+
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
 
 from app.db.models.governance_area import GovernanceArea, Indicator
 from app.db.models.user import User
@@ -322,6 +325,97 @@ class TestBulkCreation:
         assert child2.parent_id == parent_id
 
 
+def _catalogue(areas=6, indicators=10, sub_indicators=4):
+    """Build a three-level catalogue payload (area roots, indicators, sub-indicators)."""
+    payload = []
+    for a in range(areas):
+        payload.append({"temp_id": f"a{a}", "parent_temp_id": None, "name": f"Area {a}"})
+        for i in range(indicators):
+            payload.append({"temp_id": f"a{a}.{i}", "parent_temp_id": f"a{a}", "name": f"{a}.{i}"})
+            for s in range(sub_indicators):
+                payload.append({
+                    "temp_id": f"a{a}.{i}.{s}",
+                    "parent_temp_id": f"a{a}.{i}",
+                    "name": f"{a}.{i}.{s}",
+                    "description": "<b>Sub</b> indicator",
+                })
+    return payload
+
+
+class TestSetBasedBulkCreation:
+    """The bulk path inserts one level per statement inside a single transaction."""
+
+    def test_one_insert_per_level_and_single_commit(
+        self, db_session, test_governance_area, test_user
+    ):
+        payload = _catalogue()
+        statements = []
+        commits = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        event.listen(db_session, "after_commit", lambda session: commits.append(True))
+        try:
+            start = time.perf_counter()
+            created, temp_id_mapping, errors = indicator_service.bulk_create_indicators(
+                db=db_session,
+                governance_area_id=test_governance_area.id,
+                indicators_data=payload,
+                user_id=test_user.id,
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert errors == []
+        assert len(created) == len(payload) == 306
+        assert len(commits) == 1
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        if engine.dialect.name == "postgresql":
+            # PostgreSQL: one multi-row INSERT ... RETURNING per level
+            assert len(inserts) == 3
+        else:
+            # SQLite can't order batched RETURNING rows; SQLAlchemy sends one row per statement
+            assert len(inserts) == len(payload)
+        assert elapsed < 1.0
+
+        # Mapping and parent links line up with the payload
+        by_id = {indicator.id: indicator for indicator in created}
+        for item in payload:
+            indicator = by_id[temp_id_mapping[item["temp_id"]]]
+            assert indicator.name == item["name"]
+            expected_parent = temp_id_mapping.get(item["parent_temp_id"])
+            assert indicator.parent_id == expected_parent
+            assert indicator.version == 1
+
+        # Text fields are sanitized exactly as in create_indicator
+        assert "<b>" not in by_id[temp_id_mapping["a0.0.0"]].description
+
+    def test_invalid_schema_writes_nothing(self, db_session, test_governance_area, test_user):
+        payload = _catalogue(areas=1, indicators=60, sub_indicators=0)
+        payload[5]["form_schema"] = {"fields": "not-a-list"}
+        payload[40]["calculation_schema"] = {"condition_groups": "bad"}
+
+        created, temp_id_mapping, errors = indicator_service.bulk_create_indicators(
+            db=db_session,
+            governance_area_id=test_governance_area.id,
+            indicators_data=payload,
+            user_id=test_user.id,
+        )
+
+        assert created == [] and temp_id_mapping == {}
+        assert [e["temp_id"] for e in errors] == [payload[5]["temp_id"], payload[40]["temp_id"]]
+        assert db_session.query(Indicator).count() == 0
+
+    def test_levels_group_by_depth(self):
+        levels = indicator_service._topological_levels(_catalogue(areas=2, indicators=2, sub_indicators=1))
+
+        assert [len(level) for level in levels] == [2, 4, 4]
+
+
 class TestReordering:
     """Tests for indicator reordering."""
 
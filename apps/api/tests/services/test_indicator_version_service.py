@@ -0,0 +1,338 @@
+"""
+🕰️ Indicator Version Service Tests
+
+Tests:
+- JSON patch diff/apply round trips
+- History rows are deltas between periodic snapshots
+- As-of reads reconstruct every version (cached, bounded chain)
+- Compaction/expansion of existing history
+- Responses pinned to the version they were answered against (re-pinned on update)
+- Validation and classification against pinned rules
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.core.json_patch import apply_patch, make_patch
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models.assessment import Assessment, AssessmentResponse
+from app.db.models.governance_area import GovernanceArea, IndicatorHistory
+from app.db.models.user import User
+from app.services.indicator_service import indicator_service
+from app.services.indicator_version_service import (
+    HISTORY_SNAPSHOT_INTERVAL,
+    indicator_version_service,
+)
+
+
+def _form_schema(version: int, extra_fields: int = 20) -> dict:
+    """A reasonably large schema where each version only changes one label."""
+    fields = [
+        {
+            "field_id": f"field_{i}",
+            "field_type": "text_input",
+            "label": f"Field {i}",
+            "required": True,
+        }
+        for i in range(extra_fields)
+    ]
+    fields[0]["label"] = f"Field 0 (v{version})"
+    return {"fields": fields}
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    indicator_version_service.clear_cache()
+    yield
+    indicator_version_service.clear_cache()
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(
+        email="versions@example.com",
+        name="Versions User",
+        hashed_password="hashed",
+        role=UserRole.MLGOO_DILG,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def versioned_indicator(db_session, user):
+    """An indicator edited up to version 15, recording each version's form schema."""
+    area = GovernanceArea(name="Versioned Area", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicator = indicator_service.create_indicator(
+        db_session,
+        {
+            "name": "Versioned Indicator",
+            "governance_area_id": area.id,
+            "form_schema": _form_schema(1),
+            "technical_notes_text": "Notes v1",
+        },
+        user_id=user.id,
+    )
+    schemas = {1: _form_schema(1)}
+    for version in range(2, 16):
+        indicator_service.update_indicator(
+            db_session, indicator.id, {"form_schema": _form_schema(version)}, user_id=user.id
+        )
+        schemas[version] = _form_schema(version)
+    return indicator.id, schemas
+
+
+class TestJsonPatch:
+    @pytest.mark.parametrize(
+        "source,target",
+        [
+            ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "b": [1, 3], "c": {"d": None}}),
+            ({"fields": [{"id": "x"}]}, {"fields": [{"id": "x"}, {"id": "y/z~"}]}),
+            ({"a": 1}, {"a": True}),
+            (None, {"a": 1}),
+            ({"a": [1, 2]}, {"a": "replaced"}),
+        ],
+    )
+    def test_round_trip(self, source, target):
+        patch = make_patch(source, target)
+
+        result = apply_patch(source, patch)
+
+        assert result == target
+        assert type(result) is type(target)
+
+    def test_small_edit_gives_small_patch(self):
+        patch = make_patch(_form_schema(1), _form_schema(2))
+
+        assert patch == [{"op": "replace", "path": "/fields/0/label", "value": "Field 0 (v2)"}]
+
+    def test_apply_does_not_mutate_input(self):
+        source = {"a": [1]}
+        apply_patch(source, [{"op": "add", "path": "/a/1", "value": 2}])
+
+        assert source == {"a": [1]}
+
+
+class TestDeltaStorage:
+    def test_snapshots_every_interval_and_deltas_between(self, db_session, versioned_indicator):
+        indicator_id, _ = versioned_indicator
+
+        rows = (
+            db_session.query(IndicatorHistory)
+            .filter(IndicatorHistory.indicator_id == indicator_id)
+            .order_by(IndicatorHistory.version)
+            .all()
+        )
+        snapshots = [row.version for row in rows if row.is_snapshot]
+
+        assert snapshots == [1, 1 + HISTORY_SNAPSHOT_INTERVAL]
+        delta = next(row for row in rows if not row.is_snapshot)
+        assert delta.form_schema is None
+        assert len(delta.schema_patch) == 1
+
+    def test_history_reconstructs_every_version(self, db_session, versioned_indicator):
+        indicator_id, schemas = versioned_indicator
+
+        history = indicator_service.get_indicator_history(db_session, indicator_id)
+
+        assert [row.version for row in history] == list(range(14, 0, -1))
+        for row in history:
+            assert row.form_schema == schemas[row.version]
+            assert row.technical_notes_text == "Notes v1"
+
+    def test_reading_history_does_not_write_back(self, db_session, versioned_indicator):
+        indicator_id, _ = versioned_indicator
+
+        indicator_service.get_indicator_history(db_session, indicator_id)
+
+        assert not db_session.dirty
+
+
+class TestAsOf:
+    def test_as_of_each_version(self, db_session, versioned_indicator):
+        indicator_id, schemas = versioned_indicator
+
+        for version, schema in schemas.items():
+            as_of = indicator_service.get_indicator_as_of(db_session, indicator_id, version)
+            assert as_of.version == version
+            assert as_of.form_schema == schema
+
+    def test_current_version_is_the_live_indicator(self, db_session, versioned_indicator):
+        indicator_id, _ = versioned_indicator
+
+        current = indicator_service.get_indicator_as_of(db_session, indicator_id, 15)
+
+        assert current is indicator_service.get_indicator(db_session, indicator_id)
+
+    def test_chain_is_bounded_and_cached(self, db_session, versioned_indicator):
+        indicator_id, schemas = versioned_indicator
+        indicator_version_service.clear_cache()
+        db_session.expire_all()
+        engine = db_session.get_bind()
+        rows_loaded = []
+
+        def count_rows(conn, cursor, statement, parameters, context, executemany):
+            if "FROM indicators_history" in statement:
+                rows_loaded.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_rows)
+        try:
+            first = indicator_service.get_indicator_as_of(db_session, indicator_id, 9)
+            cold = len(rows_loaded)
+            db_session.expire_all()
+            again = indicator_service.get_indicator_as_of(db_session, indicator_id, 9)
+            warm = len(rows_loaded) - cold
+        finally:
+            event.remove(engine, "before_cursor_execute", count_rows)
+
+        assert first.form_schema == again.form_schema == schemas[9]
+        # Cold: target row + one chain query; warm: target row only
+        assert cold == 2
+        assert warm == 1
+
+    def test_unknown_version(self, db_session, versioned_indicator):
+        indicator_id, _ = versioned_indicator
+
+        with pytest.raises(HTTPException) as exc_info:
+            indicator_service.get_indicator_as_of(db_session, indicator_id, 99)
+
+        assert exc_info.value.status_code == 404
+
+
+class TestCompaction:
+    def test_expand_then_compact_preserves_content(self, db_session, versioned_indicator):
+        indicator_id, schemas = versioned_indicator
+
+        expanded = indicator_version_service.expand_history(db_session, indicator_id)
+        assert expanded == 14 - 2
+        assert all(
+            row.is_snapshot
+            for row in db_session.query(IndicatorHistory).filter_by(indicator_id=indicator_id)
+        )
+
+        compacted = indicator_version_service.compact_history(db_session, indicator_id)
+        assert compacted == expanded
+
+        indicator_version_service.clear_cache()
+        db_session.expire_all()
+        for row in indicator_service.get_indicator_history(db_session, indicator_id):
+            assert row.form_schema == schemas[row.version]
+
+
+class TestPinnedVersion:
+    def test_response_evaluates_against_pinned_version(self, db_session, versioned_indicator, user):
+        indicator_id, schemas = versioned_indicator
+        assessment = Assessment(blgu_user_id=user.id, status=AssessmentStatus.DRAFT)
+        db_session.add(assessment)
+        db_session.commit()
+
+        response = AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=indicator_id,
+            response_data={},
+            indicator_version=4,
+        )
+        legacy = AssessmentResponse(
+            assessment_id=assessment.id, indicator_id=indicator_id, response_data={}
+        )
+        db_session.add_all([response, legacy])
+        db_session.commit()
+
+        pinned = indicator_version_service.get_pinned_indicator(db_session, response)
+        current = indicator_version_service.get_pinned_indicator(db_session, legacy)
+
+        assert pinned.form_schema == schemas[4]
+        assert current.form_schema == schemas[15]
+
+    def test_updating_answers_re_pins_to_current_version(
+        self, db_session, versioned_indicator, user
+    ):
+        from app.schemas.assessment import AssessmentResponseUpdate
+        from app.services.assessment_service import assessment_service
+
+        indicator_id, _ = versioned_indicator
+        assessment = Assessment(blgu_user_id=user.id, status=AssessmentStatus.DRAFT)
+        db_session.add(assessment)
+        db_session.commit()
+        response = AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=indicator_id,
+            response_data={},
+            indicator_version=4,
+        )
+        db_session.add(response)
+        db_session.commit()
+
+        assessment_service.update_assessment_response(
+            db_session, response.id, AssessmentResponseUpdate(response_data={"field_0": "x"})
+        )
+
+        db_session.refresh(response)
+        assert response.indicator_version == 15
+
+    def test_classification_can_use_pinned_rules(self, db_session, user):
+        from app.db.enums import ValidationStatus
+        from app.services.compliance_validation_service import compliance_validation_service
+        from app.services.intelligence_service import intelligence_service
+
+        def rule(expected):
+            return {
+                "condition_groups": [
+                    {
+                        "operator": "AND",
+                        "rules": [
+                            {
+                                "rule_type": "MATCH_VALUE",
+                                "field_id": "field1",
+                                "operator": "==",
+                                "expected_value": expected,
+                            }
+                        ],
+                    }
+                ],
+                "output_status_on_pass": "Pass",
+                "output_status_on_fail": "Fail",
+            }
+
+        area = GovernanceArea(name="Pinned Rules Area", area_type=AreaType.CORE)
+        db_session.add(area)
+        db_session.commit()
+        indicator = indicator_service.create_indicator(
+            db_session,
+            {
+                "name": "Pinned Rules Indicator",
+                "governance_area_id": area.id,
+                "is_auto_calculable": True,
+                "calculation_schema": rule("yes"),
+            },
+            user_id=user.id,
+        )
+        assessment = Assessment(blgu_user_id=user.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW)
+        db_session.add(assessment)
+        db_session.commit()
+        response = AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=indicator.id,
+            response_data={"field1": "yes"},
+            indicator_version=indicator.version,
+        )
+        db_session.add(response)
+        db_session.commit()
+        indicator_service.update_indicator(
+            db_session, indicator.id, {"calculation_schema": rule("no")}, user_id=user.id
+        )
+
+        intelligence_service.classify_assessment(db_session, assessment.id, use_pinned_version=True)
+        db_session.refresh(response)
+        assert response.validation_status == ValidationStatus.PASS
+
+        # Without pinning, the current rules decide
+        compliance_validation_service.bulk_validate_assessment(db_session, assessment.id)
+        db_session.refresh(response)
+        assert response.validation_status == ValidationStatus.FAIL
@@ -0,0 +1,255 @@
+"""
+📬 Notification Delivery Engine Tests
+
+Tests:
+- SMTP connection pool reuses connections and reconnects dropped ones
+- Retry queue: exponential backoff, resend when due, give up after max attempts
+- Claimed rows abandoned by a crashed sender are retried once their lease expires
+- End-to-end delivery against a local aiosmtpd server (when installed)
+"""
+
+import smtplib
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.db.models.notification import NotificationDelivery
+from app.services.notification_service import notification_service
+from app.services.notification_transport import (
+    LoggingTransport,
+    NotificationTransport,
+    OutgoingMessage,
+    SMTPConnectionPool,
+    SMTPTransport,
+)
+
+
+class FakeSMTP:
+    """Records the sessions a pool opens instead of talking to a server."""
+
+    opened = []
+
+    def __init__(self, host, port, timeout=None):
+        self.alive = True
+        self.sent = []
+        FakeSMTP.opened.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        return (250, b"OK")
+
+    def send_message(self, message):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected("gone")
+        if message["To"] == "refused@example.com":
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (550, b"No such user")})
+        self.sent.append(message)
+
+    def quit(self):
+        self.alive = False
+
+    def close(self):
+        self.alive = False
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.opened = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.test")
+    monkeypatch.setattr(settings, "SMTP_TLS", False)
+    return FakeSMTP
+
+
+def _messages(*recipients, prefix="test"):
+    return notification_service.render_batch(
+        kind="rework_requested",
+        key_prefix=prefix,
+        subject="Rework",
+        template="rework_requested",
+        context={"barangay_name": "Barangay Alpha", "rework_count": 1},
+        recipients=[(i, email) for i, email in enumerate(recipients)],
+    )
+
+
+def test_pool_reuses_one_connection_across_batches(fake_smtp):
+    transport = SMTPTransport(pool=SMTPConnectionPool())
+
+    transport.send(_messages("a@example.com", "b@example.com", prefix="one"))
+    transport.send(_messages("c@example.com", prefix="two"))
+
+    assert len(fake_smtp.opened) == 1
+    assert len(fake_smtp.opened[0].sent) == 3
+
+
+def test_pool_reconnects_after_idle_drop(fake_smtp, monkeypatch):
+    monkeypatch.setattr(settings, "SMTP_POOL_IDLE_SECONDS", 0)
+    transport = SMTPTransport(pool=SMTPConnectionPool())
+
+    transport.send(_messages("a@example.com", prefix="one"))
+    fake_smtp.opened[0].alive = False  # server closed the idle session
+    delivered = transport.send(_messages("b@example.com", prefix="two"))
+
+    assert delivered == ["two:0"]
+    assert len(fake_smtp.opened) == 2
+
+
+def test_refused_recipient_does_not_fail_the_batch(fake_smtp):
+    transport = SMTPTransport(pool=SMTPConnectionPool())
+
+    delivered = transport.send(_messages("refused@example.com", "b@example.com"))
+
+    assert delivered == ["test:1"]
+
+
+def test_batch_is_rendered_once_with_html_alternative():
+    messages = notification_service.render_batch(
+        kind="deadline_extension",
+        key_prefix="deadline-extension:1",
+        subject="Deadline extended",
+        template="deadline_extension",
+        context={
+            "barangay_name": "Barangay <Alpha>",
+            "formatted_deadline": "March 01, 2026",
+            "granted_by": "MLGOO",
+            "indicator_count": 1,
+            "indicator_names": ["Indicator 1"],
+            "reason": "Typhoon",
+            "current_year": 2026,
+        },
+        recipients=[(1, "a@example.com"), (2, "b@example.com"), (3, None)],
+    )
+
+    assert [m.idempotency_key for m in messages] == [
+        "deadline-extension:1:1",
+        "deadline-extension:1:2",
+    ]
+    assert messages[0].html is messages[1].html
+    assert "Barangay &lt;Alpha&gt;" in messages[0].html
+    assert "Barangay <Alpha>" in messages[0].body
+
+
+def test_failed_deliveries_back_off_then_give_up(db_session, monkeypatch):
+    class BrokenTransport(NotificationTransport):
+        name = "broken"
+
+        def send(self, messages):
+            raise ConnectionError("unavailable")
+
+    monkeypatch.setattr(settings, "NOTIFICATION_MAX_ATTEMPTS", 3)
+    broken = BrokenTransport()
+    messages = _messages("a@example.com", prefix="backoff")
+
+    assert notification_service.deliver(db_session, messages, transport=broken)["retrying"] == 1
+    row = db_session.query(NotificationDelivery).one()
+    first_delay = row.next_attempt_at - datetime.utcnow()
+    assert timedelta(seconds=settings.NOTIFICATION_RETRY_BASE_SECONDS - 5) < first_delay
+
+    # Not due yet
+    assert notification_service.retry_due(db_session, transport=broken)["retrying"] == 0
+
+    row.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    assert notification_service.retry_due(db_session, transport=broken)["retrying"] == 1
+    db_session.refresh(row)
+    assert row.attempts == 2
+    assert row.next_attempt_at - datetime.utcnow() > first_delay
+
+    row.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+    assert notification_service.retry_due(db_session, transport=broken)["failed"] == 1
+    db_session.refresh(row)
+    assert (row.status, row.attempts, row.last_error) == ("failed", 3, "unavailable")
+
+
+def test_due_retries_are_resent(db_session):
+    class FlakyTransport(NotificationTransport):
+        name = "flaky"
+
+        def send(self, messages):
+            return [m.idempotency_key for m in messages if m.recipient != "b@example.com"]
+
+    messages = _messages("a@example.com", "b@example.com", prefix="flaky")
+
+    result = notification_service.deliver(db_session, messages, transport=FlakyTransport())
+    assert result == {"sent": 1, "retrying": 1, "failed": 0, "skipped": 0}
+
+    db_session.query(NotificationDelivery).filter_by(status="retry").update(
+        {"next_attempt_at": datetime.utcnow() - timedelta(seconds=1)}
+    )
+    db_session.commit()
+    result = notification_service.retry_due(db_session, transport=LoggingTransport())
+
+    assert result == {"sent": 1, "retrying": 0, "failed": 0, "skipped": 0}
+    assert {row.status for row in db_session.query(NotificationDelivery)} == {"sent"}
+
+
+def test_abandoned_claims_are_retried_after_their_lease(db_session):
+    messages = _messages("a@example.com", "b@example.com", prefix="crash")
+    # A worker claimed the rows, then died before sending
+    claimed = notification_service._claim(db_session, messages)
+    assert len(claimed) == 2
+    legacy = db_session.query(NotificationDelivery).filter_by(recipient="b@example.com").one()
+    legacy.next_attempt_at = None  # Claimed before leases were recorded
+    db_session.commit()
+
+    # Still within the lease: the sender may be working on them
+    assert notification_service.retry_due(db_session, transport=LoggingTransport())["sent"] == 0
+
+    db_session.query(NotificationDelivery).update(
+        {
+            "next_attempt_at": datetime.utcnow() - timedelta(seconds=1),
+            "created_at": datetime.utcnow()
+            - timedelta(seconds=settings.NOTIFICATION_SEND_LEASE_SECONDS + 1),
+        }
+    )
+    legacy.next_attempt_at = None
+    db_session.commit()
+    result = notification_service.retry_due(db_session, transport=LoggingTransport())
+
+    assert result == {"sent": 2, "retrying": 0, "failed": 0, "skipped": 0}
+    assert {row.status for row in db_session.query(NotificationDelivery)} == {"sent"}
+
+
+def test_delivery_through_local_smtp_server(db_session, monkeypatch):
+    controller_module = pytest.importorskip("aiosmtpd.controller")
+    handlers = pytest.importorskip("aiosmtpd.handlers")
+
+    handler = handlers.Sink()
+    received = []
+    handler.handle_DATA = _collect(received)
+    controller = controller_module.Controller(handler, hostname="127.0.0.1", port=0)
+    controller.start()
+    try:
+        monkeypatch.setattr(settings, "SMTP_HOST", controller.hostname)
+        monkeypatch.setattr(settings, "SMTP_PORT", controller.server.sockets[0].getsockname()[1])
+        monkeypatch.setattr(settings, "SMTP_TLS", False)
+        monkeypatch.setattr(settings, "SMTP_USER", None)
+        pool = SMTPConnectionPool()
+        messages = _messages("a@example.com", "b@example.com", prefix="live")
+
+        result = notification_service.deliver(
+            db_session, messages, transport=SMTPTransport(pool=pool)
+        )
+        pool.close_all()
+    finally:
+        controller.stop()
+
+    assert result["sent"] == 2
+    assert sorted(received) == ["a@example.com", "b@example.com"]
+
+
+def _collect(received):
+    async def handle_DATA(server, session, envelope):
+        received.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+    return handle_DATA
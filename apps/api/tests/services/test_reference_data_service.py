@@ -0,0 +1,182 @@
+"""
+📚 Reference Data Service Tests
+
+Tests:
+- Snapshot loads in three queries and is reused until reference data changes
+- Commits that write areas, barangays or cycles bump the version and announce it
+  in the background, without waiting on Redis
+- Announcements from other processes are applied once
+- Celery worker processes listen for announcements too
+- Lookup endpoints: ETag / Cache-Control headers and 304 responses
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.db.enums import AreaType
+from app.db.models.admin import AssessmentCycle
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea
+from app.services import reference_data_service as reference_module
+from app.services.reference_data_service import reference_data_service
+
+
+class RecordingRedis:
+    """Just the commands the service uses to share versions."""
+
+    def __init__(self, version=0):
+        self.version = version
+        self.published = []
+        self.reachable = threading.Event()
+        self.reachable.set()
+
+    def incr(self, key):
+        self.reachable.wait(5)
+        self.version += 1
+        return self.version
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+@pytest.fixture
+def reference_data(db_session):
+    db_session.add_all(
+        [
+            GovernanceArea(id=1, name="Financial Administration", area_type=AreaType.CORE),
+            GovernanceArea(id=2, name="Environmental Management", area_type=AreaType.ESSENTIAL),
+            Barangay(name="San Roque"),
+            Barangay(name="Poblacion"),
+            AssessmentCycle(
+                name="SGLGB 2025",
+                year=2025,
+                phase1_deadline=datetime(2025, 4, 1),
+                rework_deadline=datetime(2025, 5, 1),
+                phase2_deadline=datetime(2025, 6, 1),
+                calibration_deadline=datetime(2025, 7, 1),
+                is_active=True,
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+def _count_queries(db_session, call):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_snapshot_is_loaded_once(db_session, reference_data):
+    snapshot, queries = _count_queries(db_session, lambda: reference_data_service.get(db_session))
+    again, cached_queries = _count_queries(
+        db_session, lambda: reference_data_service.get(db_session)
+    )
+
+    assert (queries, cached_queries) == (3, 0)
+    assert again is snapshot
+    assert [area.name for area in snapshot.governance_areas] == [
+        "Financial Administration",
+        "Environmental Management",
+    ]
+    assert [b.name for b in snapshot.barangays] == ["Poblacion", "San Roque"]
+    assert snapshot.active_cycle.name == "SGLGB 2025"
+    assert reference_data_service.get_governance_area(db_session, 2).area_type == AreaType.ESSENTIAL
+    assert reference_data_service.get_governance_area_by_name(db_session, "Nope") is None
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_reference_writes_bump_and_announce_version(db_session, reference_data, monkeypatch):
+    redis = RecordingRedis(version=41)
+    monkeypatch.setattr(reference_module.settings, "CELERY_BROKER_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(reference_data_service, "_redis", lambda: redis)
+    before = reference_data_service.get(db_session)
+
+    # A slow Redis doesn't hold up the commit or the local reload
+    redis.reachable.clear()
+    barangay = db_session.query(Barangay).filter(Barangay.name == "San Roque").one()
+    barangay.name = "San Roque Norte"
+    db_session.commit()
+    after = reference_data_service.get(db_session)
+
+    assert after.version > before.version
+    assert [b.name for b in after.barangays] == ["Poblacion", "San Roque Norte"]
+    assert redis.published == []
+
+    redis.reachable.set()
+    _wait_for(lambda: redis.published)
+    assert redis.published == [(reference_module.CHANNEL, 42)]
+
+    # Our own announcement coming back from Redis doesn't reload again
+    reference_data_service._apply_shared_version(42)
+    assert reference_data_service.get(db_session) is after
+
+
+def test_other_process_announcements_invalidate(db_session, reference_data, monkeypatch):
+    monkeypatch.setattr(reference_data_service, "_redis", lambda: None)
+    reference_data_service.get(db_session)
+    shared = reference_data_service._shared_version
+
+    reference_data_service._apply_shared_version(shared + 1)
+    reloaded, queries = _count_queries(db_session, lambda: reference_data_service.get(db_session))
+    reference_data_service._apply_shared_version(shared)
+    _, stale_queries = _count_queries(db_session, lambda: reference_data_service.get(db_session))
+
+    assert (queries, stale_queries) == (3, 0)
+
+
+def test_celery_worker_processes_start_the_listener(monkeypatch):
+    from app.core import celery_app
+
+    started = []
+    monkeypatch.setattr(reference_data_service, "start_listener", lambda: started.append(True))
+
+    celery_app.worker_process_init.send(sender=None)
+
+    assert started == [True]
+
+
+def test_lookup_endpoints_support_etags(client, db_session, reference_data):
+    from app.api import deps
+
+    client.app.dependency_overrides[deps.get_db] = lambda: db_session
+    try:
+        areas = client.get("/api/v1/lookups/governance-areas")
+        unchanged = client.get(
+            "/api/v1/lookups/governance-areas", headers={"If-None-Match": areas.headers["etag"]}
+        )
+        barangays = client.get("/api/v1/lookups/barangays")
+
+        db_session.add(Barangay(name="Bagong Silang"))
+        db_session.commit()
+        changed = client.get(
+            "/api/v1/lookups/barangays", headers={"If-None-Match": barangays.headers["etag"]}
+        )
+    finally:
+        client.app.dependency_overrides.pop(deps.get_db, None)
+
+    assert areas.status_code == 200
+    assert areas.json()[0] == {"id": 1, "name": "Financial Administration", "area_type": "Core"}
+    assert areas.headers["cache-control"].startswith("public, max-age=")
+    assert unchanged.status_code == 304 and unchanged.content == b""
+    assert changed.status_code == 200
+    assert [b["name"] for b in changed.json()] == ["Bagong Silang", "Poblacion", "San Roque"]
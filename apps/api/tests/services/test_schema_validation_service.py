@@ -0,0 +1,213 @@
+"""
+🧩 Schema Validation Service Tests
+
+Tests:
+- Full validation finds the same problems as form_schema_validator
+- Incremental edits give the same errors and hash as validating from scratch
+- Only the edited fields (and fields referencing them) are re-checked
+- Calculation schema field references against a cached form schema
+"""
+
+import random
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.calculation_schema import CalculationSchema
+from app.schemas.form_schema import (
+    ConditionalMOVLogic,
+    FileUploadField,
+    FormSchema,
+    TextInputField,
+)
+from app.services.form_schema_validator import (
+    generate_validation_errors,
+    validate_no_circular_references,
+)
+from app.services.schema_validation_service import SchemaValidationService
+
+
+def _text(field_id: str, label: str = "Text") -> TextInputField:
+    return TextInputField(field_id=field_id, field_type="text_input", label=label)
+
+
+def _upload(field_id: str, depends_on: str = None) -> FileUploadField:
+    return FileUploadField(
+        field_id=field_id,
+        field_type="file_upload",
+        label="Upload",
+        conditional_mov_requirement=(
+            ConditionalMOVLogic(field_id=depends_on, operator="equals", value="yes")
+            if depends_on
+            else None
+        ),
+    )
+
+
+def _random_field(rng: random.Random, field_id: str, pool: list):
+    if rng.random() < 0.3:
+        return _text(field_id, label=f"Text {rng.randint(0, 3)}")
+    # Self-references are reported differently by the two implementations
+    targets = [other for other in pool if other != field_id]
+    return _upload(field_id, rng.choice(targets) if targets and rng.random() < 0.8 else None)
+
+
+@pytest.fixture
+def service():
+    return SchemaValidationService()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_full_validation_agrees_with_form_schema_validator(service, seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        pool = [f"f{i}" for i in range(rng.randint(1, 8))]
+        schema = FormSchema(fields=[_random_field(rng, field_id, pool) for field_id in pool])
+
+        graph = service.validate_form_schema(schema)
+
+        assert bool(graph.errors) == bool(generate_validation_errors(schema))
+        assert bool(graph.cycles) == (not validate_no_circular_references(schema.fields))
+
+
+def test_reports_every_problem_in_schema_order(service):
+    schema = FormSchema.model_construct(
+        fields=[
+            _upload("a", "b"),
+            _upload("b", "c"),
+            _upload("c", "a"),
+            _upload("self", "self"),
+            _upload("orphan", "missing"),
+            _upload("d", "e"),
+            _upload("e", "d"),
+        ]
+    )
+
+    graph = service.validate_form_schema(schema)
+
+    assert graph.errors == [
+        "Field 'self' references itself in conditional MOV logic",
+        "Field 'orphan' has invalid conditional MOV logic: referenced field 'missing' does not exist",
+        "Circular reference detected in field dependencies: a -> b -> c -> a",
+        "Circular reference detected in field dependencies: d -> e -> d",
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_edits_match_validating_from_scratch(service, seed):
+    rng = random.Random(seed)
+    pool = [f"f{i}" for i in range(12)]
+    fields = {field_id: _random_field(rng, field_id, pool) for field_id in pool[:6]}
+    graph = service.validate_form_schema(FormSchema.model_construct(fields=list(fields.values())))
+
+    for _ in range(60):
+        upserts, removed = [], []
+        for field_id in rng.sample(pool, rng.randint(1, 3)):
+            if field_id in fields and rng.random() < 0.3:
+                removed.append(field_id)
+                del fields[field_id]
+            else:
+                fields[field_id] = _random_field(rng, field_id, pool)
+                upserts.append(fields[field_id])
+
+        graph = service.apply_form_schema_edits(graph.schema_hash, upserts, removed)
+        if not fields:
+            assert graph.errors == ["Form schema must have at least one field"]
+            return
+
+        ordered = sorted(fields.values(), key=lambda f: graph.order[f.field_id])
+        fresh = SchemaValidationService().validate_form_schema(
+            FormSchema.model_construct(fields=ordered)
+        )
+        assert graph.schema_hash == fresh.schema_hash
+        assert graph.errors == fresh.errors
+
+
+def test_single_field_edit_rechecks_a_constant_number_of_fields(service):
+    fields = [_text("root")] + [_upload(f"u{i}", "root") for i in range(2000)]
+    base = service.validate_form_schema(FormSchema(fields=fields))
+
+    edited = service.apply_form_schema_edits(base.schema_hash, [_upload("u1500", "u10")])
+    renamed = service.apply_form_schema_edits(
+        edited.schema_hash, [_text("u10", label="Renamed")]
+    )
+
+    assert base.errors == [] and edited.errors == [] and renamed.errors == []
+    assert edited.rechecked == 1
+    # u1500 now reads u10, so it is re-checked along with it
+    assert renamed.rechecked == 2
+
+
+def test_edits_create_and_break_cycles(service):
+    base = service.validate_form_schema(FormSchema(fields=[_text("a"), _upload("b", "a")]))
+
+    cyclic = service.apply_form_schema_edits(base.schema_hash, [_upload("a", "b")])
+    fixed = service.apply_form_schema_edits(cyclic.schema_hash, removed_field_ids=["b"])
+
+    assert cyclic.errors == ["Circular reference detected in field dependencies: a -> b -> a"]
+    assert fixed.errors == [
+        "Field 'a' has invalid conditional MOV logic: referenced field 'b' does not exist"
+    ]
+
+
+def test_base_hash_reuses_previous_graph(service):
+    fields = [_text("a"), _upload("b", "a"), _upload("c", "a")]
+    base = service.validate_form_schema(FormSchema(fields=fields))
+
+    fields[2] = _upload("c", "b")
+    graph = service.validate_form_schema(FormSchema(fields=fields), base_hash=base.schema_hash)
+
+    assert graph.rechecked == 1
+    assert service.validate_form_schema(FormSchema(fields=fields)) is graph
+
+
+def test_unknown_base_hash_is_a_conflict(service):
+    with pytest.raises(HTTPException) as exc_info:
+        service.apply_form_schema_edits("unknown", [_text("a")])
+
+    assert exc_info.value.status_code == 409
+
+
+def test_calculation_schema_references_checked_against_cached_form(service):
+    form = service.validate_form_schema(FormSchema(fields=[_text("completion_rate")]))
+    calculation = CalculationSchema(
+        condition_groups=[
+            {
+                "operator": "AND",
+                "rules": [
+                    {
+                        "rule_type": "PERCENTAGE_THRESHOLD",
+                        "field_id": "completion_rate",
+                        "operator": ">=",
+                        "threshold": 75,
+                    },
+                    {
+                        "rule_type": "OR_ANY",
+                        "conditions": [
+                            {
+                                "rule_type": "COUNT_THRESHOLD",
+                                "field_id": "documents",
+                                "operator": ">=",
+                                "threshold": 2,
+                            },
+                            {
+                                "rule_type": "BBI_FUNCTIONALITY_CHECK",
+                                "bbi_id": 1,
+                                "expected_status": "Functional",
+                            },
+                        ],
+                    },
+                ],
+            }
+        ]
+    )
+
+    structural = service.validate_calculation_schema(calculation)
+    result = service.validate_calculation_schema(calculation, form_schema_hash=form.schema_hash)
+
+    assert structural["errors"] == []
+    assert result["referenced_field_ids"] == ["completion_rate", "documents"]
+    assert result["errors"] == [
+        "Calculation schema references field 'documents' which does not exist in form schema"
+    ]
+    assert result["schema_hash"] == structural["schema_hash"]
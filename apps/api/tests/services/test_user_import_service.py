@@ -0,0 +1,191 @@
+"""
+📥 User Import Service Tests
+
+Tests:
+- CSV / JSON parsing
+- Per-row errors: role rules, duplicates, unknown barangays and areas
+- Validation query count doesn't depend on the number of rows
+- Batched inserts, progress reporting and concurrent-insert conflicts
+- Background task wrapper
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.security import encrypt_payload, verify_password
+from app.db.enums import AreaType, UserRole
+from app.db.models.barangay import Barangay
+from app.db.models.governance_area import GovernanceArea
+from app.db.models.user import User
+from app.services import user_import_service as import_module
+from app.services.user_import_service import user_import_service
+from app.workers.user_import import import_users as import_users_task
+
+
+@pytest.fixture
+def fast_hash(monkeypatch):
+    """bcrypt at the production cost takes ~0.3s per password."""
+    monkeypatch.setattr(import_module, "get_password_hash", lambda password: f"hashed:{password}")
+
+
+@pytest.fixture
+def lookups(db_session):
+    barangay = Barangay(name="Barangay 1")
+    area = GovernanceArea(name="Financial Administration", area_type=AreaType.CORE)
+    existing = User(
+        email="existing@example.com",
+        name="Existing",
+        hashed_password="x",
+        role=UserRole.ASSESSOR,
+    )
+    db_session.add_all([barangay, area, existing])
+    db_session.commit()
+    return barangay.id, area.id
+
+
+def _blgu(n, barangay_id):
+    return {
+        "email": f"blgu{n}@example.com",
+        "name": f"BLGU {n}",
+        "password": f"secret{n}",
+        "role": "BLGU_USER",
+        "barangay_id": barangay_id,
+    }
+
+
+def _count_queries(db_session, call):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+def test_parse_csv_and_json():
+    csv_rows = user_import_service.parse_file(
+        b"\xef\xbb\xbfemail,name,password,role,barangay_id,phone_number\n"
+        b"a@example.com, A ,pw,BLGU_USER,3,\n",
+        "users.csv",
+    )
+    json_rows = user_import_service.parse_file(b'{"users": [{"email": "b@example.com"}]}', None)
+
+    assert csv_rows == [
+        {"email": "a@example.com", "name": "A", "password": "pw", "role": "BLGU_USER", "barangay_id": "3"}
+    ]
+    assert json_rows == [{"email": "b@example.com"}]
+    with pytest.raises(HTTPException) as exc_info:
+        user_import_service.parse_file(b'{"users": 1}', "users.json")
+    assert exc_info.value.status_code == 400
+
+
+def test_import_reports_row_errors_and_creates_valid_rows(db_session, lookups):
+    barangay_id, area_id = lookups
+    rows = [
+        _blgu(1, barangay_id),
+        {
+            "email": "validator@example.com",
+            "name": "Validator",
+            "password": "secret",
+            "role": "VALIDATOR",
+            "validator_area_id": area_id,
+            "barangay_id": barangay_id,
+        },
+        {**_blgu(2, barangay_id), "barangay_id": None},
+        _blgu(3, 9999),
+        {**_blgu(4, barangay_id), "role": "VALIDATOR", "validator_area_id": 9999},
+        {**_blgu(5, barangay_id), "email": "blgu1@example.com"},
+        {**_blgu(6, barangay_id), "email": "existing@example.com"},
+        {**_blgu(7, barangay_id), "role": "MAYOR"},
+        {"email": "nopassword@example.com", "name": "No Password"},
+    ]
+
+    result = user_import_service.import_users(db_session, rows)
+
+    assert (result["total"], result["created"]) == (9, 2)
+    assert [(u["row"], u["email"]) for u in result["users"]] == [
+        (1, "blgu1@example.com"),
+        (2, "validator@example.com"),
+    ]
+    errors = {error["row"]: error["error"] for error in result["errors"]}
+    assert errors[3] == "Barangay is required for BLGU User role."
+    assert errors[4] == "Barangay 9999 not found"
+    assert errors[5] == "Governance area 9999 not found"
+    assert errors[6] == "Duplicate email (also on row 1)"
+    assert errors[7] == "Email already registered"
+    assert errors[8].startswith("role:")
+    assert errors[9].startswith("password:")
+
+    db_session.expire_all()
+    validator = db_session.query(User).filter(User.email == "validator@example.com").one()
+    assert validator.barangay_id is None and validator.validator_area_id == area_id
+    assert validator.must_change_password is True
+    assert verify_password("secret", validator.hashed_password)
+
+
+def test_validation_query_count_is_independent_of_row_count(db_session, lookups, fast_hash):
+    barangay_id, _ = lookups
+
+    def validate(count, offset):
+        rows = [_blgu(offset + n, barangay_id) for n in range(count)]
+        return _count_queries(db_session, lambda: user_import_service.validate_rows(db_session, rows))
+
+    (small, _), small_queries = validate(5, 0)
+    (large, _), large_queries = validate(400, 1000)
+
+    assert (len(small), len(large)) == (5, 400)
+    assert small_queries == large_queries == 3
+
+
+def test_batches_report_progress(db_session, lookups, fast_hash, monkeypatch):
+    barangay_id, _ = lookups
+    monkeypatch.setattr(settings, "USER_IMPORT_BATCH_SIZE", 2)
+    rows = [_blgu(n, barangay_id) for n in range(5)] + [_blgu(0, barangay_id)]
+    calls = []
+
+    result, queries = _count_queries(
+        db_session,
+        lambda: user_import_service.import_users(
+            db_session, rows, progress=lambda done, total: calls.append((done, total))
+        ),
+    )
+
+    assert result["created"] == 5
+    assert calls == [(1, 6), (3, 6), (5, 6), (6, 6)]
+    # 3 validation lookups + 3 multi-row INSERTs
+    assert queries == 6
+    assert db_session.query(User).filter(User.role == UserRole.BLGU_USER).count() == 5
+
+
+def test_email_registered_during_import_is_a_row_error(db_session, lookups, fast_hash):
+    barangay_id, _ = lookups
+    rows = [_blgu(1, barangay_id), _blgu(2, barangay_id)]
+
+    def register_concurrently(done, total):
+        if done == 0:
+            db_session.add(User(email="blgu2@example.com", name="Racer", hashed_password="x"))
+            db_session.flush()
+
+    result = user_import_service.import_users(db_session, rows, progress=register_concurrently)
+
+    assert result["created"] == 1
+    assert result["errors"] == [
+        {"row": 2, "email": "blgu2@example.com", "error": "Email already registered"}
+    ]
+
+
+def test_background_task_runs_the_same_import(db_session, lookups, fast_hash):
+    barangay_id, _ = lookups
+
+    result = import_users_task(encrypt_payload([_blgu(1, barangay_id)]), db=db_session)
+
+    assert result["success"] is True
+    assert result["created"] == 1 and result["errors"] == []
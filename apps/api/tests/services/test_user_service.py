@@ -563,3 +563,32 @@ def test_get_user_stats_empty_database(db_session: Session):
     assert stats["inactive_users"] == 0
     assert stats["users_need_password_change"] == 0
     assert stats["users_by_role"] == {}
+
+
+def test_get_users_page_walks_all_users_by_name(db_session: Session):
+    """Test keyset pagination returns every user once, ordered by (name, id)"""
+    db_session.add_all(
+        [
+            User(
+                email=f"page{i}@example.com",
+                name=f"Paged User {i % 3}",
+                hashed_password=get_password_hash("pass"),
+                role=UserRole.BLGU_USER,
+            )
+            for i in range(7)
+        ]
+    )
+    db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        users, total, cursor = user_service.get_users_page(
+            db_session, cursor=cursor, limit=3, search="Paged"
+        )
+        seen.extend(users)
+        if cursor is None:
+            break
+
+    assert total == 7
+    assert [(u.name, u.id) for u in seen] == sorted((u.name, u.id) for u in seen)
+    assert len({u.id for u in seen}) == 7
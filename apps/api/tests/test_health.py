@@ -43,3 +43,31 @@ def test_openapi_schema_accessible(client):
     schema = response.json()
     assert "openapi" in schema
     assert "info" in schema
+
+
+def test_liveness_endpoint(client):
+    """Liveness probe answers without touching connections"""
+    response = client.get("/health/live")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "alive"
+
+
+def test_readiness_endpoint(client):
+    """Readiness probe reports ready (200) or not ready (503)"""
+    response = client.get("/health/ready")
+
+    assert response.status_code in [
+        status.HTTP_200_OK,
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+    ]
+    assert response.json()["status"] in ["ready", "not_ready"]
+
+
+def test_health_endpoint_is_cached(client):
+    """Repeated health probes within the TTL reuse one result"""
+    first = client.get("/health").json()
+    second = client.get("/health").json()
+
+    assert first["timestamp"] == second["timestamp"]
+    assert "cache_age_seconds" in second
@@ -0,0 +1,126 @@
+"""
+🧪 Metrics Endpoint Tests
+Prometheus exposition and hot-path instrumentation
+"""
+
+import pytest
+from fastapi import status
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY, route_template
+from app.services.calculation_engine_service import calculation_engine_service
+
+
+METRICS_AUTH = {"Authorization": "Bearer scrape-token"}
+
+
+@pytest.fixture(autouse=True)
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+
+
+def _sample(name, labels=None):
+    return REGISTRY.get_sample_value(name, labels or {}) or 0.0
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client):
+    """The scrape endpoint returns the text exposition format."""
+    response = client.get("/metrics", headers=METRICS_AUTH)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "vantage_http_request_duration_seconds" in response.text
+    assert "vantage_db_pool_checkout_seconds" in response.text
+
+
+def test_metrics_endpoint_requires_the_token(client, monkeypatch):
+    """Scrapes need the bearer token; without a configured token it is off."""
+    assert client.get("/metrics").status_code == status.HTTP_401_UNAUTHORIZED
+    wrong = {"Authorization": "Bearer guess"}
+    assert client.get("/metrics", headers=wrong).status_code == status.HTTP_401_UNAUTHORIZED
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    assert client.get("/metrics", headers=METRICS_AUTH).status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_request_latency_labelled_by_route_template(client):
+    """Requests are recorded under the route template, not the raw path."""
+    labels = {"method": "GET", "route": "/health", "status": "200"}
+    before = _sample("vantage_http_request_duration_seconds_count", labels)
+
+    client.get("/health")
+
+    after = _sample("vantage_http_request_duration_seconds_count", labels)
+    assert after == before + 1
+
+
+def test_unmatched_paths_share_one_label(client):
+    """Unknown paths collapse to a single series."""
+    labels = {"method": "GET", "route": "unmatched", "status": "404"}
+    before = _sample("vantage_http_requests_total", labels)
+
+    client.get("/no-such-path/123")
+    client.get("/no-such-path/456")
+
+    assert _sample("vantage_http_requests_total", labels) == before + 2
+
+
+def test_route_template_uses_path_parameters(client, db_session):
+    """Route templates keep placeholders so IDs do not create new series."""
+    from app.api.deps import get_db
+
+    client.app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        client.get("/api/v1/assessor/assessments/101")
+        client.get("/api/v1/assessor/assessments/202")
+    finally:
+        client.app.dependency_overrides.pop(get_db, None)
+
+    text = client.get("/metrics", headers=METRICS_AUTH).text
+    assert 'route="/api/v1/assessor/assessments/{assessment_id}"' in text
+    assert "/api/v1/assessor/assessments/101" not in text
+
+
+def test_route_template_prefix_reconstruction():
+    """Router-local templates are re-anchored under their include prefix."""
+
+    class _Route:
+        path_format = "/assessments/{assessment_id}"
+
+    scope = {"route": _Route(), "path": "/api/v1/assessor/assessments/7"}
+    assert route_template(scope) == "/api/v1/assessor/assessments/{assessment_id}"
+
+    _Route.path_format = "/api/v1/assessor/assessments/{assessment_id}"
+    assert route_template(scope) == "/api/v1/assessor/assessments/{assessment_id}"
+    assert route_template({"path": "/anything"}) is None
+
+
+def test_calculation_engine_counts_evaluations():
+    """Each schema evaluation is counted by outcome and timed."""
+    schema = {
+        "condition_groups": [
+            {
+                "operator": "AND",
+                "rules": [
+                    {
+                        "rule_type": "MATCH_VALUE",
+                        "field_id": "status",
+                        "operator": "==",
+                        "expected_value": "yes",
+                    }
+                ],
+            }
+        ],
+        "output_status_on_pass": "Pass",
+        "output_status_on_fail": "Fail",
+    }
+    passes = _sample("vantage_calculation_evaluations_total", {"outcome": "pass"})
+    fails = _sample("vantage_calculation_evaluations_total", {"outcome": "fail"})
+    timed = _sample("vantage_calculation_duration_seconds_count")
+
+    calculation_engine_service.execute_calculation(schema, {"status": "yes"})
+    calculation_engine_service.execute_calculation(schema, {"status": "no"})
+
+    assert _sample("vantage_calculation_evaluations_total", {"outcome": "pass"}) == passes + 1
+    assert _sample("vantage_calculation_evaluations_total", {"outcome": "fail"}) == fails + 1
+    assert _sample("vantage_calculation_duration_seconds_count") == timed + 2